@@ -284,6 +284,7 @@ class AdvancedPdfController:
         jobs: List[Dict[str, Any]],
         output_dir: str,
         progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Batch generate multiple PDFs with progress tracking
@@ -300,7 +301,9 @@ class AdvancedPdfController:
         ]
         """
         try:
-            results = self.service.batch_generate_pdfs(jobs, output_dir)
+            results = self.service.batch_generate_pdfs(
+                jobs, output_dir, max_workers, progress_callback
+            )
 
             # Calculate success rate
             successful = sum(1 for r in results if r.get("success", False))
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from dtos.nutrition_dtos import (
     ItemDTO,
@@ -16,7 +16,7 @@ from services.food_search_service import FiltreRecherche, FoodSearchService
 from services.meal_plan_generator_service import MealPlanGeneratorService
 from services.nutrition_service import NutritionService
 from services.pdf_generator import generate_nutrition_pdf
-from services.plan_alimentaire_service import PlanAlimentaireService
+from services.plan_alimentaire_service import MealTotals, PlanAlimentaireService
 
 # from repositories.profil_nutritionnel_repo import ProfilNutritionnelRepository
 
@@ -84,29 +84,32 @@ class NutritionController:
 
     # --- Internal helpers ---
     def _plan_to_dto(self, plan) -> PlanAlimentaireDTO:
-        repas_dtos: List[RepasDTO] = []
-        for repas in plan.repas:
-            repas_dtos.append(self._repas_to_dto(repas))
-        totals = self.plan_service.compute_plan_totals(plan)
+        totals = self.plan_service.compute_totals(plan)
+        repas_dtos: List[RepasDTO] = [
+            self._repas_to_dto(repas, meal)
+            for repas, meal in zip(plan.repas, totals.meals)
+        ]
         return PlanAlimentaireDTO(
             id=plan.id,
             repas=repas_dtos,
-            totals_kcal=totals["kcal"],
-            totals_proteines=totals["proteines"],
-            totals_glucides=totals["glucides"],
-            totals_lipides=totals["lipides"],
+            totals_kcal=totals.totals["kcal"],
+            totals_proteines=totals.totals["proteines"],
+            totals_glucides=totals.totals["glucides"],
+            totals_lipides=totals.totals["lipides"],
         )
 
-    def _repas_to_dto(self, repas: Repas) -> RepasDTO:
+    def _repas_to_dto(
+        self, repas: Repas, meal: Optional[MealTotals] = None
+    ) -> RepasDTO:
+        if meal is None:
+            meal = self.plan_service.compute_repas_totals(repas)
         items: List[ItemDTO] = []
-        for item in repas.items:
-            aliment = self.nutrition_service.get_aliment_by_id(item.aliment_id)
-            totals = self.plan_service.compute_item_totals(item)
+        for item, totals in zip(repas.items, meal.items):
             items.append(
                 ItemDTO(
                     id=item.id,
                     aliment_id=item.aliment_id,
-                    nom=aliment.nom if aliment else "",
+                    nom=item.aliment.nom if item.aliment else "",
                     quantite=item.quantite,
                     unite="g",
                     kcal=totals["kcal"],
@@ -115,7 +118,7 @@ class NutritionController:
                     lipides=totals["lipides"],
                 )
             )
-        mt = self.plan_service.compute_meal_totals(repas)
+        mt = meal.totals
         return RepasDTO(
             id=repas.id,
             nom=repas.nom,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+import random
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.session import Session
+from services.batch_session_generator import BatchItemResult, generate_sessions_batch
 from services.client_service import ClientService
 from services.exercise_service import ExerciseService
 from services.pdf_generator import (
@@ -13,6 +16,7 @@ from services.pdf_generator import (
 )
 from services.pdf_template_service import PdfTemplateService
 from services.session_generator import generate_collectif, generate_individuel
+from services.session_memo import canonical_key
 from services.session_service import SessionService
 from services.smart_workout_generator import SmartWorkoutGenerator
 from services.workout_config_service import WorkoutConfigService
@@ -30,10 +34,13 @@ class SessionController:
         self.exercise_service = exercise_service
 
         # Initialiser les services smart
-        self.config_service = WorkoutConfigService()
+        self.config_service = WorkoutConfigService(write_behind=True)
         self.smart_generator = SmartWorkoutGenerator(
             exercise_service, self.config_service
         )
+        # Graine attribuée à chaque jeu de réglages déjà prévisualisé
+        self._preview_seeds: "OrderedDict[str, int]" = OrderedDict()
+        self._last_preview_key: Optional[str] = None
 
     def build_session_preview_dto(
         self, blocks: list[Any], exercises_by_id: Dict[str, Dict[str, Any]]
@@ -91,13 +98,10 @@ class SessionController:
             blocks_out.append(block_dto)
         return {"blocks": blocks_out}
 
-    def generate_session_preview(
-        self, params: Dict[str, Any], mode: str = "collectif"
-    ) -> Tuple[Any, Dict[str, Any]]:
-        """Generate a collective session and its preview DTO."""
-        if mode != "collectif":
-            raise ValueError(f"Unknown mode: {mode}")
-        svc_params = {
+    @staticmethod
+    def _service_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Traduit les paramètres de l'UI en paramètres des générateurs."""
+        return {
             "duration": int(params.get("duration", 0)),
             "equipment": params.get("equipment", []),
             "variability": int(params.get("variability", 0)),
@@ -112,7 +116,37 @@ class SessionController:
             "custom_blocks": params.get(
                 "custom_blocks"
             ),  # Ajouter les blocs personnalisés
+            "seed": params.get("seed"),
         }
+
+    def _preview_seed(self, svc_params: Dict[str, Any]) -> int:
+        """Graine de l'aperçu pour des réglages donnés.
+
+        Des réglages déjà vus reprennent leur graine : ramener un slider à sa
+        valeur précédente redonne la même séance, servie par le mémo du
+        générateur. Relancer la génération sans rien changer tire une
+        nouvelle graine, donc une nouvelle séance.
+        """
+        key = canonical_key(svc_params)
+        seed = self._preview_seeds.get(key)
+        if seed is None or key == self._last_preview_key:
+            seed = random.randrange(2**31)
+        self._preview_seeds[key] = seed
+        self._preview_seeds.move_to_end(key)
+        while len(self._preview_seeds) > self.smart_generator.session_memo.maxsize:
+            self._preview_seeds.popitem(last=False)
+        self._last_preview_key = key
+        return seed
+
+    def generate_session_preview(
+        self, params: Dict[str, Any], mode: str = "collectif"
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Generate a collective session and its preview DTO."""
+        if mode != "collectif":
+            raise ValueError(f"Unknown mode: {mode}")
+        svc_params = self._service_params(params)
+        if svc_params["seed"] is None and svc_params["variability"] > 10:
+            svc_params["seed"] = self._preview_seed(svc_params)
         # Utiliser le générateur intelligent avec fallback vers l'ancien
         try:
             session = self.smart_generator.generate_collectif_smart(svc_params)
@@ -132,6 +166,20 @@ class SessionController:
         }
         return session, dto
 
+    def generate_sessions_batch(
+        self, params_list: List[Dict[str, Any]], **kwargs: Any
+    ) -> List[BatchItemResult]:
+        """Génère une séance par jeu de paramètres de l'UI (semaine, cycle).
+
+        Les options (``max_workers``, ``base_seed``, ``on_progress``...) sont
+        celles de ``generate_sessions_batch`` ; ``build_preview_from_session``
+        construit ensuite l'aperçu de chaque séance réussie.
+        """
+        kwargs.setdefault("config_dir", str(self.config_service.config_dir))
+        return generate_sessions_batch(
+            [self._service_params(p) for p in params_list], **kwargs
+        )
+
     def generate_individual_session(
         self, client_id: int, objectif: str, duree_minutes: int
     ) -> Tuple[Any, Dict[str, Any]]:
@@ -0,0 +1,325 @@
+"""
+Binary Event Payload Codec.
+
+Stores an event's fields as one self-describing BLOB:
+
+    header byte | dictionary id (2 bytes, when used) | body
+
+- Encoding: MessagePack when ``msgpack`` is installed, compact UTF-8 JSON
+  otherwise
+- Compression: zstd when ``zstandard`` is installed, raw DEFLATE (zlib)
+  otherwise; both are primed with a dictionary trained on earlier payloads
+  so that small events compress too. Bodies that do not shrink are stored
+  uncompressed
+- Checksums: CRC-32 by default, BLAKE2b or SHA-256 on request
+
+The header records how each payload was written, so payloads stay readable
+after settings change or a newer dictionary is trained.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.exceptions import EventSerializationError
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Header byte: bits 0-1 encoding, bits 2-3 compression, bit 4 dictionary
+_ENCODING_JSON = 0x00
+_ENCODING_MSGPACK = 0x01
+_ENCODING_MASK = 0x03
+_COMPRESSION_NONE = 0x00
+_COMPRESSION_ZLIB = 0x04
+_COMPRESSION_ZSTD = 0x08
+_COMPRESSION_MASK = 0x0C
+_WITH_DICTIONARY = 0x10
+
+_COMPRESSION_FLAGS = {
+    "none": _COMPRESSION_NONE,
+    "zlib": _COMPRESSION_ZLIB,
+    "zstd": _COMPRESSION_ZSTD,
+}
+_ZLIB_WBITS = -15  # raw DEFLATE: no zlib header or trailer on tiny payloads
+_MAX_DICTIONARY_SIZE = 32 * 1024  # DEFLATE window
+
+
+class EventCodec:
+    """
+    Encodes event payloads to compact, optionally compressed bytes.
+
+    ``compression`` is "auto" (zstd if available, else zlib), "zstd", "zlib"
+    or "none"; ``encoding`` is "auto" (msgpack if available, else JSON),
+    "msgpack" or "json"; ``checksum`` is "crc32", "blake2b" or "sha256".
+    Dictionaries are added with ``add_dictionary`` (usually loaded by the
+    event store) and built with ``train_dictionary``.
+    """
+
+    def __init__(
+        self,
+        compression: str = "auto",
+        encoding: str = "auto",
+        checksum: str = "crc32",
+        level: Optional[int] = None,
+        min_compress_size: int = 32,
+    ):
+        if compression == "auto":
+            compression = "zstd" if ZSTD_AVAILABLE else "zlib"
+        if encoding == "auto":
+            encoding = "msgpack" if MSGPACK_AVAILABLE else "json"
+        if compression not in _COMPRESSION_FLAGS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if encoding not in ("msgpack", "json"):
+            raise ValueError(f"Unknown encoding: {encoding}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        if encoding == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack encoding requires the msgpack package")
+        if checksum not in ("crc32", "blake2b", "sha256"):
+            raise ValueError(f"Unknown checksum: {checksum}")
+
+        self.compression = compression
+        self.encoding = encoding
+        self.checksum_algorithm = checksum
+        self.level = level if level is not None else 3
+        self.min_compress_size = min_compress_size
+
+        # dictionary id -> (compression, raw bytes); prepared objects cached
+        self._dictionaries: Dict[int, Tuple[str, bytes]] = {}
+        self._zstd_dictionaries: Dict[int, Any] = {}
+        self._active_dictionary: Optional[int] = None
+        self._zlib_primed: Optional[Any] = None
+        self._zstd_compressor: Optional[Any] = None
+        self._zstd_decompressors: Dict[Optional[int], Any] = {}
+
+        # Sizes for the compression ratio
+        self.encoded_bytes = 0
+        self.stored_bytes = 0
+
+    # --- payloads ---------------------------------------------------------
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Payload bytes for ``data`` (values JSON cannot represent become str)."""
+        header = _ENCODING_MSGPACK if self.encoding == "msgpack" else _ENCODING_JSON
+        body = self._encode_body(data)
+        self.encoded_bytes += len(body)
+
+        prefix = b""
+        if self.compression != "none" and len(body) >= self.min_compress_size:
+            compressed = self._compress(body)
+            extra = 2 if self._active_dictionary is not None else 0
+            if len(compressed) + extra < len(body):
+                header |= _COMPRESSION_FLAGS[self.compression]
+                if self._active_dictionary is not None:
+                    header |= _WITH_DICTIONARY
+                    prefix = self._active_dictionary.to_bytes(2, "big")
+                body = compressed
+
+        payload = bytes((header,)) + prefix + body
+        self.stored_bytes += len(payload)
+        return payload
+
+    def decode(self, payload: bytes) -> Dict[str, Any]:
+        """Fields encoded in ``payload``, whatever settings wrote it."""
+        try:
+            header = payload[0]
+            offset = 1
+            dictionary_id = None
+            if header & _WITH_DICTIONARY:
+                dictionary_id = int.from_bytes(payload[1:3], "big")
+                offset = 3
+            body = payload[offset:]
+
+            compression = header & _COMPRESSION_MASK
+            if compression == _COMPRESSION_ZLIB:
+                body = self._inflate(body, dictionary_id)
+            elif compression == _COMPRESSION_ZSTD:
+                body = self._zstd_decompress(body, dictionary_id)
+
+            if header & _ENCODING_MASK == _ENCODING_MSGPACK:
+                if not MSGPACK_AVAILABLE:
+                    raise EventSerializationError("msgpack payload: msgpack missing")
+                return msgpack.unpackb(body, raw=False, strict_map_key=False)
+            return json.loads(body)
+        except EventSerializationError:
+            raise
+        except Exception as e:
+            raise EventSerializationError(
+                f"Failed to decode event payload: {str(e)}"
+            ) from e
+
+    def checksum(self, payload: bytes) -> str:
+        """Checksum of ``payload``, prefixed with its algorithm (except SHA-256)."""
+        return _checksum(payload, self.checksum_algorithm)
+
+    @staticmethod
+    def verify(payload: bytes, checksum: str) -> bool:
+        """Check ``payload`` against a checksum written by any algorithm."""
+        algorithm, _, _ = checksum.rpartition(":")
+        return _checksum(payload, algorithm or "sha256") == checksum
+
+    @property
+    def compression_ratio(self) -> float:
+        """Encoded size over stored size of the payloads written so far."""
+        return self.encoded_bytes / self.stored_bytes if self.stored_bytes else 0.0
+
+    # --- dictionaries -----------------------------------------------------
+
+    @property
+    def dictionary_id(self) -> Optional[int]:
+        """Dictionary used for new payloads, if any."""
+        return self._active_dictionary
+
+    @property
+    def needs_dictionary(self) -> bool:
+        """Compression is on but no dictionary matches it yet."""
+        return self.compression != "none" and self._active_dictionary is None
+
+    def add_dictionary(
+        self, dictionary_id: int, data: bytes, compression: str, activate: bool = True
+    ) -> None:
+        """
+        Make a dictionary available for decoding, and for encoding when it
+        was built for this codec's compression and ``activate`` is set.
+        """
+        self._dictionaries[dictionary_id] = (compression, bytes(data))
+        if activate and compression == self.compression:
+            self._active_dictionary = dictionary_id
+            self._zlib_primed = None
+            self._zstd_compressor = None
+
+    def train_dictionary(
+        self, samples: Iterable[Dict[str, Any]], size: int = 8 * 1024
+    ) -> bytes:
+        """
+        Dictionary for this codec's compression, built from sample payloads.
+
+        zstd dictionaries come from ``zstandard.train_dictionary``. DEFLATE
+        only takes a preset window, so the zlib dictionary is one encoded
+        example of each common payload shape (same keys), the most common
+        last where matches are cheapest.
+        """
+        size = min(size, _MAX_DICTIONARY_SIZE)
+        samples = list(samples)
+        encoded = [self._encode_body(sample) for sample in samples]
+        if self.compression == "zstd" and encoded:
+            try:
+                return zstandard.train_dictionary(size, encoded).as_bytes()
+            except Exception:
+                pass  # too few samples: fall back to a raw content dictionary
+
+        shapes: Counter = Counter()
+        examples: Dict[Tuple[Any, ...], bytes] = {}
+        for sample, body in zip(samples, encoded):
+            shape = tuple(sample) if isinstance(sample, dict) else ()
+            shapes[shape] += 1
+            examples.setdefault(shape, body)
+
+        parts: List[bytes] = []
+        remaining = size
+        for shape, _ in shapes.most_common():
+            example = examples[shape][:remaining]
+            parts.append(example)
+            remaining -= len(example)
+            if remaining <= 0:
+                break
+        return b"".join(reversed(parts))
+
+    # --- internals --------------------------------------------------------
+
+    def _encode_body(self, data: Dict[str, Any]) -> bytes:
+        if self.encoding == "msgpack":
+            return msgpack.packb(data, default=str, use_bin_type=True)
+        return json.dumps(
+            data, default=str, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def _dictionary(self, dictionary_id: Optional[int]) -> Optional[bytes]:
+        if dictionary_id is None:
+            return None
+        try:
+            return self._dictionaries[dictionary_id][1]
+        except KeyError:
+            raise EventSerializationError(
+                f"Unknown compression dictionary: {dictionary_id}"
+            ) from None
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.compression == "zstd":
+            if self._zstd_compressor is None:
+                dictionary = self._zstd_dictionary(self._active_dictionary)
+                self._zstd_compressor = zstandard.ZstdCompressor(
+                    level=self.level,
+                    dict_data=dictionary,
+                    write_checksum=False,
+                    write_content_size=True,
+                    write_dict_id=False,
+                )
+            return self._zstd_compressor.compress(body)
+
+        # Priming DEFLATE with a dictionary costs more than compressing a
+        # small event: prime once, then copy the primed state per payload
+        if self._zlib_primed is None:
+            dictionary = self._dictionary(self._active_dictionary)
+            if dictionary:
+                self._zlib_primed = zlib.compressobj(
+                    self.level, zlib.DEFLATED, _ZLIB_WBITS, zdict=dictionary
+                )
+            else:
+                self._zlib_primed = zlib.compressobj(
+                    self.level, zlib.DEFLATED, _ZLIB_WBITS
+                )
+        compressor = self._zlib_primed.copy()
+        return compressor.compress(body) + compressor.flush()
+
+    def _inflate(self, body: bytes, dictionary_id: Optional[int]) -> bytes:
+        dictionary = self._dictionary(dictionary_id)
+        if dictionary:
+            inflater = zlib.decompressobj(_ZLIB_WBITS, zdict=dictionary)
+        else:
+            inflater = zlib.decompressobj(_ZLIB_WBITS)
+        return inflater.decompress(body) + inflater.flush()
+
+    def _zstd_dictionary(self, dictionary_id: Optional[int]) -> Optional[Any]:
+        if dictionary_id is None:
+            return None
+        if dictionary_id not in self._zstd_dictionaries:
+            self._zstd_dictionaries[dictionary_id] = zstandard.ZstdCompressionDict(
+                self._dictionary(dictionary_id)
+            )
+        return self._zstd_dictionaries[dictionary_id]
+
+    def _zstd_decompress(self, body: bytes, dictionary_id: Optional[int]) -> bytes:
+        if not ZSTD_AVAILABLE:
+            raise EventSerializationError("zstd payload: zstandard missing")
+        decompressor = self._zstd_decompressors.get(dictionary_id)
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor(
+                dict_data=self._zstd_dictionary(dictionary_id)
+            )
+            self._zstd_decompressors[dictionary_id] = decompressor
+        return decompressor.decompress(body)
+
+
+def _checksum(payload: bytes, algorithm: str) -> str:
+    if algorithm == "crc32":
+        return f"crc32:{zlib.crc32(payload):08x}"
+    if algorithm == "blake2b":
+        return f"blake2b:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+    return hashlib.sha256(payload).hexdigest()
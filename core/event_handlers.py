@@ -22,17 +22,21 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
 
-from core.event_store import AsyncEventStore, EventStatus
+from core.event_store import AsyncEventStore, StoredEvent
 from core.events import Event, IEventBus
 from core.exceptions import (
     BackpressureError,
     CircuitBreakerOpenError,
     EventHandlerError,
     EventOrderingError,
+    EventSerializationError,
 )
 
 logger = logging.getLogger(__name__)
 
+# Handler states that defer an event instead of failing it
+_UNAVAILABLE = (BackpressureError, CircuitBreakerOpenError)
+
 
 class HandlerStatus(Enum):
     """Event handler status states."""
@@ -592,20 +596,38 @@ class EventHandlerRegistry:
 
 
 class EventProcessor:
-    """Central event processor with enterprise features."""
+    """
+    Central event processor with push-based dispatch.
+
+    Each registered handler consumes the event store from its own durable
+    checkpoint (last handled sequence, kept in SQLite). Consumers sleep
+    until the store signals a commit, then read forward in pages of
+    ``page_size``: an idle processor issues no queries, and a restarted one
+    catches up from where each handler stopped. Delivery is at-least-once:
+    the checkpoint moves after a page has been handled. Events that cannot
+    be decoded, or that the handler gives up on, are dead-lettered before
+    the checkpoint moves past them; while a handler is unavailable (circuit
+    open, overloaded) its checkpoint stays before the deferred event.
+    """
 
     def __init__(
         self,
         event_store: AsyncEventStore,
         handler_registry: EventHandlerRegistry,
         event_bus: Optional[IEventBus] = None,
+        page_size: int = 100,
+        retry_delay: float = 5.0,
     ):
         self.event_store = event_store
         self.handler_registry = handler_registry
         self.event_bus = event_bus
+        self.page_size = page_size
+        self.retry_delay = retry_delay  # seconds before re-reading a page
 
         self._processing = False
         self._processor_tasks: List[asyncio.Task] = []
+        self._wakeups: List[asyncio.Event] = []
+        self._unresolved_types: Dict[str, type] = {}
 
     async def start(self):
         """Start event processing."""
@@ -615,13 +637,20 @@ class EventProcessor:
         for handler in self.handler_registry.get_all_handlers():
             await handler.start_processing_loop()
 
-        # Start main processing loop
-        task = asyncio.create_task(self._main_processing_loop())
-        self._processor_tasks.append(task)
+        # One consumer per handler, woken by store commits
+        for handler in self.handler_registry.get_all_handlers():
+            wakeup = asyncio.Event()
+            wakeup.set()  # catch up on anything stored while stopped
+            self._wakeups.append(wakeup)
+            task = asyncio.create_task(self._consume(handler, wakeup))
+            self._processor_tasks.append(task)
+
+        self.event_store.add_listener(self._on_events_stored)
 
     async def stop(self):
         """Stop event processing."""
         self._processing = False
+        self.event_store.remove_listener(self._on_events_stored)
 
         # Stop processor tasks
         for task in self._processor_tasks:
@@ -629,54 +658,138 @@ class EventProcessor:
 
         if self._processor_tasks:
             await asyncio.gather(*self._processor_tasks, return_exceptions=True)
+        self._processor_tasks.clear()
+        self._wakeups.clear()
 
         # Shutdown handlers
         for handler in self.handler_registry.get_all_handlers():
             await handler.shutdown()
 
-    async def _main_processing_loop(self):
-        """Main event processing loop."""
+    def _on_events_stored(self) -> None:
+        """Store listener: wake every consumer."""
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    async def _consume(self, handler: BaseEventHandler, wakeup: asyncio.Event):
+        """Feed ``handler`` every stored event after its checkpoint."""
+        consumer = handler.handler_name
+        sequence = None
+
         while self._processing:
             try:
-                # Get pending events from store
-                events = await self.event_store.get_events(
-                    from_date=datetime.now() - timedelta(minutes=5), limit=100
-                )
-
-                for stored_event in events:
-                    if stored_event.metadata.status == EventStatus.PENDING:
-                        await self._process_stored_event(stored_event)
+                if sequence is None:
+                    sequence = await self.event_store.load_checkpoint(consumer)
+
+                # Cleared before reading: a commit during the read re-arms it
+                wakeup.clear()
+                page = await self.event_store.read_after(sequence, self.page_size)
+                if not page:
+                    await wakeup.wait()
+                    continue
 
-                # Wait before next batch
-                await asyncio.sleep(1.0)
+                handled = await self._deliver(handler, page)
+                if handled > sequence:
+                    sequence = handled
+                    await self.event_store.save_checkpoint(consumer, sequence)
+                if handled < page[-1].sequence:
+                    # Handler unavailable: re-read from the checkpoint later
+                    await asyncio.sleep(self.retry_delay)
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in main processing loop: {e}")
-                await asyncio.sleep(5.0)
-
-    async def _process_stored_event(self, stored_event):
-        """Process a stored event through appropriate handlers."""
-        try:
-            # Deserialize event (simplified)
-            # This would require proper event type registry
-            # event = self._deserialize_event(stored_event)
+                logger.error(f"Error in consumer {consumer}: {e}")
+                await asyncio.sleep(self.retry_delay)
+
+    async def _deliver(self, handler: BaseEventHandler, page) -> int:
+        """
+        Run one page of stored events through ``handler``.
+
+        Returns the sequence the checkpoint may move to: the end of the page,
+        or just before the first event the handler could not take (circuit
+        open, overloaded). Events of types the handler does not handle are
+        skipped without being decoded.
+        """
+        deliveries = []
+        for stored_event in page:
+            name = stored_event.metadata.event_type
+            event_type = self.event_store.resolve_event_type(name)
+            if not handler.can_handle(event_type or self._unresolved_type(name)):
+                continue
+            try:
+                if event_type is None:
+                    raise EventSerializationError(f"Unknown event type: {name}")
+                event = await self.event_store.deserialize_event(stored_event)
+            except Exception as e:
+                # Dead-lettered before the checkpoint moves past it; if that
+                # write fails too, the error aborts the page and it is retried
+                logger.error(
+                    f"Cannot deserialize event {stored_event.metadata.event_id}: {e}"
+                )
+                await self.event_store.dead_letter(
+                    stored_event, f"{handler.handler_name}: {e}"
+                )
+                continue
+            deliveries.append((stored_event, event))
 
-            # Get handlers for event type
-            # handlers = self.handler_registry.get_handlers_for_event(type(event))
+        if handler.config.preserve_order or handler.config.max_concurrent_events <= 1:
+            for stored_event, event in deliveries:
+                if not await self._handle(handler, stored_event, event):
+                    return stored_event.sequence - 1
+            return page[-1].sequence
 
-            # Process through each handler
-            # for handler in handlers:
-            #     await handler.enqueue_event(event)
+        slots = asyncio.Semaphore(handler.config.max_concurrent_events)
 
-            # Mark event as processed
-            stored_event.metadata.status = EventStatus.PROCESSED
-            stored_event.metadata.processed_at = datetime.now()
+        async def handle_in_slot(stored_event: StoredEvent, event: Event) -> bool:
+            async with slots:
+                return await self._handle(handler, stored_event, event)
 
+        handled = await asyncio.gather(
+            *(handle_in_slot(stored_event, event) for stored_event, event in deliveries)
+        )
+        for (stored_event, _), done in zip(deliveries, handled):
+            if not done:
+                return stored_event.sequence - 1
+        return page[-1].sequence
+
+    async def _handle(
+        self, handler: BaseEventHandler, stored_event: StoredEvent, event: Event
+    ) -> bool:
+        """
+        Process one event; False when it must be delivered again later.
+
+        A handler that is unavailable (circuit open, overloaded) defers the
+        event. Other failures are final once retries are exhausted: the event
+        is dead-lettered.
+        """
+        try:
+            await handler.process_event(event)
         except Exception as e:
+            if isinstance(e, _UNAVAILABLE) or isinstance(e.__cause__, _UNAVAILABLE):
+                logger.warning(
+                    f"Handler {handler.handler_name} unavailable, deferring event "
+                    f"{stored_event.metadata.event_id}: {e}"
+                )
+                return False
             logger.error(
-                f"Error processing stored event {stored_event.metadata.event_id}: {e}"
+                f"Handler {handler.handler_name} gave up on event "
+                f"{stored_event.metadata.event_id}: {e}"
+            )
+            await self.event_store.dead_letter(
+                stored_event, f"{handler.handler_name}: {e}"
             )
-            stored_event.metadata.status = EventStatus.FAILED
+        return True
+
+    def _unresolved_type(self, name: str) -> type:
+        """
+        Stand-in class for an event type no loaded class matches, so that
+        handlers matching on type names can claim it. Not an ``Event``
+        subclass: the store never resolves the name to it.
+        """
+        placeholder = self._unresolved_types.get(name)
+        if placeholder is None:
+            placeholder = self._unresolved_types[name] = type(name, (), {})
+        return placeholder
 
 
 # Decorator for creating simple event handlers
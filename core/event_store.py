@@ -14,6 +14,7 @@ FAANG-level event sourcing system with:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import time
 import uuid
@@ -21,8 +22,21 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from core.event_codec import EventCodec
 from core.events import Event
 from core.exceptions import (
     EventReplayError,
@@ -34,6 +48,78 @@ from infrastructure.database import AsyncDatabaseManager, get_database_manager
 
 T = TypeVar("T", bound=Event)
 
+_INSERT_EVENT_SQL = """
+INSERT INTO event_store (
+    event_id, event_type, event_version, aggregate_id, aggregate_type,
+    tenant_id, user_id, correlation_id, causation_id, event_data,
+    serialized_event, checksum, status, priority, retry_count,
+    max_retries, contains_pii, retention_days, anonymize_after_days,
+    processing_time_ms, compressed, created_at, processed_at,
+    source_system, environment, request_id, session_id,
+    sequence, aggregate_version, payload
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+    ?, ?, ?)
+"""
+
+# Sequences come from a counter row, so they are never reused even when the
+# newest events are deleted (unlike rowid or MAX(sequence) + 1)
+_RESERVE_SEQUENCE_SQL = (
+    "UPDATE event_sequence SET value = value + ? WHERE name = 'global'"
+)
+_CURRENT_SEQUENCE_SQL = "SELECT value FROM event_sequence WHERE name = 'global'"
+
+# Per-aggregate version counters, bumped by the number of events written
+# (aggregates without a type are keyed by '')
+_BUMP_AGGREGATE_VERSION_SQL = """
+INSERT INTO event_aggregates (aggregate_id, aggregate_type, version)
+VALUES (?, ?, ?)
+ON CONFLICT(aggregate_id, aggregate_type) DO UPDATE SET
+    version = version + excluded.version
+"""
+_AGGREGATE_VERSIONS_SQL = """
+SELECT aggregate_id, aggregate_type, version FROM event_aggregates
+WHERE (aggregate_id, aggregate_type) IN (VALUES {})
+"""
+_AGGREGATE_TAIL_SQL = """
+SELECT * FROM event_store
+WHERE aggregate_id = ? AND aggregate_type = ? AND aggregate_version > ?
+ORDER BY aggregate_version
+LIMIT ?
+"""
+
+_SEQUENCE_MIGRATION = [
+    "ALTER TABLE event_store ADD COLUMN sequence INTEGER",
+    "ALTER TABLE event_store ADD COLUMN aggregate_version INTEGER",
+    "UPDATE event_store SET sequence = rowid",
+    """
+    UPDATE event_store SET aggregate_version = ranked.version
+    FROM (
+        SELECT rowid AS row_id, ROW_NUMBER() OVER (
+            PARTITION BY aggregate_id, aggregate_type ORDER BY rowid
+        ) AS version
+        FROM event_store WHERE aggregate_id IS NOT NULL
+    ) AS ranked
+    WHERE event_store.rowid = ranked.row_id
+    """,
+]
+
+_SEQUENCE_INDEXES = [
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_event_store_sequence "
+    "ON event_store(sequence)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_event_store_aggregate_version "
+    "ON event_store(aggregate_id, aggregate_type, aggregate_version)",
+    "INSERT OR IGNORE INTO event_sequence (name, value) "
+    "SELECT 'global', COALESCE(MAX(sequence), 0) FROM event_store",
+]
+
+# Stores created before version counters existed
+_AGGREGATE_VERSIONS_BACKFILL = """
+INSERT OR IGNORE INTO event_aggregates (aggregate_id, aggregate_type, version)
+SELECT aggregate_id, COALESCE(aggregate_type, ''), MAX(aggregate_version)
+FROM event_store WHERE aggregate_id IS NOT NULL
+GROUP BY 1, 2
+"""
+
 
 class EventStatus(Enum):
     """Event processing status."""
@@ -96,15 +182,40 @@ class EventMetadata:
     session_id: Optional[str] = None
 
 
+class _LazyEventData:
+    """
+    ``StoredEvent.event_data`` holder: a dict, or a callable decoding the
+    stored payload on first access, so events read for their metadata only
+    are never decoded.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            raise AttributeError(self._attribute)  # required dataclass field
+        value = instance.__dict__[self._attribute]
+        if callable(value):
+            value = instance.__dict__[self._attribute] = value()
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._attribute] = value
+
+
 @dataclass
 class StoredEvent:
     """Event as stored in the event store with full metadata."""
 
     metadata: EventMetadata
-    event_data: Dict[str, Any]
-    serialized_event: str
-    checksum: str
-    compressed: bool = False
+    event_data: Dict[str, Any] = _LazyEventData()
+    serialized_event: str = ""  # only for custom serializers and older rows
+    checksum: str = ""
+    compressed: bool = False  # gzip + base64 serialized_event (older rows)
+    sequence: Optional[int] = None  # global position, assigned when persisted
+    aggregate_version: Optional[int] = None  # 1, 2, ... within its aggregate
+    payload: Optional[bytes] = None  # event_data encoded by the EventCodec
 
     @property
     def is_expired(self) -> bool:
@@ -183,6 +294,33 @@ class JsonEventSerializer(IEventSerializer):
             ) from e
 
 
+class IAggregateSnapshotter(ABC):
+    """
+    Rebuilds one aggregate type from its snapshots and stored events.
+
+    Registered per aggregate type with ``AsyncEventStore.register_snapshotter``.
+    Bump ``schema_version`` when the snapshot layout changes: older snapshots
+    are then ignored and aggregates are rebuilt from their events.
+    """
+
+    schema_version: int = 1
+
+    @abstractmethod
+    def apply(self, aggregate: Optional[Any], stored_event: StoredEvent) -> Any:
+        """Aggregate after ``stored_event`` (``aggregate`` is None before the first)."""
+        pass
+
+    @abstractmethod
+    def to_snapshot(self, aggregate: Any) -> Dict[str, Any]:
+        """JSON-compatible state of ``aggregate``."""
+        pass
+
+    @abstractmethod
+    def from_snapshot(self, data: Dict[str, Any]) -> Any:
+        """Aggregate rebuilt from the output of ``to_snapshot``."""
+        pass
+
+
 class EventStoreMetrics:
     """Comprehensive metrics for event store performance."""
 
@@ -197,6 +335,14 @@ class EventStoreMetrics:
         self.dead_letter_events = 0
         self.anonymized_events = 0
 
+        # Group commit
+        self.batches_committed = 0
+        self.batched_events = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.commit_latency_ms = 0.0
+        self.total_commit_latency_ms = 0.0
+
         # Performance tracking
         self.storage_latency_ms = 0.0
         self.retrieval_latency_ms = 0.0
@@ -219,6 +365,15 @@ class EventStoreMetrics:
         self.total_processing_time_ms += processing_time_ms
         self._update_avg_processing_time()
 
+    def record_batch_committed(self, batch_size: int, commit_latency_ms: float):
+        """Record one group commit of ``batch_size`` events."""
+        self.batches_committed += 1
+        self.batched_events += batch_size
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.commit_latency_ms = commit_latency_ms
+        self.total_commit_latency_ms += commit_latency_ms
+
     def record_event_failed(self):
         """Record event processing failure."""
         self.events_failed += 1
@@ -242,6 +397,20 @@ class EventStoreMetrics:
         if total_events > 0:
             self.avg_processing_time_ms = self.total_processing_time_ms / total_events
 
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of events per group commit."""
+        if not self.batches_committed:
+            return 0.0
+        return self.batched_events / self.batches_committed
+
+    @property
+    def avg_commit_latency_ms(self) -> float:
+        """Average duration of a group commit."""
+        if not self.batches_committed:
+            return 0.0
+        return self.total_commit_latency_ms / self.batches_committed
+
     @property
     def success_rate(self) -> float:
         """Calculate event processing success rate."""
@@ -278,6 +447,10 @@ class AsyncEventStore:
         snapshot_frequency: int = 100,
         enable_compression: bool = True,
         enable_encryption: bool = False,
+        batch_size: int = 100,
+        batch_timeout: float = 0.02,
+        codec: Optional[EventCodec] = None,
+        dictionary_training_threshold: int = 1000,
     ):
         self._db_manager = db_manager or get_database_manager()
         self._cache_manager = cache_manager or get_cache_manager()
@@ -287,15 +460,29 @@ class AsyncEventStore:
         self._enable_compression = enable_compression
         self._enable_encryption = enable_encryption
 
+        # Payload codec; a compression dictionary is trained once this many
+        # events are stored (0 disables training)
+        self._codec = codec or EventCodec(
+            compression="auto" if enable_compression else "none"
+        )
+        self._dictionary_training_threshold = dictionary_training_threshold
+        self._training_dictionary = False
+
         self._metrics = EventStoreMetrics()
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._middleware: List[Callable] = []
+        self._event_types: Dict[str, Type[Event]] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self._snapshotters: Dict[str, IAggregateSnapshotter] = {}
 
-        # Performance optimization
-        self._batch_size = 100
-        self._batch_timeout = 1.0  # seconds
+        # Group commit: batched events share one INSERT and one commit
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout  # seconds, age of the oldest event
         self._pending_events: List[StoredEvent] = []
+        self._pending_commit: Optional[asyncio.Future] = None
         self._batch_timer: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._flush_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialize event store with database schema."""
@@ -333,7 +520,33 @@ class AsyncEventStore:
             source_system TEXT NOT NULL DEFAULT 'coach_pro',
             environment TEXT NOT NULL DEFAULT 'production',
             request_id TEXT,
-            session_id TEXT
+            session_id TEXT,
+            sequence INTEGER,
+            aggregate_version INTEGER,
+            payload BLOB
+        );
+
+        -- Global sequence counter
+        CREATE TABLE IF NOT EXISTS event_sequence (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+
+        -- Per-aggregate version counters
+        CREATE TABLE IF NOT EXISTS event_aggregates (
+            aggregate_id TEXT NOT NULL,
+            aggregate_type TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            PRIMARY KEY (aggregate_id, aggregate_type)
+        );
+
+        -- Compression dictionaries referenced by event payloads
+        CREATE TABLE IF NOT EXISTS event_dictionaries (
+            dictionary_id INTEGER PRIMARY KEY,
+            compression TEXT NOT NULL,
+            data BLOB NOT NULL,
+            sample_count INTEGER NOT NULL,
+            created_at TIMESTAMP NOT NULL
         );
 
         -- Snapshots table
@@ -360,6 +573,13 @@ class AsyncEventStore:
             created_at TIMESTAMP NOT NULL
         );
 
+        -- Consumer checkpoints: last sequence each consumer has handled
+        CREATE TABLE IF NOT EXISTS event_checkpoints (
+            consumer TEXT PRIMARY KEY,
+            sequence INTEGER NOT NULL,
+            updated_at TIMESTAMP NOT NULL
+        );
+
         -- Indexes for performance
         CREATE INDEX IF NOT EXISTS idx_event_store_aggregate ON event_store(aggregate_id, aggregate_type);
         CREATE INDEX IF NOT EXISTS idx_event_store_tenant ON event_store(tenant_id);
@@ -367,22 +587,52 @@ class AsyncEventStore:
         CREATE INDEX IF NOT EXISTS idx_event_store_status ON event_store(status);
         CREATE INDEX IF NOT EXISTS idx_event_store_created ON event_store(created_at);
         CREATE INDEX IF NOT EXISTS idx_event_store_correlation ON event_store(correlation_id);
-        CREATE INDEX IF NOT EXISTS idx_snapshots_aggregate ON event_snapshots(aggregate_id, aggregate_type);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_version ON event_snapshots(aggregate_id, aggregate_type, snapshot_version);
         """
 
         async with self._db_manager.get_connection() as conn:
             for statement in schema_sql.split(";"):
                 if statement.strip():
                     await conn.execute(statement.strip())
+
+            # Stores created before sequences existed: number existing events
+            # in insertion order
+            columns = await conn.fetchall("PRAGMA table_info(event_store)")
+            column_names = {column["name"] for column in columns}
+            if "sequence" not in column_names:
+                for statement in _SEQUENCE_MIGRATION:
+                    await conn.execute(statement)
+            # Older rows keep their JSON columns and are read as before
+            if "payload" not in column_names:
+                await conn.execute("ALTER TABLE event_store ADD COLUMN payload BLOB")
+            for statement in _SEQUENCE_INDEXES:
+                await conn.execute(statement)
+            if await conn.fetchone("SELECT 1 FROM event_aggregates LIMIT 1") is None:
+                await conn.execute(_AGGREGATE_VERSIONS_BACKFILL)
             await conn.commit()
 
+            dictionaries = await conn.fetchall(
+                "SELECT dictionary_id, compression, data FROM event_dictionaries "
+                "ORDER BY dictionary_id"
+            )
+            for row in dictionaries:
+                self._codec.add_dictionary(
+                    row["dictionary_id"], row["data"], row["compression"]
+                )
+
     async def store_event(
         self,
         event: Event,
         metadata: Optional[EventMetadata] = None,
         batch: bool = False,
     ) -> str:
-        """Store event in event store with comprehensive metadata."""
+        """
+        Store event in event store with comprehensive metadata.
+
+        With ``batch=True`` the event joins the pending group commit and the
+        call returns once that group is durably written: concurrent callers
+        share one INSERT and one commit.
+        """
         start_time = time.perf_counter()
 
         try:
@@ -394,31 +644,29 @@ class AsyncEventStore:
                     aggregate_type=getattr(event, "aggregate_type", None),
                 )
 
-            # Serialize event
-            serialized_event = self._serializer.serialize(event)
+            self._event_types.setdefault(event.__class__.__name__, event.__class__)
+
+            # Encode the event's fields once; the default serializer's output
+            # would only repeat them, custom serializers are kept alongside
             event_data = event.__dict__.copy()
+            payload = self._codec.encode(event_data)
+            serialized_event = ""
+            if type(self._serializer) is not JsonEventSerializer:
+                serialized_event = self._serializer.serialize(event)
+
+            # Apply encryption if enabled
+            if self._enable_encryption:
+                payload = await self._encrypt_data(payload)
 
             # Create stored event
             stored_event = StoredEvent(
                 metadata=metadata,
                 event_data=event_data,
                 serialized_event=serialized_event,
-                checksum=self._calculate_checksum(serialized_event),
-                compressed=self._enable_compression,
+                checksum=self._codec.checksum(payload),
+                payload=payload,
             )
 
-            # Apply compression if enabled
-            if self._enable_compression:
-                stored_event.serialized_event = await self._compress_data(
-                    serialized_event
-                )
-
-            # Apply encryption if enabled
-            if self._enable_encryption:
-                stored_event.serialized_event = await self._encrypt_data(
-                    stored_event.serialized_event
-                )
-
             # Store event
             if batch:
                 await self._add_to_batch(stored_event)
@@ -427,13 +675,15 @@ class AsyncEventStore:
 
             # Create snapshot if needed
             if self._enable_snapshots and metadata.aggregate_id:
-                await self._maybe_create_snapshot(
-                    metadata.aggregate_id, metadata.aggregate_type
-                )
+                await self._maybe_create_snapshot(stored_event)
+
+            if self._codec.needs_dictionary:
+                await self._maybe_train_dictionary(stored_event)
 
             # Record metrics
             processing_time_ms = (time.perf_counter() - start_time) * 1000
             self._metrics.record_event_stored(processing_time_ms)
+            self._metrics.compression_ratio = self._codec.compression_ratio
 
             return stored_event.metadata.event_id
 
@@ -450,14 +700,20 @@ class AsyncEventStore:
         to_date: Optional[datetime] = None,
         limit: int = 1000,
         include_snapshots: bool = True,
+        after_sequence: int = 0,
     ) -> List[StoredEvent]:
-        """Retrieve events from event store with filtering."""
+        """
+        Retrieve events from event store with filtering.
+
+        Events come in sequence order, starting after ``after_sequence``:
+        pass the last sequence of a page to get the next one.
+        """
         start_time = time.perf_counter()
 
         try:
             # Build query with filters
-            query_parts = ["SELECT * FROM event_store WHERE 1=1"]
-            params = []
+            query_parts = ["SELECT * FROM event_store WHERE sequence > ?"]
+            params = [after_sequence]
 
             if aggregate_id:
                 query_parts.append("AND aggregate_id = ?")
@@ -483,7 +739,7 @@ class AsyncEventStore:
                 query_parts.append("AND created_at <= ?")
                 params.append(to_date)
 
-            query_parts.append("ORDER BY created_at ASC")
+            query_parts.append("ORDER BY sequence ASC")
             query_parts.append("LIMIT ?")
             params.append(limit)
 
@@ -507,6 +763,43 @@ class AsyncEventStore:
         except Exception as e:
             raise EventStoreError(f"Failed to retrieve events: {str(e)}") from e
 
+    async def stream_events(
+        self,
+        aggregate_id: Optional[str] = None,
+        aggregate_type: Optional[str] = None,
+        event_type: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        after_sequence: int = 0,
+        page_size: int = 500,
+    ) -> AsyncIterator[StoredEvent]:
+        """
+        Stream every matching event in sequence order.
+
+        Reads pages with ``WHERE sequence > last ORDER BY sequence LIMIT
+        page_size``: memory stays bounded whatever the history size, and no
+        pool connection is held between pages. Domain events are not
+        deserialized here (see ``deserialize_event``).
+        """
+        last_sequence = after_sequence
+        while True:
+            page = await self.get_events(
+                aggregate_id=aggregate_id,
+                aggregate_type=aggregate_type,
+                event_type=event_type,
+                tenant_id=tenant_id,
+                from_date=from_date,
+                to_date=to_date,
+                limit=page_size,
+                after_sequence=last_sequence,
+            )
+            for stored_event in page:
+                yield stored_event
+            if len(page) < page_size:
+                return
+            last_sequence = page[-1].sequence
+
     async def replay_events(
         self,
         event_handlers: Dict[str, Callable],
@@ -514,42 +807,70 @@ class AsyncEventStore:
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
         batch_size: int = 100,
+        concurrency: int = 1,
+        after_sequence: int = 0,
     ) -> int:
-        """Replay events through handlers for debugging or analytics."""
+        """
+        Replay events through handlers for debugging or analytics.
+
+        The full history is streamed in pages of ``batch_size``. With
+        ``concurrency > 1`` events are spread over that many workers by
+        aggregate: one aggregate's events are always replayed in order by
+        the same worker, different aggregates run in parallel.
+        """
         start_time = time.perf_counter()
         total_replayed = 0
 
+        async def replay(stored_event: StoredEvent) -> None:
+            nonlocal total_replayed
+            handler = event_handlers.get(stored_event.metadata.event_type)
+            if not handler:
+                return
+            try:
+                event = await self._deserialize_event(stored_event)
+                await handler(event)
+                total_replayed += 1
+            except Exception as e:
+                print(f"Failed to replay event {stored_event.metadata.event_id}: {e}")
+
+        async def worker(queue: asyncio.Queue) -> None:
+            while True:
+                stored_event = await queue.get()
+                if stored_event is None:
+                    return
+                await replay(stored_event)
+
         try:
-            # Get events to replay
-            events = await self.get_events(
+            events = self.stream_events(
                 aggregate_id=aggregate_id,
                 from_date=from_date,
                 to_date=to_date,
-                limit=10000,  # Large limit for replay
+                after_sequence=after_sequence,
+                page_size=batch_size,
             )
 
-            # Process events in batches
-            for i in range(0, len(events), batch_size):
-                batch = events[i : i + batch_size]
-
-                for stored_event in batch:
-                    # Update event status to replaying
-                    stored_event.metadata.status = EventStatus.REPLAYING
-
-                    try:
-                        # Find appropriate handler
-                        handler = event_handlers.get(stored_event.metadata.event_type)
-                        if handler:
-                            # Deserialize and replay event
-                            event = await self._deserialize_event(stored_event)
-                            await handler(event)
-                            total_replayed += 1
-
-                    except Exception as e:
-                        print(
-                            f"Failed to replay event {stored_event.metadata.event_id}: {e}"
+            if concurrency <= 1:
+                async for stored_event in events:
+                    await replay(stored_event)
+            else:
+                # Bounded queues: reading pauses when workers fall behind
+                queues = [asyncio.Queue(maxsize=batch_size) for _ in range(concurrency)]
+                workers = [asyncio.create_task(worker(queue)) for queue in queues]
+                try:
+                    async for stored_event in events:
+                        metadata = stored_event.metadata
+                        key = (
+                            (metadata.aggregate_type, metadata.aggregate_id)
+                            if metadata.aggregate_id
+                            else metadata.event_id
                         )
-                        continue
+                        await queues[hash(key) % concurrency].put(stored_event)
+                    for queue in queues:
+                        await queue.put(None)
+                    await asyncio.gather(*workers)
+                finally:
+                    for task in workers:
+                        task.cancel()
 
             # Record metrics
             replay_time_ms = (time.perf_counter() - start_time) * 1000
@@ -560,6 +881,141 @@ class AsyncEventStore:
         except Exception as e:
             raise EventReplayError(f"Failed to replay events: {str(e)}") from e
 
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener()`` after each commit of new events (push dispatch)."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """Stop notifying ``listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def register_event_type(self, event_type: Type[Event]) -> None:
+        """Make ``event_type`` known for deserialization of stored events."""
+        self._event_types[event_type.__name__] = event_type
+
+    def resolve_event_type(self, name: str) -> Optional[Type[Event]]:
+        """Registered event class, else a loaded ``Event`` subclass of that name."""
+        event_type = self._event_types.get(name)
+        if event_type is None:
+            pending = list(Event.__subclasses__())
+            while pending:
+                candidate = pending.pop()
+                if candidate.__name__ == name:
+                    self._event_types[name] = event_type = candidate
+                    break
+                pending.extend(candidate.__subclasses__())
+        return event_type
+
+    async def read_after(self, sequence: int, limit: int = 100) -> List[StoredEvent]:
+        """Events stored after ``sequence``, oldest first, at most ``limit``."""
+        query = """
+        SELECT * FROM event_store
+        WHERE sequence > ?
+        ORDER BY sequence
+        LIMIT ?
+        """
+        async with self._db_manager.get_connection() as conn:
+            rows = await conn.fetchall(query, (sequence, limit))
+            return [await self._deserialize_stored_event(row) for row in rows]
+
+    async def load_checkpoint(self, consumer: str) -> int:
+        """Last sequence handled by ``consumer`` (0 when it never ran)."""
+        query = "SELECT sequence FROM event_checkpoints WHERE consumer = ?"
+        async with self._db_manager.get_connection() as conn:
+            row = await conn.fetchone(query, (consumer,))
+            return row["sequence"] if row else 0
+
+    async def save_checkpoint(self, consumer: str, sequence: int) -> None:
+        """Durably record that ``consumer`` has handled up to ``sequence``."""
+        query = """
+        INSERT INTO event_checkpoints (consumer, sequence, updated_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(consumer) DO UPDATE SET
+            sequence = excluded.sequence, updated_at = excluded.updated_at
+        """
+        async with self._db_manager.get_connection() as conn:
+            await conn.execute(query, (consumer, sequence, datetime.now()))
+            await conn.commit()
+
+    async def deserialize_event(self, stored_event: StoredEvent) -> Optional[Event]:
+        """Domain event of ``stored_event``, None when its type is unknown."""
+        event_type = self.resolve_event_type(stored_event.metadata.event_type)
+        if event_type is None:
+            return None
+        if stored_event.serialized_event:
+            return self._serializer.deserialize(
+                stored_event.serialized_event, event_type
+            )
+        try:
+            return event_type(**stored_event.event_data)
+        except Exception as e:
+            raise EventSerializationError(
+                f"Failed to deserialize event: {str(e)}"
+            ) from e
+
+    async def train_dictionary(
+        self, sample_size: int = 1000, dictionary_size: int = 8 * 1024
+    ) -> Optional[int]:
+        """
+        Train a compression dictionary on the latest ``sample_size`` events.
+
+        The dictionary is stored and used for events written from now on;
+        earlier payloads keep referencing the dictionary they were written
+        with. Returns its id, None when there is nothing to learn from.
+        """
+        if self._codec.compression == "none":
+            return None
+        query = "SELECT * FROM event_store ORDER BY sequence DESC LIMIT ?"
+        async with self._db_manager.get_connection() as conn:
+            rows = await conn.fetchall(query, (sample_size,))
+            samples = [
+                (await self._deserialize_stored_event(row)).event_data for row in rows
+            ]
+            if not samples:
+                return None
+            dictionary = self._codec.train_dictionary(samples, dictionary_size)
+            cursor = await conn.execute(
+                """
+                INSERT INTO event_dictionaries (
+                    compression, data, sample_count, created_at
+                ) VALUES (?, ?, ?, ?)
+                """,
+                (self._codec.compression, dictionary, len(samples), datetime.now()),
+            )
+            await conn.commit()
+
+        dictionary_id = cursor.lastrowid
+        self._codec.add_dictionary(dictionary_id, dictionary, self._codec.compression)
+        return dictionary_id
+
+    def register_snapshotter(
+        self, aggregate_type: str, snapshotter: IAggregateSnapshotter
+    ) -> None:
+        """Snapshot and rehydrate ``aggregate_type`` aggregates with ``snapshotter``."""
+        self._snapshotters[aggregate_type] = snapshotter
+
+    async def load_aggregate(self, aggregate_id: str, aggregate_type: str) -> Any:
+        """
+        Current state of an aggregate, None when it has no events.
+
+        Starts from the latest snapshot and applies only the events stored
+        after it, read by aggregate version: the cost is bounded by
+        ``snapshot_frequency``, not by the aggregate's history.
+        """
+        snapshotter = self._snapshotters.get(aggregate_type)
+        if snapshotter is None:
+            raise EventStoreError(f"No snapshotter registered for {aggregate_type}")
+        try:
+            _, aggregate, _, _ = await self._rehydrate(
+                snapshotter, aggregate_id, aggregate_type
+            )
+            return aggregate
+        except Exception as e:
+            raise EventStoreError(
+                f"Failed to load aggregate {aggregate_id}: {str(e)}"
+            ) from e
+
     async def create_snapshot(
         self,
         aggregate_id: str,
@@ -568,13 +1024,18 @@ class AsyncEventStore:
         event_count: int,
         last_event_id: str,
     ) -> str:
-        """Create aggregate snapshot for performance optimization."""
+        """
+        Create aggregate snapshot for performance optimization.
+
+        ``event_count`` is the aggregate version the snapshot reflects: events
+        with a higher version are replayed on top of it.
+        """
         try:
             snapshot = EventSnapshot(
                 snapshot_id=str(uuid.uuid4()),
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                snapshot_version=1,
+                snapshot_version=event_count,
                 event_count=event_count,
                 snapshot_data=snapshot_data,
                 created_at=datetime.now(),
@@ -655,7 +1116,7 @@ class AsyncEventStore:
 
             # Find events that need anonymization
             query = """
-            SELECT event_id, event_data FROM event_store
+            SELECT event_id, event_data, payload FROM event_store
             WHERE contains_pii = 1
             AND anonymize_after_days IS NOT NULL
             AND datetime(created_at, '+' || anonymize_after_days || ' days') <= ?
@@ -667,25 +1128,46 @@ class AsyncEventStore:
 
                 for row in rows:
                     try:
-                        # Anonymize PII in event data
-                        event_data = json.loads(row["event_data"])
-                        anonymized_data = await self._anonymize_pii(event_data)
-
-                        # Update event with anonymized data
-                        update_query = """
-                        UPDATE event_store
-                        SET event_data = ?, status = 'anonymized', processed_at = ?
-                        WHERE event_id = ?
-                        """
-
-                        await conn.execute(
-                            update_query,
-                            (
+                        payload = row["payload"]
+                        if payload is not None:
+                            # Re-encode the payload, its only copy
+                            if self._enable_encryption:
+                                payload = await self._decrypt_data(payload)
+                            anonymized_data = await self._anonymize_pii(
+                                self._codec.decode(payload)
+                            )
+                            payload = self._codec.encode(anonymized_data)
+                            if self._enable_encryption:
+                                payload = await self._encrypt_data(payload)
+                            update_query = """
+                            UPDATE event_store
+                            SET payload = ?, checksum = ?, status = 'anonymized',
+                                processed_at = ?
+                            WHERE event_id = ?
+                            """
+                            params = (
+                                payload,
+                                self._codec.checksum(payload),
+                                datetime.now(),
+                                row["event_id"],
+                            )
+                        else:
+                            # Anonymize PII in event data
+                            event_data = json.loads(row["event_data"])
+                            anonymized_data = await self._anonymize_pii(event_data)
+                            update_query = """
+                            UPDATE event_store
+                            SET event_data = ?, status = 'anonymized', processed_at = ?
+                            WHERE event_id = ?
+                            """
+                            params = (
                                 json.dumps(anonymized_data),
                                 datetime.now(),
                                 row["event_id"],
-                            ),
-                        )
+                            )
+
+                        # Update event with anonymized data
+                        await conn.execute(update_query, params)
 
                         anonymized_count += 1
 
@@ -728,19 +1210,33 @@ class AsyncEventStore:
 
     async def _persist_event(self, stored_event: StoredEvent) -> None:
         """Persist single event to database."""
-        query = """
-        INSERT INTO event_store (
-            event_id, event_type, event_version, aggregate_id, aggregate_type,
-            tenant_id, user_id, correlation_id, causation_id, event_data,
-            serialized_event, checksum, status, priority, retry_count,
-            max_retries, contains_pii, retention_days, anonymize_after_days,
-            processing_time_ms, compressed, created_at, processed_at,
-            source_system, environment, request_id, session_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        async with self._db_manager.get_transaction() as transaction:
+            await self._insert_events(transaction.connection, [stored_event])
+        self._notify_listeners()
+
+    async def _insert_events(self, conn: Any, events: List[StoredEvent]) -> None:
+        """
+        Insert ``events`` with one executemany inside the caller's transaction.
+
+        A block of sequences is reserved from the counter row first; the
+        write lock it takes keeps concurrent writers' blocks disjoint.
+        Each aggregate's version counter is then bumped by its number of
+        events, so versions are assigned without scanning its history.
         """
+        await conn.execute(_RESERVE_SEQUENCE_SQL, (len(events),))
+        row = await conn.fetchone(_CURRENT_SEQUENCE_SQL)
+        first_sequence = row[0] - len(events) + 1
+        for offset, stored_event in enumerate(events):
+            stored_event.sequence = first_sequence + offset
+        await self._assign_aggregate_versions(conn, events)
+        await conn.executemany(
+            _INSERT_EVENT_SQL, [self._event_row(event) for event in events]
+        )
 
+    def _event_row(self, stored_event: StoredEvent) -> tuple:
+        """Column values of ``stored_event`` in ``_INSERT_EVENT_SQL`` order."""
         metadata = stored_event.metadata
-        params = (
+        return (
             metadata.event_id,
             metadata.event_type,
             metadata.event_version,
@@ -750,7 +1246,10 @@ class AsyncEventStore:
             metadata.user_id,
             metadata.correlation_id,
             metadata.causation_id,
-            json.dumps(stored_event.event_data, default=str),
+            # event_data lives in the payload only
+            ""
+            if stored_event.payload is not None
+            else json.dumps(stored_event.event_data, default=str),
             stored_event.serialized_event,
             stored_event.checksum,
             metadata.status.value,
@@ -768,126 +1267,336 @@ class AsyncEventStore:
             metadata.environment,
             metadata.request_id,
             metadata.session_id,
+            stored_event.sequence,
+            stored_event.aggregate_version,
+            stored_event.payload,
         )
 
-        async with self._db_manager.get_connection() as conn:
-            await conn.execute(query, params)
-            await conn.commit()
+    async def _assign_aggregate_versions(
+        self, conn: Any, events: List[StoredEvent]
+    ) -> None:
+        """Bump version counters and number ``events`` within their aggregates."""
+        counts: Dict[Tuple[str, str], int] = {}
+        for stored_event in events:
+            if stored_event.metadata.aggregate_id:
+                key = _aggregate_key(stored_event)
+                counts[key] = counts.get(key, 0) + 1
+        if not counts:
+            return
+
+        await conn.executemany(
+            _BUMP_AGGREGATE_VERSION_SQL,
+            [
+                (aggregate_id, aggregate_type, count)
+                for (aggregate_id, aggregate_type), count in counts.items()
+            ],
+        )
+        # Read back the new counters; the first version of each aggregate's
+        # block is its counter minus its number of events, plus one
+        next_version: Dict[Tuple[str, str], int] = {}
+        keys = list(counts)
+        for start in range(0, len(keys), 400):
+            chunk = keys[start : start + 400]
+            rows = await conn.fetchall(
+                _AGGREGATE_VERSIONS_SQL.format(", ".join(["(?, ?)"] * len(chunk))),
+                [value for key in chunk for value in key],
+            )
+            for row in rows:
+                key = (row["aggregate_id"], row["aggregate_type"])
+                next_version[key] = row["version"] - counts[key] + 1
+
+        for stored_event in events:
+            if stored_event.metadata.aggregate_id:
+                key = _aggregate_key(stored_event)
+                stored_event.aggregate_version = next_version[key]
+                next_version[key] += 1
 
     async def _add_to_batch(self, stored_event: StoredEvent) -> None:
-        """Add event to batch for bulk processing."""
+        """Add event to the pending group and wait for its commit."""
         self._pending_events.append(stored_event)
+        if self._pending_commit is None:
+            self._pending_commit = asyncio.get_running_loop().create_future()
+        commit = self._pending_commit
 
         if len(self._pending_events) >= self._batch_size:
-            await self._flush_batch()
+            self._start_flush()
         elif self._batch_timer is None:
             self._batch_timer = asyncio.create_task(self._batch_timeout_handler())
 
-    async def _flush_batch(self) -> None:
-        """Flush pending events batch to database."""
+        # Shielded: a cancelled caller must not cancel the others' commit
+        await asyncio.shield(commit)
+
+    async def flush(self) -> int:
+        """
+        Commit pending batched events now and wait for every group in flight.
+
+        Returns how many pending events were written. Groups already handed
+        to a commit task (full groups, timeouts) are awaited too, so the
+        database can be closed once ``flush()`` returns.
+        """
+        commit = self._pending_commit
+        self._start_flush()
+        if self._flush_tasks:
+            # Outcomes reach the waiters through each group's future
+            await asyncio.shield(
+                asyncio.gather(*self._flush_tasks, return_exceptions=True)
+            )
+        return await asyncio.shield(commit) if commit is not None else 0
+
+    def _start_flush(self) -> None:
+        """
+        Detach the pending group and commit it in a task of its own.
+
+        The group is detached before returning, so events stored while a
+        commit is in flight form the next group. The commit never runs in
+        a caller's task: cancelling whoever filled the group cannot abort
+        it halfway and leave the other waiters hanging.
+        """
         if not self._pending_events:
             return
 
-        try:
-            # Batch insert all pending events
-            async with self._db_manager.get_transaction():
-                for event in self._pending_events:
-                    await self._persist_event(event)
+        events, commit = self._pending_events, self._pending_commit
+        self._pending_events, self._pending_commit = [], None
+        timer, self._batch_timer = self._batch_timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
 
-            self._pending_events.clear()
+        task = asyncio.create_task(self._write_batch(events, commit))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
 
-            if self._batch_timer:
-                self._batch_timer.cancel()
-                self._batch_timer = None
+    async def _write_batch(
+        self, events: List[StoredEvent], commit: Optional[asyncio.Future]
+    ) -> None:
+        """
+        Write one group with one executemany in one transaction.
 
+        Writes are serialised to keep commits in arrival order. Waiters
+        receive the outcome through the group's future, which is resolved
+        whatever happens, cancellation included; failed events go to the
+        dead letter queue.
+        """
+        async with self._flush_lock:
+            start_time = time.perf_counter()
+            try:
+                async with self._db_manager.get_transaction() as transaction:
+                    await self._insert_events(transaction.connection, events)
+            except BaseException as e:
+                reason = str(e) or type(e).__name__
+                if commit is not None and not commit.done():
+                    commit.set_exception(
+                        EventStoreError(
+                            f"Batch of {len(events)} events failed: {reason}"
+                        )
+                    )
+                for event in events:
+                    await self._move_to_dead_letter(event, reason)
+                if not isinstance(e, Exception):
+                    raise
+                return
+
+            commit_latency_ms = (time.perf_counter() - start_time) * 1000
+            self._metrics.record_batch_committed(len(events), commit_latency_ms)
+            if commit is not None and not commit.done():
+                commit.set_result(len(events))
+        self._notify_listeners()
+
+    async def _maybe_train_dictionary(self, stored_event: StoredEvent) -> None:
+        """Train the first dictionary once enough events are stored."""
+        threshold = self._dictionary_training_threshold
+        if (
+            not threshold
+            or self._training_dictionary
+            or (stored_event.sequence or 0) < threshold
+        ):
+            return
+        self._training_dictionary = True
+        try:
+            await self.train_dictionary(sample_size=threshold)
         except Exception as e:
-            # Move failed events to dead letter queue
-            for event in self._pending_events:
-                await self._move_to_dead_letter(event, str(e))
+            print(f"Failed to train compression dictionary: {e}")
+        finally:
+            self._training_dictionary = False
 
-            self._pending_events.clear()
-            raise
+    def _notify_listeners(self) -> None:
+        """Wake push consumers; listeners must not block."""
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Event store listener failed: {e}")
 
     async def _batch_timeout_handler(self) -> None:
         """Handle batch timeout by flushing pending events."""
         try:
             await asyncio.sleep(self._batch_timeout)
-            await self._flush_batch()
         except asyncio.CancelledError:
-            pass
+            return
+        self._start_flush()
 
-    async def _maybe_create_snapshot(
-        self, aggregate_id: str, aggregate_type: str
-    ) -> None:
-        """Create snapshot if event count threshold is reached."""
-        if not self._enable_snapshots:
+    async def _maybe_create_snapshot(self, stored_event: StoredEvent) -> None:
+        """
+        Snapshot the event's aggregate every ``snapshot_frequency`` versions.
+
+        Only aggregate types with a registered snapshotter are snapshotted.
+        Failures are logged, never raised: the event itself is already stored.
+        """
+        metadata = stored_event.metadata
+        version = stored_event.aggregate_version
+        snapshotter = self._snapshotters.get(metadata.aggregate_type)
+        if (
+            not self._enable_snapshots
+            or snapshotter is None
+            or not version
+            or version % self._snapshot_frequency
+        ):
             return
 
-        # Count events for this aggregate
-        query = "SELECT COUNT(*) FROM event_store WHERE aggregate_id = ? AND aggregate_type = ?"
+        try:
+            snapshot, aggregate, version, last_event_id = await self._rehydrate(
+                snapshotter, metadata.aggregate_id, metadata.aggregate_type
+            )
+            if aggregate is None or (
+                snapshot is not None and snapshot.snapshot_version >= version
+            ):
+                return
+            await self.create_snapshot(
+                aggregate_id=metadata.aggregate_id,
+                aggregate_type=metadata.aggregate_type,
+                snapshot_data={
+                    "schema_version": snapshotter.schema_version,
+                    "state": snapshotter.to_snapshot(aggregate),
+                },
+                event_count=version,
+                last_event_id=last_event_id,
+            )
+        except Exception as e:
+            print(f"Failed to snapshot aggregate {metadata.aggregate_id}: {e}")
 
-        async with self._db_manager.get_connection() as conn:
-            count = await conn.execute_scalar(query, (aggregate_id, aggregate_type))
+    async def _rehydrate(
+        self,
+        snapshotter: IAggregateSnapshotter,
+        aggregate_id: str,
+        aggregate_type: str,
+    ) -> Tuple[Optional[EventSnapshot], Any, int, Optional[str]]:
+        """
+        Latest usable snapshot, then the aggregate, version and last event id
+        after applying the events stored since that snapshot.
+        """
+        snapshot = await self.get_latest_snapshot(aggregate_id, aggregate_type)
+        if snapshot is not None and not self._is_usable_snapshot(snapshot, snapshotter):
+            snapshot = None
+
+        if snapshot is None:
+            aggregate, version, last_event_id = None, 0, None
+        else:
+            aggregate = snapshotter.from_snapshot(snapshot.snapshot_data["state"])
+            version = snapshot.snapshot_version
+            last_event_id = snapshot.last_event_id
+
+        async for stored_event in self._stream_aggregate(
+            aggregate_id, aggregate_type, after_version=version
+        ):
+            aggregate = snapshotter.apply(aggregate, stored_event)
+            version = stored_event.aggregate_version
+            last_event_id = stored_event.metadata.event_id
+
+        return snapshot, aggregate, version, last_event_id
+
+    def _is_usable_snapshot(
+        self, snapshot: EventSnapshot, snapshotter: IAggregateSnapshotter
+    ) -> bool:
+        """Snapshot written by this snapshotter layout and not corrupted."""
+        data = snapshot.snapshot_data
+        return (
+            data.get("schema_version") == snapshotter.schema_version
+            and "state" in data
+            and snapshot.checksum
+            == self._calculate_checksum(json.dumps(data, default=str))
+        )
 
-            if count and count % self._snapshot_frequency == 0:
-                # Get latest snapshot
-                latest_snapshot = await self.get_latest_snapshot(
-                    aggregate_id, aggregate_type
+    async def _stream_aggregate(
+        self,
+        aggregate_id: str,
+        aggregate_type: str,
+        after_version: int = 0,
+        page_size: int = 500,
+    ) -> AsyncIterator[StoredEvent]:
+        """One aggregate's events after ``after_version``, in version order."""
+        while True:
+            async with self._db_manager.get_connection() as conn:
+                rows = await conn.fetchall(
+                    _AGGREGATE_TAIL_SQL,
+                    (aggregate_id, aggregate_type, after_version, page_size),
                 )
+                page = [await self._deserialize_stored_event(row) for row in rows]
+            for stored_event in page:
+                yield stored_event
+            if len(page) < page_size:
+                return
+            after_version = page[-1].aggregate_version
+
+    async def dead_letter(self, stored_event: StoredEvent, failure_reason: str) -> None:
+        """
+        Record ``stored_event`` in the dead letter queue.
 
-                # Only create if we don't have a recent snapshot
-                if (
-                    not latest_snapshot
-                    or (count - latest_snapshot.event_count) >= self._snapshot_frequency
-                ):
-                    # This would require aggregate reconstruction logic
-                    # Placeholder for actual snapshot creation
-                    snapshot_data = {"placeholder": "snapshot_data"}
-
-                    await self.create_snapshot(
-                        aggregate_id=aggregate_id,
-                        aggregate_type=aggregate_type,
-                        snapshot_data=snapshot_data,
-                        event_count=count,
-                        last_event_id=str(uuid.uuid4()),
-                    )
+        Events whose payload cannot be decoded are recorded with the raw
+        payload (base64) and the decode error. Raises when the write fails,
+        so that callers about to move past the event (consumer checkpoints)
+        can retry instead of losing it.
+        """
+        query = """
+        INSERT OR REPLACE INTO event_dead_letters (
+            event_id, original_event, failure_reason, failure_count,
+            first_failed_at, last_failed_at, created_at
+        ) VALUES (?, ?, ?,
+            COALESCE((SELECT failure_count FROM event_dead_letters WHERE event_id = ?), 0) + 1,
+            COALESCE((SELECT first_failed_at FROM event_dead_letters WHERE event_id = ?), ?),
+            ?, ?
+        )
+        """
 
-    async def _move_to_dead_letter(
-        self, stored_event: StoredEvent, failure_reason: str
-    ) -> None:
-        """Move failed event to dead letter queue."""
+        now = datetime.now()
         try:
-            query = """
-            INSERT OR REPLACE INTO event_dead_letters (
-                event_id, original_event, failure_reason, failure_count,
-                first_failed_at, last_failed_at, created_at
-            ) VALUES (?, ?, ?,
-                COALESCE((SELECT failure_count FROM event_dead_letters WHERE event_id = ?), 0) + 1,
-                COALESCE((SELECT first_failed_at FROM event_dead_letters WHERE event_id = ?), ?),
-                ?, ?
-            )
-            """
-
-            now = datetime.now()
             original_event = json.dumps(stored_event.event_data, default=str)
-
-            params = (
-                stored_event.metadata.event_id,
-                original_event,
-                failure_reason,
-                stored_event.metadata.event_id,
-                stored_event.metadata.event_id,
-                now,
-                now,
-                now,
+        except Exception as e:
+            # Payload that cannot be decoded: keep the raw stored bytes
+            import base64
+
+            payload = stored_event.payload
+            original_event = json.dumps(
+                {
+                    "decode_error": str(e),
+                    "payload": base64.b64encode(payload).decode("ascii")
+                    if payload is not None
+                    else None,
+                    "serialized_event": stored_event.serialized_event,
+                }
             )
 
-            async with self._db_manager.get_connection() as conn:
-                await conn.execute(query, params)
-                await conn.commit()
+        params = (
+            stored_event.metadata.event_id,
+            original_event,
+            failure_reason,
+            stored_event.metadata.event_id,
+            stored_event.metadata.event_id,
+            now,
+            now,
+            now,
+        )
+
+        async with self._db_manager.get_connection() as conn:
+            await conn.execute(query, params)
+            await conn.commit()
 
-            self._metrics.record_dead_letter()
+        self._metrics.record_dead_letter()
 
+    async def _move_to_dead_letter(
+        self, stored_event: StoredEvent, failure_reason: str
+    ) -> None:
+        """Move failed event to dead letter queue."""
+        try:
+            await self.dead_letter(stored_event, failure_reason)
         except Exception as e:
             print(f"Failed to move event to dead letter queue: {e}")
 
@@ -921,28 +1630,42 @@ class AsyncEventStore:
             session_id=row["session_id"],
         )
 
-        # Decrypt and decompress if needed
+        # event_data is decoded on first access only
+        payload = row["payload"]
+        if payload is not None:
+            if self._enable_encryption:
+                payload = await self._decrypt_data(payload)
+            event_data = functools.partial(self._codec.decode, payload)
+        else:
+            event_data = functools.partial(json.loads, row["event_data"])
+
+        # Decrypt and decompress if needed (rows written before the codec)
         serialized_event = row["serialized_event"]
-        if self._enable_encryption:
-            serialized_event = await self._decrypt_data(serialized_event)
-        if row["compressed"]:
-            serialized_event = await self._decompress_data(serialized_event)
+        if serialized_event and payload is None:
+            if self._enable_encryption:
+                serialized_event = await self._decrypt_data(serialized_event)
+            if row["compressed"]:
+                serialized_event = await self._decompress_data(serialized_event)
 
         return StoredEvent(
             metadata=metadata,
-            event_data=json.loads(row["event_data"]),
+            event_data=event_data,
             serialized_event=serialized_event,
             checksum=row["checksum"],
             compressed=row["compressed"],
+            sequence=row["sequence"],
+            aggregate_version=row["aggregate_version"],
+            payload=row["payload"],
         )
 
     async def _deserialize_event(self, stored_event: StoredEvent) -> Event:
         """Deserialize stored event back to domain event."""
-        # This would require event type registry for proper deserialization
-        # Placeholder implementation
-        from core.events import Event
-
-        return Event()
+        event = await self.deserialize_event(stored_event)
+        if event is None:
+            raise EventSerializationError(
+                f"Unknown event type: {stored_event.metadata.event_type}"
+            )
+        return event
 
     def _calculate_checksum(self, data: str) -> str:
         """Calculate checksum for data integrity."""
@@ -950,28 +1673,20 @@ class AsyncEventStore:
 
         return hashlib.sha256(data.encode()).hexdigest()
 
-    async def _compress_data(self, data: str) -> str:
-        """Compress data for storage optimization."""
-        import base64
-        import gzip
-
-        compressed = gzip.compress(data.encode("utf-8"))
-        return base64.b64encode(compressed).decode("ascii")
-
     async def _decompress_data(self, data: str) -> str:
-        """Decompress stored data."""
+        """Decompress serialized events written before the payload codec."""
         import base64
         import gzip
 
         compressed = base64.b64decode(data.encode("ascii"))
         return gzip.decompress(compressed).decode("utf-8")
 
-    async def _encrypt_data(self, data: str) -> str:
+    async def _encrypt_data(self, data: Union[str, bytes]) -> Union[str, bytes]:
         """Encrypt sensitive data."""
         # Placeholder for encryption implementation
         return data
 
-    async def _decrypt_data(self, data: str) -> str:
+    async def _decrypt_data(self, data: Union[str, bytes]) -> Union[str, bytes]:
         """Decrypt sensitive data."""
         # Placeholder for decryption implementation
         return data
@@ -1019,3 +1734,9 @@ class AsyncEventStore:
     def get_metrics(self) -> EventStoreMetrics:
         """Get event store performance metrics."""
         return self._metrics
+
+
+def _aggregate_key(stored_event: StoredEvent) -> Tuple[str, str]:
+    """Key of the event's aggregate in the version counter table."""
+    metadata = stored_event.metadata
+    return (metadata.aggregate_id, metadata.aggregate_type or "")
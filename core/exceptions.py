@@ -394,6 +394,97 @@ class ConfigurationError(CoachProException):
         self.setting_name = setting_name
 
 
+class EventStoreError(CoachProException):
+    """Exception for event store persistence and retrieval errors."""
+
+    def __init__(
+        self,
+        message: str,
+        error_code: str = "EVENT_STORE_ERROR",
+        context: Optional[ErrorContext] = None,
+        inner_exception: Optional[Exception] = None,
+    ):
+        super().__init__(
+            message=message,
+            error_code=error_code,
+            category=ErrorCategory.DATABASE,
+            severity=ErrorSeverity.HIGH,
+            context=context,
+            inner_exception=inner_exception,
+            recoverable=True,
+        )
+
+
+class EventReplayError(EventStoreError):
+    """Exception raised when replaying stored events fails."""
+
+    def __init__(
+        self,
+        message: str,
+        error_code: str = "EVENT_REPLAY_ERROR",
+        context: Optional[ErrorContext] = None,
+        inner_exception: Optional[Exception] = None,
+    ):
+        super().__init__(message, error_code, context, inner_exception)
+
+
+class EventSerializationError(EventStoreError):
+    """Exception for events or payloads that cannot be (de)serialized."""
+
+    def __init__(
+        self,
+        message: str,
+        error_code: str = "EVENT_SERIALIZATION_ERROR",
+        context: Optional[ErrorContext] = None,
+        inner_exception: Optional[Exception] = None,
+    ):
+        super().__init__(message, error_code, context, inner_exception)
+        self.recoverable = False
+
+
+class EventHandlerError(CoachProException):
+    """Exception for event handlers that fail to process an event."""
+
+    def __init__(
+        self,
+        message: str,
+        error_code: str = "EVENT_HANDLER_ERROR",
+        context: Optional[ErrorContext] = None,
+        inner_exception: Optional[Exception] = None,
+    ):
+        super().__init__(
+            message=message,
+            error_code=error_code,
+            category=ErrorCategory.SYSTEM,
+            severity=ErrorSeverity.MEDIUM,
+            context=context,
+            inner_exception=inner_exception,
+            recoverable=True,
+        )
+
+
+class BackpressureError(EventHandlerError):
+    """Exception raised when a handler is too loaded to accept an event."""
+
+    def __init__(self, message: str, context: Optional[ErrorContext] = None):
+        super().__init__(message, "EVENT_HANDLER_BACKPRESSURE", context)
+
+
+class CircuitBreakerOpenError(EventHandlerError):
+    """Exception raised when a handler's circuit breaker rejects a call."""
+
+    def __init__(self, message: str, context: Optional[ErrorContext] = None):
+        super().__init__(message, "EVENT_HANDLER_CIRCUIT_OPEN", context)
+
+
+class EventOrderingError(EventHandlerError):
+    """Exception for events delivered out of their aggregate order."""
+
+    def __init__(self, message: str, context: Optional[ErrorContext] = None):
+        super().__init__(message, "EVENT_ORDERING_ERROR", context)
+        self.recoverable = False
+
+
 # Exception Handlers and Utilities
 class ExceptionHandler:
     """Central exception handler with logging and recovery."""
@@ -340,17 +340,9 @@ class BaseStrategy(ABC, Generic[T]):
     def _get_cache_key(self, context: StrategyContext[T]) -> str:
         """Generate cache key for context"""
         # Simple implementation - override for custom caching logic
-        import hashlib
+        from utils.fingerprint import fingerprint
 
-        cache_data = {
-            "strategy": self.name,
-            "version": self.version,
-            "data": str(context.data),
-            "metadata": context.metadata,
-        }
-
-        cache_string = str(sorted(cache_data.items()))
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        return fingerprint(self.name, self.version, context.data, context.metadata)
 
     def _get_from_cache(self, cache_key: str) -> Optional[StrategyResult[T]]:
         """Get result from cache"""
@@ -487,16 +487,9 @@ class FallbackManager(Generic[T]):
 
     def _get_cache_key(self, context: StrategyContext[T]) -> str:
         """Generate cache key for context"""
-        import hashlib
+        from utils.fingerprint import fingerprint
 
-        cache_data = {
-            "data": str(context.data),
-            "user_id": context.user_id,
-            "metadata": str(sorted(context.metadata.items())),
-        }
-
-        cache_string = str(sorted(cache_data.items()))
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        return fingerprint(context.data, context.user_id, context.metadata)
 
     def _cache_result(self, context: StrategyContext[T], result: StrategyResult[T]):
         """Cache strategy result"""
@@ -1,16 +1,446 @@
+"""
+Sync SQLite connection management.
+
+Every sync repository goes through ``db_manager.get_connection()``. Connections
+are drawn from a bounded, thread-safe pool, configured once with the
+performance PRAGMAs when they are opened, and handed back to the pool when the
+``with`` block (or an explicit ``close()``) ends. Statements run through the
+pooled connection are timed and aggregated per fingerprint in ``QueryStats``.
+"""
+
+from __future__ import annotations
+
+import atexit
 import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from db.query_stats import QueryStats
 
 DB_PATH = "coach.db"
 
 
-class DatabaseManager:
-    def __init__(self, db_path: str) -> None:
-        self.db_path = db_path
+@dataclass
+class PoolConfig:
+    """Connection pool settings."""
+
+    max_connections: int = 8
+    checkout_timeout: float = 30.0
+    busy_timeout_ms: int = 5000
+    enable_wal_mode: bool = True
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 16384
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store_memory: bool = True
+    cached_statements: int = 256
+    enable_query_stats: bool = True
+    max_fingerprints: int = 500
+    latency_samples: int = 512
+
+
+@dataclass
+class PoolMetrics:
+    """Pool-level counters."""
+
+    checkouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    timeouts: int = 0
+    connections_created: int = 0
+    connections_closed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["avg_wait_ms"] = (
+            self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+        )
+        return data
+
+
+class PoolExhaustedError(sqlite3.OperationalError):
+    """Raised when no connection could be checked out before the timeout."""
+
+
+class InstrumentedCursor:
+    """
+    ``sqlite3.Cursor`` wrapper that times statements and counts fetched rows.
+
+    A SELECT is recorded once its result set is exhausted (or the cursor is
+    re-executed, closed or returned with its connection), so the latency
+    includes the stepping done by ``fetch*``.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+        self._sql: Optional[str] = None
+        self._elapsed_ms = 0.0
+        self._rows = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    @property
+    def pending(self) -> bool:
+        return self._sql is not None
+
+    def flush(self) -> None:
+        """Record the current statement, if any."""
+        if self._sql is None:
+            return
+        self._stats.record(self._sql, self._elapsed_ms, self._rows)
+        self._sql = None
+        self._elapsed_ms = 0.0
+        self._rows = 0
+
+    def _run(self, method, sql: str, parameters) -> InstrumentedCursor:
+        self.flush()
+        self._rows = 0
+        start = time.perf_counter()
+        try:
+            method(sql, parameters)
+        except Exception:
+            elapsed = (time.perf_counter() - start) * 1000
+            self._stats.record(sql, elapsed, error=True)
+            raise
+        self._sql = sql
+        self._elapsed_ms = (time.perf_counter() - start) * 1000
+        if self._cursor.description is None:
+            self._rows = max(self._cursor.rowcount, 0)
+            self.flush()
+        return self
+
+    def execute(self, sql: str, parameters: Any = ()) -> InstrumentedCursor:
+        return self._run(self._cursor.execute, sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> InstrumentedCursor:
+        return self._run(self._cursor.executemany, sql, seq_of_parameters)
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._elapsed_ms += (time.perf_counter() - start) * 1000
+        if row is None:
+            self.flush()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size or self._cursor.arraysize)
+        self._elapsed_ms += (time.perf_counter() - start) * 1000
+        self._rows += len(rows)
+        if len(rows) < (size or self._cursor.arraysize):
+            self.flush()
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._elapsed_ms += (time.perf_counter() - start) * 1000
+        self._rows += len(rows)
+        self.flush()
+        return rows
+
+    def __iter__(self) -> InstrumentedCursor:
+        return self
+
+    def __next__(self) -> Any:
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self) -> None:
+        self.flush()
+        self._cursor.close()
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled ``sqlite3.Connection``.
+
+    Behaves like the raw connection (``execute``, ``cursor``, ``commit``...),
+    including ``with conn:`` transaction semantics, but returns the underlying
+    connection to the pool on exit instead of leaking it. When the pool has
+    query stats enabled, ``execute``/``executemany``/``cursor`` hand out
+    ``InstrumentedCursor`` objects.
+    """
+
+    def __init__(
+        self, pool: ConnectionPool, connection: sqlite3.Connection, generation: int
+    ):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_generation", generation)
+        object.__setattr__(self, "_cursors", [])
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """Underlying sqlite3 connection."""
+        if self._connection is None:
+            raise sqlite3.ProgrammingError("Connection returned to the pool")
+        return self._connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.raw, name, value)
 
-    def get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def cursor(self, *args: Any) -> Any:
+        cursor = self.raw.cursor(*args)
+        stats = self._pool.query_stats
+        if stats is None:
+            return cursor
+        wrapped = InstrumentedCursor(cursor, stats)
+        if len(self._cursors) >= 32:
+            self._cursors[:] = [c for c in self._cursors if c.pending]
+        self._cursors.append(wrapped)
+        return wrapped
+
+    def execute(self, sql: str, parameters: Any = ()) -> Any:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> Any:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            self.raw.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)."""
+        connection = self._connection
+        if connection is None:
+            return
+        object.__setattr__(self, "_connection", None)
+        for cursor in self._cursors:
+            cursor.flush()
+        self._cursors.clear()
+        self._pool.release(connection, self._generation)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections shared by all threads.
+
+    A connection is only ever used by the thread that checked it out; idle
+    connections are reused LIFO so the most recently used page cache stays hot.
+    """
+
+    def __init__(self, db_path: str, config: Optional[PoolConfig] = None):
+        self.config = config or PoolConfig()
+        self._db_path = db_path
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._open = 0
+        self._generation = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self.metrics = PoolMetrics()
+        self.query_stats: Optional[QueryStats] = (
+            QueryStats(self.config.max_fingerprints, self.config.latency_samples)
+            if self.config.enable_query_stats
+            else None
+        )
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    @db_path.setter
+    def db_path(self, value: str) -> None:
+        """Point the pool at another file; connections to the old one are dropped."""
+        with self._cond:
+            self._db_path = value
+            self._generation += 1
+            stale = list(self._idle)
+            self._idle.clear()
+            self._open -= len(stale)
+            self._cond.notify_all()
+        for conn in stale:
+            self._close_connection(conn)
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self.config.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.config.cached_statements,
+        )
         conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        with self._cond:
+            self.metrics.connections_created += 1
         return conn
 
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        cfg = self.config
+        pragmas = [
+            f"PRAGMA busy_timeout={int(cfg.busy_timeout_ms)}",
+            f"PRAGMA synchronous={cfg.synchronous}",
+            f"PRAGMA cache_size=-{int(cfg.cache_size_kib)}",
+            f"PRAGMA mmap_size={int(cfg.mmap_size)}",
+        ]
+        if cfg.enable_wal_mode:
+            pragmas.insert(0, "PRAGMA journal_mode=WAL")
+        if cfg.temp_store_memory:
+            pragmas.append("PRAGMA temp_store=MEMORY")
+        for pragma in pragmas:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error as e:
+                # In-memory or read-only databases reject some of these
+                print(f"WARN: {pragma} non applique: {e}")
+
+    def _close_connection(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        finally:
+            with self._cond:
+                self.metrics.connections_closed += 1
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check a connection out of the pool, waiting up to ``timeout`` seconds."""
+        if timeout is None:
+            timeout = self.config.checkout_timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    generation = self._generation
+                    break
+                if self._open < self.config.max_connections:
+                    self._open += 1
+                    conn = None
+                    generation = self._generation
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self.metrics.timeouts += 1
+                    raise PoolExhaustedError(
+                        f"Database connection pool exhausted "
+                        f"({self.config.max_connections} connections in use)"
+                    )
+                self._cond.wait(remaining)
+
+        if conn is None:
+            try:
+                conn = self._create_connection()
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        with self._cond:
+            self.metrics.checkouts += 1
+            self.metrics.total_wait_ms += wait_ms
+            self.metrics.max_wait_ms = max(self.metrics.max_wait_ms, wait_ms)
+        return PooledConnection(self, conn, generation)
+
+    def release(self, conn: sqlite3.Connection, generation: int) -> None:
+        """Give a connection back; uncommitted work is rolled back."""
+        discard = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            discard = True
+
+        with self._cond:
+            if discard or self._closed or generation != self._generation:
+                self._open -= 1
+                discard = True
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+        if discard:
+            self._close_connection(conn)
+
+    def close_all(self) -> None:
+        """Close idle connections and refuse new checkouts."""
+        with self._cond:
+            self._closed = True
+            self._generation += 1
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_connection(conn)
+
+    def reopen(self) -> None:
+        """Allow checkouts again after ``close_all``."""
+        with self._cond:
+            self._closed = False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            data = self.metrics.to_dict()
+            data.update(
+                {
+                    "open_connections": self._open,
+                    "idle_connections": len(self._idle),
+                    "in_use_connections": self._open - len(self._idle),
+                    "max_connections": self.config.max_connections,
+                }
+            )
+        return data
+
+
+class DatabaseManager:
+    def __init__(self, db_path: str, config: Optional[PoolConfig] = None) -> None:
+        self._pool = ConnectionPool(db_path, config)
+
+    @property
+    def db_path(self) -> str:
+        return self._pool.db_path
+
+    @db_path.setter
+    def db_path(self, value: str) -> None:
+        self._pool.db_path = value
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return self._pool
+
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check out a pooled connection; use it as ``with ... as conn``."""
+        return self._pool.acquire(timeout)
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        return self._pool.get_metrics()
+
+    def get_query_stats(self, limit: int = 20, by: str = "total_ms") -> List[Dict]:
+        """Heaviest query fingerprints (empty when stats are disabled)."""
+        stats = self._pool.query_stats
+        return stats.top(limit, by) if stats else []
+
+    def dump_query_stats(self, path: Optional[str] = None) -> str:
+        """JSON dump of every tracked fingerprint, optionally written to ``path``."""
+        stats = self._pool.query_stats
+        return stats.to_json(path) if stats else "{}"
+
+    def close(self) -> None:
+        self._pool.close_all()
+
 
 db_manager = DatabaseManager(DB_PATH)
+atexit.register(db_manager.close)
@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 from db.database_manager import db_manager
+from db.exercise_fts import ensure_exercise_fts
 from db.seed import create_schema, seed_data
 
 
@@ -125,6 +126,7 @@ def initialize_database() -> None:
             return
 
     # Otherwise, nothing to do
+    _ensure_indexes()
     # Ensure pdf_templates table exists for customizable PDF styles
     try:
         _ensure_pdf_templates_table()
@@ -140,6 +142,45 @@ def initialize_database() -> None:
     return
 
 
+# Indexes backing the eager/batch loaders (plan index names match
+# db/optimize_database.py)
+_INDEXES = {
+    "plans_alimentaires": [
+        "CREATE INDEX IF NOT EXISTS idx_plans_client_id ON plans_alimentaires(client_id)",
+    ],
+    "repas": [
+        "CREATE INDEX IF NOT EXISTS idx_repas_plan_ordre ON repas(plan_id, ordre)",
+    ],
+    "repas_items": [
+        "CREATE INDEX IF NOT EXISTS idx_repas_items_repas_id ON repas_items(repas_id)",
+    ],
+    "sessions": [
+        "CREATE INDEX IF NOT EXISTS idx_sessions_date_creation ON sessions(date_creation)",
+    ],
+    "session_blocks": [
+        "CREATE INDEX IF NOT EXISTS idx_session_blocks_session_id ON session_blocks(session_id)",
+    ],
+    "session_items": [
+        "CREATE INDEX IF NOT EXISTS idx_session_items_block_id ON session_items(block_id)",
+    ],
+}
+
+
+def _ensure_indexes() -> None:
+    with db_manager.get_connection() as conn:
+        for table, statements in _INDEXES.items():
+            if not _table_exists(conn, table):
+                continue
+            for sql in statements:
+                try:
+                    conn.execute(sql)
+                except sqlite3.Error as e:
+                    print(f"WARN: Index non cree sur '{table}': {e}")
+        # Index plein texte des exercices (créé et rempli au premier lancement)
+        if _table_exists(conn, "exercices"):
+            ensure_exercise_fts(conn)
+
+
 def _ensure_pdf_templates_table() -> None:
     with db_manager.get_connection() as conn:
         try:
@@ -0,0 +1,117 @@
+"""
+Index plein texte FTS5 des exercices.
+
+La table virtuelle ``exercices_fts`` est une table à contenu externe
+(``content='exercices'``) : elle ne stocke que l'index, maintenu par des
+triggers sur ``exercices``. La tokenisation ``unicode61 remove_diacritics 2``
+rend la recherche insensible aux accents et à la casse ("halteres" trouve
+"Haltères") et les index de préfixes accélèrent les requêtes ``terme*``.
+"""
+
+import re
+import sqlite3
+from typing import Iterable, List, Optional
+
+FTS_TABLE = "exercices_fts"
+
+# Colonnes indexées, dans l'ordre des poids bm25 ci-dessous
+FTS_COLUMNS = (
+    "nom",
+    "groupe_musculaire_principal",
+    "equipement",
+    "tags",
+    "movement_pattern",
+)
+
+# Le nom pèse le plus, puis le muscle, puis matériel/tags
+BM25_WEIGHTS = (10.0, 4.0, 2.0, 2.0, 1.0)
+
+BM25_RANK = f"bm25({FTS_TABLE}, {', '.join(str(w) for w in BM25_WEIGHTS)})"
+
+# Sous-requête (rowid, score) à joindre sur exercices. bm25() doit être
+# évalué dans la requête FTS elle-même, pas dans une requête fenêtrée.
+RANKED_MATCH = (
+    f"(SELECT rowid, {BM25_RANK} AS score FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?)"
+)
+
+_CREATE_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+    {", ".join(FTS_COLUMNS)},
+    content='exercices',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+_COLS = ", ".join(FTS_COLUMNS)
+_NEW_COLS = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_OLD_COLS = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS exercices_fts_ai AFTER INSERT ON exercices BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW_COLS});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS exercices_fts_ad AFTER DELETE ON exercices BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS exercices_fts_au AFTER UPDATE ON exercices BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+        INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW_COLS});
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ensure_exercise_fts(conn: sqlite3.Connection) -> bool:
+    """Crée l'index et ses triggers s'ils manquent, puis le reconstruit.
+
+    Retourne False si SQLite n'a pas été compilé avec FTS5.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+    ).fetchone()
+    try:
+        conn.execute(_CREATE_SQL)
+        for sql in _TRIGGERS:
+            conn.execute(sql)
+        if not exists:
+            conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    except sqlite3.OperationalError as e:
+        print(f"WARN: Index FTS des exercices non cree: {e}")
+        return False
+    return True
+
+
+def _phrase(text: str, prefix: bool) -> Optional[str]:
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"' + ("*" if prefix else "")
+
+
+def match_expression(text: str, prefix: bool = True) -> Optional[str]:
+    """Expression MATCH pour une saisie libre : tous les mots, en préfixe.
+
+    "dev halt" -> ``"dev"* "halt"*`` ; None si la saisie ne contient aucun mot.
+    Les guillemets et opérateurs FTS de la saisie sont neutralisés.
+    """
+    phrases = [_phrase(tok, prefix) for tok in _TOKEN_RE.findall(text)]
+    return " ".join(p for p in phrases if p) or None
+
+
+def column_any(column: str, values: Iterable[str], prefix: bool = True) -> str:
+    """Filtre ``colonne : (v1 OR v2 ...)`` ; chaque valeur est une phrase."""
+    phrases: List[str] = [p for p in (_phrase(v, prefix) for v in values) if p]
+    if not phrases:
+        return ""
+    return f"{column} : ({' OR '.join(phrases)})"
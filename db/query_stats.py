@@ -0,0 +1,192 @@
+"""
+Per-query statistics for the sync SQLite layer.
+
+Queries are grouped by fingerprint (literals and ``IN`` lists collapsed, case
+and whitespace normalised) so that ``search_advanced`` called with different
+filter values lands in one bucket per filter shape. Each bucket keeps counters, a
+fixed latency histogram and a bounded sample window for p50/p95/p99.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PARAM_RE = re.compile(r"\?\d*|[:@$]\w+")
+_IN_LIST_RE = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_RE = re.compile(
+    r"\bvalues\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*"
+)
+_SPACE_RE = re.compile(r"\s+")
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+_fingerprint_cache: "OrderedDict[str, str]" = OrderedDict()
+_fingerprint_lock = threading.Lock()
+_FINGERPRINT_CACHE_SIZE = 1024
+
+
+def _normalize(sql: str) -> str:
+    text = _COMMENT_RE.sub(" ", sql)
+    text = _STRING_RE.sub("?", text)
+    text = _PARAM_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _SPACE_RE.sub(" ", text).strip().lower()
+    text = _IN_LIST_RE.sub("in (?+)", text)
+    text = _VALUES_RE.sub("values (?+)", text)
+    return text
+
+
+def fingerprint_query(sql: str) -> str:
+    """Return the normalised shape of ``sql`` (memoised by raw text)."""
+    with _fingerprint_lock:
+        fp = _fingerprint_cache.get(sql)
+        if fp is not None:
+            _fingerprint_cache.move_to_end(sql)
+            return fp
+    fp = _normalize(sql)
+    with _fingerprint_lock:
+        _fingerprint_cache[sql] = fp
+        if len(_fingerprint_cache) > _FINGERPRINT_CACHE_SIZE:
+            _fingerprint_cache.popitem(last=False)
+    return fp
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _FingerprintStats:
+    __slots__ = (
+        "count",
+        "errors",
+        "rows",
+        "total_ms",
+        "max_ms",
+        "buckets",
+        "samples",
+        "last_seen",
+    )
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+        self.last_seen = 0.0
+
+    def to_dict(self, fingerprint: str) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "fingerprint": fingerprint,
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "avg_rows": self.rows / self.count if self.count else 0.0,
+            "total_ms": self.total_ms,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": _percentile(ordered, 0.50),
+            "p95_ms": _percentile(ordered, 0.95),
+            "p99_ms": _percentile(ordered, 0.99),
+            "histogram": dict(
+                zip(
+                    [f"<={b}ms" for b in LATENCY_BUCKETS_MS]
+                    + [f">{LATENCY_BUCKETS_MS[-1]}ms"],
+                    self.buckets,
+                )
+            ),
+            "last_seen": self.last_seen,
+        }
+
+
+class QueryStats:
+    """
+    Thread-safe, bounded registry of per-fingerprint query statistics.
+
+    At most ``max_fingerprints`` shapes are tracked; the least recently seen
+    one is evicted when a new shape arrives.
+    """
+
+    def __init__(self, max_fingerprints: int = 500, sample_size: int = 512):
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self._stats: "OrderedDict[str, _FingerprintStats]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def record(
+        self, sql: str, elapsed_ms: float, rows: int = 0, error: bool = False
+    ) -> None:
+        fp = fingerprint_query(sql)
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            entry = self._stats.get(fp)
+            if entry is None:
+                entry = _FingerprintStats(self.sample_size)
+                self._stats[fp] = entry
+                if len(self._stats) > self.max_fingerprints:
+                    self._stats.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._stats.move_to_end(fp)
+            entry.count += 1
+            entry.rows += max(rows, 0)
+            entry.total_ms += elapsed_ms
+            entry.max_ms = max(entry.max_ms, elapsed_ms)
+            entry.buckets[bucket] += 1
+            entry.samples.append(elapsed_ms)
+            entry.last_seen = time.time()
+            if error:
+                entry.errors += 1
+
+    def get(self, sql_or_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Stats for one query (raw SQL or fingerprint)."""
+        fp = fingerprint_query(sql_or_fingerprint)
+        with self._lock:
+            entry = self._stats.get(fp) or self._stats.get(sql_or_fingerprint)
+            return entry.to_dict(fp) if entry else None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [entry.to_dict(fp) for fp, entry in self._stats.items()]
+
+    def top(self, n: int = 10, by: str = "total_ms") -> List[Dict[str, Any]]:
+        """The ``n`` heaviest fingerprints by ``by`` (e.g. total_ms, p95_ms)."""
+        return sorted(self.snapshot(), key=lambda s: s.get(by, 0), reverse=True)[:n]
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """Serialise all stats; also written to ``path`` when given."""
+        payload = json.dumps(
+            {
+                "generated_at": time.time(),
+                "evicted_fingerprints": self.evicted,
+                "queries": self.top(len(self._stats)),
+            },
+            indent=indent,
+            ensure_ascii=False,
+        )
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+        return payload
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.evicted = 0
@@ -1,6 +1,7 @@
 DROP TABLE IF EXISTS resultats_exercices;
 DROP TABLE IF EXISTS seances;
 DROP TABLE IF EXISTS clients;
+DROP TABLE IF EXISTS exercices_fts;
 DROP TABLE IF EXISTS exercices;
 DROP TABLE IF EXISTS portions;
 DROP TABLE IF EXISTS aliments;
@@ -181,3 +182,11 @@ CREATE TABLE session_items (
     FOREIGN KEY(block_id) REFERENCES session_blocks(block_id)
 );
 
+
+-- Index des clés étrangères utilisées par les chargements eager
+CREATE INDEX IF NOT EXISTS idx_plans_client_id ON plans_alimentaires(client_id);
+CREATE INDEX IF NOT EXISTS idx_repas_plan_ordre ON repas(plan_id, ordre);
+CREATE INDEX IF NOT EXISTS idx_repas_items_repas_id ON repas_items(repas_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_date_creation ON sessions(date_creation);
+CREATE INDEX IF NOT EXISTS idx_session_blocks_session_id ON session_blocks(session_id);
+CREATE INDEX IF NOT EXISTS idx_session_items_block_id ON session_items(block_id);
@@ -3,6 +3,7 @@ import os
 from typing import Optional
 
 from db.database_manager import db_manager
+from db.exercise_fts import ensure_exercise_fts
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCHEMA_PATH = os.path.join(BASE_DIR, "db", "schema.sql")
@@ -14,6 +15,8 @@ def create_schema():
     with db_manager.get_connection() as conn:
         with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
             conn.executescript(f.read())
+        # Index plein texte (table virtuelle + triggers), hors schema.sql
+        ensure_exercise_fts(conn)
 
 
 def seed_data():
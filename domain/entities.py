@@ -9,13 +9,21 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 from core.events import DomainEvent
 
 
+def _event_data(value: Any) -> Dict[str, Any]:
+    """Dataclass fields as JSON-compatible event data (datetimes as ISO)."""
+    return {
+        name: item.isoformat() if isinstance(item, datetime) else item
+        for name, item in asdict(value).items()
+    }
+
+
 class Entity(ABC):
     """
     Base class for all domain entities.
@@ -215,6 +223,12 @@ class Client(AggregateRoot):
                 client_id=str(self.id),
                 email=personal_info.email,
                 full_name=personal_info.full_name,
+                first_name=personal_info.first_name,
+                last_name=personal_info.last_name,
+                phone=personal_info.phone,
+                birth_date=personal_info.birth_date.isoformat()
+                if personal_info.birth_date
+                else None,
             )
         )
 
@@ -259,6 +273,7 @@ class Client(AggregateRoot):
             self._personal_info = personal_info
             self._touch_updated_at()
             self.increment_version()
+            self._fields_updated(personal_info=_event_data(personal_info))
 
     def update_physical_profile(self, physical_profile: PhysicalProfile) -> None:
         """Update physical profile."""
@@ -266,6 +281,7 @@ class Client(AggregateRoot):
             self._physical_profile = physical_profile
             self._touch_updated_at()
             self.increment_version()
+            self._fields_updated(physical_profile=_event_data(physical_profile))
 
     def set_fitness_goals(self, fitness_goals: FitnessGoals) -> None:
         """Set fitness goals."""
@@ -273,6 +289,7 @@ class Client(AggregateRoot):
             self._fitness_goals = fitness_goals
             self._touch_updated_at()
             self.increment_version()
+            self._fields_updated(fitness_goals=_event_data(fitness_goals))
 
     def add_exercise_exclusion(self, exercise_id: int) -> None:
         """Add an exercise to exclusions."""
@@ -280,6 +297,7 @@ class Client(AggregateRoot):
             self._excluded_exercise_ids.add(exercise_id)
             self._touch_updated_at()
             self.increment_version()
+            self._exclusions_updated()
 
     def remove_exercise_exclusion(self, exercise_id: int) -> None:
         """Remove an exercise from exclusions."""
@@ -287,6 +305,7 @@ class Client(AggregateRoot):
             self._excluded_exercise_ids.remove(exercise_id)
             self._touch_updated_at()
             self.increment_version()
+            self._exclusions_updated()
 
     def set_exercise_exclusions(self, exercise_ids: Set[int]) -> None:
         """Set all exercise exclusions."""
@@ -294,14 +313,22 @@ class Client(AggregateRoot):
             self._excluded_exercise_ids = exercise_ids.copy()
             self._touch_updated_at()
             self.increment_version()
+            self._exclusions_updated()
 
-    def deactivate(self) -> None:
+    def deactivate(self, reason: str = "") -> None:
         """Deactivate client."""
         if self._is_active:
             self._is_active = False
             self._touch_updated_at()
             self.increment_version()
 
+            # Add domain event
+            from domain.events import ClientDeactivatedEvent
+
+            self.add_domain_event(
+                ClientDeactivatedEvent(client_id=str(self.id), reason=reason)
+            )
+
     def reactivate(self) -> None:
         """Reactivate client."""
         if not self._is_active:
@@ -309,6 +336,11 @@ class Client(AggregateRoot):
             self._touch_updated_at()
             self.increment_version()
 
+            # Add domain event
+            from domain.events import ClientReactivatedEvent
+
+            self.add_domain_event(ClientReactivatedEvent(client_id=str(self.id)))
+
     def can_perform_exercise(self, exercise_id: int) -> bool:
         """Check if client can perform an exercise."""
         return exercise_id not in self._excluded_exercise_ids
@@ -317,6 +349,25 @@ class Client(AggregateRoot):
         """Update the last modified timestamp."""
         self._updated_at = datetime.utcnow()
 
+    def _fields_updated(self, **updated_fields: Any) -> None:
+        """Record the new value of updated client fields."""
+        from domain.events import ClientUpdatedEvent
+
+        self.add_domain_event(
+            ClientUpdatedEvent(client_id=str(self.id), updated_fields=updated_fields)
+        )
+
+    def _exclusions_updated(self) -> None:
+        """Record the full set of excluded exercises."""
+        from domain.events import ExerciseExclusionUpdatedEvent
+
+        self.add_domain_event(
+            ExerciseExclusionUpdatedEvent(
+                client_id=str(self.id),
+                excluded_exercise_ids=sorted(self._excluded_exercise_ids),
+            )
+        )
+
 
 # Exercise Domain
 @dataclass(frozen=True)
@@ -568,6 +619,20 @@ class WorkoutSession(AggregateRoot):
         self._exercises.append(exercise)
         self.increment_version()
 
+        # Add domain event
+        from domain.events import ExerciseAddedToSessionEvent
+
+        self.add_domain_event(
+            ExerciseAddedToSessionEvent(
+                session_id=str(self.id),
+                client_id=str(self._client_id),
+                exercise_id=exercise.exercise_id,
+                sets=[asdict(exercise_set) for exercise_set in exercise.sets],
+                notes=exercise.notes,
+                order=exercise.order,
+            )
+        )
+
     def remove_exercise(self, exercise_id: int) -> None:
         """Remove exercise from session."""
         initial_count = len(self._exercises)
@@ -576,24 +641,71 @@ class WorkoutSession(AggregateRoot):
         if len(self._exercises) < initial_count:
             self.increment_version()
 
+            # Add domain event
+            from domain.events import ExerciseRemovedFromSessionEvent
+
+            self.add_domain_event(
+                ExerciseRemovedFromSessionEvent(
+                    session_id=str(self.id),
+                    client_id=str(self._client_id),
+                    exercise_id=exercise_id,
+                )
+            )
+
     def set_notes(self, notes: str) -> None:
         """Set session notes."""
         if notes != self._notes:
             self._notes = notes
             self.increment_version()
 
+            # Add domain event
+            from domain.events import SessionNotesUpdatedEvent
+
+            self.add_domain_event(
+                SessionNotesUpdatedEvent(
+                    session_id=str(self.id),
+                    client_id=str(self._client_id),
+                    notes=notes,
+                )
+            )
+
     def set_duration(self, duration_minutes: int) -> None:
         """Set session duration."""
         if duration_minutes != self._duration_minutes:
             self._duration_minutes = duration_minutes
             self.increment_version()
 
+            # Add domain event
+            from domain.events import SessionDurationSetEvent
+
+            self.add_domain_event(
+                SessionDurationSetEvent(
+                    session_id=str(self.id),
+                    client_id=str(self._client_id),
+                    duration_minutes=duration_minutes,
+                )
+            )
+
     def complete_session(self) -> None:
         """Mark session as completed."""
         if not self._is_completed:
             self._is_completed = True
             self.increment_version()
 
+            # Add domain event
+            from domain.events import SessionCompletedEvent
+
+            self.add_domain_event(
+                SessionCompletedEvent(
+                    session_id=str(self.id),
+                    client_id=str(self._client_id),
+                    completion_date=datetime.utcnow().isoformat(),
+                    total_exercises=self.calculate_total_exercises(),
+                    total_volume=self.calculate_total_volume(),
+                    duration_minutes=self._duration_minutes,
+                )
+            )
+
     def calculate_total_volume(self) -> float:
         """Calculate total session volume."""
         return sum(exercise.total_volume for exercise in self._exercises)
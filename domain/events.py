@@ -3,21 +3,28 @@ Domain Events for CoachPro Application.
 
 Domain events represent important business events that have occurred
 in the domain and may trigger side effects or integrations.
+
+Events are keyword-only dataclasses: their own fields follow the defaulted
+fields inherited from ``DomainEvent``.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from core.events import DomainEvent
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ClientCreatedEvent(DomainEvent):
     """Event raised when a new client is created."""
 
     client_id: str
     email: str
     full_name: str
+    first_name: str = ""
+    last_name: str = ""
+    phone: Optional[str] = None
+    birth_date: Optional[str] = None
     aggregate_type: str = "Client"
 
     def __post_init__(self):
@@ -25,7 +32,7 @@ class ClientCreatedEvent(DomainEvent):
         self.aggregate_id = self.client_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ClientUpdatedEvent(DomainEvent):
     """Event raised when a client is updated."""
 
@@ -38,12 +45,24 @@ class ClientUpdatedEvent(DomainEvent):
         self.aggregate_id = self.client_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ClientDeactivatedEvent(DomainEvent):
     """Event raised when a client is deactivated."""
 
     client_id: str
-    reason: str
+    reason: str = ""
+    aggregate_type: str = "Client"
+
+    def __post_init__(self):
+        """Set aggregate information."""
+        self.aggregate_id = self.client_id
+
+
+@dataclass(kw_only=True)
+class ClientReactivatedEvent(DomainEvent):
+    """Event raised when a deactivated client is reactivated."""
+
+    client_id: str
     aggregate_type: str = "Client"
 
     def __post_init__(self):
@@ -51,7 +70,7 @@ class ClientDeactivatedEvent(DomainEvent):
         self.aggregate_id = self.client_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class SessionCreatedEvent(DomainEvent):
     """Event raised when a new workout session is created."""
 
@@ -66,7 +85,35 @@ class SessionCreatedEvent(DomainEvent):
         self.aggregate_id = self.session_id
 
 
-@dataclass
+@dataclass(kw_only=True)
+class SessionNotesUpdatedEvent(DomainEvent):
+    """Event raised when a session's notes change."""
+
+    session_id: str
+    client_id: str
+    notes: str
+    aggregate_type: str = "WorkoutSession"
+
+    def __post_init__(self):
+        """Set aggregate information."""
+        self.aggregate_id = self.session_id
+
+
+@dataclass(kw_only=True)
+class SessionDurationSetEvent(DomainEvent):
+    """Event raised when a session's duration is set."""
+
+    session_id: str
+    client_id: str
+    duration_minutes: int
+    aggregate_type: str = "WorkoutSession"
+
+    def __post_init__(self):
+        """Set aggregate information."""
+        self.aggregate_id = self.session_id
+
+
+@dataclass(kw_only=True)
 class SessionCompletedEvent(DomainEvent):
     """Event raised when a workout session is completed."""
 
@@ -83,14 +130,31 @@ class SessionCompletedEvent(DomainEvent):
         self.aggregate_id = self.session_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ExerciseAddedToSessionEvent(DomainEvent):
     """Event raised when an exercise is added to a session."""
 
     session_id: str
     client_id: str
     exercise_id: int
-    exercise_name: str
+    exercise_name: str = ""
+    sets: List[Dict[str, Any]]
+    notes: str = ""
+    order: int = 1
+    aggregate_type: str = "WorkoutSession"
+
+    def __post_init__(self):
+        """Set aggregate information."""
+        self.aggregate_id = self.session_id
+
+
+@dataclass(kw_only=True)
+class ExerciseRemovedFromSessionEvent(DomainEvent):
+    """Event raised when an exercise is removed from a session."""
+
+    session_id: str
+    client_id: str
+    exercise_id: int
     aggregate_type: str = "WorkoutSession"
 
     def __post_init__(self):
@@ -98,7 +162,7 @@ class ExerciseAddedToSessionEvent(DomainEvent):
         self.aggregate_id = self.session_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ExerciseExclusionUpdatedEvent(DomainEvent):
     """Event raised when a client's exercise exclusions are updated."""
 
@@ -111,7 +175,7 @@ class ExerciseExclusionUpdatedEvent(DomainEvent):
         self.aggregate_id = self.client_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class NutritionPlanCreatedEvent(DomainEvent):
     """Event raised when a nutrition plan is created."""
 
@@ -126,7 +190,7 @@ class NutritionPlanCreatedEvent(DomainEvent):
         self.aggregate_id = self.plan_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class NutritionPlanUpdatedEvent(DomainEvent):
     """Event raised when a nutrition plan is updated."""
 
@@ -140,7 +204,7 @@ class NutritionPlanUpdatedEvent(DomainEvent):
         self.aggregate_id = self.plan_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class MealAddedEvent(DomainEvent):
     """Event raised when a meal is added to a nutrition plan."""
 
@@ -156,7 +220,7 @@ class MealAddedEvent(DomainEvent):
         self.aggregate_id = self.plan_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ExerciseImportedEvent(DomainEvent):
     """Event raised when exercises are imported from external source."""
 
@@ -172,7 +236,7 @@ class ExerciseImportedEvent(DomainEvent):
         self.aggregate_id = self.import_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class PDFGeneratedEvent(DomainEvent):
     """Event raised when a PDF document is generated."""
 
@@ -188,7 +252,7 @@ class PDFGeneratedEvent(DomainEvent):
         self.aggregate_id = self.pdf_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class WorkoutGeneratedEvent(DomainEvent):
     """Event raised when an automatic workout is generated."""
 
@@ -205,7 +269,7 @@ class WorkoutGeneratedEvent(DomainEvent):
         self.aggregate_id = self.generation_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ProgressMilestoneReachedEvent(DomainEvent):
     """Event raised when a client reaches a progress milestone."""
 
@@ -221,7 +285,7 @@ class ProgressMilestoneReachedEvent(DomainEvent):
         self.aggregate_id = self.milestone_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class SystemHealthCheckEvent(DomainEvent):
     """Event raised for system health monitoring."""
 
@@ -237,7 +301,7 @@ class SystemHealthCheckEvent(DomainEvent):
         self.aggregate_id = self.check_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class UserActionEvent(DomainEvent):
     """Event raised for user activity tracking."""
 
@@ -254,7 +318,7 @@ class UserActionEvent(DomainEvent):
         self.aggregate_id = self.action_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class DataExportRequestedEvent(DomainEvent):
     """Event raised when a data export is requested."""
 
@@ -270,7 +334,7 @@ class DataExportRequestedEvent(DomainEvent):
         self.aggregate_id = self.export_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class DataDeletionRequestedEvent(DomainEvent):
     """Event raised when data deletion is requested (GDPR compliance)."""
 
@@ -286,7 +350,7 @@ class DataDeletionRequestedEvent(DomainEvent):
         self.aggregate_id = self.deletion_id
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ErrorOccurredEvent(DomainEvent):
     """Event raised when significant errors occur."""
 
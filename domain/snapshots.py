@@ -0,0 +1,328 @@
+"""
+Aggregate Snapshotters for the Event Store.
+
+Rebuild ``Client`` and ``WorkoutSession`` aggregates from event store
+snapshots and the domain events stored after them. Aggregates are restored
+without calling their constructors, so no creation event is raised again.
+
+Register them on an event store with ``register_domain_snapshotters``.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from core.event_store import AsyncEventStore, IAggregateSnapshotter, StoredEvent
+
+from .entities import (
+    AggregateRoot,
+    Client,
+    ExerciseSet,
+    FitnessGoals,
+    PersonalInfo,
+    PhysicalProfile,
+    SessionExercise,
+    WorkoutSession,
+)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Parse a datetime stored as ISO text (``str(datetime)`` included)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _to_iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _restore_id(value: Any) -> Any:
+    """Entity IDs are ints when numeric, events carry them as strings."""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+class AggregateSnapshotter(IAggregateSnapshotter):
+    """
+    Base snapshotter for domain aggregate roots.
+
+    Subclasses map event types to ``_on_<EventType>`` methods; events without
+    a handler, or stored before the aggregate's creation event, leave it
+    unchanged. Entities raise one event per version change plus their
+    creation event at version 0, so the aggregate version is the stored
+    aggregate version minus one.
+    """
+
+    schema_version = 2
+    aggregate_class: type = AggregateRoot
+    creation_events: Tuple[str, ...] = ()  # event types starting an aggregate
+
+    def apply(self, aggregate: Optional[Any], stored_event: StoredEvent) -> Any:
+        """Apply one stored event and move the aggregate to its version."""
+        event_type = stored_event.metadata.event_type
+        handler = getattr(self, f"_on_{event_type}", None)
+        if handler is not None and (
+            aggregate is not None or event_type in self.creation_events
+        ):
+            aggregate = handler(aggregate, stored_event.event_data, stored_event)
+        if aggregate is not None:
+            aggregate._version = stored_event.aggregate_version - 1
+        return aggregate
+
+    def to_snapshot(self, aggregate: Any) -> Dict[str, Any]:
+        """Identity and version, completed by ``_state``."""
+        return {
+            "id": aggregate.id,
+            "version": aggregate.version,
+            **self._state(aggregate),
+        }
+
+    def from_snapshot(self, data: Dict[str, Any]) -> Any:
+        """Restore the aggregate, then its attributes with ``_restore``."""
+        aggregate = self._new(data["id"], data["version"])
+        self._restore(aggregate, data)
+        return aggregate
+
+    def _new(self, aggregate_id: Any, version: int = 0) -> Any:
+        """Blank aggregate instance, constructor (and its events) skipped."""
+        aggregate = self.aggregate_class.__new__(self.aggregate_class)
+        aggregate._id = aggregate_id
+        aggregate._domain_events = []
+        aggregate._version = version
+        return aggregate
+
+    @abstractmethod
+    def _state(self, aggregate: Any) -> Dict[str, Any]:
+        """JSON-compatible attributes of ``aggregate`` besides id and version."""
+        pass
+
+    @abstractmethod
+    def _restore(self, aggregate: Any, data: Dict[str, Any]) -> None:
+        """Set the attributes saved by ``_state`` on a blank aggregate."""
+        pass
+
+
+class ClientSnapshotter(AggregateSnapshotter):
+    """Snapshots and client events for the ``Client`` aggregate."""
+
+    aggregate_class = Client
+    creation_events = ("ClientCreatedEvent",)
+
+    def _state(self, client: Client) -> Dict[str, Any]:
+        personal_info = asdict(client.personal_info)
+        personal_info["birth_date"] = _to_iso(personal_info["birth_date"])
+        fitness_goals = None
+        if client.fitness_goals is not None:
+            fitness_goals = asdict(client.fitness_goals)
+            fitness_goals["target_date"] = _to_iso(fitness_goals["target_date"])
+        return {
+            "personal_info": personal_info,
+            "physical_profile": asdict(client.physical_profile)
+            if client.physical_profile is not None
+            else None,
+            "fitness_goals": fitness_goals,
+            "excluded_exercise_ids": sorted(client.excluded_exercise_ids),
+            "is_active": client.is_active,
+            "created_at": _to_iso(client.created_at),
+            "updated_at": _to_iso(client.updated_at),
+        }
+
+    def _restore(self, client: Client, data: Dict[str, Any]) -> None:
+        client._personal_info = self._personal_info(data["personal_info"])
+        client._physical_profile = self._physical_profile(data["physical_profile"])
+        client._fitness_goals = self._fitness_goals(data["fitness_goals"])
+        client._excluded_exercise_ids = set(data["excluded_exercise_ids"])
+        client._is_active = data["is_active"]
+        client._created_at = _to_datetime(data["created_at"])
+        client._updated_at = _to_datetime(data["updated_at"])
+
+    @staticmethod
+    def _personal_info(data: Dict[str, Any]) -> PersonalInfo:
+        return PersonalInfo(
+            **{**data, "birth_date": _to_datetime(data.get("birth_date"))}
+        )
+
+    @staticmethod
+    def _physical_profile(data: Optional[Dict[str, Any]]) -> Optional[PhysicalProfile]:
+        return PhysicalProfile(**data) if data is not None else None
+
+    @staticmethod
+    def _fitness_goals(data: Optional[Dict[str, Any]]) -> Optional[FitnessGoals]:
+        if data is None:
+            return None
+        return FitnessGoals(
+            **{**data, "target_date": _to_datetime(data.get("target_date"))}
+        )
+
+    def _on_ClientCreatedEvent(
+        self, client: Optional[Client], data: Dict[str, Any], stored: StoredEvent
+    ) -> Client:
+        client = self._new(_restore_id(data["client_id"]))
+        client._personal_info = self._personal_info(
+            {
+                "first_name": data["first_name"],
+                "last_name": data["last_name"],
+                "email": data["email"],
+                "birth_date": data.get("birth_date"),
+                "phone": data.get("phone"),
+            }
+        )
+        client._physical_profile = None
+        client._fitness_goals = None
+        client._excluded_exercise_ids = set()
+        client._is_active = True
+        client._created_at = client._updated_at = stored.metadata.created_at
+        return client
+
+    def _on_ClientUpdatedEvent(
+        self, client: Client, data: Dict[str, Any], stored: StoredEvent
+    ) -> Client:
+        updated = data["updated_fields"]
+        personal_fields = {
+            name: updated[name]
+            for name in PersonalInfo.__dataclass_fields__
+            if name in updated
+        }
+        if personal_fields:
+            current = asdict(client.personal_info)
+            client._personal_info = self._personal_info({**current, **personal_fields})
+        if "personal_info" in updated:
+            client._personal_info = self._personal_info(updated["personal_info"])
+        if "physical_profile" in updated:
+            client._physical_profile = self._physical_profile(
+                updated["physical_profile"]
+            )
+        if "fitness_goals" in updated:
+            client._fitness_goals = self._fitness_goals(updated["fitness_goals"])
+        if "is_active" in updated:
+            client._is_active = bool(updated["is_active"])
+        client._updated_at = stored.metadata.created_at
+        return client
+
+    def _on_ClientDeactivatedEvent(
+        self, client: Client, data: Dict[str, Any], stored: StoredEvent
+    ) -> Client:
+        client._is_active = False
+        client._updated_at = stored.metadata.created_at
+        return client
+
+    def _on_ClientReactivatedEvent(
+        self, client: Client, data: Dict[str, Any], stored: StoredEvent
+    ) -> Client:
+        client._is_active = True
+        client._updated_at = stored.metadata.created_at
+        return client
+
+    def _on_ExerciseExclusionUpdatedEvent(
+        self, client: Client, data: Dict[str, Any], stored: StoredEvent
+    ) -> Client:
+        client._excluded_exercise_ids = set(data["excluded_exercise_ids"])
+        client._updated_at = stored.metadata.created_at
+        return client
+
+
+class WorkoutSessionSnapshotter(AggregateSnapshotter):
+    """Snapshots and session events for the ``WorkoutSession`` aggregate."""
+
+    aggregate_class = WorkoutSession
+    creation_events = ("SessionCreatedEvent",)
+
+    def _state(self, session: WorkoutSession) -> Dict[str, Any]:
+        return {
+            "client_id": session.client_id,
+            "name": session.name,
+            "session_date": _to_iso(session.session_date),
+            "exercises": [asdict(exercise) for exercise in session.exercises],
+            "notes": session.notes,
+            "duration_minutes": session.duration_minutes,
+            "is_completed": session.is_completed,
+            "created_at": _to_iso(session.created_at),
+        }
+
+    def _restore(self, session: WorkoutSession, data: Dict[str, Any]) -> None:
+        session._client_id = data["client_id"]
+        session._name = data["name"]
+        session._session_date = _to_datetime(data["session_date"])
+        session._exercises = [self._exercise(item) for item in data["exercises"]]
+        session._notes = data["notes"]
+        session._duration_minutes = data["duration_minutes"]
+        session._is_completed = data["is_completed"]
+        session._created_at = _to_datetime(data["created_at"])
+
+    @staticmethod
+    def _exercise(data: Dict[str, Any]) -> SessionExercise:
+        return SessionExercise(
+            exercise_id=data["exercise_id"],
+            sets=[ExerciseSet(**item) for item in data["sets"]],
+            notes=data.get("notes", ""),
+            order=data.get("order", 1),
+        )
+
+    def _on_SessionCreatedEvent(
+        self,
+        session: Optional[WorkoutSession],
+        data: Dict[str, Any],
+        stored: StoredEvent,
+    ) -> WorkoutSession:
+        session = self._new(_restore_id(data["session_id"]))
+        self._restore(
+            session,
+            {
+                "client_id": _restore_id(data["client_id"]),
+                "name": data["session_name"].strip(),
+                "session_date": data["session_date"],
+                "exercises": [],
+                "notes": "",
+                "duration_minutes": None,
+                "is_completed": False,
+                "created_at": stored.metadata.created_at,
+            },
+        )
+        return session
+
+    def _on_ExerciseAddedToSessionEvent(
+        self, session: WorkoutSession, data: Dict[str, Any], stored: StoredEvent
+    ) -> WorkoutSession:
+        session._exercises.append(self._exercise(data))
+        return session
+
+    def _on_ExerciseRemovedFromSessionEvent(
+        self, session: WorkoutSession, data: Dict[str, Any], stored: StoredEvent
+    ) -> WorkoutSession:
+        session._exercises = [
+            exercise
+            for exercise in session._exercises
+            if exercise.exercise_id != data["exercise_id"]
+        ]
+        return session
+
+    def _on_SessionNotesUpdatedEvent(
+        self, session: WorkoutSession, data: Dict[str, Any], stored: StoredEvent
+    ) -> WorkoutSession:
+        session._notes = data["notes"]
+        return session
+
+    def _on_SessionDurationSetEvent(
+        self, session: WorkoutSession, data: Dict[str, Any], stored: StoredEvent
+    ) -> WorkoutSession:
+        session._duration_minutes = data["duration_minutes"]
+        return session
+
+    def _on_SessionCompletedEvent(
+        self, session: WorkoutSession, data: Dict[str, Any], stored: StoredEvent
+    ) -> WorkoutSession:
+        session._is_completed = True
+        if data.get("duration_minutes") is not None:
+            session._duration_minutes = data["duration_minutes"]
+        return session
+
+
+def register_domain_snapshotters(event_store: AsyncEventStore) -> None:
+    """Enable snapshots and ``load_aggregate`` for the domain aggregates."""
+    event_store.register_snapshotter("Client", ClientSnapshotter())
+    event_store.register_snapshotter("WorkoutSession", WorkoutSessionSnapshotter())
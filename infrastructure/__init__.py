@@ -5,23 +5,31 @@ This module contains implementations of external concerns like:
 - Database repositories
 - External service integrations
 - Caching implementations
-- Configuration management
 - Async I/O operations
+
+The async database layer needs ``aiosqlite``; without it the package (and
+its cache) still imports and ``DATABASE_AVAILABLE`` is False.
 """
 
 from .cache import AsyncMemoryCache, AsyncRedisCache
-from .configuration import ConfigurationManager, Settings
-from .database import AsyncConnection, AsyncDatabaseManager, AsyncTransaction
+
+try:
+    from .database import AsyncConnection, AsyncDatabaseManager, AsyncTransaction
+
+    DATABASE_AVAILABLE = True
+except ImportError:
+    DATABASE_AVAILABLE = False
 
 __all__ = [
-    # Database
-    "AsyncDatabaseManager",
-    "AsyncConnection",
-    "AsyncTransaction",
     # Cache
     "AsyncMemoryCache",
     "AsyncRedisCache",
-    # Configuration
-    "ConfigurationManager",
-    "Settings",
 ]
+
+if DATABASE_AVAILABLE:
+    __all__ += [
+        # Database
+        "AsyncDatabaseManager",
+        "AsyncConnection",
+        "AsyncTransaction",
+    ]
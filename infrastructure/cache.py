@@ -8,15 +8,47 @@ including cache warming, eviction policies, and performance monitoring.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import fnmatch
+import functools
 import json
+import os
 import pickle
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from db.database_manager import ConnectionPool, PoolConfig
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 T = TypeVar("T")
 
+DEFAULT_L2_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "cache",
+    "l2_cache.sqlite3",
+)
+
 
 @dataclass
 class CacheConfig:
@@ -27,6 +59,10 @@ class CacheConfig:
     cleanup_interval: int = 60  # 1 minute
     enable_metrics: bool = True
     serialization_method: str = "pickle"  # "pickle" or "json"
+    store_by_reference: bool = False  # skip serialisation (values must not mutate)
+    l2_url: str = "redis://localhost:6379"  # or "sqlite:///path/to/cache.db"
+    l2_namespace: str = "coachpro:"
+    l2_pool_size: int = 4
 
 
 @dataclass
@@ -72,6 +108,7 @@ class CacheEntry:
     ttl: int
     access_count: int = 0
     last_accessed: float = 0.0
+    serialized: bool = True
 
     def __post_init__(self):
         """Initialize timestamps."""
@@ -96,6 +133,18 @@ class CacheEntry:
         self.last_accessed = time.time()
 
 
+_IMMUTABLE_SCALARS = (str, bytes, int, float, bool, complex, type(None))
+
+
+def _is_immutable(value: Any) -> bool:
+    """True for values that can safely be shared instead of copied."""
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(v) for v in value)
+    return False
+
+
 class ICache(ABC):
     """Abstract cache interface."""
 
@@ -136,103 +185,126 @@ class AsyncMemoryCache(ICache):
 
     Features:
     - TTL (Time To Live) support
-    - LRU (Least Recently Used) eviction
+    - O(1) LRU (Least Recently Used) touch and eviction (OrderedDict)
+    - Zero-serialisation fast path for immutable values
+    - Lock-free reads
     - Automatic cleanup of expired entries
+    - Eviction listeners (LRU eviction and TTL expiry)
     - Performance metrics
-    - Thread-safe operations
+
+    Reads never await, so they run atomically on the event loop and do not
+    take the lock; writes keep the lock so ``set``/``delete``/``clear`` stay
+    serialised with the background cleanup.
     """
 
     def __init__(self, config: CacheConfig):
         self.config = config
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: List[str] = []
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = asyncio.Lock()
         self._metrics = CacheMetrics()
         self._cleanup_task: Optional[asyncio.Task] = None
-
-        # Start cleanup task
-        if config.cleanup_interval > 0:
-            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._eviction_listeners: List[Callable[[str, bool], None]] = []
+        self._ensure_cleanup_task()
+
+    def add_eviction_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Call ``listener(key, expired)`` for every entry the cache drops on its
+        own: LRU eviction (``expired`` False) or TTL expiry (``expired`` True).
+        """
+        self._eviction_listeners.append(listener)
+
+    def _notify_evicted(self, key: str, expired: bool) -> None:
+        for listener in self._eviction_listeners:
+            listener(key, expired)
+
+    def _ensure_cleanup_task(self) -> None:
+        """Start the cleanup loop once an event loop is running."""
+        if self._cleanup_task is not None or self.config.cleanup_interval <= 0:
+            return
+        try:
+            self._cleanup_task = asyncio.get_running_loop().create_task(
+                self._cleanup_loop()
+            )
+        except RuntimeError:
+            # Created outside of a loop: started on first write instead
+            pass
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         start_time = time.perf_counter()
+        metrics = self._metrics
+        metrics.total_operations += 1
 
-        async with self._lock:
-            entry = self._cache.get(key)
-
-            if entry is None:
-                self._metrics.misses += 1
-                self._metrics.total_operations += 1
-                return None
-
-            if entry.is_expired:
-                # Remove expired entry
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            metrics.misses += 1
+            return None
 
-                self._metrics.misses += 1
-                self._metrics.evictions += 1
-                self._metrics.total_operations += 1
-                return None
+        if entry.is_expired:
+            del self._cache[key]
+            metrics.misses += 1
+            metrics.evictions += 1
+            self._notify_evicted(key, True)
+            return None
 
-            # Update access information
-            entry.touch()
+        entry.touch()
+        self._cache.move_to_end(key)
+        metrics.hits += 1
 
-            # Update LRU order
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+        value = self._deserialize(entry.value) if entry.serialized else entry.value
 
-            self._metrics.hits += 1
-            self._metrics.total_operations += 1
+        # Update average access time
+        access_time = (time.perf_counter() - start_time) * 1000
+        self._update_avg_access_time(access_time)
 
-            # Update average access time
-            access_time = (time.perf_counter() - start_time) * 1000
-            self._update_avg_access_time(access_time)
+        return value
 
-            return self._deserialize(entry.value)
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        by_reference: Optional[bool] = None,
+    ) -> None:
+        """
+        Set value in cache.
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache."""
+        ``by_reference`` stores the object itself instead of a serialised copy;
+        only use it for values nobody mutates afterwards. It defaults to
+        ``config.store_by_reference`` and is always on for immutable scalars.
+        """
         if ttl is None:
             ttl = self.config.default_ttl
+        if by_reference is None:
+            by_reference = self.config.store_by_reference or _is_immutable(value)
 
-        async with self._lock:
-            # Serialize value
-            serialized_value = self._serialize(value)
-
-            # Create cache entry
-            entry = CacheEntry(
-                value=serialized_value,
-                created_at=time.time(),
-                ttl=ttl,
-            )
-
-            # Check if we need to evict entries
-            if len(self._cache) >= self.config.max_size and key not in self._cache:
-                await self._evict_lru()
-
-            # Store entry
-            self._cache[key] = entry
+        stored = value if by_reference else self._serialize(value)
+        self._ensure_cleanup_task()
 
-            # Update LRU order
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+        async with self._lock:
+            self._store(key, stored, ttl, serialized=not by_reference)
+
+    def _store(self, key: str, stored: Any, ttl: int, serialized: bool) -> None:
+        entry = CacheEntry(
+            value=stored,
+            created_at=time.time(),
+            ttl=ttl,
+            serialized=serialized,
+        )
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+        elif len(cache) >= self.config.max_size:
+            self._evict_lru()
+        cache[key] = entry
 
-            self._metrics.sets += 1
-            self._metrics.total_operations += 1
+        self._metrics.sets += 1
+        self._metrics.total_operations += 1
 
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
         async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-
+            if self._cache.pop(key, None) is not None:
                 self._metrics.deletes += 1
                 self._metrics.total_operations += 1
                 return True
@@ -241,15 +313,13 @@ class AsyncMemoryCache(ICache):
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            return entry is not None and not entry.is_expired
+        entry = self._cache.get(key)
+        return entry is not None and not entry.is_expired
 
     async def clear(self) -> None:
         """Clear all cache entries."""
         async with self._lock:
             self._cache.clear()
-            self._access_order.clear()
             self._metrics.reset()
 
     async def get_metrics(self) -> CacheMetrics:
@@ -258,20 +328,17 @@ class AsyncMemoryCache(ICache):
 
     async def get_cache_info(self) -> Dict[str, Any]:
         """Get detailed cache information."""
-        async with self._lock:
-            total_entries = len(self._cache)
-            expired_entries = sum(
-                1 for entry in self._cache.values() if entry.is_expired
-            )
-
-            return {
-                "total_entries": total_entries,
-                "expired_entries": expired_entries,
-                "valid_entries": total_entries - expired_entries,
-                "max_size": self.config.max_size,
-                "utilization_percent": (total_entries / self.config.max_size) * 100,
-                "metrics": self._metrics,
-            }
+        total_entries = len(self._cache)
+        expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired)
+
+        return {
+            "total_entries": total_entries,
+            "expired_entries": expired_entries,
+            "valid_entries": total_entries - expired_entries,
+            "max_size": self.config.max_size,
+            "utilization_percent": (total_entries / self.config.max_size) * 100,
+            "metrics": self._metrics,
+        }
 
     async def warm_cache(
         self, warm_data: Dict[str, Any], ttl: Optional[int] = None
@@ -289,7 +356,7 @@ class AsyncMemoryCache(ICache):
                 # Fallback to pickle for non-JSON serializable objects
                 return pickle.dumps(value)
         else:
-            return pickle.dumps(value)
+            return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize value from storage."""
@@ -302,29 +369,20 @@ class AsyncMemoryCache(ICache):
         else:
             return pickle.loads(data)
 
-    async def _evict_lru(self) -> None:
+    def _evict_lru(self) -> None:
         """Evict least recently used entry."""
-        if not self._access_order:
-            return
-
-        # Remove oldest entry
-        oldest_key = self._access_order.pop(0)
-        if oldest_key in self._cache:
-            del self._cache[oldest_key]
+        if self._cache:
+            key, _ = self._cache.popitem(last=False)
             self._metrics.evictions += 1
+            self._notify_evicted(key, False)
 
     async def _cleanup_expired(self) -> int:
         """Clean up expired entries."""
-        expired_keys = []
-
-        for key, entry in self._cache.items():
-            if entry.is_expired:
-                expired_keys.append(key)
+        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
 
         for key in expired_keys:
             del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
+            self._notify_evicted(key, True)
 
         if expired_keys:
             self._metrics.evictions += len(expired_keys)
@@ -370,58 +428,586 @@ class AsyncMemoryCache(ICache):
         await self.clear()
 
 
-class AsyncRedisCache(ICache):
+class SQLiteL2Backend:
     """
-    Async Redis cache implementation.
+    On-disk L2 stand-in shared by every app instance on the machine.
 
-    Note: This is a simplified implementation. In production,
-    you would use a library like aioredis.
+    Entries live in a WAL-mode SQLite file (one BLOB per key with an absolute
+    expiry), so several app processes pointing at the same
+    file share warm entries without running a Redis server. Tag membership is
+    stored next to the entries so any process can invalidate a tag. Blocking
+    SQLite calls run in a worker thread over a small connection pool.
     """
 
-    def __init__(self, config: CacheConfig, redis_url: str = "redis://localhost:6379"):
+    _MAX_PARAMS = 500
+
+    def __init__(self, path: str = DEFAULT_L2_PATH, pool_size: int = 4):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._pool = ConnectionPool(
+            path, PoolConfig(max_connections=pool_size, enable_query_stats=False)
+        )
+        self._writes_since_purge = 0
+        with self._pool.acquire() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS l2_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS l2_tags (
+                    tag TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (tag, key)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_l2_tags_key ON l2_tags(key)")
+
+    def _chunks(self, keys: List[str]) -> List[List[str]]:
+        step = self._MAX_PARAMS
+        return [keys[i : i + step] for i in range(0, len(keys), step)]
+
+    def _mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        found: Dict[str, bytes] = {}
+        now = time.time()
+        with self._pool.acquire() as conn:
+            for chunk in self._chunks(keys):
+                rows = conn.execute(
+                    f"SELECT key, value FROM l2_cache WHERE key IN "
+                    f"({','.join('?' * len(chunk))}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (*chunk, now),
+                ).fetchall()
+                found.update((row[0], row[1]) for row in rows)
+        return [found.get(key) for key in keys]
+
+    def _mset(
+        self, items: Dict[str, bytes], ttl: int, tags: Optional[List[str]]
+    ) -> None:
+        expires_at = time.time() + ttl if ttl > 0 else None
+        with self._pool.acquire() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO l2_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, value in items.items()],
+            )
+            if tags:
+                self._insert_tags(conn, list(items), tags)
+            self._writes_since_purge += len(items)
+            if self._writes_since_purge >= 1000:
+                conn.execute(
+                    "DELETE FROM l2_cache WHERE expires_at IS NOT NULL "
+                    "AND expires_at <= ?",
+                    (time.time(),),
+                )
+                conn.execute(
+                    "DELETE FROM l2_tags WHERE key NOT IN (SELECT key FROM l2_cache)"
+                )
+                self._writes_since_purge = 0
+
+    @staticmethod
+    def _insert_tags(conn: Any, keys: List[str], tags: List[str]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO l2_tags (tag, key) VALUES (?, ?)",
+            [(tag, key) for tag in tags for key in keys],
+        )
+
+    def _tag(self, keys: List[str], tags: List[str]) -> None:
+        with self._pool.acquire() as conn:
+            self._insert_tags(conn, keys, tags)
+
+    def _invalidate_tags(self, tags: List[str]) -> List[str]:
+        now = time.time()
+        with self._pool.acquire() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT t.key, c.key, c.expires_at FROM l2_tags t "
+                "LEFT JOIN l2_cache c ON c.key = t.key "
+                f"WHERE t.tag IN ({','.join('?' * len(tags))})",
+                tags,
+            ).fetchall()
+            self._delete_rows(conn, [row[0] for row in rows])
+        return [
+            row[0]
+            for row in rows
+            if row[1] is not None and (row[2] is None or row[2] > now)
+        ]
+
+    def _delete_prefix(self, prefix: str, pattern: Optional[str]) -> List[str]:
+        now = time.time()
+        with self._pool.acquire() as conn:
+            if prefix:
+                upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                rows = conn.execute(
+                    "SELECT key, expires_at FROM l2_cache WHERE key >= ? AND key < ?",
+                    (prefix, upper),
+                ).fetchall()
+            else:
+                rows = conn.execute("SELECT key, expires_at FROM l2_cache").fetchall()
+            keys = [
+                row[0]
+                for row in rows
+                if pattern is None or fnmatch.fnmatchcase(row[0], pattern)
+            ]
+            self._delete_rows(conn, keys)
+        expired = {row[0] for row in rows if row[1] is not None and row[1] <= now}
+        return [key for key in keys if key not in expired]
+
+    def _delete_rows(self, conn: Any, keys: List[str]) -> int:
+        deleted = 0
+        for chunk in self._chunks(keys):
+            placeholders = ",".join("?" * len(chunk))
+            cur = conn.execute(
+                f"DELETE FROM l2_cache WHERE key IN ({placeholders})", chunk
+            )
+            deleted += cur.rowcount
+            conn.execute(f"DELETE FROM l2_tags WHERE key IN ({placeholders})", chunk)
+        return deleted
+
+    def _delete(self, keys: List[str]) -> int:
+        with self._pool.acquire() as conn:
+            return self._delete_rows(conn, keys)
+
+    def _clear(self, prefix: str) -> None:
+        with self._pool.acquire() as conn:
+            if prefix:
+                upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                for table in ("l2_cache", "l2_tags"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE key >= ? AND key < ?",
+                        (prefix, upper),
+                    )
+            else:
+                conn.execute("DELETE FROM l2_cache")
+                conn.execute("DELETE FROM l2_tags")
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await asyncio.to_thread(self._mget, keys)
+
+    async def mset(
+        self, items: Dict[str, bytes], ttl: int, tags: Optional[List[str]] = None
+    ) -> None:
+        await asyncio.to_thread(self._mset, items, ttl, tags)
+
+    async def tag(self, keys: List[str], tags: List[str], ttl: int) -> None:
+        """Record ``keys`` as members of ``tags`` (they expire with the entries)."""
+        await asyncio.to_thread(self._tag, keys, tags)
+
+    async def invalidate_tags(self, tags: List[str]) -> List[str]:
+        """Delete every entry carrying one of ``tags``; returns the live keys deleted."""
+        return await asyncio.to_thread(self._invalidate_tags, tags)
+
+    async def delete_prefix(
+        self, prefix: str, pattern: Optional[str] = None
+    ) -> List[str]:
+        """Delete the entries under ``prefix`` (matching the glob ``pattern`` if
+        given); returns the live keys deleted."""
+        return await asyncio.to_thread(self._delete_prefix, prefix, pattern)
+
+    async def delete(self, keys: List[str]) -> int:
+        return await asyncio.to_thread(self._delete, keys)
+
+    async def exists(self, key: str) -> bool:
+        return (await self.mget([key]))[0] is not None
+
+    async def clear(self, prefix: str = "") -> None:
+        await asyncio.to_thread(self._clear, prefix)
+
+    async def close(self) -> None:
+        self._pool.close_all()
+
+
+class RedisL2Backend:
+    """
+    Redis L2 backend: pooled connections, MGET and pipelined SET.
+
+    Each tag is a Redis set of member keys (``tag:<tag>``) whose TTL is
+    extended to cover its longest-lived member.
+    """
+
+    def __init__(self, redis_url: str, pool_size: int = 10):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package is not installed")
+        self._pool = aioredis.ConnectionPool.from_url(
+            redis_url, max_connections=pool_size
+        )
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self._client.mget(keys)
+
+    async def mset(
+        self, items: Dict[str, bytes], ttl: int, tags: Optional[List[str]] = None
+    ) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, value, ex=ttl if ttl > 0 else None)
+        if tags:
+            self._add_tags(pipe, list(items), tags, ttl)
+        await pipe.execute()
+
+    @staticmethod
+    def _add_tags(pipe: Any, keys: List[str], tags: List[str], ttl: int) -> None:
+        for tag in tags:
+            tag_key = f"tag:{tag}"
+            pipe.sadd(tag_key, *keys)
+            if ttl > 0:
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            else:
+                pipe.persist(tag_key)
+
+    async def tag(self, keys: List[str], tags: List[str], ttl: int) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        self._add_tags(pipe, keys, tags, ttl)
+        await pipe.execute()
+
+    async def invalidate_tags(self, tags: List[str]) -> List[str]:
+        tag_keys = [f"tag:{tag}" for tag in tags]
+        pipe = self._client.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members = {
+            key.decode() if isinstance(key, bytes) else key
+            for found in await pipe.execute()
+            for key in found
+        }
+        keys = list(members)
+        for i in range(0, len(keys), 500):
+            await self._client.unlink(*keys[i : i + 500])
+        await self._client.unlink(*tag_keys)
+        return keys
+
+    async def delete_prefix(
+        self, prefix: str, pattern: Optional[str] = None
+    ) -> List[str]:
+        deleted: List[str] = []
+        batch: List[str] = []
+        async for key in self._client.scan_iter(
+            match=pattern or f"{prefix}*", count=500
+        ):
+            batch.append(key.decode() if isinstance(key, bytes) else key)
+            if len(batch) >= 500:
+                await self._client.unlink(*batch)
+                deleted.extend(batch)
+                batch = []
+        if batch:
+            await self._client.unlink(*batch)
+            deleted.extend(batch)
+        return deleted
+
+    async def delete(self, keys: List[str]) -> int:
+        return await self._client.unlink(*keys) if keys else 0
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self._client.exists(key))
+
+    async def clear(self, prefix: str = "") -> None:
+        batch: List[str] = []
+        async for key in self._client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self._client.unlink(*batch)
+                batch.clear()
+        if batch:
+            await self._client.unlink(*batch)
+
+    async def close(self) -> None:
+        await self._client.close()
+        await self._pool.disconnect()
+
+
+class AsyncRedisCache(ICache):
+    """
+    Async L2 cache.
+
+    Talks to Redis when ``redis_url`` is a ``redis://`` URL and the ``redis``
+    package is installed; otherwise (or with a ``sqlite:///path`` URL) it uses
+    the on-disk ``SQLiteL2Backend`` so L2 is never silently disabled.
+    Values are stored binary-safe (one format byte + pickle/JSON payload)
+    under ``config.l2_namespace``; ``get_many``/``set_many`` batch round-trips.
+    Tags and prefix deletes are handled by the backend, so they reach entries
+    written by every process sharing it.
+    """
+
+    _PICKLE = b"P"
+    _JSON = b"J"
+
+    def __init__(
+        self,
+        config: CacheConfig,
+        redis_url: str = "redis://localhost:6379",
+        backend: Optional[Any] = None,
+    ):
         self.config = config
         self.redis_url = redis_url
         self._metrics = CacheMetrics()
-        self._redis = None  # Would be actual Redis connection
+        self._namespace = config.l2_namespace
+        self._backend = backend or self._create_backend(redis_url)
 
-    async def get(self, key: str) -> Optional[Any]:
-        """Get value from Redis cache."""
-        # Simplified implementation - would use actual Redis operations
+    def _create_backend(self, redis_url: str) -> Any:
+        if redis_url.startswith("sqlite:///"):
+            return SQLiteL2Backend(
+                redis_url[len("sqlite:///") :], self.config.l2_pool_size
+            )
+        if REDIS_AVAILABLE:
+            return RedisL2Backend(redis_url, self.config.l2_pool_size)
+        print("WARN: redis non installe, cache L2 sur disque local")
+        return SQLiteL2Backend(DEFAULT_L2_PATH, self.config.l2_pool_size)
+
+    @property
+    def backend(self) -> Any:
+        return self._backend
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}{key}"
+
+    def _unkey(self, key: str) -> str:
+        return key[len(self._namespace) :]
+
+    def _encode(self, value: Any) -> bytes:
+        if self.config.serialization_method == "json":
+            try:
+                return self._JSON + json.dumps(value).encode("utf-8")
+            except (TypeError, ValueError):
+                pass
+        return self._PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, data: bytes) -> Any:
+        data = bytes(data)
+        if data[:1] == self._JSON:
+            return json.loads(data[1:].decode("utf-8"))
+        return pickle.loads(data[1:])
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Fetch several keys in one round-trip; missing keys are omitted."""
+        if not keys:
+            return {}
         self._metrics.total_operations += 1
-        return None
+        try:
+            raw_values = await self._backend.mget([self._key(k) for k in keys])
+        except Exception as e:
+            print(f"Cache L2 error (get): {e}")
+            self._metrics.misses += len(keys)
+            return {}
+        result: Dict[str, Any] = {}
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                self._metrics.misses += 1
+                continue
+            try:
+                result[key] = self._decode(raw)
+                self._metrics.hits += 1
+            except Exception:
+                self._metrics.misses += 1
+        return result
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in Redis cache."""
-        # Simplified implementation
-        self._metrics.sets += 1
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Store several keys in one pipelined round-trip, tagged with ``tags``."""
+        if not items:
+            return
+        if ttl is None:
+            ttl = self.config.default_ttl
+        encoded = {self._key(k): self._encode(v) for k, v in items.items()}
+        self._metrics.sets += len(items)
+        self._metrics.total_operations += 1
+        try:
+            if tags:
+                await self._backend.mset(encoded, ttl, [self._key(tag) for tag in tags])
+            else:
+                await self._backend.mset(encoded, ttl)
+        except Exception as e:
+            print(f"Cache L2 error (set): {e}")
+
+    async def tag(
+        self, keys: List[str], tags: Iterable[str], ttl: Optional[int] = None
+    ) -> None:
+        """Add already stored keys to ``tags``."""
+        tags = [self._key(tag) for tag in tags]
+        if not keys or not tags:
+            return
+        if ttl is None:
+            ttl = self.config.default_ttl
+        try:
+            await self._backend.tag([self._key(k) for k in keys], tags, ttl)
+        except Exception as e:
+            print(f"Cache L2 error (tag): {e}")
+
+    async def invalidate_tags(self, *tags: str) -> List[str]:
+        """Delete every entry carrying one of ``tags``; returns the keys deleted."""
+        if not tags:
+            return []
+        self._metrics.total_operations += 1
+        try:
+            keys = await self._backend.invalidate_tags([self._key(t) for t in tags])
+        except Exception as e:
+            print(f"Cache L2 error (invalidate): {e}")
+            return []
+        self._metrics.deletes += len(keys)
+        return [self._unkey(key) for key in keys]
+
+    async def delete_prefix(
+        self, prefix: str, pattern: Optional[str] = None
+    ) -> List[str]:
+        """
+        Delete every entry whose key starts with ``prefix`` and, if given,
+        matches the glob ``pattern``; returns the keys deleted.
+        """
         self._metrics.total_operations += 1
+        try:
+            keys = await self._backend.delete_prefix(
+                self._key(prefix), self._key(pattern) if pattern else None
+            )
+        except Exception as e:
+            print(f"Cache L2 error (invalidate): {e}")
+            return []
+        self._metrics.deletes += len(keys)
+        return [self._unkey(key) for key in keys]
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from L2 cache."""
+        return (await self.get_many([key])).get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Set value in L2 cache."""
+        await self.set_many({key: value}, ttl, tags)
 
     async def delete(self, key: str) -> bool:
-        """Delete value from Redis cache."""
-        # Simplified implementation
+        """Delete value from L2 cache."""
         self._metrics.deletes += 1
         self._metrics.total_operations += 1
-        return False
+        try:
+            return await self._backend.delete([self._key(key)]) > 0
+        except Exception as e:
+            print(f"Cache L2 error (delete): {e}")
+            return False
 
     async def exists(self, key: str) -> bool:
-        """Check if key exists in Redis cache."""
+        """Check if key exists in L2 cache."""
         self._metrics.total_operations += 1
-        return False
+        try:
+            return await self._backend.exists(self._key(key))
+        except Exception:
+            return False
 
     async def clear(self) -> None:
-        """Clear all Redis cache entries."""
+        """Clear all entries of this namespace."""
+        try:
+            await self._backend.clear(self._namespace)
+        except Exception as e:
+            print(f"Cache L2 error (clear): {e}")
         self._metrics.reset()
 
     async def get_metrics(self) -> CacheMetrics:
-        """Get Redis cache metrics."""
+        """Get L2 cache metrics."""
         return self._metrics
 
+    async def close(self) -> None:
+        await self._backend.close()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent loads of the same key.
+
+    The first caller for a key starts the loader in its own task; callers
+    arriving while it is in flight await the same task instead of issuing the
+    same query again. Every caller awaits it through ``asyncio.shield``, so a
+    cancelled caller (the first one included) does not cancel the others.
+
+    ``forget`` detaches an in-flight load and bumps the key's generation; a
+    loader compares ``generation`` before and after loading to avoid storing
+    a value read before the invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Tracked only while a load of the key (detached or not) is running
+        self._generations: Dict[str, int] = {}
+        self._running: Dict[str, int] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def generation(self, key: str) -> int:
+        return self._generations.get(key, 0)
+
+    def forget(self, key: str) -> None:
+        """Detach an in-flight load so later callers start a fresh one."""
+        self._inflight.pop(key, None)
+        if key in self._running:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def forget_all(self) -> None:
+        for key in list(self._running):
+            self.forget(key)
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.get_running_loop().create_task(loader())
+            self._inflight[key] = task
+            self._running[key] = self._running.get(key, 0) + 1
+            self.executed += 1
+            task.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        running = self._running[key] - 1
+        if running:
+            self._running[key] = running
+        else:
+            del self._running[key]
+            self._generations.pop(key, None)
+        # Mark the exception as retrieved when every caller went away
+        if not task.cancelled():
+            task.exception()
+
 
 class CacheManager:
     """
     Cache manager that coordinates multiple cache implementations.
 
-    Supports cache hierarchies (L1 memory cache + L2 Redis cache).
+    Supports cache hierarchies (L1 memory cache + L2 Redis cache) and
+    bulk invalidation:
+    - by tag, through a reverse index tag -> keys (O(number of tags))
+    - by prefix or glob pattern, through a sorted index of known keys
+
+    Only keys written through the manager (or promoted from L2) are indexed.
+    Indexing is O(1): new keys are merged into the sorted index on the next
+    prefix lookup, and keys the L1 cache evicts are dropped once no cache
+    layer holds them. With an ``AsyncRedisCache`` L2, tag membership is also
+    written to L2 and tag/prefix invalidations run on the backend, so they
+    remove entries other processes wrote to the shared L2 as well.
+
+    ``get_or_load`` coalesces concurrent misses through ``SingleFlight`` and,
+    with ``stale_ttl``, keeps serving an expired value for that long while a
+    single background refresh reloads it (stale-while-revalidate). A load
+    overtaken by a ``delete`` or an invalidation of its key is returned to its
+    callers but not stored.
     """
 
     def __init__(
@@ -431,35 +1017,301 @@ class CacheManager:
     ):
         self.primary_cache = primary_cache
         self.secondary_cache = secondary_cache
+        self._key_tags: Dict[str, Set[str]] = {}  # indexed keys
+        self._tag_keys: Dict[str, Set[str]] = {}
+        # Sorted view of the indexed keys, rebuilt lazily for prefix lookups
+        self._sorted_keys: List[str] = []
+        self._unsorted_keys: List[str] = []
+        self._forgotten_keys = 0
+        self._flight = SingleFlight()
+        # stale-while-revalidate: key -> fresh-until timestamp / reload recipe
+        self._fresh_until: Dict[str, float] = {}
+        self._refreshers: Dict[str, Tuple[Callable[[], Awaitable[Any]], Any]] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+        add_eviction_listener = getattr(primary_cache, "add_eviction_listener", None)
+        if add_eviction_listener is not None:
+            add_eviction_listener(self._on_primary_evicted)
+
+    # --- Key / tag index ---
+    def _index_key(self, key: str, tags: Optional[Iterable[str]]) -> None:
+        indexed = self._key_tags
+        if key not in indexed:
+            indexed[key] = set()
+            unsorted = self._unsorted_keys
+            unsorted.append(key)
+            if len(unsorted) > 1024 and len(unsorted) > 2 * len(indexed):
+                # Churn without prefix lookups: drop the keys forgotten since
+                self._unsorted_keys = [
+                    k for k in dict.fromkeys(unsorted) if k in indexed
+                ]
+        if tags:
+            key_tags = indexed[key]
+            for tag in tags:
+                key_tags.add(tag)
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+    def _forget_key(self, key: str) -> None:
+        self._fresh_until.pop(key, None)
+        self._refreshers.pop(key, None)
+        tags = self._key_tags.pop(key, None)
+        if tags is None:
+            return
+        # Left in the sorted view until the next rebuild
+        self._forgotten_keys += 1
+        for tag in tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def _on_primary_evicted(self, key: str, expired: bool) -> None:
+        # An entry the L1 evicted may still be served by L2; both share its TTL
+        if expired or self.secondary_cache is None:
+            self._forget_key(key)
+
+    def _sorted_index(self) -> List[str]:
+        """Sorted indexed keys, merging keys indexed since the last lookup."""
+        if self._unsorted_keys or self._forgotten_keys:
+            indexed = self._key_tags
+            keys = [key for key in self._sorted_keys if key in indexed]
+            if self._unsorted_keys:
+                fresh = {key for key in self._unsorted_keys if key in indexed}
+                keys.extend(fresh.difference(keys))
+                keys.sort()  # one sorted run plus the new keys
+            self._sorted_keys = keys
+            self._unsorted_keys = []
+            self._forgotten_keys = 0
+        return self._sorted_keys
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """Indexed keys starting with ``prefix`` (binary search on the sorted index)."""
+        keys = self._sorted_index()
+        start = bisect.bisect_left(keys, prefix)
+        if not prefix:
+            return list(keys)
+        # Smallest string greater than every string starting with prefix
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return keys[start : bisect.bisect_left(keys, upper, start)]
+
+    def keys_for_tag(self, tag: str) -> Set[str]:
+        return set(self._tag_keys.get(tag, ()))
 
+    @property
+    def _shared_l2(self) -> bool:
+        """L2 supports backend-side tags and prefix deletes."""
+        return isinstance(self.secondary_cache, AsyncRedisCache)
+
+    def _discard(self, key: str) -> None:
+        self._forget_key(key)
+        # Callers after the invalidation must not join a load started before it
+        self._flight.forget(key)
+
+    async def _delete_keys(self, keys: Iterable[str]) -> int:
+        deleted = 0
+        for key in list(keys):
+            if await self.delete(key):
+                deleted += 1
+        return deleted
+
+    async def _delete_local(self, keys: Iterable[str], l2_deleted: List[str]) -> int:
+        """Delete ``keys`` from L1 once the L2 backend deleted ``l2_deleted``."""
+        l2_keys = set(l2_deleted)
+        deleted = 0
+        for key in l2_keys.union(keys):
+            self._discard(key)
+            if await self.primary_cache.delete(key) or key in l2_keys:
+                deleted += 1
+        return deleted
+
+    # --- Cache operations ---
     async def get(self, key: str) -> Optional[Any]:
         """Get value with cache hierarchy."""
         # Try primary cache first
         value = await self.primary_cache.get(key)
         if value is not None:
+            self._check_stale(key)
             return value
 
         # Try secondary cache if available
         if self.secondary_cache:
             value = await self.secondary_cache.get(key)
             if value is not None:
-                # Populate primary cache
+                # Populate primary cache; indexed so invalidations reach the copy
                 await self.primary_cache.set(key, value)
+                self._index_key(key, None)
+                self._check_stale(key)
                 return value
 
+        # Expired or evicted everywhere: drop it from the invalidation index
+        self._forget_key(key)
         return None
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in both cache layers."""
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        stale_ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached value or load it once for all concurrent callers.
+
+        ``None`` results are returned but not cached. With ``stale_ttl`` the
+        entry outlives ``ttl`` by that many seconds; a read in that window
+        returns the stale value and triggers a background refresh.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def load() -> Any:
+            # Another flight may have filled the key while we were queued
+            value = await self.get(key)
+            if value is None:
+                value = await self._load_and_store(key, loader, ttl, tags, stale_ttl)
+            return value
+
+        return await self._flight.do(key, load)
+
+    async def _load_and_store(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        tags: Optional[Iterable[str]],
+        stale_ttl: Optional[int],
+    ) -> Any:
+        generation = self._flight.generation(key)
+        value = await loader()
+        if value is None or self._flight.generation(key) != generation:
+            return value
+        if not stale_ttl:
+            await self.set(key, value, ttl, tags)
+            await self._drop_if_invalidated(key, generation)
+            return value
+
+        config = getattr(self.primary_cache, "config", None)
+        fresh_ttl = ttl if ttl is not None else getattr(config, "default_ttl", 300)
+        tags = list(tags) if tags else None
+        await self.set(key, value, fresh_ttl + stale_ttl, tags)
+        if not await self._drop_if_invalidated(key, generation):
+            self._fresh_until[key] = time.time() + fresh_ttl
+            self._refreshers[key] = (loader, (ttl, tags, stale_ttl))
+        return value
+
+    async def _drop_if_invalidated(self, key: str, generation: int) -> bool:
+        """Undo a write of a loaded value that an invalidation overtook."""
+        if self._flight.generation(key) == generation:
+            return False
+        self._forget_key(key)
+        await self.primary_cache.delete(key)
+        if self.secondary_cache:
+            await self.secondary_cache.delete(key)
+        return True
+
+    def _check_stale(self, key: str) -> None:
+        fresh_until = self._fresh_until.get(key)
+        if fresh_until is None or time.time() < fresh_until:
+            return
+        if self._flight.in_flight(key):
+            return
+        loader, (ttl, tags, stale_ttl) = self._refreshers[key]
+
+        async def refresh() -> None:
+            try:
+                await self._flight.do(
+                    key,
+                    lambda: self._load_and_store(key, loader, ttl, tags, stale_ttl),
+                )
+            except Exception as e:
+                # Keep serving the stale value until it really expires
+                print(f"Cache refresh error for {key}: {e}")
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several keys; L1 misses are fetched from L2 in one batch."""
+        result: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            value = await self.primary_cache.get(key)
+            if value is not None:
+                result[key] = value
+            else:
+                missing.append(key)
+
+        if missing and self.secondary_cache:
+            if isinstance(self.secondary_cache, AsyncRedisCache):
+                found = await self.secondary_cache.get_many(missing)
+            else:
+                found = {}
+                for key in missing:
+                    value = await self.secondary_cache.get(key)
+                    if value is not None:
+                        found[key] = value
+            for key, value in found.items():
+                await self.primary_cache.set(key, value)
+                self._index_key(key, None)
+            result.update(found)
+
+        return result
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Set several keys; L2 writes are pipelined when supported."""
+        tags = list(tags) if tags else None
+        for key, value in items.items():
+            await self.primary_cache.set(key, value, ttl)
+            self._index_key(key, tags)
+
+        if self.secondary_cache:
+            if isinstance(self.secondary_cache, AsyncRedisCache):
+                await self.secondary_cache.set_many(items, ttl, tags)
+            else:
+                for key, value in items.items():
+                    await self.secondary_cache.set(key, value, ttl)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Set value in both cache layers, optionally registering tags."""
+        # An explicit write is fresh; drop any stale-while-revalidate state
+        self._fresh_until.pop(key, None)
+        self._refreshers.pop(key, None)
+
         # Set in primary cache
         await self.primary_cache.set(key, value, ttl)
 
         # Set in secondary cache if available
-        if self.secondary_cache:
+        if self._shared_l2:
+            await self.secondary_cache.set(key, value, ttl, tags)
+        elif self.secondary_cache:
             await self.secondary_cache.set(key, value, ttl)
 
+        self._index_key(key, tags)
+
+    async def tag(self, key: str, *tags: str) -> None:
+        """Attach extra tags to a key (cached already or about to be)."""
+        self._index_key(key, tags)
+        if self._shared_l2:
+            await self.secondary_cache.tag([key], tags)
+
     async def delete(self, key: str) -> bool:
         """Delete value from both cache layers."""
+        self._discard(key)
         primary_deleted = await self.primary_cache.delete(key)
         secondary_deleted = True
 
@@ -468,6 +1320,52 @@ class CacheManager:
 
         return primary_deleted or secondary_deleted
 
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key carrying any of ``tags``; returns the count deleted."""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys.update(self._tag_keys.get(tag, ()))
+        if self._shared_l2:
+            l2_deleted = await self.secondary_cache.invalidate_tags(*tags)
+            return await self._delete_local(keys, l2_deleted)
+        return await self._delete_keys(keys)
+
+    async def invalidate_prefix(self, prefix: str) -> int:
+        """Delete every key starting with ``prefix``."""
+        keys = self.keys_with_prefix(prefix)
+        if self._shared_l2:
+            l2_deleted = await self.secondary_cache.delete_prefix(prefix)
+            return await self._delete_local(keys, l2_deleted)
+        return await self._delete_keys(keys)
+
+    async def clear_cache(self, pattern: Optional[str] = None) -> int:
+        """
+        Invalidate by pattern.
+
+        ``None`` or ``"*"`` clears everything, ``"prefix*"`` is a prefix
+        invalidation, other globs are matched within their literal prefix and
+        a pattern without wildcard deletes that single key.
+        """
+        if pattern is None or pattern == "*":
+            count = len(self._key_tags)
+            await self.clear()
+            return count
+
+        wildcard = min((i for i, ch in enumerate(pattern) if ch in "*?["), default=None)
+        if wildcard is None:
+            return int(await self.delete(pattern))
+        if wildcard == len(pattern) - 1 and pattern.endswith("*"):
+            return await self.invalidate_prefix(pattern[:-1])
+
+        prefix = pattern[:wildcard]
+        keys = [
+            k for k in self.keys_with_prefix(prefix) if fnmatch.fnmatchcase(k, pattern)
+        ]
+        if self._shared_l2:
+            l2_deleted = await self.secondary_cache.delete_prefix(prefix, pattern)
+            return await self._delete_local(keys, l2_deleted)
+        return await self._delete_keys(keys)
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in either cache layer."""
         exists_primary = await self.primary_cache.exists(key)
@@ -484,6 +1382,14 @@ class CacheManager:
         await self.primary_cache.clear()
         if self.secondary_cache:
             await self.secondary_cache.clear()
+        self._sorted_keys.clear()
+        self._unsorted_keys.clear()
+        self._forgotten_keys = 0
+        self._key_tags.clear()
+        self._tag_keys.clear()
+        self._fresh_until.clear()
+        self._refreshers.clear()
+        self._flight.forget_all()
 
     async def get_combined_metrics(self) -> Dict[str, CacheMetrics]:
         """Get metrics from both cache layers."""
@@ -494,16 +1400,37 @@ class CacheManager:
 
         return metrics
 
+    def get_index_info(self) -> Dict[str, int]:
+        """Size of the invalidation indexes and single-flight counters."""
+        return {
+            "indexed_keys": len(self._key_tags),
+            "tags": len(self._tag_keys),
+            "loads_executed": self._flight.executed,
+            "loads_coalesced": self._flight.coalesced,
+            "stale_tracked": len(self._fresh_until),
+        }
+
 
 # Cache decorators for easy use
-def cache_result(cache_key_func, ttl: Optional[int] = None):
-    """Decorator to cache function results."""
+def cache_result(
+    cache_key_func,
+    ttl: Optional[int] = None,
+    stale_ttl: Optional[int] = None,
+):
+    """
+    Decorator to cache function results.
+
+    ``cache_key_func`` receives the call arguments and returns the cache key;
+    concurrent misses on the same key share one call of the function.
+    """
 
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            # This would implement caching logic
-            # For now, just call the function
-            return await func(*args, **kwargs)
+            key = cache_key_func(*args, **kwargs)
+            return await get_cache_manager().get_or_load(
+                key, lambda: func(*args, **kwargs), ttl, stale_ttl=stale_ttl
+            )
 
         return wrapper
 
@@ -530,8 +1457,14 @@ def get_memory_cache(config: Optional[CacheConfig] = None) -> AsyncMemoryCache:
 def get_cache_manager(
     primary_config: Optional[CacheConfig] = None,
     use_redis: bool = False,
+    redis_url: Optional[str] = None,
 ) -> CacheManager:
-    """Get global cache manager instance."""
+    """
+    Get global cache manager instance.
+
+    With ``use_redis`` an L2 tier is attached: Redis at ``redis_url`` (or
+    ``config.l2_url``) when available, the shared on-disk stand-in otherwise.
+    """
     global _cache_manager
 
     if _cache_manager is None:
@@ -539,8 +1472,8 @@ def get_cache_manager(
         secondary_cache = None
 
         if use_redis:
-            # In production, you would configure Redis here
-            secondary_cache = AsyncRedisCache(primary_config or CacheConfig())
+            config = primary_config or CacheConfig()
+            secondary_cache = AsyncRedisCache(config, redis_url or config.l2_url)
 
         _cache_manager = CacheManager(primary_cache, secondary_cache)
 
@@ -554,13 +1487,36 @@ async def cache_get(key: str) -> Optional[Any]:
     return await manager.get(key)
 
 
-async def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> None:
+async def cache_set(
+    key: str,
+    value: Any,
+    ttl: Optional[int] = None,
+    tags: Optional[Iterable[str]] = None,
+) -> None:
     """Set in global cache."""
     manager = get_cache_manager()
-    await manager.set(key, value, ttl)
+    await manager.set(key, value, ttl, tags)
+
+
+async def cache_get_or_load(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: Optional[int] = None,
+    tags: Optional[Iterable[str]] = None,
+    stale_ttl: Optional[int] = None,
+) -> Any:
+    """Get from global cache, loading once across concurrent misses."""
+    manager = get_cache_manager()
+    return await manager.get_or_load(key, loader, ttl, tags, stale_ttl)
 
 
 async def cache_delete(key: str) -> bool:
     """Delete from global cache."""
     manager = get_cache_manager()
     return await manager.delete(key)
+
+
+async def cache_invalidate_tags(*tags: str) -> int:
+    """Invalidate tagged keys in global cache."""
+    manager = get_cache_manager()
+    return await manager.invalidate_tags(*tags)
@@ -188,6 +188,11 @@ class AsyncTransaction:
         self._committed = False
         self._rolled_back = False
 
+    @property
+    def connection(self) -> AsyncConnection:
+        """Connection the transaction runs on."""
+        return self._connection
+
     async def __aenter__(self) -> AsyncTransaction:
         """Start transaction."""
         await self._connection.execute("BEGIN")
@@ -306,7 +311,7 @@ class AsyncDatabaseManager:
             # Return connection to pool
             if connection and not connection.is_closed:
                 try:
-                    await self._connections.put_nowait(connection)
+                    self._connections.put_nowait(connection)
                 except asyncio.QueueFull:
                     # Pool is full, close the connection
                     await connection.close()
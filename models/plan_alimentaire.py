@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from models.aliment import Aliment
+from models.portion import Portion
+
 
 @dataclass
 class RepasItem:
@@ -9,6 +12,9 @@ class RepasItem:
     aliment_id: int
     portion_id: int
     quantite: float = 1.0
+    # Renseignés par le chargement eager (PlanAlimentaireRepository.get_plan)
+    aliment: Optional[Aliment] = field(default=None, repr=False, compare=False)
+    portion: Optional[Portion] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
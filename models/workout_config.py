@@ -4,6 +4,7 @@ Modèle pour persister les préférences du coach utilisateur.
 """
 
 import json
+import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -96,6 +97,8 @@ class WorkoutGenerationConfig:
             "equipment_preferences": {},  # Préférences d'équipement par contexte
         }
     )
+    # Dernière entrée du journal d'apprentissage intégrée à ce fichier
+    learning_log_seq: int = 0
 
     # === CONTRAINTES TECHNIQUES ===
     # Gestion de l'équipement
@@ -147,6 +150,7 @@ class WorkoutGenerationConfig:
             "favorite_exercises": self.favorite_exercises,
             "exercise_restrictions": self.exercise_restrictions,
             "learning_preferences": self.learning_preferences,
+            "learning_log_seq": self.learning_log_seq,
             "equipment_management": self.equipment_management,
             "timing_rules": self.timing_rules,
             "physiological_rules": self.physiological_rules,
@@ -158,9 +162,17 @@ class WorkoutGenerationConfig:
         return cls(**data)
 
     def save_to_file(self, filepath: str):
-        """Sauvegarde la configuration dans un fichier JSON."""
-        with open(filepath, "w", encoding="utf-8") as f:
+        """Sauvegarde la configuration dans un fichier JSON.
+
+        Écriture atomique : fichier temporaire puis renommage, un lecteur ne
+        voit jamais un fichier à moitié écrit.
+        """
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
 
     @classmethod
     def load_from_file(cls, filepath: str) -> "WorkoutGenerationConfig":
@@ -23,20 +23,16 @@ from core.exceptions import (
     RepositoryError,
     ValidationError,
 )
+from db.exercise_fts import FTS_TABLE, RANKED_MATCH, match_expression
 from domain.entities import Exercise
 from domain.events import (
     ExerciseCreatedEvent,
     ExerciseUpdatedEvent,
     ExerciseUsageTrackedEvent,
 )
-from infrastructure.cache import (
-    CacheManager,
-    cache_delete,
-    cache_get,
-    cache_set,
-    get_cache_manager,
-)
+from infrastructure.cache import CacheManager, get_cache_manager
 from infrastructure.database import AsyncDatabaseManager, get_database_manager
+from repositories.exercices_repo import mark_exercises_changed
 from repositories.interfaces import (
     IAsyncExerciseRepository,
     ISpecification,
@@ -141,10 +137,13 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
         # Cache configuration
         self._cache_prefix = "exercise:"
+        # Pages, searches and analytics spanning several exercises
+        self._list_tag = "exercise:lists"
         self._default_cache_ttl = 600  # 10 minutes (exercises change less frequently)
         self._list_cache_ttl = 300  # 5 minutes for lists
         self._analytics_cache_ttl = 1800  # 30 minutes for analytics
         self._search_cache_ttl = 180  # 3 minutes for search results
+        self._stale_cache_ttl = 60  # serve expired entries while refreshing
 
     # Core CRUD Operations
 
@@ -159,7 +158,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
             # Check cache first
             cache_key = f"{self._cache_prefix}{entity_id}"
             if options.use_cache:
-                cached_exercise = await cache_get(cache_key)
+                cached_exercise = await self._cache_manager.get(cache_key)
                 if cached_exercise:
                     self._metrics.cache_hits += 1
                     self._metrics.successful_queries += 1
@@ -168,36 +167,25 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
                 self._metrics.cache_misses += 1
 
-            # Query database
-            query = """
-            SELECT id, nom, description, categorie, muscles_cibles,
-                   materiel, niveau_difficulte, instructions,
-                   duree_moyenne, calories_par_minute, image_url,
-                   video_url, date_creation, date_modification, is_active
-            FROM exercices
-            WHERE id = ? AND is_active = 1
-            """
-
-            async with self._db_manager.get_connection() as conn:
-                row = await conn.fetchone(query, (entity_id,))
-
-                if not row:
-                    self._metrics.successful_queries += 1
-                    self._metrics.total_queries += 1
-                    return None
-
-                exercise = self._map_row_to_exercise(row)
+                # Concurrent misses for this id share a single query
+                data = await self._cache_manager.get_or_load(
+                    cache_key,
+                    lambda: self._load_exercise_data(entity_id),
+                    options.cache_ttl or self._default_cache_ttl,
+                    tags=[f"exercise:{entity_id}"],
+                    stale_ttl=self._stale_cache_ttl,
+                )
+                exercise = self._deserialize_exercise(data) if data else None
+            else:
+                exercise = await self._query_exercise(entity_id)
 
-                # Cache result
-                if options.use_cache:
-                    await cache_set(
-                        cache_key,
-                        self._serialize_exercise(exercise),
-                        options.cache_ttl or self._default_cache_ttl,
-                    )
+            if exercise is None:
+                self._metrics.successful_queries += 1
+                self._metrics.total_queries += 1
+                return None
 
-                self._update_metrics(start_time, True)
-                return exercise
+            self._update_metrics(start_time, True)
+            return exercise
 
         except Exception as e:
             self._update_metrics(start_time, False)
@@ -205,6 +193,25 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 f"Failed to get exercise {entity_id}: {str(e)}"
             ) from e
 
+    async def _query_exercise(self, entity_id: int) -> Optional[Exercise]:
+        query = """
+        SELECT id, nom, description, categorie, muscles_cibles,
+               materiel, niveau_difficulte, instructions,
+               duree_moyenne, calories_par_minute, image_url,
+               video_url, date_creation, date_modification, is_active
+        FROM exercices
+        WHERE id = ? AND is_active = 1
+        """
+
+        async with self._db_manager.get_connection() as conn:
+            row = await conn.fetchone(query, (entity_id,))
+        return self._map_row_to_exercise(row) if row else None
+
+    async def _load_exercise_data(self, entity_id: int) -> Optional[Dict[str, Any]]:
+        """Cache loader for ``get_by_id``: serialized exercise or None."""
+        exercise = await self._query_exercise(entity_id)
+        return self._serialize_exercise(exercise) if exercise else None
+
     async def get_all(
         self, options: Optional[QueryOptions] = None
     ) -> QueryResult[Exercise]:
@@ -218,7 +225,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
             # Check cache
             if options.use_cache:
-                cached_result = await cache_get(cache_key)
+                cached_result = await self._cache_manager.get(cache_key)
                 if cached_result:
                     self._metrics.cache_hits += 1
                     self._metrics.successful_queries += 1
@@ -272,10 +279,11 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
                 # Cache result
                 if options.use_cache:
-                    await cache_set(
+                    await self._cache_manager.set(
                         cache_key,
                         self._serialize_query_result(result),
                         self._list_cache_ttl,
+                        tags=[self._list_tag],
                     )
 
                 self._update_metrics(start_time, True)
@@ -392,7 +400,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 entity.id = cursor.lastrowid
 
             # Invalidate caches
-            await self._invalidate_exercise_caches()
+            await self._invalidate_list_caches()
 
             # Publish domain event
             if self._event_bus:
@@ -458,7 +466,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
             # Invalidate caches
             await self._invalidate_single_exercise_cache(entity.id)
-            await self._invalidate_exercise_caches()
+            await self._invalidate_list_caches()
 
             # Publish domain event
             if self._event_bus:
@@ -511,7 +519,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
             # Check cache
             if options.use_cache:
-                cached_result = await cache_get(cache_key)
+                cached_result = await self._cache_manager.get(cache_key)
                 if cached_result:
                     self._metrics.cache_hits += 1
                     self._metrics.successful_queries += 1
@@ -520,96 +528,84 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
                 self._metrics.cache_misses += 1
 
-            # Full-text search query with ranking
-            search_pattern = f"%{search_term.lower()}%"
+                async def load_search() -> Dict[str, Any]:
+                    result = await self._query_search(search_term, options)
+                    # Tags depend on the rows found, register them before the write
+                    await self._cache_manager.tag(
+                        cache_key, *(f"exercise:{ex.id}" for ex in result.data)
+                    )
+                    return self._serialize_query_result(result)
+
+                # Concurrent misses for the same search share a single query
+                data = await self._cache_manager.get_or_load(
+                    cache_key,
+                    load_search,
+                    self._search_cache_ttl,
+                    tags=["search", self._list_tag],
+                    stale_ttl=self._stale_cache_ttl,
+                )
+                result = self._deserialize_query_result(data)
+            else:
+                result = await self._query_search(search_term, options)
 
-            base_query = """
-            SELECT id, nom, description, categorie, muscles_cibles,
-                   materiel, niveau_difficulte, instructions,
-                   duree_moyenne, calories_par_minute, image_url,
-                   video_url, date_creation, date_modification, is_active,
-                   (CASE
-                    WHEN LOWER(nom) = ? THEN 100
-                    WHEN LOWER(nom) LIKE ? THEN 90
-                    WHEN LOWER(description) LIKE ? THEN 70
-                    WHEN LOWER(muscles_cibles) LIKE ? THEN 60
-                    WHEN LOWER(instructions) LIKE ? THEN 50
-                    ELSE 0
-                   END) as relevance_score
-            FROM exercices
-            WHERE is_active = 1
-            AND (LOWER(nom) LIKE ? OR LOWER(description) LIKE ?
-                 OR LOWER(muscles_cibles) LIKE ? OR LOWER(instructions) LIKE ?)
-            """
+            self._update_metrics(start_time, True)
+            return result
 
-            search_params = (
-                search_term.lower(),  # Exact match
-                f"{search_term.lower()}%",  # Starts with
-                search_pattern,  # Description contains
-                search_pattern,  # Muscle groups contains
-                search_pattern,  # Instructions contains
-                search_pattern,  # Name contains
-                search_pattern,  # Description contains
-                search_pattern,  # Muscle groups contains
-                search_pattern,  # Instructions contains
-            )
+        except Exception as e:
+            self._update_metrics(start_time, False)
+            raise RepositoryError(f"Failed to search exercises: {str(e)}") from e
 
-            # Add sorting by relevance then name
-            order_clause = " ORDER BY relevance_score DESC, nom ASC"
+    async def _query_search(
+        self, search_term: str, options: QueryOptions
+    ) -> QueryResult[Exercise]:
+        start_time = time.perf_counter()
 
-            # Add pagination
-            pagination = PaginationSpecification(options.page, options.page_size)
-            limit_clause, limit_params = pagination.to_sql_limit()
+        # FTS5 index (bm25 ranking, prefix and accent-insensitive matching);
+        # the window count returns the total with the page in one query
+        expression = match_expression(search_term)
+        pagination = PaginationSpecification(options.page, options.page_size)
+        limit_clause, limit_params = pagination.to_sql_limit()
 
-            # Count query (simpler version)
-            count_query = """
-            SELECT COUNT(*) FROM exercices
-            WHERE is_active = 1
-            AND (LOWER(nom) LIKE ? OR LOWER(description) LIKE ?
-                 OR LOWER(muscles_cibles) LIKE ? OR LOWER(instructions) LIKE ?)
+        rows: List[Any] = []
+        total_count = 0
+        if expression is not None:
+            data_query = f"""
+            SELECT e.id, e.nom, e.description, e.categorie, e.muscles_cibles,
+                   e.materiel, e.niveau_difficulte, e.instructions,
+                   e.duree_moyenne, e.calories_par_minute, e.image_url,
+                   e.video_url, e.date_creation, e.date_modification, e.is_active,
+                   COUNT(*) OVER () AS total_count
+            FROM {RANKED_MATCH} m
+            JOIN exercices e ON e.id = m.rowid
+            WHERE e.is_active = 1
+            ORDER BY m.score, e.nom ASC
+            {limit_clause}
             """
 
-            count_params = (
-                search_pattern,
-                search_pattern,
-                search_pattern,
-                search_pattern,
-            )
-
-            # Data query
-            data_query = f"{base_query}{order_clause} {limit_clause}"
-
             async with self._db_manager.get_connection() as conn:
-                total_count = await conn.execute_scalar(count_query, count_params)
-                rows = await conn.fetchall(data_query, search_params + limit_params)
-
-                exercises = [self._map_row_to_exercise(row) for row in rows]
-
-                result = QueryResult(
-                    data=exercises,
-                    total_count=total_count,
-                    page=options.page,
-                    page_size=options.page_size,
-                    has_next=(options.page * options.page_size) < total_count,
-                    has_previous=options.page > 1,
-                    execution_time_ms=(time.perf_counter() - start_time) * 1000,
-                    cache_hit=False,
-                )
-
-                # Cache search results
-                if options.use_cache:
-                    await cache_set(
-                        cache_key,
-                        self._serialize_query_result(result),
-                        self._search_cache_ttl,
+                rows = await conn.fetchall(data_query, (expression, *limit_params))
+                if rows:
+                    total_count = rows[0]["total_count"]
+                elif options.page > 1:
+                    total_count = await conn.execute_scalar(
+                        f"""
+                        SELECT COUNT(*) FROM {FTS_TABLE}
+                        JOIN exercices e ON e.id = {FTS_TABLE}.rowid
+                        WHERE {FTS_TABLE} MATCH ? AND e.is_active = 1
+                        """,
+                        (expression,),
                     )
 
-                self._update_metrics(start_time, True)
-                return result
-
-        except Exception as e:
-            self._update_metrics(start_time, False)
-            raise RepositoryError(f"Failed to search exercises: {str(e)}") from e
+        return QueryResult(
+            data=[self._map_row_to_exercise(row) for row in rows],
+            total_count=total_count,
+            page=options.page,
+            page_size=options.page_size,
+            has_next=(options.page * options.page_size) < total_count,
+            has_previous=options.page > 1,
+            execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            cache_hit=False,
+        )
 
     async def find_by_equipment(
         self, equipment: str, options: Optional[QueryOptions] = None
@@ -629,7 +625,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
             cache_key = f"{self._cache_prefix}popular:{limit}:{days_back}"
 
             # Check cache
-            cached_result = await cache_get(cache_key)
+            cached_result = await self._cache_manager.get(cache_key)
             if cached_result:
                 self._metrics.cache_hits += 1
                 self._metrics.successful_queries += 1
@@ -675,8 +671,11 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 serialized_exercises = [
                     self._serialize_exercise(ex) for ex in exercises
                 ]
-                await cache_set(
-                    cache_key, serialized_exercises, self._analytics_cache_ttl
+                await self._cache_manager.set(
+                    cache_key,
+                    serialized_exercises,
+                    self._analytics_cache_ttl,
+                    tags=[self._list_tag],
                 )
 
                 self._update_metrics(start_time, True)
@@ -695,7 +694,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
             cache_key = f"{self._cache_prefix}stats:{exercise_id}"
 
             # Check cache
-            cached_stats = await cache_get(cache_key)
+            cached_stats = await self._cache_manager.get(cache_key)
             if cached_stats:
                 self._metrics.cache_hits += 1
                 return cached_stats
@@ -797,7 +796,12 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 }
 
             # Cache statistics
-            await cache_set(cache_key, stats, self._analytics_cache_ttl)
+            await self._cache_manager.set(
+                cache_key,
+                stats,
+                self._analytics_cache_ttl,
+                tags=[f"exercise:{exercise_id}"],
+            )
 
             # Track usage analytics event
             if self._event_bus:
@@ -837,7 +841,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
             cache_key = f"{self._cache_prefix}similar:{exercise_id}:{limit}"
 
             # Check cache
-            cached_result = await cache_get(cache_key)
+            cached_result = await self._cache_manager.get(cache_key)
             if cached_result:
                 self._metrics.cache_hits += 1
                 return [self._deserialize_exercise(ex) for ex in cached_result]
@@ -903,8 +907,11 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 serialized_exercises = [
                     self._serialize_exercise(ex) for ex in similar_exercises
                 ]
-                await cache_set(
-                    cache_key, serialized_exercises, self._analytics_cache_ttl
+                await self._cache_manager.set(
+                    cache_key,
+                    serialized_exercises,
+                    self._analytics_cache_ttl,
+                    tags=[self._list_tag],
                 )
 
                 self._update_metrics(start_time, True)
@@ -958,8 +965,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                         )
                         continue
 
-            # Invalidate all caches after bulk import
-            await self._invalidate_exercise_caches()
+            # Each create already invalidated the list caches
 
             self._update_metrics(start_time, True)
             return imported_exercises
@@ -1056,12 +1062,14 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
             return row["rank"] if row else 0
 
     async def _invalidate_single_exercise_cache(self, exercise_id: int) -> None:
-        """Invalidate cache for a specific exercise."""
-        await cache_delete(f"{self._cache_prefix}{exercise_id}")
+        """Invalidate cache for a specific exercise and the searches listing it."""
+        await self._cache_manager.delete(f"{self._cache_prefix}{exercise_id}")
+        await self._cache_manager.invalidate_tags(f"exercise:{exercise_id}")
 
-    async def _invalidate_exercise_caches(self) -> None:
-        """Invalidate all exercise-related caches."""
-        await self._cache_manager.clear_cache(f"{self._cache_prefix}*")
+    async def _invalidate_list_caches(self) -> None:
+        """Invalidate the caches spanning several exercises."""
+        await self._cache_manager.invalidate_tags(self._list_tag)
+        mark_exercises_changed()
 
     def _update_metrics(self, start_time: float, success: bool) -> None:
         """Update repository metrics."""
@@ -1123,7 +1131,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
             if success:
                 await self._invalidate_single_exercise_cache(entity_id)
-                await self._invalidate_exercise_caches()
+                await self._invalidate_list_caches()
 
             self._update_metrics(start_time, True)
             return success
@@ -1154,7 +1162,7 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
 
             if success:
                 await self._invalidate_single_exercise_cache(entity_id)
-                await self._invalidate_exercise_caches()
+                await self._invalidate_list_caches()
 
             self._update_metrics(start_time, True)
             return success
@@ -1195,7 +1203,6 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 updated_exercise = await self.update(entity)
                 updated_exercises.append(updated_exercise)
 
-        await self._invalidate_exercise_caches()
         return updated_exercises
 
     async def batch_delete(self, entity_ids: List[int]) -> int:
@@ -1207,7 +1214,6 @@ class AsyncExerciseRepository(IAsyncExerciseRepository):
                 if await self.delete(entity_id):
                     deleted_count += 1
 
-        await self._invalidate_exercise_caches()
         return deleted_count
 
     async def get_metrics(self) -> RepositoryMetrics:
@@ -1,13 +1,51 @@
-from typing import Any, Dict, List, Optional
+import itertools
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from db.database_manager import db_manager
+from db.exercise_fts import FTS_TABLE, RANKED_MATCH, column_any, match_expression
 from models.exercices import Exercise
 
+# Version des données d'exercices, incrémentée à chaque écriture (sert à
+# invalider le catalogue en mémoire, voir repositories/exercise_catalog.py)
+_data_version = 0
+_version_counter = itertools.count(1)
+_version_lock = threading.Lock()
+
+
+def mark_exercises_changed() -> None:
+    """Signale une écriture sur la table exercices."""
+    global _data_version
+    with _version_lock:
+        _data_version = next(_version_counter)
+
+
+def exercises_data_version() -> int:
+    return _data_version
+
 
 def _split_csv(s: str | None) -> List[str]:
     return [x.strip() for x in s.split(",") if x.strip()] if s else []
 
 
+def _row_to_exercise(row) -> Exercise:
+    return Exercise(
+        id=row["id"],
+        nom=row["nom"],
+        groupe_musculaire_principal=row["groupe_musculaire_principal"],
+        equipement=row["equipement"],
+        tags=row["tags"],
+        movement_pattern=row["movement_pattern"],
+        movement_category=row["movement_category"]
+        if "movement_category" in row.keys()
+        else None,
+        type_effort=row["type_effort"],
+        coefficient_volume=row["coefficient_volume"],
+        est_chargeable=bool(row["est_chargeable"]),
+    )
+
+
 class ExerciseRepository:
     def list_all_exercices(self) -> List[Exercise]:
         with db_manager.get_connection() as conn:
@@ -112,7 +150,8 @@ class ExerciseRepository:
                 ),
             )
             conn.commit()
-            return int(cur.lastrowid)
+        mark_exercises_changed()
+        return int(cur.lastrowid)
 
     def update(self, e: Exercise) -> None:
         with db_manager.get_connection() as conn:
@@ -135,11 +174,13 @@ class ExerciseRepository:
                 ),
             )
             conn.commit()
+        mark_exercises_changed()
 
     def delete(self, exercise_id: int) -> None:
         with db_manager.get_connection() as conn:
             conn.execute("DELETE FROM exercices WHERE id = ?", (exercise_id,))
             conn.commit()
+        mark_exercises_changed()
 
     def cleanup_normalize(self) -> int:
         """Normalise les valeurs redondantes/incohérentes.
@@ -171,7 +212,8 @@ class ExerciseRepository:
             )
             conn.commit()
             after = conn.total_changes
-            return max(0, after - before)
+        mark_exercises_changed()
+        return max(0, after - before)
 
     def get_names_by_ids(self, ids: List[int]) -> Dict[int, str]:
         if not ids:
@@ -219,12 +261,77 @@ class ExerciseRepository:
             }
         return out
 
+    def search(
+        self, term: str, limit: int = 50, offset: int = 0
+    ) -> Tuple[List[Exercise], int]:
+        """Recherche plein texte (préfixes, sans accents) classée par bm25.
+
+        Retourne la page demandée et le nombre total de résultats, obtenus
+        par une seule requête sur l'index FTS.
+        """
+        expression = match_expression(term)
+        if expression is None:
+            return [], 0
+        query = (
+            f"SELECT e.*, COUNT(*) OVER () AS total_count FROM {RANKED_MATCH} m "
+            "JOIN exercices e ON e.id = m.rowid "
+            "ORDER BY m.score, e.nom LIMIT ? OFFSET ?"
+        )
+        with db_manager.get_connection() as conn:
+            rows = conn.execute(query, (expression, limit, offset)).fetchall()
+            if rows:
+                total = rows[0]["total_count"]
+            elif offset:
+                # Page au-delà de la fin : le total reste utile à la pagination
+                total = conn.execute(
+                    f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?",
+                    (expression,),
+                ).fetchone()[0]
+            else:
+                total = 0
+        return [_row_to_exercise(row) for row in rows], total
+
     def filter(
         self,
         equipment: Optional[List[str]] = None,
         tags: Optional[List[str]] = None,
     ) -> List[Exercise]:
-        """Return exercises filtered by equipment and/or tags."""
+        """Return exercises filtered by equipment and/or tags.
+
+        Uses the FTS index (accent-insensitive, prefix match per value) and
+        falls back to LIKE scans when the index is not available.
+        """
+        conditions = [
+            c
+            for c in (
+                column_any("equipement", equipment or []),
+                column_any("tags", tags or []),
+            )
+            if c
+        ]
+        if not conditions:
+            if equipment or tags:
+                return []
+            with db_manager.get_connection() as conn:
+                rows = conn.execute("SELECT * FROM exercices ORDER BY nom").fetchall()
+            return [_row_to_exercise(row) for row in rows]
+
+        query = (
+            f"SELECT e.* FROM {FTS_TABLE} JOIN exercices e ON e.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH ? ORDER BY e.nom"
+        )
+        try:
+            with db_manager.get_connection() as conn:
+                rows = conn.execute(query, (" AND ".join(conditions),)).fetchall()
+        except sqlite3.OperationalError:
+            return self._filter_like(equipment, tags)
+        return [_row_to_exercise(row) for row in rows]
+
+    def _filter_like(
+        self,
+        equipment: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[Exercise]:
         query = "SELECT * FROM exercices"
         conditions: List[str] = []
         params: List[str] = []
@@ -250,20 +357,4 @@ class ExerciseRepository:
         with db_manager.get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
 
-        return [
-            Exercise(
-                id=row["id"],
-                nom=row["nom"],
-                groupe_musculaire_principal=row["groupe_musculaire_principal"],
-                equipement=row["equipement"],
-                tags=row["tags"],
-                movement_pattern=row["movement_pattern"],
-                movement_category=row["movement_category"]
-                if "movement_category" in row.keys()
-                else None,
-                type_effort=row["type_effort"],
-                coefficient_volume=row["coefficient_volume"],
-                est_chargeable=bool(row["est_chargeable"]),
-            )
-            for row in rows
-        ]
+        return [_row_to_exercise(row) for row in rows]
@@ -0,0 +1,252 @@
+"""
+Catalogue d'exercices en mémoire pour les générateurs de séances.
+
+Le catalogue charge tous les exercices en une requête puis précalcule des
+index inversés (matériel, tags, pattern, groupe musculaire) sous forme de
+bitsets : un ``int`` Python dont le bit ``i`` désigne le i-ème exercice trié
+par nom. Filtrer revient alors à combiner des entiers (``&``, ``|``) au lieu
+d'interroger SQLite.
+
+Le catalogue est versionné : toute écriture sur ``exercices`` passant par
+``ExerciseRepository`` (ou l'import wger) incrémente la version de données et
+la prochaine lecture recharge l'instantané. Un changement de base
+(``db_manager.db_path``) provoque aussi un rechargement.
+"""
+
+import bisect
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from db.database_manager import db_manager
+from models.exercices import Exercise
+from repositories.exercices_repo import ExerciseRepository, exercises_data_version
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Minuscules sans accents ("Haltères" -> "halteres")."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _tokens(value: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(normalize_text(value))
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Positions des bits à 1, par ordre croissant."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class _TokenIndex:
+    """Index mot -> bitset, avec recherche par préfixe sur les mots triés."""
+
+    def __init__(self) -> None:
+        self.bits: Dict[str, int] = {}
+        self._sorted: List[str] = []
+
+    def add(self, text: Optional[str], bit: int) -> None:
+        for token in _tokens(text):
+            self.bits[token] = self.bits.get(token, 0) | bit
+
+    def freeze(self) -> None:
+        self._sorted = sorted(self.bits)
+
+    def _prefix_bits(self, prefix: str) -> int:
+        start = bisect.bisect_left(self._sorted, prefix)
+        result = 0
+        for token in self._sorted[start:]:
+            if not token.startswith(prefix):
+                break
+            result |= self.bits[token]
+        return result
+
+    def match(self, value: str) -> int:
+        """Exercices contenant tous les mots de ``value`` (dernier en préfixe).
+
+        Même sémantique que les filtres FTS de ``ExerciseRepository.filter``.
+        """
+        tokens = _tokens(value)
+        if not tokens:
+            return 0
+        result = self._prefix_bits(tokens[-1])
+        for token in tokens[:-1]:
+            result &= self.bits.get(token, 0)
+        return result
+
+    def match_any(self, values: Iterable[str]) -> int:
+        result = 0
+        for value in values:
+            result |= self.match(value)
+        return result
+
+
+class _Snapshot:
+    """Instantané immuable du catalogue et de ses index."""
+
+    def __init__(self, exercises: List[Exercise], version: int, db_path: str):
+        self.version = version
+        self.db_path = db_path
+        self.exercises = sorted(exercises, key=lambda e: e.nom)
+        self.all_bits = (1 << len(self.exercises)) - 1
+        self.position_by_id: Dict[int, int] = {}
+        self.equipment = _TokenIndex()
+        self.tags = _TokenIndex()
+        self.by_pattern: Dict[str, int] = {}
+        self.by_muscle: Dict[str, int] = {}
+
+        for position, exercise in enumerate(self.exercises):
+            bit = 1 << position
+            self.position_by_id[exercise.id] = position
+            self.equipment.add(exercise.equipement, bit)
+            self.tags.add(exercise.tags, bit)
+            pattern = normalize_text(exercise.movement_pattern).strip()
+            if pattern:
+                self.by_pattern[pattern] = self.by_pattern.get(pattern, 0) | bit
+            muscle = normalize_text(exercise.groupe_musculaire_principal).strip()
+            if muscle:
+                self.by_muscle[muscle] = self.by_muscle.get(muscle, 0) | bit
+
+        self.equipment.freeze()
+        self.tags.freeze()
+
+
+class ExerciseCatalog:
+    """Catalogue versionné d'exercices avec index inversés en bitsets."""
+
+    def __init__(self, repo: Optional[ExerciseRepository] = None):
+        self.repo = repo or ExerciseRepository()
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+        self._frozen = False
+        self.loads = 0
+
+    @classmethod
+    def from_exercises(
+        cls, exercises: List[Exercise], version: int = 0, db_path: str = ""
+    ) -> "ExerciseCatalog":
+        """Catalogue figé sur une liste d'exercices, sans accès à la base.
+
+        Sert à partager un instantané chaud avec des processus de génération.
+        """
+        catalog = cls()
+        catalog._snapshot = _Snapshot(exercises, version, db_path)
+        catalog._frozen = True
+        return catalog
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if self._frozen:
+            return snapshot
+        version = exercises_data_version()
+        db_path = db_manager.db_path
+        if (
+            snapshot is not None
+            and snapshot.version == version
+            and snapshot.db_path == db_path
+        ):
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if (
+                snapshot is None
+                or snapshot.version != version
+                or snapshot.db_path != db_path
+            ):
+                snapshot = _Snapshot(self.repo.list_all(), version, db_path)
+                self._snapshot = snapshot
+                self.loads += 1
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Force le rechargement à la prochaine lecture."""
+        if not self._frozen:
+            self._snapshot = None
+
+    @property
+    def version(self) -> int:
+        return self._current().version
+
+    @property
+    def data_key(self) -> tuple:
+        """Identifie les données servies : (version, base d'origine)."""
+        snapshot = self._current()
+        return (snapshot.version, snapshot.db_path)
+
+    # --- Lecture ---
+    def all(self) -> List[Exercise]:
+        return list(self._current().exercises)
+
+    def export(self) -> Tuple[List[Exercise], tuple]:
+        """Exercices et ``data_key`` lus sur un même instantané."""
+        snapshot = self._current()
+        return list(snapshot.exercises), (snapshot.version, snapshot.db_path)
+
+    def get(self, exercise_id: int) -> Optional[Exercise]:
+        snapshot = self._current()
+        position = snapshot.position_by_id.get(exercise_id)
+        return snapshot.exercises[position] if position is not None else None
+
+    def exercises_for(self, bits: int) -> List[Exercise]:
+        """Exercices désignés par un bitset, triés par nom."""
+        exercises = self._current().exercises
+        return [exercises[position] for position in iter_bits(bits)]
+
+    # --- Bitsets ---
+    def all_bits(self) -> int:
+        return self._current().all_bits
+
+    def equipment_bits(self, equipment: Iterable[str]) -> int:
+        return self._current().equipment.match_any(equipment)
+
+    def tag_bits(self, tags: Iterable[str]) -> int:
+        return self._current().tags.match_any(tags)
+
+    def pattern_bits(self, patterns: Iterable[str]) -> int:
+        index = self._current().by_pattern
+        result = 0
+        for pattern in patterns:
+            result |= index.get(normalize_text(pattern).strip(), 0)
+        return result
+
+    def muscle_bits(self, muscles: Iterable[str]) -> int:
+        index = self._current().by_muscle
+        result = 0
+        for muscle in muscles:
+            result |= index.get(normalize_text(muscle).strip(), 0)
+        return result
+
+    def filter(
+        self,
+        equipment: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[Exercise]:
+        """Équivalent en mémoire de ``ExerciseRepository.filter``."""
+        bits = self.all_bits()
+        if equipment:
+            bits &= self.equipment_bits(equipment)
+        if tags:
+            bits &= self.tag_bits(tags)
+        return self.exercises_for(bits)
+
+
+_catalog: Optional[ExerciseCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_exercise_catalog() -> ExerciseCatalog:
+    """Catalogue partagé par tout le processus."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ExerciseCatalog()
+    return _catalog
@@ -1,7 +1,18 @@
 from typing import Dict, List, Optional
 
 from db.database_manager import db_manager
+from models.aliment import Aliment
 from models.plan_alimentaire import PlanAlimentaire, Repas, RepasItem
+from models.portion import Portion
+
+# Limite prudente du nombre de paramètres SQLite par requête
+_MAX_SQL_PARAMS = 500
+
+
+def _chunks(values: List[int]) -> List[List[int]]:
+    return [
+        values[i : i + _MAX_SQL_PARAMS] for i in range(0, len(values), _MAX_SQL_PARAMS)
+    ]
 
 
 class PlanAlimentaireRepository:
@@ -23,58 +34,118 @@ class PlanAlimentaireRepository:
             for row in rows
         ]
 
-    def get_plan(self, plan_id: int) -> PlanAlimentaire:
+    @staticmethod
+    def _row_to_aliment(row, aliment_id: int, nom: str) -> Aliment:
+        return Aliment(
+            id=aliment_id,
+            nom=nom,
+            categorie=row["categorie"],
+            type_alimentation=row["type_alimentation"],
+            kcal_100g=row["kcal_100g"],
+            proteines_100g=row["proteines_100g"],
+            glucides_100g=row["glucides_100g"],
+            lipides_100g=row["lipides_100g"],
+            fibres_100g=row["fibres_100g"],
+            unite_base=row["unite_base"],
+            indice_healthy=row["indice_healthy"],
+            indice_commun=row["indice_commun"],
+        )
+
+    # Colonnes du chargement eager : plan + repas + items + aliment + portion
+    _EAGER_PLAN_SQL = """
+        SELECT
+            pa.id AS plan_id, pa.client_id, pa.nom AS plan_nom,
+            pa.description AS plan_description, pa.tags AS plan_tags,
+            r.id AS repas_id, r.nom AS repas_nom, r.ordre AS repas_ordre,
+            ri.id AS item_id, ri.aliment_id, ri.portion_id, ri.quantite,
+            a.nom AS aliment_nom, a.categorie, a.type_alimentation,
+            a.kcal_100g, a.proteines_100g, a.glucides_100g, a.lipides_100g,
+            a.fibres_100g, a.unite_base, a.indice_healthy, a.indice_commun,
+            p.description AS portion_description, p.grammes_equivalents
+        FROM plans_alimentaires pa
+        LEFT JOIN repas r ON r.plan_id = pa.id
+        LEFT JOIN repas_items ri ON ri.repas_id = r.id
+        LEFT JOIN aliments a ON a.id = ri.aliment_id
+        LEFT JOIN portions p ON p.id = ri.portion_id
+        WHERE {where}
+        ORDER BY pa.id, r.ordre, r.id, ri.id
+    """
+
+    def _load_plans(self, where: str, params: tuple) -> List[PlanAlimentaire]:
+        """Charge plans, repas, items et données nutritionnelles en une requête
+        puis assemble le graphe d'objets en mémoire."""
         with db_manager.get_connection() as conn:
-            plan_row = conn.execute(
-                "SELECT * FROM plans_alimentaires WHERE id = ?", (plan_id,)
-            ).fetchone()
-            if not plan_row:
-                raise ValueError("Plan introuvable")
-            repas_rows = conn.execute(
-                "SELECT * FROM repas WHERE plan_id = ? ORDER BY ordre", (plan_id,)
+            rows = conn.execute(
+                self._EAGER_PLAN_SQL.format(where=where), params
             ).fetchall()
-            repas_list = []
-            for rr in repas_rows:
-                items_rows = conn.execute(
-                    "SELECT * FROM repas_items WHERE repas_id = ?", (rr["id"],)
-                ).fetchall()
-                items = [
-                    RepasItem(
-                        id=ir["id"],
-                        repas_id=ir["repas_id"],
-                        aliment_id=ir["aliment_id"],
-                        portion_id=ir["portion_id"],
-                        quantite=ir["quantite"],
-                    )
-                    for ir in items_rows
-                ]
-                repas_list.append(
-                    Repas(
-                        id=rr["id"],
-                        plan_id=rr["plan_id"],
-                        nom=rr["nom"],
-                        ordre=rr["ordre"],
-                        items=items,
-                    )
+
+        plans: Dict[int, PlanAlimentaire] = {}
+        repas_by_id: Dict[int, Repas] = {}
+        for row in rows:
+            plan = plans.get(row["plan_id"])
+            if plan is None:
+                plan = PlanAlimentaire(
+                    id=row["plan_id"],
+                    client_id=row["client_id"],
+                    nom=row["plan_nom"],
+                    description=row["plan_description"],
+                    tags=row["plan_tags"],
+                    repas=[],
+                )
+                plans[plan.id] = plan
+            if row["repas_id"] is None:
+                continue
+            repas = repas_by_id.get(row["repas_id"])
+            if repas is None:
+                repas = Repas(
+                    id=row["repas_id"],
+                    plan_id=plan.id,
+                    nom=row["repas_nom"],
+                    ordre=row["repas_ordre"],
+                    items=[],
+                )
+                repas_by_id[repas.id] = repas
+                plan.repas.append(repas)
+            if row["item_id"] is None:
+                continue
+            aliment = None
+            if row["aliment_nom"] is not None:
+                aliment = self._row_to_aliment(
+                    row, row["aliment_id"], row["aliment_nom"]
+                )
+            portion = None
+            if row["grammes_equivalents"] is not None:
+                portion = Portion(
+                    id=row["portion_id"],
+                    aliment_id=row["aliment_id"],
+                    description=row["portion_description"],
+                    grammes_equivalents=row["grammes_equivalents"],
+                )
+            repas.items.append(
+                RepasItem(
+                    id=row["item_id"],
+                    repas_id=repas.id,
+                    aliment_id=row["aliment_id"],
+                    portion_id=row["portion_id"],
+                    quantite=row["quantite"],
+                    aliment=aliment,
+                    portion=portion,
                 )
-            return PlanAlimentaire(
-                id=plan_row["id"],
-                client_id=plan_row["client_id"],
-                nom=plan_row["nom"],
-                description=plan_row["description"],
-                tags=plan_row["tags"],
-                repas=repas_list,
             )
+        return list(plans.values())
+
+    def get_plan(self, plan_id: int) -> PlanAlimentaire:
+        plans = self._load_plans("pa.id = ?", (plan_id,))
+        if not plans:
+            raise ValueError("Plan introuvable")
+        return plans[0]
 
     def find_by_client_id(self, client_id: int) -> Optional[PlanAlimentaire]:
-        with db_manager.get_connection() as conn:
-            plan_row = conn.execute(
-                "SELECT * FROM plans_alimentaires WHERE client_id = ?",
-                (client_id,),
-            ).fetchone()
-            if not plan_row:
-                return None
-            return self.get_plan(plan_row["id"])
+        plans = self._load_plans(
+            "pa.id = (SELECT id FROM plans_alimentaires WHERE client_id = ? LIMIT 1)",
+            (client_id,),
+        )
+        return plans[0] if plans else None
 
     def create_plan(self, plan: PlanAlimentaire) -> int:
         with db_manager.get_connection() as conn:
@@ -206,6 +277,47 @@ class PlanAlimentaireRepository:
             cur.execute("DELETE FROM repas_items WHERE id = ?", (item_id,))
             conn.commit()
 
+    def attach_nutrition(self, items: List[RepasItem]) -> None:
+        """Renseigne item.aliment / item.portion manquants en lots (requêtes IN)
+        sur une seule connexion."""
+        aliment_ids = {i.aliment_id for i in items if i.aliment is None}
+        portion_ids = {
+            i.portion_id for i in items if i.portion_id and i.portion is None
+        }
+        if not aliment_ids and not portion_ids:
+            return
+
+        aliments: Dict[int, Aliment] = {}
+        portions: Dict[int, Portion] = {}
+        with db_manager.get_connection() as conn:
+            for chunk in _chunks(sorted(aliment_ids)):
+                rows = conn.execute(
+                    f"SELECT * FROM aliments WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    aliments[row["id"]] = self._row_to_aliment(
+                        row, row["id"], row["nom"]
+                    )
+            for chunk in _chunks(sorted(portion_ids)):
+                rows = conn.execute(
+                    f"SELECT * FROM portions WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    portions[row["id"]] = Portion(
+                        id=row["id"],
+                        aliment_id=row["aliment_id"],
+                        description=row["description"],
+                        grammes_equivalents=row["grammes_equivalents"],
+                    )
+
+        for item in items:
+            if item.aliment is None:
+                item.aliment = aliments.get(item.aliment_id)
+            if item.portion_id and item.portion is None:
+                item.portion = portions.get(item.portion_id)
+
     # --- Calculations ---
     def compute_item_totals(self, item: RepasItem) -> Dict[str, float]:
         with db_manager.get_connection() as conn:
@@ -1,4 +1,5 @@
 import json
+from datetime import date
 
 from db.database_manager import db_manager
 from models.session import Block, BlockItem, Session
@@ -67,64 +68,91 @@ class SessionsRepository:
                 conn.rollback()
                 raise
 
-    def list_sessions_for_month(self, year: int, month: int) -> list[Session]:
-        with db_manager.get_connection() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM sessions
-                WHERE strftime('%Y', date_creation) = ?
-                  AND strftime('%m', date_creation) = ?
-                ORDER BY date_creation
-                """,
-                (str(year), f"{month:02d}"),
-            ).fetchall()
-            sessions: list[Session] = []
-            for s in rows:
-                block_rows = conn.execute(
-                    "SELECT * FROM session_blocks WHERE session_id = ?",
-                    (s["session_id"],),
-                ).fetchall()
-                blocks = []
-                for b in block_rows:
-                    item_rows = conn.execute(
-                        "SELECT * FROM session_items WHERE block_id = ?",
-                        (b["block_id"],),
-                    ).fetchall()
-                    items = [
-                        BlockItem(
-                            exercise_id=r["exercise_id"],
-                            prescription=json.loads(r["prescription"]),
-                            notes=r["notes"],
-                        )
-                        for r in item_rows
-                    ]
-                    blocks.append(
-                        Block(
-                            block_id=b["block_id"],
-                            type=b["type"],
-                            duration_sec=b["duration_sec"],
-                            rounds=b["rounds"],
-                            work_sec=b["work_sec"],
-                            rest_sec=b["rest_sec"],
-                            items=items,
-                            title=b["title"],
-                            locked=bool(b["locked"]),
-                        )
-                    )
-                sessions.append(
-                    Session(
-                        session_id=s["session_id"],
-                        mode=s["mode"],
-                        label=s["label"],
-                        duration_sec=s["duration_sec"],
-                        date_creation=s["date_creation"],
-                        client_id=s["client_id"],
-                        is_template=bool(s["is_template"]),
-                        blocks=blocks,
-                        meta={},
-                    )
+    @staticmethod
+    def _month_range(year: int, month: int) -> tuple[str, str]:
+        """Bornes [début, fin) d'un mois, comparables aux dates ISO stockées."""
+        if month == 12:
+            return f"{year:04d}-12-01", f"{year + 1:04d}-01-01"
+        return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month + 1:02d}-01"
+
+    def _load_sessions(self, conn, where: str, params: tuple) -> list[Session]:
+        """Charge sessions, blocs et items en trois requêtes ensemblistes
+        (quel que soit le nombre de sessions) puis assemble en mémoire."""
+        session_rows = conn.execute(
+            f"SELECT * FROM sessions s WHERE {where} ORDER BY s.date_creation",
+            params,
+        ).fetchall()
+        if not session_rows:
+            return []
+        block_rows = conn.execute(
+            f"""
+            SELECT b.* FROM session_blocks b
+            JOIN sessions s ON s.session_id = b.session_id
+            WHERE {where}
+            ORDER BY b.rowid
+            """,
+            params,
+        ).fetchall()
+        item_rows = conn.execute(
+            f"""
+            SELECT i.block_id, i.exercise_id, i.prescription, i.notes
+            FROM session_items i
+            JOIN session_blocks b ON b.block_id = i.block_id
+            JOIN sessions s ON s.session_id = b.session_id
+            WHERE {where}
+            ORDER BY i.id
+            """,
+            params,
+        ).fetchall()
+
+        items_by_block: dict[str, list[BlockItem]] = {}
+        for r in item_rows:
+            items_by_block.setdefault(r["block_id"], []).append(
+                BlockItem(
+                    exercise_id=r["exercise_id"],
+                    prescription=json.loads(r["prescription"]),
+                    notes=r["notes"],
+                )
+            )
+        blocks_by_session: dict[str, list[Block]] = {}
+        for b in block_rows:
+            blocks_by_session.setdefault(b["session_id"], []).append(
+                Block(
+                    block_id=b["block_id"],
+                    type=b["type"],
+                    duration_sec=b["duration_sec"],
+                    rounds=b["rounds"],
+                    work_sec=b["work_sec"],
+                    rest_sec=b["rest_sec"],
+                    items=items_by_block.get(b["block_id"], []),
+                    title=b["title"],
+                    locked=bool(b["locked"]),
                 )
-            return sessions
+            )
+        return [
+            Session(
+                session_id=s["session_id"],
+                mode=s["mode"],
+                label=s["label"],
+                duration_sec=s["duration_sec"],
+                date_creation=s["date_creation"],
+                client_id=s["client_id"],
+                is_template=bool(s["is_template"]),
+                blocks=blocks_by_session.get(s["session_id"], []),
+                meta={},
+            )
+            for s in session_rows
+        ]
+
+    def list_sessions_between(self, start: str, end: str) -> list[Session]:
+        """Sessions dont date_creation est dans [start, end), avec blocs et items."""
+        with db_manager.get_connection() as conn:
+            return self._load_sessions(
+                conn, "s.date_creation >= ? AND s.date_creation < ?", (start, end)
+            )
+
+    def list_sessions_for_month(self, year: int, month: int) -> list[Session]:
+        return self.list_sessions_between(*self._month_range(year, month))
 
     def list_templates(self) -> list[Session]:
         with db_manager.get_connection() as conn:
@@ -148,63 +176,20 @@ class SessionsRepository:
 
     def get_by_id(self, session_id: str) -> Session | None:
         with db_manager.get_connection() as conn:
-            s = conn.execute(
-                "SELECT * FROM sessions WHERE session_id = ?",
-                (session_id,),
-            ).fetchone()
-            if not s:
-                return None
-            block_rows = conn.execute(
-                "SELECT * FROM session_blocks WHERE session_id = ?",
-                (session_id,),
-            ).fetchall()
-            blocks = []
-            for b in block_rows:
-                item_rows = conn.execute(
-                    "SELECT * FROM session_items WHERE block_id = ?",
-                    (b["block_id"],),
-                ).fetchall()
-                items = [
-                    BlockItem(
-                        exercise_id=r["exercise_id"],
-                        prescription=json.loads(r["prescription"]),
-                        notes=r["notes"],
-                    )
-                    for r in item_rows
-                ]
-                blocks.append(
-                    Block(
-                        block_id=b["block_id"],
-                        type=b["type"],
-                        duration_sec=b["duration_sec"],
-                        rounds=b["rounds"],
-                        work_sec=b["work_sec"],
-                        rest_sec=b["rest_sec"],
-                        items=items,
-                        title=b["title"],
-                        locked=bool(b["locked"]),
-                    )
-                )
-            return Session(
-                session_id=s["session_id"],
-                mode=s["mode"],
-                label=s["label"],
-                duration_sec=s["duration_sec"],
-                date_creation=s["date_creation"],
-                client_id=s["client_id"],
-                is_template=bool(s["is_template"]),
-                blocks=blocks,
-                meta={},
-            )
+            sessions = self._load_sessions(conn, "s.session_id = ?", (session_id,))
+        return sessions[0] if sessions else None
 
     def count_sessions_this_month(self) -> int:
+        today = date.today()
+        start, end = self._month_range(today.year, today.month)
         with db_manager.get_connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT COUNT(*)
                 FROM sessions
-                WHERE strftime('%Y-%m', date_creation) = strftime('%Y-%m', 'now')
-                """
+                WHERE date_creation >= ? AND date_creation < ?
+                """,
+                (start, end),
             )
             (count,) = cursor.fetchone()
         return count
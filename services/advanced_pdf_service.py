@@ -5,7 +5,7 @@ Integrates the new advanced PDF system with existing controllers and services
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .pdf_engine import PDFEngine
 from .pdf_engine.core.professional_template_factory import ProfessionalTemplateFactory
@@ -303,10 +303,16 @@ class AdvancedPdfService:
     # ========== BATCH OPERATIONS ==========
 
     def batch_generate_pdfs(
-        self, jobs: List[Dict[str, Any]], output_dir: str
+        self,
+        jobs: List[Dict[str, Any]],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
     ) -> List[Dict[str, Any]]:
-        """Batch generate multiple PDFs"""
-        return self.pdf_engine.batch_generate(jobs, output_dir)
+        """Batch generate multiple PDFs over a process pool"""
+        return self.pdf_engine.batch_generate(
+            jobs, output_dir, max_workers, progress_callback
+        )
 
     # ========== PERFORMANCE MONITORING ==========
 
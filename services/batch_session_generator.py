@@ -0,0 +1,184 @@
+"""
+Génération de séances en lot (programmation d'une semaine ou d'un cycle).
+
+Les N jeux de paramètres sont répartis sur un pool de processus. Chaque worker
+reçoit une seule fois l'instantané chaud du catalogue d'exercices (via
+l'initializer) et ne touche donc pas la base. Chaque item a sa propre graine
+(résultat reproductible), son temps de génération et son erreur éventuelle :
+un échec n'interrompt pas le lot et les résultats sont rendus dans l'ordre.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from models.exercices import Exercise
+from models.session import Session
+from repositories.exercise_catalog import ExerciseCatalog, get_exercise_catalog
+from services.session_generator import generate_collectif
+from services.smart_workout_generator import SmartWorkoutGenerator
+from services.workout_config_service import WorkoutConfigService
+
+GENERATORS = ("smart", "basic")
+
+
+@dataclass
+class BatchItemResult:
+    """Résultat d'un item du lot."""
+
+    index: int
+    seed: int
+    session: Optional[Session] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    generator: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.session is not None
+
+
+# État du worker, construit une fois par processus par _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _build_state(
+    exercises: List[Exercise], data_key: tuple, config_dir: str
+) -> Dict[str, Any]:
+    catalog = ExerciseCatalog.from_exercises(exercises, *data_key)
+    return {
+        "catalog": catalog,
+        "smart": SmartWorkoutGenerator(
+            config_service=WorkoutConfigService(config_dir), catalog=catalog
+        ),
+    }
+
+
+def _init_worker(exercises: List[Exercise], data_key: tuple, config_dir: str) -> None:
+    _worker_state.update(_build_state(exercises, data_key, config_dir))
+
+
+def _generate_one(
+    index: int,
+    params: Dict[str, Any],
+    seed: int,
+    generator: str,
+    fallback: bool,
+    state: Optional[Dict[str, Any]] = None,
+) -> BatchItemResult:
+    state = state or _worker_state
+    params = dict(params)
+    params["seed"] = seed
+    start = time.perf_counter()
+    used = generator
+    try:
+        try:
+            if generator == "smart":
+                session = state["smart"].generate_collectif_smart(params)
+            else:
+                session = generate_collectif(params, repo=state["catalog"])
+        except Exception:
+            if generator != "smart" or not fallback:
+                raise
+            # Même repli que SessionController.generate_session_preview
+            used = "basic"
+            session = generate_collectif(params, repo=state["catalog"])
+    except Exception as e:
+        return BatchItemResult(
+            index=index,
+            seed=seed,
+            error=f"{type(e).__name__}: {e}",
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            generator=used,
+        )
+    return BatchItemResult(
+        index=index,
+        seed=seed,
+        session=session,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        generator=used,
+    )
+
+
+def generate_sessions_batch(
+    param_sets: Iterable[Dict[str, Any]],
+    generator: str = "smart",
+    max_workers: Optional[int] = None,
+    base_seed: Optional[int] = None,
+    fallback: bool = True,
+    config_dir: str = "data/config",
+    catalog: Optional[ExerciseCatalog] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> List[BatchItemResult]:
+    """Génère une séance par jeu de paramètres, en parallèle.
+
+    - graine de l'item : ``params["seed"]``, sinon ``base_seed + index``,
+      sinon tirée au hasard (toujours renvoyée dans le résultat) ;
+    - ``max_workers`` : nombre de processus (par défaut le nombre de cœurs) ;
+      1 génère dans le processus courant ;
+    - ``on_progress(done, total)`` est appelé à chaque item terminé.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"Générateur inconnu: {generator}")
+    param_sets = list(param_sets)
+    total = len(param_sets)
+    if not total:
+        return []
+
+    catalog = catalog or get_exercise_catalog()
+    # Même instantané pour la liste et sa clé (un rechargement peut s'intercaler)
+    exercises, data_key = catalog.export()
+
+    seed_rng = random.SystemRandom()
+    seeds = []
+    for i, params in enumerate(param_sets):
+        seed = params.get("seed")
+        if seed is None:
+            seed = base_seed + i if base_seed is not None else seed_rng.randrange(2**31)
+        seeds.append(int(seed))
+
+    def progress(done: int) -> None:
+        if on_progress:
+            try:
+                on_progress(done, total)
+            except Exception:
+                pass
+
+    workers = max_workers or min(total, os.cpu_count() or 1)
+    if workers <= 1 or total == 1:
+        state = _build_state(exercises, data_key, config_dir)
+        results = []
+        for i, params in enumerate(param_sets):
+            results.append(
+                _generate_one(i, params, seeds[i], generator, fallback, state)
+            )
+            progress(i + 1)
+        return results
+
+    results: List[Optional[BatchItemResult]] = [None] * total
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(exercises, data_key, config_dir),
+    ) as executor:
+        futures = {
+            executor.submit(_generate_one, i, params, seeds[i], generator, fallback): i
+            for i, params in enumerate(param_sets)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # Worker tombé ou résultat non transférable : l'item seul échoue
+                results[i] = BatchItemResult(
+                    index=i,
+                    seed=seeds[i],
+                    error=f"{type(e).__name__}: {e}",
+                    generator=generator,
+                )
+            progress(done)
+    return results
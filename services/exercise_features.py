@@ -0,0 +1,287 @@
+"""
+Features précompilées et scoring vectorisé pour le SmartWorkoutGenerator.
+
+Chaque exercice est compilé une fois en une ligne de features (masque de tags,
+identifiants de pattern et de groupe musculaire, drapeau chargeable). Les
+règles de pondération sont décrites par les tables ci-dessous et appliquées
+au pool entier par opérations NumPy, au lieu de reparcourir les chaînes de
+tags exercice par exercice pour chaque slot.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.exercices import Exercise
+
+# Tags utilisés par les règles (un bit chacun dans ``tag_mask``)
+SCORING_TAGS = (
+    "cardio",
+    "conditioning",
+    "metabolic",
+    "plyometric",
+    "technique",
+    "skill",
+    "high_intensity",
+    "explosive",
+    "mobility",
+    "activation",
+)
+_TAG_BIT = {tag: np.uint64(1 << i) for i, tag in enumerate(SCORING_TAGS)}
+
+# === Règles de pondération globales ===
+# objectif -> (condition, multiplicateur) ; condition = "chargeable" ou tags
+OBJECTIVE_RULES: Dict[str, Tuple[Any, float]] = {
+    "force": ("chargeable", 1.4),
+    "strength": ("chargeable", 1.4),
+    "cardio": (("cardio", "conditioning"), 1.3),
+    "conditioning": (("cardio", "conditioning"), 1.3),
+    "technique": (("technique", "skill"), 1.2),
+    "skill": (("technique", "skill"), 1.2),
+}
+CONTINUUM_THRESHOLD = 20
+CONTINUUM_CARDIO_TAGS = ("cardio", "conditioning", "metabolic")
+CONTINUUM_HEAVY_PATTERNS = ("squat", "hinge")
+CONTINUUM_CARDIO_HEAVY_MALUS = 0.8
+CONTINUUM_STRENGTH_PATTERNS = ("push", "pull", "squat", "hinge")
+CONTINUUM_STRENGTH_CARDIO_TAGS = ("cardio", "plyometric")
+CONTINUUM_STRENGTH_CARDIO_MALUS = 0.7
+FOCUS_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "Upper": ("push", "pull", "carry"),
+    "Lower": ("squat", "hinge", "lunge"),
+    "Push": ("push",),
+    "Pull": ("pull",),
+    "Core": ("twist", "carry"),
+}
+FOCUS_BONUS = 1.5
+FOCUS_MALUS = 0.6
+FAVORITE_BONUS = 1.2
+SUGGESTED_BONUS = 1.3
+MIN_WEIGHT = 0.05
+
+# === Pénalités par slot ===
+USED_EXERCISE_MALUS = 0.2
+RECENT_PATTERN_MALUS = 0.5
+MUSCLE_USAGE_MALUS = ((2, 0.3), (1, 0.7))  # (utilisations >=, multiplicateur)
+HIGH_INTENSITY_TAGS = ("high_intensity", "explosive", "cardio")
+FATIGUE_MALUS = 0.1
+SLOT_FOCUS_RULES: Dict[str, Tuple[Tuple[str, ...], float]] = {
+    "activation": (("mobility", "activation"), 1.3),
+    "metabolic": (("cardio", "metabolic"), 1.4),
+}
+CANDIDATE_THRESHOLD = 0.05
+
+
+def tag_bits(tags: Iterable[str]) -> np.uint64:
+    bits = np.uint64(0)
+    for tag in tags:
+        bits |= _TAG_BIT.get(tag, np.uint64(0))
+    return bits
+
+
+def _vocab_ids(values: Sequence[Optional[str]]) -> Tuple[np.ndarray, Dict[str, int]]:
+    vocab: Dict[str, int] = {}
+    ids = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        ids[i] = vocab.setdefault(value, len(vocab)) if value else -1
+    return ids, vocab
+
+
+class FeatureMatrix:
+    """Features d'une liste d'exercices, une ligne par exercice."""
+
+    def __init__(self, exercises: Sequence[Exercise]):
+        self.exercises = list(exercises)
+        n = len(self.exercises)
+        self.ids = np.array([e.id for e in self.exercises], dtype=np.int64)
+        self.names = [e.nom for e in self.exercises]
+        self.position_by_id = {e.id: i for i, e in enumerate(self.exercises)}
+        self.position_by_name = {e.nom: i for i, e in enumerate(self.exercises)}
+        self.chargeable = np.array(
+            [bool(e.est_chargeable) for e in self.exercises], dtype=bool
+        )
+        self.tag_mask = np.zeros(n, dtype=np.uint64)
+        for i, e in enumerate(self.exercises):
+            self.tag_mask[i] = tag_bits(
+                t.strip().lower() for t in (e.tags or "").split(",")
+            )
+        # Pattern en minuscules pour les règles globales, brut pour l'historique
+        self.pattern, self.pattern_vocab = _vocab_ids(
+            [(e.movement_pattern or "").lower() for e in self.exercises]
+        )
+        self.raw_pattern, self.raw_pattern_vocab = _vocab_ids(
+            [e.movement_pattern for e in self.exercises]
+        )
+        self.muscle, self.muscle_vocab = _vocab_ids(
+            [e.groupe_musculaire_principal for e in self.exercises]
+        )
+
+    def __len__(self) -> int:
+        return len(self.exercises)
+
+    def has_any_tag(self, tags: Iterable[str]) -> np.ndarray:
+        return (self.tag_mask & tag_bits(tags)) != 0
+
+    def pattern_in(self, patterns: Iterable[str]) -> np.ndarray:
+        wanted = [self.pattern_vocab[p] for p in patterns if p in self.pattern_vocab]
+        return np.isin(self.pattern, wanted)
+
+    def raw_pattern_in(self, patterns: Iterable[Optional[str]]) -> np.ndarray:
+        vocab = self.raw_pattern_vocab
+        wanted = [vocab[p] for p in patterns if p in vocab]
+        return np.isin(self.raw_pattern, wanted)
+
+    def name_mask(self, names: Iterable[str]) -> np.ndarray:
+        mask = np.zeros(len(self.exercises), dtype=bool)
+        positions = [
+            self.position_by_name[n] for n in names if n in self.position_by_name
+        ]
+        mask[positions] = True
+        return mask
+
+
+def score_exercises(
+    features: FeatureMatrix,
+    params: Dict[str, Any],
+    recommendations: Dict[str, Any],
+    config,
+) -> np.ndarray:
+    """Poids intelligent de chaque exercice selon le contexte de la séance."""
+    weight = np.ones(len(features), dtype=np.float64)
+
+    # === BONUS SELON OBJECTIF ===
+    objectif = (params.get("objectif") or "").lower()
+    rule = OBJECTIVE_RULES.get(objectif)
+    if rule is not None:
+        condition, factor = rule
+        if condition == "chargeable":
+            mask = features.chargeable
+        else:
+            mask = features.has_any_tag(condition)
+        weight[mask] *= factor
+
+    # === BONUS SELON CONTINUUM CARDIO-RENFO ===
+    continuum = params.get("continuum_cardio_renfo", 0)
+    if continuum > CONTINUUM_THRESHOLD:
+        cardio = features.has_any_tag(CONTINUUM_CARDIO_TAGS)
+        weight[cardio] *= 1 + (continuum / 100)
+        heavy = (
+            ~cardio
+            & features.chargeable
+            & features.pattern_in(CONTINUUM_HEAVY_PATTERNS)
+        )
+        weight[heavy] *= CONTINUUM_CARDIO_HEAVY_MALUS
+    elif continuum < -CONTINUUM_THRESHOLD:
+        strength = features.chargeable | features.pattern_in(
+            CONTINUUM_STRENGTH_PATTERNS
+        )
+        weight[strength] *= 1 + (abs(continuum) / 100)
+        cardio = ~strength & features.has_any_tag(CONTINUUM_STRENGTH_CARDIO_TAGS)
+        weight[cardio] *= CONTINUUM_STRENGTH_CARDIO_MALUS
+
+    # === BONUS SELON FOCUS ===
+    focus = params.get("focus", "Full-body")
+    in_focus = features.pattern_in(FOCUS_PATTERNS.get(focus, ()))
+    if focus in FOCUS_PATTERNS:
+        weight[in_focus] *= FOCUS_BONUS
+    if focus != "Full-body":
+        weight[~in_focus] *= FOCUS_MALUS
+
+    # === BONUS EXERCICES FAVORIS ===
+    favorites = set()
+    for fav_list in config.favorite_exercises.values():
+        favorites.update(fav_list)
+    weight[features.name_mask(favorites)] *= FAVORITE_BONUS
+
+    # === MALUS RESTRICTIONS FRÉQUENCE ===
+    limited_freq = config.exercise_restrictions.get("limited_frequency", {})
+    for name, freq_limit in limited_freq.items():
+        position = features.position_by_name.get(name)
+        if position is not None:
+            # Réduire poids selon restriction (+0.1 pour éviter poids = 0)
+            weight[position] *= 1 - freq_limit + 0.1
+
+    # === BONUS SELON RECOMMANDATIONS HISTORIQUES ===
+    suggested = set()
+    for suggestion_list in recommendations.get("suggested_exercises", []):
+        suggested.update(suggestion_list)
+    weight[features.name_mask(suggested)] *= SUGGESTED_BONUS
+
+    return np.maximum(weight, MIN_WEIGHT)
+
+
+def slot_weights(
+    features: FeatureMatrix,
+    positions: np.ndarray,
+    weights: np.ndarray,
+    slot_focus: str,
+    used_exercises: Iterable[int],
+    muscle_usage_count: Dict[str, int],
+    last_patterns: List[str],
+    consecutive_high_intensity: int,
+    max_consecutive: int,
+) -> np.ndarray:
+    """Poids du pool ajustés aux contraintes physiologiques du slot courant."""
+    weights = weights.copy()
+
+    # Éviter répétition d'exercices (forte pénalité mais pas exclusion)
+    used = np.isin(features.ids[positions], list(used_exercises))
+    weights[used] *= USED_EXERCISE_MALUS
+
+    # Éviter répétition des 2 derniers patterns
+    recent = features.raw_pattern_in(last_patterns[-2:])[positions]
+    weights[recent] *= RECENT_PATTERN_MALUS
+
+    # Équilibrage musculaire (le dernier slot sert aux exercices sans muscle)
+    counts = np.zeros(len(features.muscle_vocab) + 1, dtype=np.int64)
+    for muscle, index in features.muscle_vocab.items():
+        counts[index] = muscle_usage_count.get(muscle, 0)
+    usage = counts[features.muscle[positions]]
+    applied = np.zeros(len(positions), dtype=bool)
+    for minimum, factor in MUSCLE_USAGE_MALUS:
+        mask = (usage >= minimum) & ~applied
+        weights[mask] *= factor
+        applied |= mask
+
+    # Gestion fatigue/intensité
+    if consecutive_high_intensity >= max_consecutive:
+        high = features.has_any_tag(HIGH_INTENSITY_TAGS)[positions]
+        weights[high] *= FATIGUE_MALUS
+
+    # Bonus selon focus du slot
+    rule = SLOT_FOCUS_RULES.get(slot_focus)
+    if rule is not None:
+        tags, factor = rule
+        weights[features.has_any_tag(tags)[positions]] *= factor
+
+    return weights
+
+
+class WeightedPool(list):
+    """Liste de couples (exercice, poids) adossée à ses tableaux de features.
+
+    Reste utilisable comme la liste d'origine ; les positions et poids NumPy
+    permettent d'appliquer les pénalités par slot sans reboucler en Python.
+    """
+
+    def __init__(
+        self, features: FeatureMatrix, positions: np.ndarray, weights: np.ndarray
+    ):
+        exercises = features.exercises
+        super().__init__(
+            zip(map(exercises.__getitem__, positions.tolist()), weights.tolist())
+        )
+        self.features = features
+        self.positions = positions
+        self.weights = weights
+
+    @classmethod
+    def from_pairs(cls, pairs: Sequence[Tuple[Exercise, float]]) -> "WeightedPool":
+        if isinstance(pairs, WeightedPool):
+            return pairs
+        features = FeatureMatrix([ex for ex, _ in pairs])
+        return cls(
+            features,
+            np.arange(len(pairs)),
+            np.array([w for _, w in pairs], dtype=np.float64),
+        )
@@ -21,6 +21,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from db.database_manager import db_manager
+from repositories.exercices_repo import mark_exercises_changed
 
 WGER_BASE = "https://wger.de/api/v2"
 
@@ -357,6 +358,8 @@ def import_from_wger(
                     pass
         conn.commit()
 
+    if imported:
+        mark_exercises_changed()
     return imported, skipped
 
 
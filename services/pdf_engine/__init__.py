@@ -5,12 +5,15 @@ from .core.pdf_engine import PDFEngine
 from .core.template_factory import TemplateFactory
 from .managers.cache_manager import CacheManager
 from .managers.style_manager import StyleManager
+from .managers.style_registry import StyleRegistry, get_style_registry
 from .templates.base_template import BaseTemplate
 
 __all__ = [
     "PDFEngine",
     "TemplateFactory",
     "StyleManager",
+    "StyleRegistry",
+    "get_style_registry",
     "CacheManager",
     "BaseTemplate",
 ]
@@ -0,0 +1,126 @@
+"""
+Process pool side of PDFEngine batch rendering
+
+Kept free of ReportLab imports: workers get the engine class, the template
+factory class and the template registry from the parent, so pool handling
+does not depend on the rendering stack.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# (index in the batch, job, output file)
+BatchJob = Tuple[int, Dict[str, Any], str]
+
+MAX_POOL_RESTARTS = 2
+
+_worker_engine: Any = None
+
+
+def _init_batch_worker(
+    engine_factory: Callable[..., Any],
+    template_factory_class: type,
+    registry: Dict[str, type],
+) -> None:
+    """Process pool initializer: one engine per worker, rendering warmed
+
+    The worker builds the same template factory as the parent engine, so a
+    subclass (professional variants, ``create_template`` override) renders
+    exactly as it would in process.
+    """
+    global _worker_engine
+    engine = engine_factory(cache_enabled=False)
+    engine.template_factory = template_factory_class()
+    for template_type, template_class in registry.items():
+        engine.register_custom_template(template_type, template_class)
+    engine.warm_up()
+    _worker_engine = engine
+
+
+def _render_job(
+    engine: Any,
+    index: int,
+    job: Dict[str, Any],
+    file_path: str,
+    cache_lookup: bool = True,
+) -> Dict[str, Any]:
+    """Render one batch job, turning any error into a failed result"""
+    try:
+        result = engine._generate(
+            job["template_type"],
+            job["data"],
+            file_path,
+            job.get("template_config"),
+            job.get("style_overrides"),
+            cache_lookup=cache_lookup,
+        )
+        result["success"] = True
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+    result["filename"] = Path(file_path).name
+    result["index"] = index
+    return result
+
+
+def _render_batch_job(
+    index: int, job: Dict[str, Any], file_path: str
+) -> Dict[str, Any]:
+    return _render_job(_worker_engine, index, job, file_path)
+
+
+def _failed(index: int, file_path: str, error: BaseException) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": str(error),
+        "filename": Path(file_path).name,
+        "index": index,
+    }
+
+
+def iter_pool_results(
+    jobs: List[BatchJob],
+    max_workers: int,
+    engine_factory: Callable[..., Any],
+    template_factory_class: type,
+    registry: Dict[str, type],
+    max_restarts: int = MAX_POOL_RESTARTS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Render ``jobs`` over a process pool, yielding results as they complete
+
+    A worker that dies (crash, OOM kill) breaks the whole pool and every job
+    still queued or running fails with BrokenProcessPool, not only the one
+    that killed it. Those jobs are resubmitted to a fresh pool, up to
+    ``max_restarts`` times; jobs still unfinished after that are reported
+    as failed.
+    """
+    restarts = 0
+    while jobs:
+        unfinished: List[BatchJob] = []
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(jobs)),
+            initializer=_init_batch_worker,
+            initargs=(engine_factory, template_factory_class, registry),
+        ) as executor:
+            futures = {
+                executor.submit(_render_batch_job, *batch_job): batch_job
+                for batch_job in jobs
+            }
+            for future in as_completed(futures):
+                index, job, file_path = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    if restarts < max_restarts:
+                        unfinished.append(futures[future])
+                        continue
+                    result = _failed(index, file_path, e)
+                except Exception as e:
+                    result = _failed(index, file_path, e)
+                yield result
+        jobs = sorted(unfinished, key=lambda batch_job: batch_job[0])
+        restarts += 1
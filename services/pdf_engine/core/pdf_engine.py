@@ -6,15 +6,23 @@ Performance-optimized with Template Factory pattern
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
+import os
 import time
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.fingerprint import fingerprint
 
 from ..managers.cache_manager import CacheManager
 from ..managers.style_manager import StyleManager
+from .batch_worker import _render_job, iter_pool_results
 from .template_factory import TemplateFactory
 
+logger = logging.getLogger(__name__)
+
 
 class PDFEngine:
     """
@@ -40,15 +48,52 @@ class PDFEngine:
         Asynchronous PDF generation for better UX
         Returns generation statistics and metadata
         """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self._generate,
+                template_type,
+                data,
+                output_path,
+                template_config,
+                style_overrides,
+            ),
+        )
+
+    def generate_sync(
+        self,
+        template_type: str,
+        data: Dict[str, Any],
+        output_path: str,
+        template_config: Optional[Dict[str, Any]] = None,
+        style_overrides: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Synchronous PDF generation (no event loop involved)"""
+        return self._generate(
+            template_type, data, output_path, template_config, style_overrides
+        )
+
+    def _generate(
+        self,
+        template_type: str,
+        data: Dict[str, Any],
+        output_path: str,
+        template_config: Optional[Dict[str, Any]] = None,
+        style_overrides: Optional[Dict[str, Any]] = None,
+        cache_lookup: bool = True,
+    ) -> Dict[str, Any]:
+        """Render one document straight to ``output_path``"""
         start_time = time.perf_counter()
 
         # Check cache first
-        cache_key = self._generate_cache_key(template_type, data, template_config)
-        if self.cache_manager and self.cache_manager.get(cache_key):
-            cached_pdf = self.cache_manager.get(cache_key)
-            with open(output_path, "wb") as f:
-                f.write(cached_pdf)
-            return {"cached": True, "generation_time": 0}
+        cache_key = None
+        if self.cache_manager:
+            cache_key = self._generate_cache_key(
+                template_type, data, template_config, style_overrides
+            )
+            if cache_lookup and self.cache_manager.copy_to(cache_key, output_path):
+                return {"cached": True, "generation_time": 0}
 
         # Create template instance
         template = self.template_factory.create_template(
@@ -59,17 +104,13 @@ class PDFEngine:
         if style_overrides:
             template.apply_style_overrides(style_overrides)
 
-        # Generate PDF
-        pdf_buffer = BytesIO()
-        await asyncio.get_event_loop().run_in_executor(None, template.build, pdf_buffer)
-
-        # Save to file
-        with open(output_path, "wb") as f:
-            f.write(pdf_buffer.getvalue())
+        # Generate PDF directly into the output file
+        template.build(output_path)
+        file_size = os.path.getsize(output_path)
 
         # Cache result
-        if self.cache_manager:
-            self.cache_manager.set(cache_key, pdf_buffer.getvalue())
+        if cache_key is not None:
+            self.cache_manager.put_file(cache_key, output_path)
 
         generation_time = time.perf_counter() - start_time
         self._update_stats(generation_time)
@@ -77,25 +118,10 @@ class PDFEngine:
         return {
             "cached": False,
             "generation_time": generation_time,
-            "file_size": len(pdf_buffer.getvalue()),
+            "file_size": file_size,
             "pages": template.page_count,
         }
 
-    def generate_sync(
-        self,
-        template_type: str,
-        data: Dict[str, Any],
-        output_path: str,
-        template_config: Optional[Dict[str, Any]] = None,
-        style_overrides: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Synchronous PDF generation wrapper"""
-        return asyncio.run(
-            self.generate_async(
-                template_type, data, output_path, template_config, style_overrides
-            )
-        )
-
     def generate_preview(
         self,
         template_type: str,
@@ -121,33 +147,104 @@ class PDFEngine:
         self,
         jobs: List[Dict[str, Any]],
         output_dir: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Batch processing for multiple PDFs
-        Optimized for bulk exports
+        Optimized for bulk exports: see iter_batch_generate. Results are
+        returned in job order; progress_callback(done, total, result) is
+        called as each document completes.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        for done, result in enumerate(
+            self.iter_batch_generate(jobs, output_dir, max_workers), start=1
+        ):
+            results[result["index"]] = result
+            if progress_callback:
+                try:
+                    progress_callback(done, len(jobs), result)
+                except Exception:
+                    logger.exception("Batch progress callback failed")
+        return results
+
+    def iter_batch_generate(
+        self,
+        jobs: List[Dict[str, Any]],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Render jobs over a process pool, yielding results as they complete
+
+        ReportLab rendering is CPU-bound, so documents are spread over
+        ``max_workers`` processes (default: CPU count). Each worker builds its
+        engine and warms fonts/styles once, then writes every document
+        straight to its output file: only small result dicts travel back.
+        Cache hits are served by the parent without dispatching. With
+        ``max_workers=1`` (or a single job) rendering stays in-process. A
+        crashed worker breaks the pool: unfinished jobs are resubmitted to a
+        fresh one (see batch_worker.iter_pool_results).
         """
-        results = []
         output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
-
-        for i, job in enumerate(jobs):
-            file_path = output_path / f"{job.get('filename', f'document_{i}')}.pdf"
-            try:
-                result = self.generate_sync(
-                    job["template_type"],
-                    job["data"],
-                    str(file_path),
-                    job.get("template_config"),
-                    job.get("style_overrides"),
-                )
-                result["filename"] = file_path.name
-                result["success"] = True
-            except Exception as e:
-                result = {"success": False, "error": str(e), "filename": file_path.name}
-
-            results.append(result)
+        output_path.mkdir(parents=True, exist_ok=True)
 
-        return results
+        pending = []
+        cache_keys: Dict[int, Tuple[str, str]] = {}
+        for index, job in enumerate(jobs):
+            file_path = output_path / f"{job.get('filename', f'document_{index}')}.pdf"
+            cache_key = self._job_cache_key(job)
+            if cache_key is not None:
+                if self.cache_manager.copy_to(cache_key, file_path):
+                    yield {
+                        "cached": True,
+                        "generation_time": 0,
+                        "filename": file_path.name,
+                        "success": True,
+                        "index": index,
+                    }
+                    continue
+                cache_keys[index] = (cache_key, str(file_path))
+            pending.append((index, job, str(file_path)))
+
+        workers = max_workers or min(len(pending), os.cpu_count() or 1)
+        if workers <= 1 or len(pending) <= 1:
+            for index, job, file_path in pending:
+                yield _render_job(self, index, job, file_path, cache_lookup=False)
+            return
+
+        for result in iter_pool_results(
+            pending,
+            workers,
+            PDFEngine,
+            type(self.template_factory),
+            self.template_factory.get_registry(),
+        ):
+            if result["success"]:
+                self._update_stats(result["generation_time"])
+                if result["index"] in cache_keys:
+                    self.cache_manager.put_file(*cache_keys[result["index"]])
+            yield result
+
+    def _job_cache_key(self, job: Dict[str, Any]) -> Optional[str]:
+        """Cache key of a batch job, None when caching is off or job is invalid"""
+        if not self.cache_manager or "template_type" not in job or "data" not in job:
+            return None  # malformed jobs are reported by the render path
+        return self._generate_cache_key(
+            job["template_type"],
+            job["data"],
+            job.get("template_config"),
+            job.get("style_overrides"),
+        )
+
+    def warm_up(self) -> None:
+        """Load standard font metrics and the sample stylesheet once"""
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.pdfbase import pdfmetrics
+
+        for font_name in ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique"):
+            pdfmetrics.getFont(font_name)
+        getSampleStyleSheet()
 
     def get_available_templates(self) -> Dict[str, List[str]]:
         """Return all available template types and variants"""
@@ -184,22 +281,26 @@ class PDFEngine:
             self.cache_manager.clear()
 
     def _generate_cache_key(
-        self, template_type: str, data: Dict[str, Any], config: Optional[Dict[str, Any]]
+        self,
+        template_type: str,
+        data: Dict[str, Any],
+        config: Optional[Dict[str, Any]],
+        style_overrides: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """Generate unique cache key for template + data combination"""
-        import hashlib
-        import json
-
-        combined = {
-            "template_type": template_type,
-            "data_hash": hashlib.md5(
-                json.dumps(data, sort_keys=True).encode()
-            ).hexdigest(),
-            "config_hash": hashlib.md5(
-                json.dumps(config or {}, sort_keys=True).encode()
-            ).hexdigest(),
-        }
-        return hashlib.md5(json.dumps(combined, sort_keys=True).encode()).hexdigest()
+        """
+        Fingerprint of everything that shapes the rendered document: inputs,
+        template class and version, and the loaded themes
+        """
+        template_class = self.template_factory.get_template_class(template_type)
+        return fingerprint(
+            template_type,
+            template_class,
+            getattr(template_class, "TEMPLATE_VERSION", None),
+            self.style_manager.version,
+            data,
+            config or {},
+            style_overrides or {},
+        )
 
     def _update_stats(self, generation_time: float) -> None:
         """Update performance statistics"""
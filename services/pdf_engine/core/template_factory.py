@@ -59,6 +59,14 @@ class TemplateFactory:
 
         self._template_registry[template_type] = template_class
 
+    def get_template_class(self, template_type: str) -> Optional[Type[BaseTemplate]]:
+        """Return the class registered for ``template_type``, if any"""
+        return self._template_registry.get(template_type)
+
+    def get_registry(self) -> Dict[str, Type[BaseTemplate]]:
+        """Return a copy of the template type -> class registry"""
+        return dict(self._template_registry)
+
     def get_available_templates(self) -> Dict[str, List[str]]:
         """Return available template types and their variants"""
         result = {}
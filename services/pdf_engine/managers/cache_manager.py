@@ -1,22 +1,63 @@
 """
 Cache Manager - High-performance caching for PDF generation
-Implements intelligent caching with size limits and TTL
+Content-addressed store with a SQLite metadata index, size limits and TTL
+
+Layout of ``cache_dir``:
+- ``blobs/<2 hex>/<sha256>.pdf``: raw PDF bytes, stored once per content
+  (identical documents under different keys share one blob)
+- ``index.db``: entries (key -> digest, timestamps) and blobs (size,
+  reference count), plus the running total size so accounting is O(1)
+
+A hit is one indexed lookup plus one file copy (``copy_to`` goes through
+``shutil.copyfile``, which uses ``sendfile`` where available). Access times
+are buffered in memory and written in batches; they only matter to the LRU
+sweeper, which flushes them before choosing victims.
 """
 
 from __future__ import annotations
 
-import pickle
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    refs INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta(name, value) VALUES ('total_size', 0);
+"""
 
 
 class CacheManager:
     """
     Intelligent caching system for PDF generation
-    Features: TTL, size limits, LRU eviction, statistics
+    Features: content addressing, TTL, size limits, LRU eviction, statistics
     """
 
+    # Buffered access-time updates written in one transaction past this count
+    ACCESS_FLUSH_THRESHOLD = 64
+    EVICTION_BATCH = 32
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -24,195 +65,312 @@ class CacheManager:
         default_ttl: int = 3600,  # 1 hour
     ):
         self.cache_dir = Path(cache_dir) if cache_dir else self._get_default_cache_dir()
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
 
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.default_ttl = default_ttl
 
-        # In-memory index for fast lookups
-        self.index = self._load_index()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "index.db"),
+            check_same_thread=False,
+            isolation_level=None,  # explicit transactions below
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending_access: Dict[str, float] = {}
+        self._remove_legacy_files()
+
         self.stats = {"hits": 0, "misses": 0, "evictions": 0}
 
+    # --- Lookups ---
+    def _lookup(self, key: str) -> Optional[Path]:
+        """Blob path for a live entry, or None (expired entries are dropped)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            digest, expires_at = row
+            now = time.time()
+            if now > expires_at:
+                self._delete_entry(key)
+                self.stats["misses"] += 1
+                return None
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                # Blob removed behind our back
+                self._delete_entry(key)
+                self.stats["misses"] += 1
+                return None
+
+            self._pending_access[key] = now
+            if len(self._pending_access) >= self.ACCESS_FLUSH_THRESHOLD:
+                self.flush_access_times()
+            self.stats["hits"] += 1
+            return blob
+
     def get(self, key: str) -> Optional[bytes]:
         """Get cached PDF data"""
-        cache_file = self.cache_dir / f"{key}.cache"
-
-        if not cache_file.exists():
-            self.stats["misses"] += 1
+        blob = self._lookup(key)
+        if blob is None:
             return None
-
-        # Check TTL
-        if self._is_expired(key):
-            self._delete_entry(key)
-            self.stats["misses"] += 1
+        try:
+            return blob.read_bytes()
+        except OSError:
             return None
 
+    def copy_to(self, key: str, output_path: Union[str, Path]) -> bool:
+        """Write the cached PDF for ``key`` straight to ``output_path``"""
+        blob = self._lookup(key)
+        if blob is None:
+            return False
         try:
-            with open(cache_file, "rb") as f:
-                cached_data = pickle.load(f)
-
-            # Update access time for LRU
-            self.index[key]["accessed_at"] = time.time()
-            self._save_index()
-
-            self.stats["hits"] += 1
-            return cached_data["content"]
-
-        except Exception:
-            # Corrupted cache file
-            self._delete_entry(key)
-            self.stats["misses"] += 1
-            return None
+            shutil.copyfile(blob, output_path)
+        except OSError:
+            return False
+        return True
 
+    # --- Writes ---
     def set(self, key: str, content: bytes, ttl: Optional[int] = None) -> None:
         """Set cached PDF data"""
-        if ttl is None:
-            ttl = self.default_ttl
-
-        cache_file = self.cache_dir / f"{key}.cache"
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self._blob_path(digest)
+        try:
+            if not blob.exists():
+                self._write_blob(blob, lambda tmp: tmp.write_bytes(content))
+            self._register(key, digest, len(content), ttl)
+        except OSError:
+            pass
 
-        # Check if we need to free space
-        content_size = len(content)
-        if self._get_total_size() + content_size > self.max_size_bytes:
-            self._evict_lru(content_size)
+    def put_file(
+        self, key: str, source_path: Union[str, Path], ttl: Optional[int] = None
+    ) -> None:
+        """Cache an already written PDF without loading it in memory"""
+        try:
+            with open(source_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                self._write_blob(blob, lambda tmp: shutil.copyfile(source_path, tmp))
+            self._register(key, digest, blob.stat().st_size, ttl)
+        except OSError:
+            pass
 
-        # Save cached data
-        cached_data = {
-            "content": content,
-            "created_at": time.time(),
-            "ttl": ttl,
-            "size": content_size,
-        }
+    def _write_blob(self, blob: Path, write) -> None:
+        blob.parent.mkdir(exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            write(tmp)
+            os.replace(tmp, blob)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
 
+    def _register(self, key: str, digest: str, size: int, ttl: Optional[int]) -> None:
+        if ttl is None:
+            ttl = self.default_ttl
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            # A known blob adds no bytes; sweeping for it could evict the
+            # entries sharing it and unlink the file we are about to reference
+            known = conn.execute(
+                "SELECT 1 FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+            if not known and self._total_size() + size > self.max_size_bytes:
+                self.sweep(needed_space=size)
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT digest FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                old_digest = row[0] if row else None
+                if old_digest != digest:
+                    self._retain(digest, size)
+                conn.execute(
+                    "INSERT INTO entries (key, digest, created_at, accessed_at, "
+                    "expires_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET digest = excluded.digest, "
+                    "created_at = excluded.created_at, "
+                    "accessed_at = excluded.accessed_at, "
+                    "expires_at = excluded.expires_at",
+                    (key, digest, now, now, now + ttl),
+                )
+                if old_digest is not None and old_digest != digest:
+                    self._release(old_digest)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._pending_access.pop(key, None)
+
+    def _retain(self, digest: str, size: int) -> None:
+        updated = self._conn.execute(
+            "UPDATE blobs SET refs = refs + 1 WHERE digest = ?", (digest,)
+        ).rowcount
+        if not updated:
+            self._conn.execute(
+                "INSERT INTO blobs (digest, size, refs) VALUES (?, ?, 1)",
+                (digest, size),
+            )
+            self._add_size(size)
+
+    def _release(self, digest: str) -> None:
+        """Drop one reference; the blob goes with its last reference"""
+        row = self._conn.execute(
+            "UPDATE blobs SET refs = refs - 1 WHERE digest = ? RETURNING refs, size",
+            (digest,),
+        ).fetchone()
+        if row is None or row[0] > 0:
+            return
+        self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._add_size(-row[1])
         try:
-            with open(cache_file, "wb") as f:
-                pickle.dump(cached_data, f)
-
-            # Update index
-            self.index[key] = {
-                "created_at": time.time(),
-                "accessed_at": time.time(),
-                "expires_at": time.time() + ttl,
-                "size": content_size,
-            }
-            self._save_index()
-
-        except Exception:
-            # Cleanup on failure
-            if cache_file.exists():
-                cache_file.unlink()
+            self._blob_path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _add_size(self, delta: int) -> None:
+        self._conn.execute(
+            "UPDATE meta SET value = value + ? WHERE name = 'total_size'", (delta,)
+        )
 
+    # --- Removal ---
     def delete(self, key: str) -> bool:
         """Delete cached entry"""
         return self._delete_entry(key)
 
     def clear(self) -> None:
         """Clear all cached entries"""
-        for cache_file in self.cache_dir.glob("*.cache"):
-            cache_file.unlink()
-
-        self.index.clear()
-        self._save_index()
-
-        self.stats["evictions"] += len(self.index)
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM blobs")
+            self._conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_size'")
+            self._conn.execute("COMMIT")
+            self._pending_access.clear()
+            shutil.rmtree(self.blob_dir, ignore_errors=True)
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            self.stats["evictions"] += count
 
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count"""
-        expired_count = 0
-        current_time = time.time()
-
-        expired_keys = [
-            key for key, meta in self.index.items() if current_time > meta["expires_at"]
-        ]
+        with self._lock:
+            keys = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT key FROM entries WHERE expires_at < ?", (time.time(),)
+                )
+            ]
+            return sum(1 for key in keys if self._delete_entry(key))
+
+    def sweep(self, needed_space: int = 0) -> int:
+        """Drop expired entries, then least recently used ones until
+        ``needed_space`` more bytes fit under the size limit"""
+        with self._lock:
+            self.flush_access_times()
+            removed = self.cleanup_expired()
+            while self._total_size() + needed_space > self.max_size_bytes:
+                keys = [
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT key FROM entries ORDER BY accessed_at LIMIT ?",
+                        (self.EVICTION_BATCH,),
+                    )
+                ]
+                if not keys:
+                    break
+                for key in keys:
+                    if self._total_size() + needed_space <= self.max_size_bytes:
+                        break
+                    if self._delete_entry(key):
+                        removed += 1
+                        self.stats["evictions"] += 1
+            return removed
 
-        for key in expired_keys:
-            if self._delete_entry(key):
-                expired_count += 1
-
-        return expired_count
+    def _delete_entry(self, key: str) -> bool:
+        """Delete cache entry and release its blob"""
+        with self._lock:
+            self._pending_access.pop(key, None)
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "DELETE FROM entries WHERE key = ? RETURNING digest", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._release(row[0])
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                return False
+            return row is not None
+
+    # --- Bookkeeping ---
+    def flush_access_times(self) -> None:
+        """Write buffered access times in one transaction"""
+        with self._lock:
+            if not self._pending_access:
+                return
+            updates = [(ts, key) for key, ts in self._pending_access.items()]
+            self._pending_access.clear()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", updates
+            )
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush_access_times()
+            self._conn.close()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests) if total_requests > 0 else 0
+        entries, blobs = self._counts()
 
         return {
             "hits": self.stats["hits"],
             "misses": self.stats["misses"],
             "hit_rate": hit_rate,
             "evictions": self.stats["evictions"],
-            "entries": len(self.index),
-            "total_size_mb": self._get_total_size() / (1024 * 1024),
+            "entries": entries,
+            "blobs": blobs,
+            "total_size_mb": self._total_size() / (1024 * 1024),
             "max_size_mb": self.max_size_bytes / (1024 * 1024),
         }
 
-    def _get_default_cache_dir(self) -> Path:
-        """Get default cache directory"""
-        return Path.home() / ".coachpro" / "pdf_cache"
-
-    def _load_index(self) -> Dict[str, Dict[str, Any]]:
-        """Load cache index from disk"""
-        index_file = self.cache_dir / "index.json"
-        if index_file.exists():
-            try:
-                import json
-
-                with open(index_file, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {}
-
-    def _save_index(self) -> None:
-        """Save cache index to disk"""
-        index_file = self.cache_dir / "index.json"
-        try:
-            import json
-
-            with open(index_file, "w") as f:
-                json.dump(self.index, f, indent=2)
-        except Exception:
-            pass
-
-    def _is_expired(self, key: str) -> bool:
-        """Check if cache entry is expired"""
-        if key not in self.index:
-            return True
-
-        current_time = time.time()
-        return current_time > self.index[key]["expires_at"]
-
-    def _delete_entry(self, key: str) -> bool:
-        """Delete cache entry and update index"""
-        cache_file = self.cache_dir / f"{key}.cache"
-
-        try:
-            if cache_file.exists():
-                cache_file.unlink()
+    def _counts(self) -> Tuple[int, int]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM entries), (SELECT COUNT(*) FROM blobs)"
+            ).fetchone()
 
-            if key in self.index:
-                del self.index[key]
-                self._save_index()
+    def _total_size(self) -> int:
+        """Total cached bytes, kept as a running counter in the index"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT value FROM meta WHERE name = 'total_size'"
+            ).fetchone()[0]
 
-            return True
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.pdf"
 
-        except Exception:
-            return False
-
-    def _get_total_size(self) -> int:
-        """Get total cache size in bytes"""
-        return sum(meta["size"] for meta in self.index.values())
-
-    def _evict_lru(self, needed_space: int) -> None:
-        """Evict least recently used entries to free space"""
-        # Sort by access time (oldest first)
-        sorted_entries = sorted(self.index.items(), key=lambda x: x[1]["accessed_at"])
-
-        freed_space = 0
-        for key, meta in sorted_entries:
-            if freed_space >= needed_space:
-                break
+    def _get_default_cache_dir(self) -> Path:
+        """Get default cache directory"""
+        return Path.home() / ".coachpro" / "pdf_cache"
 
-            if self._delete_entry(key):
-                freed_space += meta["size"]
-                self.stats["evictions"] += 1
+    def _remove_legacy_files(self) -> None:
+        """Drop pickle entries and the JSON index left by the previous format"""
+        for legacy in self.cache_dir.glob("*.cache"):
+            legacy.unlink(missing_ok=True)
+        (self.cache_dir / "index.json").unlink(missing_ok=True)
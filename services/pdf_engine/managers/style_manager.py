@@ -5,11 +5,16 @@ Handles themes, color palettes, fonts, and brand customization
 
 from __future__ import annotations
 
+import copy
 import json
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from utils.fingerprint import fingerprint
+
+from .style_registry import get_style_registry
+
 
 class StyleManager:
     """
@@ -21,8 +26,24 @@ class StyleManager:
         self.config_path = (
             Path(config_path) if config_path else self._get_default_config_path()
         )
+        self._registry = get_style_registry()
+        self._generation = self._registry.generation
         self.themes = self._load_themes()
         self.brand_settings = self._load_brand_settings()
+        self._version: Optional[str] = None
+
+    @property
+    def version(self) -> str:
+        """Fingerprint of the themes and brand settings, reloaded if edited"""
+        generation = self._registry.generation
+        if generation != self._generation:
+            self._generation = generation
+            self.themes = self._load_themes()
+            self.brand_settings = self._load_brand_settings()
+            self._version = None
+        if self._version is None:
+            self._version = fingerprint(self.themes, self.brand_settings)
+        return self._version
 
     def get_theme(self, theme_name: str = "default") -> Dict[str, Any]:
         """Get theme configuration"""
@@ -215,31 +236,28 @@ class StyleManager:
         return errors
 
     def _load_themes(self) -> Dict[str, Any]:
-        """Load themes from configuration file"""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        """Load themes from configuration file (parsed once per process)"""
+        themes = self._registry.read_json(self.config_path)
+        if themes is not None:
+            return copy.deepcopy(themes)
 
         return self._get_default_themes()
 
     def _save_themes(self) -> None:
         """Save themes to configuration file"""
+        self._version = None
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w") as f:
             json.dump(self.themes, f, indent=2)
+        self._registry.invalidate(self.config_path)
+        self._generation = self._registry.generation
 
     def _load_brand_settings(self) -> Dict[str, Any]:
         """Load brand settings"""
         brand_path = self.config_path.parent / "brand_settings.json"
-        if brand_path.exists():
-            try:
-                with open(brand_path, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        brand_settings = self._registry.read_json(brand_path)
+        if brand_settings is not None:
+            return copy.deepcopy(brand_settings)
         return {}
 
     def _get_default_config_path(self) -> Path:
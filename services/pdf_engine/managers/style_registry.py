@@ -0,0 +1,154 @@
+"""
+Style Registry - Process-wide store for theme files and built style objects
+
+Templates are created by the thousand during batch exports, and each one used
+to re-read the theme and brand JSON files and rebuild the same ReportLab
+styles. The registry keeps:
+- parsed JSON config files, re-read only when their (mtime, size) stamp
+  changes; stamps are checked at most every ``check_interval`` seconds
+- memoised style objects (paragraph style sets, table styles) keyed by a
+  fingerprint of the configuration that produced them, cleared whenever a
+  watched file changes
+
+Everything handed out is shared between templates and threads: treat it as
+read-only and copy before modifying (``StyleManager`` deep-copies themes).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+_Stamp = Optional[Tuple[int, int]]
+
+
+class StyleRegistry:
+    """
+    Shared, watched theme data and memoised style objects
+    Use ``get_style_registry()`` for the process-wide instance
+    """
+
+    def __init__(self, check_interval: float = 1.0, max_styles: int = 256):
+        self.check_interval = check_interval
+        self.max_styles = max_styles
+        self._lock = threading.RLock()
+        # path -> (stamp, parsed data, time of last stat)
+        self._files: Dict[str, Tuple[_Stamp, Any, float]] = {}
+        self._styles: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented each time a watched file is found changed"""
+        self._check_files()
+        return self._generation
+
+    def read_json(self, path: Union[str, Path]) -> Any:
+        """
+        Parsed content of a JSON file, shared and read-only
+        Returns None when the file is missing or invalid
+        """
+        key = str(path)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and not self._is_stale(key, entry):
+                return entry[1]
+            stamp = _stat(key)
+            data = _parse(key) if stamp is not None else None
+            if entry is not None and entry[0] != stamp:
+                self._bump()
+            self._files[key] = (stamp, data, time.monotonic())
+            return data
+
+    def memo(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the object built by ``factory`` for ``key``, built once"""
+        self._check_files()
+        with self._lock:
+            if key in self._styles:
+                self._styles.move_to_end(key)
+                self.hits += 1
+                return self._styles[key]
+        value = factory()
+        with self._lock:
+            self.misses += 1
+            self._styles[key] = value
+            while len(self._styles) > self.max_styles:
+                self._styles.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Forget a file (or all files) so the next read goes to disk"""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+            else:
+                self._files.pop(str(path), None)
+            self._bump()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "styles": len(self._styles),
+                "hits": self.hits,
+                "misses": self.misses,
+                "generation": self._generation,
+            }
+
+    def _is_stale(self, key: str, entry: Tuple[_Stamp, Any, float]) -> bool:
+        stamp, data, checked_at = entry
+        now = time.monotonic()
+        if now - checked_at < self.check_interval:
+            return False
+        current = _stat(key)
+        if current == stamp:
+            self._files[key] = (stamp, data, now)
+            return False
+        return True
+
+    def _check_files(self) -> None:
+        with self._lock:
+            for key, entry in list(self._files.items()):
+                if self._is_stale(key, entry):
+                    self.read_json(key)
+
+    def _bump(self) -> None:
+        self._generation += 1
+        self._styles.clear()
+
+
+def _stat(path: str) -> _Stamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse(path: str) -> Any:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+_registry: Optional[StyleRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_style_registry() -> StyleRegistry:
+    """Process-wide registry, created on first use"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = StyleRegistry()
+    return _registry
@@ -5,19 +5,41 @@ Implements common functionality and template pattern
 
 from __future__ import annotations
 
+import functools
 import time
 from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, TypeVar, Union
 
 from reportlab.lib.colors import Color, HexColor
 from reportlab.lib.pagesizes import A4, LETTER
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate
 
+from utils.fingerprint import fingerprint
+
 from ..components.footer import FooterComponent
 from ..components.header import HeaderComponent
 from ..managers.style_manager import StyleManager
+from ..managers.style_registry import get_style_registry
+
+_T = TypeVar("_T")
+
+
+def shared_style(method: Callable[[Any], _T]) -> Callable[[Any], _T]:
+    """
+    Build a style once per template class and configuration
+    The result is shared by every template rendered with the same
+    ``merged_config``: callers must not modify it.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseTemplate") -> _T:
+        key = (type(self), method.__name__, self._style_key())
+        return get_style_registry().memo(key, lambda: method(self))
+
+    return wrapper
 
 
 class BaseTemplate(ABC):
@@ -26,10 +48,14 @@ class BaseTemplate(ABC):
     Implements Template Method pattern for consistent PDF generation
     """
 
+    # Bump when a change to the rendering would alter previously cached output
+    TEMPLATE_VERSION = 1
+
     def __init__(self, data: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
         self.data = data
         self.config = config or {}
-        self.style_manager = StyleManager()
+        self._style_manager: Optional[StyleManager] = None
+        self._config_fingerprint: Optional[str] = None
         self.page_count = 0
         self.preview_mode = False
         self.max_preview_pages = 3
@@ -45,6 +71,13 @@ class BaseTemplate(ABC):
         # Styles
         self._setup_styles()
 
+    @property
+    def style_manager(self) -> StyleManager:
+        """Theme access, created on first use (themes come from the registry)"""
+        if self._style_manager is None:
+            self._style_manager = StyleManager()
+        return self._style_manager
+
     def build(self, output: Union[str, BytesIO]) -> None:
         """
         Main template method - builds the complete PDF
@@ -108,6 +141,7 @@ class BaseTemplate(ABC):
     def apply_style_overrides(self, overrides: Dict[str, Any]) -> None:
         """Apply style overrides to template configuration"""
         self.merged_config = {**self.merged_config, **overrides}
+        self._config_fingerprint = None
         self._setup_styles()
 
     def _build_header(self) -> List[Any]:
@@ -123,13 +157,23 @@ class BaseTemplate(ABC):
         return []
 
     def _setup_styles(self) -> None:
-        """Setup paragraph and table styles"""
-        base_styles = getSampleStyleSheet()
-
-        # Extract style configuration
-        self.merged_config.get("styles", {})
+        """
+        Setup paragraph styles
+        Identical colors/fonts share one read-only style set across templates
+        """
         colors = self.merged_config.get("colors", {})
         fonts = self.merged_config.get("fonts", {})
+        self.styles = get_style_registry().memo(
+            ("paragraph_styles", fingerprint(colors, fonts)),
+            lambda: self._build_paragraph_styles(colors, fonts),
+        )
+
+    def _build_paragraph_styles(
+        self, colors: Any, fonts: Dict[str, Any]
+    ) -> Mapping[str, ParagraphStyle]:
+        base_styles = get_style_registry().memo(
+            "sample_stylesheet", getSampleStyleSheet
+        )
 
         # Handle case where colors is a theme name instead of a dict
         if isinstance(colors, str):
@@ -142,41 +186,51 @@ class BaseTemplate(ABC):
             }
 
         # Create custom styles
-        self.styles = {
-            "title": ParagraphStyle(
-                "Title",
-                parent=base_styles["Title"],
-                fontName=fonts.get("title", {}).get("name", "Helvetica-Bold"),
-                fontSize=fonts.get("title", {}).get("size", 20),
-                textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
-                spaceAfter=20,
-            ),
-            "heading": ParagraphStyle(
-                "Heading",
-                parent=base_styles["Heading1"],
-                fontName=fonts.get("heading", {}).get("name", "Helvetica-Bold"),
-                fontSize=fonts.get("heading", {}).get("size", 14),
-                textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
-                spaceBefore=12,
-                spaceAfter=8,
-            ),
-            "body": ParagraphStyle(
-                "Body",
-                parent=base_styles["Normal"],
-                fontName=fonts.get("body", {}).get("name", "Helvetica"),
-                fontSize=fonts.get("body", {}).get("size", 10),
-                textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
-                spaceAfter=6,
-            ),
-            "caption": ParagraphStyle(
-                "Caption",
-                parent=base_styles["Normal"],
-                fontName=fonts.get("caption", {}).get("name", "Helvetica"),
-                fontSize=fonts.get("caption", {}).get("size", 8),
-                textColor=self._hex_to_color(colors.get("text_secondary", "#666666")),
-                spaceAfter=4,
-            ),
-        }
+        return MappingProxyType(
+            {
+                "title": ParagraphStyle(
+                    "Title",
+                    parent=base_styles["Title"],
+                    fontName=fonts.get("title", {}).get("name", "Helvetica-Bold"),
+                    fontSize=fonts.get("title", {}).get("size", 20),
+                    textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
+                    spaceAfter=20,
+                ),
+                "heading": ParagraphStyle(
+                    "Heading",
+                    parent=base_styles["Heading1"],
+                    fontName=fonts.get("heading", {}).get("name", "Helvetica-Bold"),
+                    fontSize=fonts.get("heading", {}).get("size", 14),
+                    textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
+                    spaceBefore=12,
+                    spaceAfter=8,
+                ),
+                "body": ParagraphStyle(
+                    "Body",
+                    parent=base_styles["Normal"],
+                    fontName=fonts.get("body", {}).get("name", "Helvetica"),
+                    fontSize=fonts.get("body", {}).get("size", 10),
+                    textColor=self._hex_to_color(colors.get("text_primary", "#000000")),
+                    spaceAfter=6,
+                ),
+                "caption": ParagraphStyle(
+                    "Caption",
+                    parent=base_styles["Normal"],
+                    fontName=fonts.get("caption", {}).get("name", "Helvetica"),
+                    fontSize=fonts.get("caption", {}).get("size", 8),
+                    textColor=self._hex_to_color(
+                        colors.get("text_secondary", "#666666")
+                    ),
+                    spaceAfter=4,
+                ),
+            }
+        )
+
+    def _style_key(self) -> str:
+        """Fingerprint of the configuration styles are built from"""
+        if self._config_fingerprint is None:
+            self._config_fingerprint = fingerprint(self.merged_config)
+        return self._config_fingerprint
 
     def _get_page_size(self) -> tuple:
         """Get page size from configuration"""
@@ -11,7 +11,7 @@ from reportlab.lib import colors
 from reportlab.lib.units import cm
 from reportlab.platypus import PageBreak, Paragraph, Spacer, Table, TableStyle
 
-from .base_template import BaseTemplate
+from .base_template import BaseTemplate, shared_style
 
 
 class MealPlanTemplate(BaseTemplate):
@@ -551,6 +551,7 @@ class MealPlanTemplate(BaseTemplate):
         else:
             return "🍽️"
 
+    @shared_style
     def _get_overview_table_style(self) -> TableStyle:
         """Get styling for overview table"""
         return TableStyle(
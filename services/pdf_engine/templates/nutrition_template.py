@@ -12,7 +12,7 @@ from reportlab.lib import colors
 from reportlab.lib.units import cm
 from reportlab.platypus import Image, Paragraph, Spacer, Table, TableStyle
 
-from .base_template import BaseTemplate
+from .base_template import BaseTemplate, shared_style
 
 
 class NutritionTemplate(BaseTemplate):
@@ -680,6 +680,7 @@ class NutritionTemplate(BaseTemplate):
 
         return recommendations
 
+    @shared_style
     def _get_standard_table_style(self) -> TableStyle:
         """Get standard table styling"""
         return TableStyle(
@@ -11,7 +11,7 @@ from reportlab.lib import colors
 from reportlab.lib.units import cm
 from reportlab.platypus import PageBreak, Paragraph, Spacer, Table, TableStyle
 
-from .base_template import BaseTemplate
+from .base_template import BaseTemplate, shared_style
 
 
 class ProgramTemplate(BaseTemplate):
@@ -578,6 +578,7 @@ class ProgramTemplate(BaseTemplate):
         table.setStyle(style)
         return table
 
+    @shared_style
     def _get_compact_table_style(self) -> TableStyle:
         """Get styling for compact table"""
         return TableStyle(
@@ -12,7 +12,7 @@ from reportlab.lib import colors
 from reportlab.lib.units import cm
 from reportlab.platypus import Image, PageBreak, Paragraph, Spacer, Table, TableStyle
 
-from .base_template import BaseTemplate
+from .base_template import BaseTemplate, shared_style
 
 
 class ProgressReportTemplate(BaseTemplate):
@@ -867,6 +867,7 @@ class ProgressReportTemplate(BaseTemplate):
         icons = {"improvement": "📈", "regression": "📉", "stable": "➡️"}
         return icons.get(status, "➡️")
 
+    @shared_style
     def _get_metrics_table_style(self) -> TableStyle:
         """Get styling for metrics table"""
         return TableStyle(
@@ -926,6 +927,7 @@ class ProgressReportTemplate(BaseTemplate):
             ]
         )
 
+    @shared_style
     def _get_standard_table_style(self) -> TableStyle:
         """Get standard table styling"""
         return TableStyle(
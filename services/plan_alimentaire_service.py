@@ -1,6 +1,47 @@
+from dataclasses import dataclass, field
+
 from models.plan_alimentaire import PlanAlimentaire, Repas, RepasItem
 from repositories.plan_alimentaire_repo import PlanAlimentaireRepository
 
+MACRO_KEYS = ("kcal", "proteines", "glucides", "lipides")
+
+
+def _empty_totals() -> dict[str, float]:
+    return dict.fromkeys(MACRO_KEYS, 0.0)
+
+
+def item_macros(item: RepasItem) -> dict[str, float]:
+    """Macros d'un item à partir des données aliment/portion déjà chargées."""
+    aliment = item.aliment
+    if aliment is None:
+        return _empty_totals()
+    if item.portion is not None:
+        facteur = (item.portion.grammes_equivalents * item.quantite) / 100
+    else:
+        facteur = item.quantite / 100
+    return {
+        "kcal": aliment.kcal_100g * facteur,
+        "proteines": aliment.proteines_100g * facteur,
+        "glucides": aliment.glucides_100g * facteur,
+        "lipides": aliment.lipides_100g * facteur,
+    }
+
+
+@dataclass
+class MealTotals:
+    """Totaux d'un repas ; ``items`` est aligné sur ``repas.items``."""
+
+    items: list[dict[str, float]] = field(default_factory=list)
+    totals: dict[str, float] = field(default_factory=_empty_totals)
+
+
+@dataclass
+class PlanTotals:
+    """Totaux item / repas / plan ; ``meals`` est aligné sur ``plan.repas``."""
+
+    meals: list[MealTotals] = field(default_factory=list)
+    totals: dict[str, float] = field(default_factory=_empty_totals)
+
 
 class PlanAlimentaireService:
     def __init__(self, repo: PlanAlimentaireRepository) -> None:
@@ -44,21 +85,41 @@ class PlanAlimentaireService:
         self.repo.delete_item(item_id)
         return self.repo.get_plan(self._current_plan_id)
 
+    # --- Totaux nutritionnels ---
+    def compute_totals(self, plan: PlanAlimentaire) -> PlanTotals:
+        """Calcule les trois niveaux (item, repas, plan) en une seule passe.
+
+        Les items issus de ``get_plan`` portent déjà leurs données aliment et
+        portion ; les autres sont complétés par un unique chargement en lot.
+        """
+        self.repo.attach_nutrition(
+            [item for repas in plan.repas for item in repas.items]
+        )
+        result = PlanTotals()
+        plan_totals = result.totals
+        for repas in plan.repas:
+            meal = MealTotals()
+            meal_totals = meal.totals
+            for item in repas.items:
+                macros = item_macros(item)
+                meal.items.append(macros)
+                for k in MACRO_KEYS:
+                    meal_totals[k] += macros[k]
+            for k in MACRO_KEYS:
+                plan_totals[k] += meal_totals[k]
+            result.meals.append(meal)
+        return result
+
+    def compute_repas_totals(self, repas: Repas) -> MealTotals:
+        plan = PlanAlimentaire(id=repas.plan_id, client_id=None, nom="", repas=[repas])
+        return self.compute_totals(plan).meals[0]
+
     def compute_item_totals(self, item: RepasItem) -> dict[str, float]:
-        return self.repo.compute_item_totals(item)
+        self.repo.attach_nutrition([item])
+        return item_macros(item)
 
     def compute_meal_totals(self, repas: Repas) -> dict[str, float]:
-        totals = {"kcal": 0.0, "proteines": 0.0, "glucides": 0.0, "lipides": 0.0}
-        for item in repas.items:
-            it = self.compute_item_totals(item)
-            for k in totals:
-                totals[k] += it[k]
-        return totals
+        return self.compute_repas_totals(repas).totals
 
     def compute_plan_totals(self, plan: PlanAlimentaire) -> dict[str, float]:
-        totals = {"kcal": 0.0, "proteines": 0.0, "glucides": 0.0, "lipides": 0.0}
-        for repas in plan.repas:
-            mt = self.compute_meal_totals(repas)
-            for k in totals:
-                totals[k] += mt[k]
-        return totals
+        return self.compute_totals(plan).totals
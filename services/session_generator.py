@@ -2,6 +2,7 @@ import logging
 import random
 import time
 import uuid
+from collections import defaultdict
 from datetime import date
 from typing import Any, Dict, List, Tuple
 
@@ -10,7 +11,9 @@ from models.exercices import Exercise
 from models.session import Block, BlockItem, Session
 from repositories.client_repo import ClientRepository
 from repositories.exercices_repo import ExerciseRepository
+from repositories.exercise_catalog import get_exercise_catalog
 from services.client_service import ClientService
+from services.weighted_sampler import WeightedSampler, choose
 
 
 def rest_from_density(density_1_10: int) -> int:
@@ -104,10 +107,8 @@ def weighted_choice(
 ) -> Exercise:
     if not items:
         raise ValueError("Pool is empty")
-    if entropy <= 0.05:
-        return sorted(items, key=lambda x: x[1], reverse=True)[0][0]
-    exercises, weights = zip(*items)
-    return rng.choices(exercises, weights=weights, k=1)[0]
+    sampler = WeightedSampler(w for _, w in items)
+    return items[choose(sampler, rng, entropy)][0]
 
 
 def pick_main_block_count(duration_min: int, entropy: float) -> int:
@@ -209,8 +210,13 @@ def adjust_to_time_budget(blocks: List[Block], duration_min: int) -> List[Block]
     return blocks
 
 
-def generate_collectif(params: Dict[str, Any]) -> Session:
-    """Generate a collective session from form parameters."""
+def generate_collectif(params: Dict[str, Any], repo=None) -> Session:
+    """Generate a collective session from form parameters.
+
+    ``repo`` is anything exposing ``filter(equipment, tags)``; defaults to the
+    shared in-memory exercise catalogue. ``params["seed"]`` makes the draw
+    reproducible.
+    """
     params = params.copy()
     params.setdefault("variabilite", 50)
     params.setdefault("volume", 50)
@@ -230,17 +236,15 @@ def generate_collectif(params: Dict[str, Any]) -> Session:
     params["intensity_cont"] = intensity_map.get(intensity, 6)
 
     tpl = T.pick_template(params["course_type"], params["duration_min"])
-    repo = ExerciseRepository()
-    pool = filter_and_score_pool(repo, params)
+    pool = filter_and_score_pool(repo or get_exercise_catalog(), params)
     if not pool:
         raise ValueError(
             "Impossible de générer une séance : la base de données d'exercices est vide."
         )
     variabilite = params.get("variabilite", 50)
-    if variabilite <= 10:
-        seed = 42
-    else:
-        seed = int(time.time())
+    seed = params.get("seed")
+    if seed is None:
+        seed = 42 if variabilite <= 10 else int(time.time())
     rng = random.Random(seed)
     entropy = map_slider_to_entropy(variabilite)
 
@@ -412,21 +416,23 @@ def build_block_v2(
         candidates.append((ex, max(w, 0.05)))
 
     rng.shuffle(candidates)
+    sampler = WeightedSampler(w for _, w in candidates)
+    by_pattern: Dict[Any, List[int]] = defaultdict(list)
+    by_primary: Dict[Any, List[int]] = defaultdict(list)
+    for i, (ex, _) in enumerate(candidates):
+        by_pattern[ex.movement_pattern].append(i)
+        by_primary[ex.groupe_musculaire_principal].append(i)
 
     last_pattern = None
     last_primary = None
     for _ in range(n_items):
-        pool_step = (
-            [
-                (ex, w)
-                for ex, w in candidates
-                if ex.movement_pattern != last_pattern
-                and ex.groupe_musculaire_principal != last_primary
-            ]
-            or [(ex, w) for ex, w in candidates if ex.movement_pattern != last_pattern]
-            or candidates
+        # éviter le même pattern et le même muscle, sinon le même pattern
+        same_pattern = by_pattern.get(last_pattern, [])
+        same_both = set(same_pattern).union(by_primary.get(last_primary, []))
+        exclude = next(
+            (e for e in (same_both, same_pattern) if sampler.available(e)), ()
         )
-        ex = weighted_choice(rng, pool_step, entropy)
+        ex = candidates[choose(sampler, rng, entropy, exclude)][0]
 
         tnorm = block.type.replace(" ", "").upper()
         if tnorm in ("SETSXREPS", "AMRAP"):
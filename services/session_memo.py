@@ -0,0 +1,77 @@
+"""
+Mémo LRU des séances générées.
+
+Une séance générée ne dépend que des paramètres normalisés, de la graine, des
+exercices du catalogue et de la configuration du coach. La clé du mémo est
+donc une empreinte canonique de ces quatre éléments : régénérer avec les mêmes
+réglages (retour d'un slider à sa valeur précédente) ressort la séance déjà
+calculée, et toute modification du catalogue ou de la configuration change
+la clé, ce qui invalide les entrées sans purge explicite.
+"""
+
+import copy
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Optional
+
+from models.session import Session
+from utils.fingerprint import fingerprint
+
+
+def canonical_key(*parts: Any) -> str:
+    """Empreinte indépendante de l'ordre des clés de dictionnaire et des ensembles."""
+    return fingerprint(*parts)
+
+
+class SessionMemo:
+    """Cache LRU borné de séances, sûr entre threads.
+
+    Les séances sont copiées à l'entrée et à la sortie : l'appelant peut
+    modifier la séance rendue sans altérer le mémo. Chaque copie rendue reçoit
+    de nouveaux identifiants de séance et de blocs, comme une séance neuve.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Session]:
+        with self._lock:
+            session = self._entries.get(key)
+            if session is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._fresh_copy(session)
+
+    def put(self, key: str, session: Session) -> None:
+        if self.maxsize <= 0:
+            return
+        stored = copy.deepcopy(session)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _fresh_copy(session: Session) -> Session:
+        fresh = copy.deepcopy(session)
+        fresh.session_id = str(uuid.uuid4())
+        fresh.date_creation = date.today().isoformat()
+        for block in fresh.blocks:
+            block.block_id = str(uuid.uuid4())
+        return fresh
@@ -11,10 +11,22 @@ from collections import defaultdict
 from datetime import date
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
 import services.session_templates as T
 from models.exercices import Exercise
 from models.session import Block, BlockItem, Session
 from repositories.exercices_repo import ExerciseRepository
+from repositories.exercise_catalog import ExerciseCatalog, get_exercise_catalog
+from services.exercise_features import (
+    CANDIDATE_THRESHOLD,
+    FeatureMatrix,
+    WeightedPool,
+    score_exercises,
+    slot_weights,
+)
+from services.session_memo import SessionMemo, canonical_key
+from services.weighted_sampler import WeightedSampler, choose
 from services.workout_config_service import WorkoutConfigService
 
 
@@ -26,9 +38,23 @@ class SmartWorkoutGenerator:
         exercise_service=None,
         config_service: Optional[WorkoutConfigService] = None,
         exercise_repo: Optional[ExerciseRepository] = None,
+        catalog: Optional[ExerciseCatalog] = None,
+        memo_size: int = 64,
     ):
         self.config_service = config_service or WorkoutConfigService()
         self.repo = exercise_repo or ExerciseRepository()
+        # Catalogue en mémoire : aucune requête SQL par génération une fois chaud
+        if catalog is None:
+            catalog = (
+                ExerciseCatalog(exercise_repo)
+                if exercise_repo
+                else get_exercise_catalog()
+            )
+        self.catalog = catalog
+        self._features: Optional[FeatureMatrix] = None
+        self._features_key: Optional[tuple] = None
+        # Séances déjà générées, pour des réglages et une graine identiques
+        self.session_memo = SessionMemo(memo_size)
         self.exercise_service = exercise_service
         self.logger = logging.getLogger(__name__)
 
@@ -39,8 +65,26 @@ class SmartWorkoutGenerator:
         if not self._validate_input_params(params):
             raise ValueError("Paramètres d'entrée invalides pour la génération")
 
+        # Lue avant les paramètres : recharge la config si le fichier a changé
+        config_version = self.config_service.version
         smart_params = self._prepare_smart_params(params)
 
+        # Configurer randomisation
+        variabilite = smart_params.get("variabilite", 50)
+        seed = smart_params.get("seed")  # graine explicite : séance reproductible
+        memo_key = None
+        if seed is None and variabilite <= 10:
+            seed = 42
+        if seed is not None:
+            memo_key = canonical_key(
+                smart_params, seed, self.catalog.data_key, config_version
+            )
+            cached = self.session_memo.get(memo_key)
+            if cached is not None:
+                return cached
+        else:
+            seed = int(time.time())
+
         # Obtenir recommandations basées sur historique
         context = {
             "course_type": smart_params["course_type"],
@@ -58,9 +102,6 @@ class SmartWorkoutGenerator:
                 "Impossible de générer une séance : pool d'exercices insuffisant."
             )
 
-        # Configurer randomisation
-        variabilite = smart_params.get("variabilite", 50)
-        seed = 42 if variabilite <= 10 else int(time.time())
         rng = random.Random(seed)
         entropy = self._calculate_entropy(variabilite)
 
@@ -95,6 +136,9 @@ class SmartWorkoutGenerator:
         # Analytics et feedback pour amélioration continue
         self._log_generation_metrics(session, smart_params, recommendations)
 
+        if memo_key is not None:
+            self.session_memo.put(memo_key, session)
+
         self.logger.info(f"Séance générée: {session.label} - {len(blocks)} blocs")
         return session
 
@@ -174,35 +218,38 @@ class SmartWorkoutGenerator:
         # Tags associés au type de cours
         course_tags = self._get_course_tags(course_type)
 
-        # Récupérer exercices depuis repo
-        exercises = self.repo.filter(equipment=equipment, tags=course_tags)
+        # Intersections de bitsets sur le catalogue en mémoire
+        catalog = self.catalog
+        all_bits = catalog.all_bits()
+        equipment_bits = catalog.equipment_bits(equipment) if equipment else all_bits
+        tag_bits = catalog.tag_bits(course_tags) if course_tags else all_bits
+        exercises = catalog.exercises_for(equipment_bits & tag_bits)
 
         self.logger.info(
             f"Exercices trouvés avec équipement {equipment}: {len(exercises)}"
         )
 
         # Si pas d'exercices avec l'équipement spécifique, fallback plus intelligent
+        extended_bits = equipment_bits
+        if equipment and "Poids du corps" not in equipment:
+            extended_bits |= catalog.equipment_bits(["Poids du corps"])
         if not exercises and equipment:
             self.logger.info(
                 "Peu d'exercices avec l'équipement spécifié, ajout du poids du corps"
             )
-            # Ajouter "Poids du corps" si pas déjà présent
-            extended_equipment = equipment.copy()
-            if "Poids du corps" not in extended_equipment:
-                extended_equipment.append("Poids du corps")
-            exercises = self.repo.filter(equipment=extended_equipment, tags=course_tags)
+            exercises = catalog.exercises_for(extended_bits & tag_bits)
 
         if not exercises:
             self.logger.info(
                 "Aucun exercice avec équipement étendu, fallback vers tags uniquement"
             )
-            exercises = self.repo.filter(tags=course_tags)
+            exercises = catalog.exercises_for(tag_bits)
 
         if not exercises:
             self.logger.info(
                 "Aucun exercice avec tags, utilisation de tous les exercices"
             )
-            exercises = self.repo.list_all()
+            exercises = catalog.all()
 
         # Filtrer selon restrictions
         valid_exercises = []
@@ -221,11 +268,10 @@ class SmartWorkoutGenerator:
             # Fallback amélioré respectant l'équipement
             if equipment:
                 # Essayer d'abord avec l'équipement demandé
-                fallback_exercises = self.repo.filter(equipment=equipment)
+                fallback_exercises = catalog.exercises_for(equipment_bits)
                 if not fallback_exercises:
                     # Si rien, ajouter poids du corps
-                    extended_equipment = equipment + ["Poids du corps"]
-                    fallback_exercises = self.repo.filter(equipment=extended_equipment)
+                    fallback_exercises = catalog.exercises_for(extended_bits)
 
                 if fallback_exercises:
                     valid_exercises = fallback_exercises[:50]
@@ -233,111 +279,40 @@ class SmartWorkoutGenerator:
                     self.logger.warning(
                         "Impossible de respecter l'équipement, utilisation pool complet"
                     )
-                    valid_exercises = self.repo.list_all()[:50]
+                    valid_exercises = catalog.all()[:50]
             else:
-                valid_exercises = self.repo.list_all()[:50]
+                valid_exercises = catalog.all()[:50]
 
-        # Pondération intelligente
-        weighted_pool = []
-        for ex in valid_exercises:
-            weight = self._calculate_intelligent_weight(
-                ex, params, recommendations, config
-            )
-            if weight > 0.1:  # Seuil minimal
-                weighted_pool.append((ex, weight))
+        # Pondération intelligente, vectorisée sur les features du catalogue
+        features = self._catalog_features()
+        positions = np.array(
+            [features.position_by_id[ex.id] for ex in valid_exercises], dtype=np.int64
+        )
+        weights = score_exercises(features, params, recommendations, config)[positions]
 
-        # Trier par poids décroissant
-        weighted_pool.sort(key=lambda x: x[1], reverse=True)
+        # Seuil minimal puis tri par poids décroissant (stable)
+        keep = weights > 0.1
+        positions, weights = positions[keep], weights[keep]
+        order = np.argsort(-weights, kind="stable")
+        weighted_pool = WeightedPool(features, positions[order], weights[order])
 
         self.logger.info(
             f"Pool d'exercices construit: {len(weighted_pool)} exercices valides"
         )
         return weighted_pool
 
-    def _calculate_intelligent_weight(
-        self,
-        exercise: Exercise,
-        params: Dict[str, Any],
-        recommendations: Dict[str, Any],
-        config,
-    ) -> float:
-        """Calcule un poids intelligent pour un exercice selon contexte."""
-
-        weight = 1.0
-        ex_tags = [t.strip().lower() for t in (exercise.tags or "").split(",")]
-        pattern = (exercise.movement_pattern or "").lower()
-        (exercise.groupe_musculaire_principal or "").lower()
-
-        # === BONUS SELON OBJECTIF ===
-        objectif = (params.get("objectif") or "").lower()
-        if objectif in ["force", "strength"] and exercise.est_chargeable:
-            weight *= 1.4
-        elif objectif in ["cardio", "conditioning"] and any(
-            tag in ex_tags for tag in ["cardio", "conditioning"]
-        ):
-            weight *= 1.3
-        elif objectif in ["technique", "skill"] and any(
-            tag in ex_tags for tag in ["technique", "skill"]
-        ):
-            weight *= 1.2
-
-        # === BONUS SELON CONTINUUM CARDIO-RENFO ===
-        continuum = params.get("continuum_cardio_renfo", 0)
-        if continuum > 20:  # Plus cardio
-            if any(tag in ex_tags for tag in ["cardio", "conditioning", "metabolic"]):
-                weight *= 1 + (continuum / 100)
-            elif exercise.est_chargeable and pattern in ["squat", "hinge"]:
-                weight *= 0.8
-        elif continuum < -20:  # Plus renforcement
-            if exercise.est_chargeable or pattern in ["push", "pull", "squat", "hinge"]:
-                weight *= 1 + (abs(continuum) / 100)
-            elif any(tag in ex_tags for tag in ["cardio", "plyometric"]):
-                weight *= 0.7
-
-        # === BONUS SELON FOCUS ===
-        focus = params.get("focus", "Full-body")
-        focus_patterns = {
-            "Upper": ["push", "pull", "carry"],
-            "Lower": ["squat", "hinge", "lunge"],
-            "Push": ["push"],
-            "Pull": ["pull"],
-            "Core": ["twist", "carry"],
-        }
+    def _catalog_features(self) -> FeatureMatrix:
+        """Features de tout le catalogue, recompilées quand ses données changent.
 
-        if focus in focus_patterns and pattern in focus_patterns[focus]:
-            weight *= 1.5
-        elif focus != "Full-body" and pattern not in focus_patterns.get(focus, []):
-            weight *= 0.6
-
-        # === BONUS EXERCICES FAVORIS ===
-        favorites = config.favorite_exercises
-        for context, fav_list in favorites.items():
-            if exercise.nom in fav_list:
-                weight *= 1.2
-                break
-
-        # === MALUS RESTRICTIONS FRÉQUENCE ===
-        limited_freq = config.exercise_restrictions.get("limited_frequency", {})
-        if exercise.nom in limited_freq:
-            # Réduire poids selon restriction (0.3 = 30% max -> poids * 0.7)
-            freq_limit = limited_freq[exercise.nom]
-            weight *= 1 - freq_limit + 0.1  # +0.1 pour éviter poids = 0
-
-        # === BONUS SELON RECOMMANDATIONS HISTORIQUES ===
-        suggested = recommendations.get("suggested_exercises", [])
-        for suggestion_list in suggested:
-            if exercise.nom in suggestion_list:
-                weight *= 1.3
-                break
-
-        # === MALUS COMPLEXITÉ VS INTENSITÉ ===
-        intensity = params.get("intensity_numeric", 6)
-        if hasattr(exercise, "complexity_level"):
-            complexity = getattr(exercise, "complexity_level", "moderate")
-            if complexity == "high" and intensity >= 8:
-                weight *= 0.8  # Éviter exercices complexes Ã  haute intensité
-
-        return max(weight, 0.05)  # Poids minimum
+        Clé ``data_key`` et non ``version`` : changer de base recharge le
+        catalogue sans incrémenter sa version.
+        """
+        # Même instantané pour la liste et sa clé (un rechargement peut s'intercaler)
+        exercises, data_key = self.catalog.export()
+        if self._features is None or self._features_key != data_key:
+            self._features = FeatureMatrix(exercises)
+            self._features_key = data_key
+        return self._features
 
     def _design_smart_session_structure(
         self, params: Dict[str, Any], rng: random.Random, entropy: float
@@ -646,34 +621,40 @@ class SmartWorkoutGenerator:
             "max_consecutive_high_intensity"
         ]
 
-        selected_exercises = []
+        pool = WeightedPool.from_pairs(pool)
+        # Poids du slot tenus à jour en place : seuls les exercices touchés par
+        # la dernière sélection (muscle, pattern, fatigue) changent de poids
+        sampler = WeightedSampler(np.zeros(len(pool)))
+        selected_positions: List[int] = []
         consecutive_high_intensity = 0
 
         for i in range(n_items):
-            # Construire pool candidat avec contraintes
-            candidate_pool = self._build_candidate_pool(
-                pool,
+            # Pool candidat avec contraintes (poids nul = hors pool)
+            weights = slot_weights(
+                pool.features,
+                pool.positions,
+                pool.weights,
                 slot_focus,
                 used_exercises,
                 muscle_usage_count,
                 last_patterns,
                 consecutive_high_intensity,
                 max_consecutive,
-                physiological_rules,
             )
+            weights[weights <= CANDIDATE_THRESHOLD] = 0.0
+            sampler.sync(weights)
 
-            if not candidate_pool:
+            candidates = sampler
+            if not sampler.active:
                 self.logger.warning("Pool candidat vide, utilisation pool complet")
-                candidate_pool = pool
-
-            # Sélection avec entropy et anti-répétition
-            used_exercise_names = {
-                ex.nom for ex in selected_exercises
-            }  # Exercices déjà dans ce bloc
-            exercise = self._weighted_choice_entropy(
-                rng, candidate_pool, entropy, used_exercise_names
+                candidates = WeightedSampler(pool.weights)
+
+            # Sélection avec entropy et anti-répétition dans le bloc
+            position = self._choose_in_block(
+                rng, candidates, entropy, selected_positions
             )
-            selected_exercises.append(exercise)
+            selected_positions.append(position)
+            exercise = pool[position][0]
 
             # Mise Ã  jour des contraintes pour prochaine itération
             used_exercises.add(exercise.id)
@@ -700,62 +681,6 @@ class SmartWorkoutGenerator:
 
         return block
 
-    def _build_candidate_pool(
-        self,
-        pool: List[Tuple[Exercise, float]],
-        slot_focus: str,
-        used_exercises: Set[int],
-        muscle_usage_count: defaultdict,
-        last_patterns: List[str],
-        consecutive_high_intensity: int,
-        max_consecutive: int,
-        physiological_rules: Dict[str, Any],
-    ) -> List[Tuple[Exercise, float]]:
-        """Construit un pool de candidats selon contraintes physiologiques."""
-
-        candidates = []
-
-        for exercise, weight in pool:
-            # Éviter répétition d'exercices
-            if exercise.id in used_exercises:
-                weight *= 0.2  # Forte pénalité mais pas exclusion totale
-
-            # Éviter répétition de patterns récents
-            if exercise.movement_pattern in last_patterns[-2:]:  # 2 derniers
-                weight *= 0.5
-
-            # Équilibrage musculaire
-            muscle = exercise.groupe_musculaire_principal
-            muscle_count = muscle_usage_count.get(muscle, 0)
-            if muscle_count >= 2:  # DéjÃ  utilisé 2 fois
-                weight *= 0.3
-            elif muscle_count >= 1:
-                weight *= 0.7
-
-            # Gestion fatigue/intensité
-            ex_tags = [t.strip().lower() for t in (exercise.tags or "").split(",")]
-            is_high_intensity = any(
-                tag in ex_tags for tag in ["high_intensity", "explosive", "cardio"]
-            )
-
-            if consecutive_high_intensity >= max_consecutive and is_high_intensity:
-                weight *= 0.1  # Éviter surcharge
-
-            # Bonus selon focus du slot
-            if slot_focus == "activation" and any(
-                tag in ex_tags for tag in ["mobility", "activation"]
-            ):
-                weight *= 1.3
-            elif slot_focus == "metabolic" and any(
-                tag in ex_tags for tag in ["cardio", "metabolic"]
-            ):
-                weight *= 1.4
-
-            if weight > 0.05:  # Seuil minimal
-                candidates.append((exercise, weight))
-
-        return candidates
-
     def _create_smart_prescription(
         self,
         exercise: Exercise,
@@ -876,35 +801,22 @@ class SmartWorkoutGenerator:
 
         return intensity_to_percent.get(intensity, "70-75%")
 
-    def _weighted_choice_entropy(
+    def _choose_in_block(
         self,
         rng: random.Random,
-        items: List[Tuple[Exercise, float]],
+        sampler: WeightedSampler,
         entropy: float,
-        used_exercises: Optional[Set[str]] = None,
-    ) -> Exercise:
-        """Sélection pondérée avec entropy et anti-répétition."""
-        if not items:
+        selected: List[int],
+    ) -> int:
+        """Sélection pondérée avec entropy et anti-répétition dans le bloc."""
+        if not sampler.active:
             raise ValueError("Pool vide")
 
-        # Filtrer les exercices déjà utilisés pour améliorer la diversité
-        if used_exercises:
-            unused_items = [(ex, w) for ex, w in items if ex.nom not in used_exercises]
-            # Si il reste des exercices non utilisés, les privilégier
-            if (
-                unused_items and len(unused_items) >= len(items) * 0.3
-            ):  # Au moins 30% de nouveau
-                items = unused_items
-                # Booster le poids des exercices non utilisés
-                items = [(ex, w * 1.5) for ex, w in items]
-
-        if entropy <= 0.05:
-            # Déterministe : meilleur poids
-            return max(items, key=lambda x: x[1])[0]
-        else:
-            # Pondéré aléatoire avec diversité améliorée
-            exercises, weights = zip(*items)
-            return rng.choices(exercises, weights=weights)[0]
+        # Écarter les exercices déjà pris dans le bloc (tirage sans remise)
+        # s'il reste au moins 30% de nouveaux candidats
+        unused = sampler.available(selected) if selected else 0
+        exclude = selected if unused and unused >= sampler.active * 0.3 else ()
+        return choose(sampler, rng, entropy, exclude)
 
     def _validate_and_adjust_session(
         self, blocks: List[Block], params: Dict[str, Any]
@@ -921,7 +833,7 @@ class SmartWorkoutGenerator:
         for block in blocks:
             for item in block.items:
                 # Trouver exercice pour récupérer muscle group
-                exercise = self.repo.get_by_id(item.exercise_id)
+                exercise = self.catalog.get(item.exercise_id)
                 if exercise:
                     muscle_group = exercise.groupe_musculaire_principal
                     if muscle_group:
@@ -1163,7 +1075,7 @@ class SmartWorkoutGenerator:
         muscle_groups = set()
 
         for item in block.items:
-            exercise = self.repo.get_by_id(item.exercise_id)
+            exercise = self.catalog.get(item.exercise_id)
             if exercise and exercise.groupe_musculaire_principal:
                 muscle_groups.add(exercise.groupe_musculaire_principal.lower().strip())
 
@@ -0,0 +1,215 @@
+"""
+Tirage pondéré avec mise à jour des poids en place (arbre de Fenwick).
+
+``WeightedSampler`` range les poids d'un pool d'exercices dans un arbre de
+Fenwick : un tirage coûte O(log n), et modifier un poids aussi (pénalité
+d'exercice déjà utilisé, fatigue d'un groupe musculaire). Il n'est donc plus
+nécessaire de refiltrer le pool ni de recalculer les cumuls à chaque slot
+comme avec ``random.choices``.
+
+Un tirage consomme un seul ``rng.random()`` et retient le premier indice dont
+le cumul dépasse la cible, exactement comme ``random.choices`` : à graine
+égale, une séance reste reproductible.
+
+Une table d'alias (Walker/Vose) tire en O(1) mais doit être reconstruite à
+chaque changement de poids, or ici les poids changent à chaque slot.
+"""
+
+import random
+from typing import Iterable, List
+
+import numpy as np
+
+# Au-delà de cette fraction du pool, modifier ou écarter les entrées une à une
+# coûte plus cher qu'un passage vectorisé sur tout le tableau.
+_BULK_FRACTION = 0.125
+
+
+def _fenwick(weights: np.ndarray) -> List[float]:
+    """Arbre de Fenwick (base 1, stocké en base 0) construit en O(n)."""
+    prefix = np.concatenate(([0.0], np.cumsum(weights)))
+    index = np.arange(1, len(weights) + 1)
+    return (prefix[index] - prefix[index - (index & -index)]).tolist()
+
+
+class WeightedSampler:
+    """Poids positifs indexés de 0 à n-1, tirables et modifiables en O(log n)."""
+
+    def __init__(self, weights: Iterable[float]):
+        self._weights = np.array(list(weights), dtype=np.float64)
+        if self._weights.size and self._weights.min() < 0:
+            raise ValueError("Poids négatif")
+        n = len(self._weights)
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._tree = _fenwick(self._weights)
+        self._active = int(np.count_nonzero(self._weights))
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Vue en lecture seule des poids courants."""
+        view = self._weights.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def active(self) -> int:
+        """Nombre d'entrées de poids non nul."""
+        return self._active
+
+    def total(self) -> float:
+        total = 0.0
+        i = len(self._tree)
+        while i > 0:
+            total += self._tree[i - 1]
+            i &= i - 1
+        return total
+
+    # --- Mise à jour ---
+    def _add(self, index: int, delta: float) -> None:
+        tree = self._tree
+        n = len(tree)
+        i = index + 1
+        while i <= n:
+            tree[i - 1] += delta
+            i += i & -i
+
+    def update(self, index: int, weight: float) -> None:
+        """Remplace le poids d'une entrée (0 la retire des tirages)."""
+        if weight < 0:
+            raise ValueError("Poids négatif")
+        old = float(self._weights[index])
+        if weight == old:
+            return
+        self._active += (weight > 0) - (old > 0)
+        self._weights[index] = weight
+        self._add(index, weight - old)
+
+    def scale(self, index: int, factor: float) -> None:
+        self.update(index, float(self._weights[index]) * factor)
+
+    def sync(self, weights: np.ndarray) -> int:
+        """Aligne les poids sur ``weights`` en ne touchant que ceux qui changent.
+
+        Retourne le nombre d'entrées modifiées.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != self._weights.shape:
+            raise ValueError("Taille de poids incohérente")
+        if weights.size and weights.min() < 0:
+            raise ValueError("Poids négatif")
+        changed = np.flatnonzero(weights != self._weights)
+        if len(changed) > len(self._weights) * _BULK_FRACTION:
+            self._weights[:] = weights
+            self._rebuild()
+        else:
+            for index, weight in zip(changed.tolist(), weights[changed].tolist()):
+                self.update(index, weight)
+        return len(changed)
+
+    # --- Tirage ---
+    def _indices(self, exclude: Iterable[int]) -> np.ndarray:
+        return np.unique(np.fromiter(exclude, dtype=np.intp))
+
+    def available(self, exclude: Iterable[int] = ()) -> int:
+        """Nombre d'entrées tirables une fois ``exclude`` écarté."""
+        excluded = self._indices(exclude)
+        if not excluded.size:
+            return self._active
+        return self._active - int(np.count_nonzero(self._weights[excluded]))
+
+    def _find(self, target: float) -> int:
+        """Premier indice dont le cumul dépasse ``target``."""
+        tree = self._tree
+        n = len(tree)
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt - 1] <= target:
+                pos = nxt
+                target -= tree[nxt - 1]
+            step >>= 1
+        return pos
+
+    def _find_masked(self, u: float, excluded: np.ndarray) -> int:
+        weights = self._weights.copy()
+        weights[excluded] = 0.0
+        cumulative = np.cumsum(weights)
+        pos = int(np.searchsorted(cumulative, u * cumulative[-1], side="right"))
+        if pos >= len(weights) or weights[pos] <= 0:
+            # u proche de 1 : dernier poids non nul
+            pos = int(np.flatnonzero(weights)[-1])
+        return pos
+
+    def sample(self, rng: random.Random, exclude: Iterable[int] = ()) -> int:
+        """Indice tiré proportionnellement à son poids.
+
+        ``exclude`` écarte temporairement des indices (exercices déjà pris
+        dans le bloc, pattern qu'on vient d'enchaîner...).
+        """
+        excluded = self._indices(exclude)
+        if self.available(excluded) <= 0:
+            raise ValueError("Pool vide")
+        u = rng.random()
+        if len(excluded) > len(self._weights) * _BULK_FRACTION:
+            return self._find_masked(u, excluded)
+
+        removed = [
+            (index, weight)
+            for index, weight in zip(
+                excluded.tolist(), self._weights[excluded].tolist()
+            )
+            if weight > 0
+        ]
+        for index, weight in removed:
+            self._weights[index] = 0.0
+            self._add(index, -weight)
+        try:
+            pos = self._find(u * self.total())
+            if pos >= len(self._weights) or self._weights[pos] <= 0:
+                # Arrondi en bout de cumul : repli sur le calcul direct
+                pos = self._find_masked(u, excluded)
+        finally:
+            for index, weight in removed:
+                self._weights[index] = weight
+                self._add(index, weight)
+        return pos
+
+    def best(self, exclude: Iterable[int] = ()) -> int:
+        """Indice du plus gros poids (le premier en cas d'égalité)."""
+        excluded = self._indices(exclude)
+        if self.available(excluded) <= 0:
+            raise ValueError("Pool vide")
+        if not excluded.size:
+            return int(np.argmax(self._weights))
+        weights = self._weights.copy()
+        weights[excluded] = -1.0
+        return int(np.argmax(weights))
+
+    def pop(self, rng: random.Random) -> int:
+        """Tire un indice puis le retire du pool (tirage sans remise)."""
+        index = self.sample(rng)
+        self.update(index, 0.0)
+        return index
+
+    def sample_without_replacement(self, rng: random.Random, k: int) -> List[int]:
+        """``k`` indices distincts (moins si le pool s'épuise)."""
+        return [self.pop(rng) for _ in range(min(k, self._active))]
+
+
+def choose(
+    sampler: WeightedSampler,
+    rng: random.Random,
+    entropy: float,
+    exclude: Iterable[int] = (),
+) -> int:
+    """Choix selon la variabilité : meilleur poids si entropy <= 0.05."""
+    if entropy <= 0.05:
+        return sampler.best(exclude)
+    return sampler.sample(rng, exclude)
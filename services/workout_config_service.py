@@ -1,9 +1,24 @@
 """
 Service de gestion des configurations de génération de séances.
 Gère la persistance et l'application des préférences du coach.
+
+Deux modes de persistance :
+- immédiat (par défaut) : chaque modification réécrit le fichier ;
+- différé (``write_behind=True``) : les modifications s'appliquent en mémoire
+  et les écritures sont regroupées, au plus tard ``debounce_sec`` après la
+  première modification ou dès ``max_pending`` modifications en attente.
+
+L'écriture du fichier est atomique (fichier temporaire + renommage). Les
+feedbacks de séance vont dans un journal en ajout seul
+(``learning_log.jsonl``), rejoué au chargement et compacté dans le fichier
+principal à chaque écriture de celui-ci ou tous les ``compact_every``
+feedbacks.
 """
 
+import atexit
+import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -13,14 +28,41 @@ from models.workout_config import SessionFeedback, WorkoutGenerationConfig
 class WorkoutConfigService:
     """Service de gestion des configurations de workout."""
 
-    def __init__(self, config_dir: str = "data/config"):
+    def __init__(
+        self,
+        config_dir: str = "data/config",
+        write_behind: bool = False,
+        debounce_sec: float = 2.0,
+        max_pending: int = 50,
+        compact_every: int = 200,
+    ):
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "workout_generation.json"
+        self.learning_log = self.config_dir / "learning_log.jsonl"
         self.logger = logging.getLogger(__name__)
 
+        self.write_behind = write_behind
+        self.debounce_sec = debounce_sec
+        self.max_pending = max_pending
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending = 0  # modifications pas encore écrites
+        self._log_entries = 0  # entrées du journal non compactées
+        self._log_seq = 0
+        self.writes = 0
+
+        # Révision de la configuration et empreinte du fichier sur disque
+        self._version = 0
+        self._file_stamp = None
+
         # Charger ou créer la configuration
         self._config = self._load_config()
+        self._replay_learning_log()
+        self._file_stamp = self._stat_config_file()
+        if write_behind:
+            atexit.register(self.close)
 
     def _load_config(self) -> WorkoutGenerationConfig:
         """Charge la configuration depuis le fichier ou crée une par défaut."""
@@ -37,6 +79,29 @@ class WorkoutConfigService:
             self.logger.error(f"Erreur lors du chargement de la config: {e}")
             return WorkoutGenerationConfig()
 
+    def _replay_learning_log(self) -> None:
+        """Réapplique les feedbacks du journal absents du fichier principal."""
+        self._log_seq = self._config.learning_log_seq
+        self._log_entries = 0
+        try:
+            with open(self.learning_log, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Dernière ligne tronquée par un arrêt brutal
+                self.logger.warning("Entrée illisible ignorée dans le journal")
+                continue
+            self._log_entries += 1
+            if entry["seq"] > self._config.learning_log_seq:
+                self._config.update_learning_from_session(
+                    entry["session"], entry["score"]
+                )
+                self._log_seq = max(self._log_seq, entry["seq"])
+
     def _apply_smart_defaults(self, config: WorkoutGenerationConfig):
         """Applique des defaults intelligents basés sur les meilleures pratiques."""
 
@@ -108,66 +173,153 @@ class WorkoutConfigService:
             }
         )
 
+    def _stat_config_file(self):
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def version(self) -> int:
+        """Révision de la configuration, incrémentée à chaque modification.
+
+        Un fichier modifié hors de ce service (autre processus, édition à la
+        main) est rechargé et compte comme une nouvelle révision.
+        """
+        stamp = self._stat_config_file()
+        with self._lock:
+            if stamp != self._file_stamp:
+                self._file_stamp = stamp
+                if self._pending:
+                    # Nos modifications en attente l'emporteront à l'écriture
+                    self.logger.warning("Fichier de config modifié pendant l'attente")
+                elif stamp is not None:
+                    self._config = self._load_config()
+                    self._replay_learning_log()
+                self._version += 1
+            return self._version
+
     def get_config(self) -> WorkoutGenerationConfig:
         """Retourne la configuration actuelle."""
         return self._config
 
     def save_config(self, config: Optional[WorkoutGenerationConfig] = None):
-        """Sauvegarde la configuration."""
-        if config:
-            self._config = config
+        """Sauvegarde la configuration (écriture immédiate, même en différé)."""
+        with self._lock:
+            if config:
+                self._config = config
+            self._version += 1
+            self._pending += 1
+            self.flush()
+
+    # --- Persistance ---
+    def _changed(self) -> None:
+        """Enregistre une modification en mémoire et planifie son écriture."""
+        self._version += 1
+        self._pending += 1
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        if not self.write_behind or self._pending >= self.max_pending:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.debounce_sec, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Écrit les modifications en attente et compacte le journal.
+
+        Retourne True si le fichier a été écrit.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending and not self._log_entries:
+                return False
+            self._config.learning_log_seq = self._log_seq
+            try:
+                self._config.save_to_file(str(self.config_file))
+            except Exception as e:
+                # Les modifications restent en attente pour la prochaine écriture
+                self.logger.error(f"Erreur lors de la sauvegarde: {e}")
+                return False
+            self._pending = 0
+            self._file_stamp = self._stat_config_file()
+            self.writes += 1
+            if self._log_entries:
+                # Feedbacks intégrés au fichier principal : journal vidé
+                self.learning_log.unlink(missing_ok=True)
+                self._log_entries = 0
+        self.logger.info("Configuration sauvegardée avec succès")
+        return True
 
-        try:
-            self._config.save_to_file(str(self.config_file))
-            self.logger.info("Configuration sauvegardée avec succès")
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la sauvegarde: {e}")
+    def close(self) -> None:
+        """Écrit ce qui reste en attente (appelé à la sortie en mode différé)."""
+        self.flush()
+
+    def _append_learning(self, session_data: Dict[str, Any], score: float) -> None:
+        self._log_seq += 1
+        entry = {"seq": self._log_seq, "session": session_data, "score": score}
+        with open(self.learning_log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log_entries += 1
 
+    # --- Modifications ---
     def update_muscle_balance_rules(self, rules: Dict[str, float]):
         """Met à jour les règles d'équilibrage musculaire."""
-        self._config.muscle_balance_rules.update(rules)
-        self.save_config()
+        with self._lock:
+            self._config.muscle_balance_rules.update(rules)
+            self._changed()
 
     def update_format_rules(self, format_name: str, rules: Dict[str, Any]):
         """Met à jour les règles pour un format spécifique."""
-        self._config.format_rules[format_name] = rules
-        self.save_config()
+        with self._lock:
+            self._config.format_rules[format_name] = rules
+            self._changed()
 
     def add_favorite_exercise(self, context: str, exercise_name: str):
         """Ajoute un exercice aux favoris pour un contexte donné."""
-        if context not in self._config.favorite_exercises:
-            self._config.favorite_exercises[context] = []
-
-        if exercise_name not in self._config.favorite_exercises[context]:
-            self._config.favorite_exercises[context].append(exercise_name)
-            self.save_config()
+        with self._lock:
+            favorites = self._config.favorite_exercises.setdefault(context, [])
+            if exercise_name not in favorites:
+                favorites.append(exercise_name)
+                self._changed()
 
     def remove_favorite_exercise(self, context: str, exercise_name: str):
         """Retire un exercice des favoris."""
-        if context in self._config.favorite_exercises:
-            try:
-                self._config.favorite_exercises[context].remove(exercise_name)
-                self.save_config()
-            except ValueError:
-                pass  # Exercice pas dans la liste
+        with self._lock:
+            favorites = self._config.favorite_exercises.get(context, [])
+            if exercise_name in favorites:
+                favorites.remove(exercise_name)
+                self._changed()
 
     def ban_exercise(self, exercise_name: str, reason: Optional[str] = None):
         """Interdit un exercice."""
-        if exercise_name not in self._config.exercise_restrictions["banned_exercises"]:
-            self._config.exercise_restrictions["banned_exercises"].append(exercise_name)
-            self.save_config()
-            self.logger.info(f"Exercice banni: {exercise_name} - Raison: {reason}")
+        with self._lock:
+            banned = self._config.exercise_restrictions["banned_exercises"]
+            if exercise_name in banned:
+                return
+            banned.append(exercise_name)
+            self._changed()
+        self.logger.info(f"Exercice banni: {exercise_name} - Raison: {reason}")
 
     def unban_exercise(self, exercise_name: str):
         """Retire un exercice de la liste noire."""
-        try:
-            self._config.exercise_restrictions["banned_exercises"].remove(exercise_name)
-            self.save_config()
-        except ValueError:
-            pass
+        with self._lock:
+            banned = self._config.exercise_restrictions["banned_exercises"]
+            if exercise_name in banned:
+                banned.remove(exercise_name)
+                self._changed()
 
     def record_session_feedback(self, feedback: SessionFeedback):
-        """Enregistre le feedback d'une séance pour apprentissage."""
+        """Enregistre le feedback d'une séance pour apprentissage.
+
+        Le feedback est ajouté au journal d'apprentissage, sans réécrire le
+        fichier de configuration.
+        """
         try:
             # Convertir le feedback en format d'apprentissage
             session_data = {
@@ -183,8 +335,12 @@ class WorkoutConfigService:
                 + (feedback.engagement_level / 10) * 0.3
             ) / 10  # Normaliser sur 0-1
 
-            self._config.update_learning_from_session(session_data, composite_score)
-            self.save_config()
+            with self._lock:
+                self._config.update_learning_from_session(session_data, composite_score)
+                self._append_learning(session_data, composite_score)
+                self._version += 1
+                if self._log_entries >= self.compact_every:
+                    self._schedule_write()
 
             self.logger.info(f"Feedback enregistré pour session {feedback.session_id}")
 
@@ -0,0 +1,412 @@
+"""
+Tests du cache asynchrone (L1 mémoire, L2 partagé, gestionnaire)
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.cache import (
+    AsyncMemoryCache,
+    AsyncRedisCache,
+    CacheConfig,
+    CacheManager,
+)
+
+
+def _memory_cache(max_size=3, default_ttl=300):
+    return AsyncMemoryCache(
+        CacheConfig(max_size=max_size, default_ttl=default_ttl, cleanup_interval=0)
+    )
+
+
+def _expire(cache, key):
+    """Recule la date de création d'une entrée au-delà de son TTL"""
+    entry = cache._cache[key]
+    entry.created_at -= entry.ttl + 1
+
+
+class TestAsyncMemoryCache(unittest.IsolatedAsyncioTestCase):
+    """Éviction LRU, expiration TTL et borne de taille"""
+
+    async def test_evicts_least_recently_used(self):
+        """Une lecture protège l'entrée, la moins récente part en premier"""
+        cache = _memory_cache(max_size=3)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key.upper())
+        self.assertEqual(await cache.get("a"), "A")
+
+        await cache.set("d", "D")
+
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(list(cache._cache), ["c", "a", "d"])
+        self.assertEqual(cache._metrics.evictions, 1)
+
+    async def test_overwrite_refreshes_recency_without_eviction(self):
+        """Réécrire une clé existante ne fait rien sortir"""
+        cache = _memory_cache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.set("a", 3)
+
+        self.assertEqual(list(cache._cache), ["b", "a"])
+        self.assertEqual(await cache.get("a"), 3)
+        self.assertEqual(cache._metrics.evictions, 0)
+
+    async def test_size_never_exceeds_max_size(self):
+        """Le nombre d'entrées reste borné par max_size"""
+        cache = _memory_cache(max_size=5)
+        for i in range(50):
+            await cache.set(f"k{i}", {"i": i})
+            self.assertLessEqual(len(cache._cache), 5)
+
+        self.assertEqual(list(cache._cache), [f"k{i}" for i in range(45, 50)])
+        self.assertEqual(cache._metrics.evictions, 45)
+
+    async def test_expired_entry_is_a_miss(self):
+        """Une entrée expirée est retirée à la lecture"""
+        cache = _memory_cache()
+        await cache.set("k", "v", ttl=5)
+        _expire(cache, "k")
+
+        self.assertFalse(await cache.exists("k"))
+        self.assertIsNone(await cache.get("k"))
+        self.assertNotIn("k", cache._cache)
+        self.assertEqual(cache._metrics.misses, 1)
+
+    async def test_zero_ttl_never_expires(self):
+        """Un TTL nul désactive l'expiration"""
+        cache = _memory_cache()
+        await cache.set("k", "v", ttl=0)
+        cache._cache["k"].created_at -= 10**6
+
+        self.assertEqual(await cache.get("k"), "v")
+
+    async def test_cleanup_removes_only_expired_entries(self):
+        """Le nettoyage périodique ne retire que les entrées expirées"""
+        cache = _memory_cache(max_size=10)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+        _expire(cache, "a")
+        _expire(cache, "c")
+
+        self.assertEqual(await cache._cleanup_expired(), 2)
+        self.assertEqual(list(cache._cache), ["b"])
+
+    async def test_mutable_values_are_copied(self):
+        """Les valeurs mutables sont sérialisées, pas partagées"""
+        cache = _memory_cache()
+        value = {"sets": [1, 2]}
+        await cache.set("k", value)
+        value["sets"].append(3)
+
+        self.assertEqual(await cache.get("k"), {"sets": [1, 2]})
+
+
+class TestCacheManagerIndex(unittest.IsolatedAsyncioTestCase):
+    """Index des clés et des tags : élagage et recherche par préfixe"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _l2(self, name="l2.sqlite3"):
+        path = os.path.join(self.tmpdir.name, name)
+        return AsyncRedisCache(CacheConfig(), f"sqlite:///{path}")
+
+    async def test_lru_eviction_prunes_index_without_l2(self):
+        """Une clé évincée du L1 sans L2 sort de l'index"""
+        manager = CacheManager(_memory_cache(max_size=2))
+        await manager.set("ex:1", 1, tags=["t1"])
+        await manager.set("ex:2", 2, tags=["t1"])
+        await manager.set("ex:3", 3, tags=["t2"])
+
+        self.assertEqual(manager.keys_with_prefix("ex:"), ["ex:2", "ex:3"])
+        self.assertEqual(manager.keys_for_tag("t1"), {"ex:2"})
+        self.assertEqual(manager.get_index_info()["indexed_keys"], 2)
+
+    async def test_expiry_prunes_index(self):
+        """Une clé expirée sort de l'index et de ses tags"""
+        memory = _memory_cache(max_size=10)
+        manager = CacheManager(memory)
+        await manager.set("ex:1", 1, tags=["t"])
+        await manager.set("ex:2", 2, tags=["t"])
+        _expire(memory, "ex:1")
+
+        await memory._cleanup_expired()
+
+        self.assertEqual(manager.keys_with_prefix("ex:"), ["ex:2"])
+        self.assertEqual(manager.keys_for_tag("t"), {"ex:2"})
+
+    async def test_lru_eviction_keeps_keys_still_in_l2(self):
+        """Une clé évincée du L1 mais encore en L2 reste invalidable"""
+        l2 = self._l2()
+        manager = CacheManager(_memory_cache(max_size=1), l2)
+        await manager.set("ex:1", 1, tags=["t"])
+        await manager.set("ex:2", 2)
+
+        self.assertEqual(manager.keys_for_tag("t"), {"ex:1"})
+        self.assertEqual(await manager.invalidate_tags("t"), 1)
+        self.assertIsNone(await l2.get("ex:1"))
+        await l2.close()
+
+    async def test_prefix_lookup_matches_index_under_churn(self):
+        """Le préfixe suit les écritures et suppressions entrelacées"""
+        manager = CacheManager(_memory_cache(max_size=10_000))
+        rng = random.Random(7)
+        live = set()
+        for step in range(3000):
+            key = f"{rng.choice('abc')}:{rng.randrange(400)}"
+            if rng.random() < 0.3:
+                await manager.delete(key)
+                live.discard(key)
+            else:
+                await manager.set(key, step)
+                live.add(key)
+            if step % 250 == 0:
+                self.assertEqual(
+                    manager.keys_with_prefix("b:"),
+                    sorted(k for k in live if k.startswith("b:")),
+                )
+
+        self.assertEqual(manager.keys_with_prefix(""), sorted(live))
+        self.assertEqual(
+            await manager.invalidate_prefix("a:"),
+            len([k for k in live if k.startswith("a:")]),
+        )
+        self.assertEqual(manager.keys_with_prefix("a:"), [])
+
+    async def test_index_stays_bounded_without_prefix_lookups(self):
+        """Les clés oubliées ne s'accumulent pas entre deux recherches"""
+        manager = CacheManager(_memory_cache(max_size=100))
+        for i in range(10_000):
+            await manager.set(f"tmp:{i}", i)
+            await manager.delete(f"tmp:{i}")
+        await manager.set("kept", 1)
+
+        self.assertLessEqual(len(manager._unsorted_keys), 1025)
+        self.assertEqual(manager.keys_with_prefix(""), ["kept"])
+
+    async def test_glob_clear_uses_prefix_candidates(self):
+        """Les motifs glob ne suppriment que les clés correspondantes"""
+        manager = CacheManager(_memory_cache(max_size=100))
+        for key in ("ex:1:a", "ex:2:a", "ex:2:b", "other:1:a"):
+            await manager.set(key, key)
+
+        self.assertEqual(await manager.clear_cache("ex:*:a"), 2)
+        self.assertEqual(manager.keys_with_prefix(""), ["ex:2:b", "other:1:a"])
+
+
+class TestSharedL2Invalidation(unittest.IsolatedAsyncioTestCase):
+    """Deux gestionnaires sur le même L2 : tags, préfixes et promotions"""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(self.tmpdir.name, 'shared.sqlite3')}"
+        self.l2_a = AsyncRedisCache(CacheConfig(), url)
+        self.l2_b = AsyncRedisCache(CacheConfig(), url)
+        self.a = CacheManager(_memory_cache(max_size=100), self.l2_a)
+        self.b = CacheManager(_memory_cache(max_size=100), self.l2_b)
+
+    async def asyncTearDown(self):
+        await self.l2_a.close()
+        await self.l2_b.close()
+        self.tmpdir.cleanup()
+
+    async def test_tag_invalidation_reaches_other_manager_entries(self):
+        """Un tag posé par A est invalidé depuis B, en L2"""
+        await self.a.set("ex:1", {"id": 1}, tags=["exercise:1", "lists"])
+        await self.a.set("ex:2", {"id": 2}, tags=["lists"])
+        await self.a.set("ex:3", {"id": 3})
+
+        self.assertEqual(await self.b.invalidate_tags("lists"), 2)
+
+        self.assertIsNone(await self.l2_a.get("ex:1"))
+        self.assertIsNone(await self.l2_a.get("ex:2"))
+        self.assertEqual(await self.b.get("ex:3"), {"id": 3})
+
+    async def test_promoted_keys_are_invalidated_locally(self):
+        """Une valeur promue du L2 vers le L1 est indexée puis invalidée"""
+        await self.a.set("ex:1", "v1", tags=["t"])
+        self.assertEqual(await self.b.get("ex:1"), "v1")
+        self.assertEqual(self.b.keys_with_prefix("ex:"), ["ex:1"])
+
+        await self.b.invalidate_tags("t")
+
+        self.assertIsNone(await self.b.primary_cache.get("ex:1"))
+        self.assertIsNone(await self.b.get("ex:1"))
+
+    async def test_get_many_indexes_promoted_keys(self):
+        """get_many indexe aussi les valeurs promues"""
+        await self.a.set_many({"ex:1": 1, "ex:2": 2}, tags=["t"])
+        self.assertEqual(
+            await self.b.get_many(["ex:1", "ex:2"]), {"ex:1": 1, "ex:2": 2}
+        )
+
+        self.assertEqual(self.b.keys_with_prefix("ex:"), ["ex:1", "ex:2"])
+
+    async def test_prefix_invalidation_runs_on_backend(self):
+        """Un préfixe supprime en L2 les clés écrites par l'autre gestionnaire"""
+        await self.a.set("ex:1", 1)
+        await self.a.set("ex:all:1", 2)
+        await self.a.set("other:1", 3)
+
+        self.assertEqual(await self.b.invalidate_prefix("ex:"), 2)
+
+        self.assertIsNone(await self.l2_a.get("ex:1"))
+        self.assertIsNone(await self.l2_a.get("ex:all:1"))
+        self.assertEqual(await self.b.get("other:1"), 3)
+
+    async def test_glob_invalidation_runs_on_backend(self):
+        """Un motif glob ne supprime en L2 que les clés correspondantes"""
+        for key in ("ex:1:a", "ex:2:a", "ex:2:b"):
+            await self.a.set(key, key)
+
+        self.assertEqual(await self.b.clear_cache("ex:*:a"), 2)
+
+        self.assertEqual(await self.b.get("ex:2:b"), "ex:2:b")
+        self.assertIsNone(await self.l2_a.get("ex:1:a"))
+
+    async def test_tag_added_after_write_is_shared(self):
+        """Un tag ajouté après l'écriture est lui aussi stocké en L2"""
+        await self.a.set("search:squat", [1, 2], tags=["search"])
+        await self.a.tag("search:squat", "exercise:1")
+
+        self.assertEqual(await self.b.invalidate_tags("exercise:1"), 1)
+        self.assertIsNone(await self.l2_a.get("search:squat"))
+
+
+class _GatedLoader:
+    """Chargeur bloqué jusqu'à ouverture de la porte, qui compte ses appels"""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        value = self.values[min(self.calls, len(self.values)) - 1]
+        await self.gate.wait()
+        return value
+
+
+class TestGetOrLoad(unittest.IsolatedAsyncioTestCase):
+    """Chargement unique, revalidation, invalidation et annulation"""
+
+    async def asyncSetUp(self):
+        self.manager = CacheManager(_memory_cache(max_size=100))
+
+    async def _settle(self):
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_concurrent_misses_share_one_load(self):
+        """Les demandes simultanées d'une clé déclenchent un seul chargement"""
+        loader = _GatedLoader("v")
+        callers = [
+            asyncio.create_task(self.manager.get_or_load("k", loader))
+            for _ in range(10)
+        ]
+        await self._settle()
+        loader.gate.set()
+
+        self.assertEqual(await asyncio.gather(*callers), ["v"] * 10)
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(self.manager.get_index_info()["loads_coalesced"], 9)
+        self.assertEqual(await self.manager.get("k"), "v")
+
+    async def test_stale_value_served_while_refreshing(self):
+        """Une valeur périmée est servie pendant un seul rechargement"""
+        loader = _GatedLoader("v1", "v2")
+        loader.gate.set()
+        self.assertEqual(
+            await self.manager.get_or_load("k", loader, ttl=10, stale_ttl=60), "v1"
+        )
+        loader.gate.clear()
+        self.manager._fresh_until["k"] = 0  # fenêtre fraîche écoulée
+
+        self.assertEqual(await self.manager.get_or_load("k", loader), "v1")
+        self.assertEqual(await self.manager.get_or_load("k", loader), "v1")
+        await self._settle()
+        self.assertEqual(loader.calls, 2)
+
+        loader.gate.set()
+        await asyncio.gather(*self.manager._refresh_tasks)
+        self.assertEqual(await self.manager.get("k"), "v2")
+
+    async def test_delete_during_load_skips_the_write(self):
+        """Une suppression pendant le chargement empêche d'écrire la valeur périmée"""
+        slow = _GatedLoader("stale")
+        first = asyncio.create_task(self.manager.get_or_load("k", slow))
+        await self._settle()
+
+        await self.manager.delete("k")
+        fast = _GatedLoader("fresh")
+        fast.gate.set()
+        self.assertEqual(await self.manager.get_or_load("k", fast), "fresh")
+        slow.gate.set()
+
+        self.assertEqual(await first, "stale")
+        self.assertEqual(await self.manager.get("k"), "fresh")
+
+    async def test_tag_invalidation_during_load_skips_the_write(self):
+        """Une invalidation par tag pendant le chargement est respectée"""
+        loader = _GatedLoader("stale")
+        load = asyncio.create_task(self.manager.get_or_load("k", loader, tags=["t"]))
+        await self._settle()
+        await self.manager.tag("k", "t")
+
+        await self.manager.invalidate_tags("t")
+        loader.gate.set()
+
+        self.assertEqual(await load, "stale")
+        self.assertIsNone(await self.manager.get("k"))
+        self.assertEqual(self.manager.keys_for_tag("t"), set())
+
+    async def test_cancelling_first_caller_keeps_the_load(self):
+        """Annuler le premier appelant n'annule pas les autres"""
+        loader = _GatedLoader("v")
+        first = asyncio.create_task(self.manager.get_or_load("k", loader))
+        await self._settle()
+        others = [
+            asyncio.create_task(self.manager.get_or_load("k", loader)) for _ in range(3)
+        ]
+        await self._settle()
+
+        first.cancel()
+        await self._settle()
+        loader.gate.set()
+
+        self.assertEqual(await asyncio.gather(*others), ["v"] * 3)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(await self.manager.get("k"), "v")
+
+    async def test_loader_error_reaches_every_caller(self):
+        """Une erreur du chargeur est remontée à tous les appelants"""
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        callers = [
+            asyncio.create_task(self.manager.get_or_load("k", failing))
+            for _ in range(3)
+        ]
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertFalse(self.manager._flight.in_flight("k"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests de la génération de séances en lot
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.seed import create_schema, seed_data
+from repositories.exercise_catalog import ExerciseCatalog
+from services.batch_session_generator import generate_sessions_batch
+
+_PARAMS = {
+    "course_type": "Cross-Training",
+    "duration": 45,
+    "equipment": ["Kettlebell", "Barre"],
+    "intensity": "Moyenne",
+    "variabilite": 50,
+    "volume": 50,
+}
+
+
+def _exercise_ids(session):
+    return [item.exercise_id for block in session.blocks for item in block.items]
+
+
+class TestBatchSessionGenerator(unittest.TestCase):
+    """Lot ordonné, graines reproductibles, échecs isolés"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "batch.db")
+        create_schema()
+        seed_data()
+        self.catalog = ExerciseCatalog()
+        self.config_dir = os.path.join(self.tmpdir.name, "cfg")
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def _batch(self, param_sets, **kwargs):
+        return generate_sessions_batch(
+            param_sets, config_dir=self.config_dir, catalog=self.catalog, **kwargs
+        )
+
+    def test_serial_batch_is_reproducible(self):
+        """Même graine de base : mêmes exercices, sans requête SQL"""
+        param_sets = [dict(_PARAMS, duration=d) for d in (30, 45, 60)]
+        first = self._batch(param_sets, max_workers=1, base_seed=7)
+        stats = db_manager.pool.query_stats
+        stats.reset()
+        second = self._batch(param_sets, max_workers=1, base_seed=7)
+
+        self.assertEqual(stats.snapshot(), [])
+        self.assertEqual([r.seed for r in first], [7, 8, 9])
+        self.assertTrue(all(r.ok and r.generator == "smart" for r in first))
+        self.assertEqual(
+            [_exercise_ids(r.session) for r in first],
+            [_exercise_ids(r.session) for r in second],
+        )
+        self.assertEqual([r.session.duration_sec for r in first], [1800, 2700, 3600])
+
+    def test_failure_is_isolated(self):
+        """Un jeu de paramètres invalide n'interrompt pas le lot"""
+        param_sets = [_PARAMS, {"course_type": "Cross-Training"}, _PARAMS]
+        results = self._batch(param_sets, max_workers=1, fallback=False)
+
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertTrue(results[1].error)
+
+    def test_process_pool_matches_serial(self):
+        """Les workers reçoivent le catalogue et rendent les résultats en ordre"""
+        param_sets = [dict(_PARAMS, seed=s) for s in (1, 2, 3, 4)]
+        serial = self._batch(param_sets, max_workers=1, generator="basic")
+        parallel = self._batch(param_sets, max_workers=2, generator="basic")
+
+        self.assertEqual([r.index for r in parallel], [0, 1, 2, 3])
+        self.assertEqual([r.seed for r in parallel], [1, 2, 3, 4])
+        self.assertEqual(
+            [_exercise_ids(r.session) for r in serial],
+            [_exercise_ids(r.session) for r in parallel],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests du pool de connexions SQLite synchrone
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import DatabaseManager, PoolConfig, PoolExhaustedError
+from db.query_stats import QueryStats, fingerprint_query
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Tests pour DatabaseManager avec pool borné"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "pool.db")
+        self.manager = DatabaseManager(
+            self.db_path, PoolConfig(max_connections=2, checkout_timeout=0.2)
+        )
+        with self.manager.get_connection() as conn:
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmpdir.cleanup()
+
+    def test_connection_is_reused(self):
+        """Une connexion rendue est réutilisée au lieu d'en ouvrir une nouvelle"""
+        for _ in range(10):
+            with self.manager.get_connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+
+        metrics = self.manager.get_pool_metrics()
+        self.assertEqual(metrics["connections_created"], 1)
+        self.assertEqual(metrics["checkouts"], 11)
+        self.assertEqual(metrics["in_use_connections"], 0)
+
+    def test_pragmas_applied(self):
+        """Les PRAGMAs de performance sont appliqués à l'ouverture"""
+        with self.manager.get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+        self.assertEqual(temp_store, 2)
+
+    def test_with_block_commits_and_rollback_on_error(self):
+        """Le bloc with valide ou annule la transaction"""
+        with self.manager.get_connection() as conn:
+            conn.execute("INSERT INTO t (v) VALUES ('ok')")
+
+        with self.assertRaises(ValueError):
+            with self.manager.get_connection() as conn:
+                conn.execute("INSERT INTO t (v) VALUES ('ko')")
+                raise ValueError("boom")
+
+        with self.manager.get_connection() as conn:
+            rows = conn.execute("SELECT v FROM t").fetchall()
+        self.assertEqual([r["v"] for r in rows], ["ok"])
+
+    def test_pool_is_bounded(self):
+        """Au-delà de max_connections, l'emprunt expire"""
+        a = self.manager.get_connection()
+        b = self.manager.get_connection()
+        with self.assertRaises(PoolExhaustedError):
+            self.manager.get_connection()
+        a.close()
+        c = self.manager.get_connection()
+        b.close()
+        c.close()
+        self.assertEqual(self.manager.get_pool_metrics()["timeouts"], 1)
+
+    def test_closed_proxy_rejects_use(self):
+        """Une connexion rendue au pool n'est plus utilisable"""
+        conn = self.manager.get_connection()
+        conn.close()
+        conn.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_threads_share_pool(self):
+        """Plusieurs threads se partagent le pool sans erreur"""
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    with self.manager.get_connection(timeout=5) as conn:
+                        conn.execute("INSERT INTO t (v) VALUES (?)", (f"{n}-{i}",))
+            except Exception as e:  # pragma: no cover - reporté plus bas
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+
+        self.assertEqual(errors, [])
+        with self.manager.get_connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+        self.assertEqual(count, 80)
+        self.assertLessEqual(self.manager.get_pool_metrics()["open_connections"], 2)
+
+    def test_changing_db_path_drops_old_connections(self):
+        """Changer db_path ferme les connexions vers l'ancien fichier"""
+        other = os.path.join(self.tmpdir.name, "other.db")
+        self.manager.db_path = other
+        with self.manager.get_connection() as conn:
+            tables = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ).fetchall()
+        self.assertEqual(tables, [])
+
+
+class TestQueryStats(unittest.TestCase):
+    """Tests des empreintes de requêtes et des latences par empreinte"""
+
+    def test_fingerprint_collapses_literals(self):
+        """Littéraux, listes IN et espaces sont normalisés"""
+        a = fingerprint_query("SELECT * FROM t WHERE id IN (?, ?, ?)  AND v = 'x'")
+        b = fingerprint_query("select *\nfrom t where id in (?) and v = 12")
+        self.assertEqual(a, b)
+        self.assertEqual(a, "select * from t where id in (?+) and v = ?")
+
+    def test_percentiles_and_bound(self):
+        """Les percentiles sont calculés et le nombre d'empreintes est borné"""
+        stats = QueryStats(max_fingerprints=2, sample_size=100)
+        for i in range(1, 101):
+            stats.record("SELECT 1 FROM a", float(i), rows=1)
+        entry = stats.get("SELECT 1 FROM a")
+        self.assertEqual(entry["count"], 100)
+        self.assertEqual(entry["rows"], 100)
+        self.assertAlmostEqual(entry["p50_ms"], 50, delta=1)
+        self.assertAlmostEqual(entry["p99_ms"], 99, delta=1)
+
+        stats.record("SELECT 1 FROM b", 1.0)
+        stats.record("SELECT 1 FROM c", 1.0)
+        self.assertIsNone(stats.get("SELECT 1 FROM a"))
+        self.assertEqual(stats.evicted, 1)
+        self.assertIn('"queries"', stats.to_json())
+
+    def test_connection_records_rows(self):
+        """Les requêtes passant par le pool sont mesurées avec leur nombre de lignes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = DatabaseManager(os.path.join(tmpdir, "stats.db"))
+            with manager.get_connection() as conn:
+                conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                conn.executemany("INSERT INTO t (id) VALUES (?)", [(1,), (2,), (3,)])
+                conn.execute("SELECT id FROM t WHERE id > ?", (0,)).fetchall()
+                conn.execute("SELECT id FROM t WHERE id > ?", (1,)).fetchone()
+            manager.close()
+
+            select = manager.pool.query_stats.get("SELECT id FROM t WHERE id > ?")
+            insert = manager.pool.query_stats.get("INSERT INTO t (id) VALUES (?)")
+        self.assertEqual(select["count"], 2)
+        self.assertEqual(select["rows"], 4)
+        self.assertEqual(insert["rows"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
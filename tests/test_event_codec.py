@@ -0,0 +1,199 @@
+"""
+Tests du codec binaire des événements
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import event_codec
+from core.event_codec import EventCodec
+from core.exceptions import EventSerializationError
+
+
+def _sample(n):
+    return {
+        "event_type": "SetLogged",
+        "client_id": n,
+        "exercise_name": "Squat barre",
+        "reps": 5,
+        "weight_kg": 100.0 + n,
+        "notes": "tempo contrôlé, dernière série difficile",
+    }
+
+
+class TestHeader(unittest.TestCase):
+    """Octet d'en-tête : encodage, compression, dictionnaire"""
+
+    def test_small_payload_stays_uncompressed(self):
+        """Sous min_compress_size : JSON brut, en-tête à zéro"""
+        codec = EventCodec(compression="zlib", encoding="json")
+        payload = codec.encode({"n": 1})
+
+        self.assertEqual(payload[0], 0x00)
+        self.assertEqual(payload[1:], b'{"n":1}')
+
+    def test_compressed_payload_flags(self):
+        """Corps compressé par DEFLATE : bit zlib posé, pas de dictionnaire"""
+        codec = EventCodec(compression="zlib", encoding="json")
+        payload = codec.encode({"notes": "série " * 50})
+
+        self.assertEqual(payload[0] & event_codec._COMPRESSION_MASK, 0x04)
+        self.assertFalse(payload[0] & event_codec._WITH_DICTIONARY)
+        self.assertEqual(codec.decode(payload), {"notes": "série " * 50})
+
+    def test_compression_none(self):
+        """Compression désactivée : corps toujours stocké tel quel"""
+        codec = EventCodec(compression="none", encoding="json")
+        payload = codec.encode({"notes": "série " * 50})
+
+        self.assertEqual(payload[0], 0x00)
+        self.assertEqual(codec.decode(payload), {"notes": "série " * 50})
+        self.assertLess(codec.compression_ratio, 1.0)  # octet d'en-tête
+
+    def test_dictionary_id_follows_header(self):
+        """Avec dictionnaire : bit posé et identifiant sur deux octets"""
+        codec = EventCodec(compression="zlib", encoding="json")
+        dictionary = codec.train_dictionary(_sample(n) for n in range(50))
+        codec.add_dictionary(258, dictionary, "zlib")
+
+        payload = codec.encode(_sample(7))
+
+        self.assertTrue(payload[0] & event_codec._WITH_DICTIONARY)
+        self.assertEqual(int.from_bytes(payload[1:3], "big"), 258)
+
+    def test_invalid_settings_rejected(self):
+        """Options inconnues refusées à la construction"""
+        for options in (
+            {"compression": "lz4"},
+            {"encoding": "xml"},
+            {"checksum": "md5"},
+        ):
+            with self.subTest(**options):
+                with self.assertRaises(ValueError):
+                    EventCodec(**options)
+
+
+class TestDictionaries(unittest.TestCase):
+    """Dictionnaires entraînés : gain sur petits événements et relecture"""
+
+    def setUp(self):
+        self.codec = EventCodec(compression="zlib", encoding="json")
+        self.dictionary = self.codec.train_dictionary(_sample(n) for n in range(50))
+
+    def test_round_trip_and_gain(self):
+        """Même contenu relu, payload plus court qu'avec DEFLATE seul"""
+        plain = self.codec.encode(_sample(99))
+        self.codec.add_dictionary(1, self.dictionary, "zlib")
+        primed = self.codec.encode(_sample(99))
+
+        self.assertEqual(self.codec.decode(primed), _sample(99))
+        self.assertLess(len(primed), len(plain))
+        self.assertEqual(self.codec.dictionary_id, 1)
+        self.assertFalse(self.codec.needs_dictionary)
+
+    def test_decode_without_dictionary_fails(self):
+        """Dictionnaire absent à la lecture : EventSerializationError"""
+        self.codec.add_dictionary(1, self.dictionary, "zlib")
+        payload = self.codec.encode(_sample(3))
+
+        reader = EventCodec(compression="zlib", encoding="json")
+        with self.assertRaises(EventSerializationError):
+            reader.decode(payload)
+        reader.add_dictionary(1, self.dictionary, "zlib", activate=False)
+        self.assertEqual(reader.decode(payload), _sample(3))
+        self.assertIsNone(reader.dictionary_id)
+
+    def test_older_dictionary_stays_readable(self):
+        """Un nouveau dictionnaire actif n'empêche pas de relire les anciens"""
+        self.codec.add_dictionary(1, self.dictionary, "zlib")
+        old = self.codec.encode(_sample(1))
+        newer = self.codec.train_dictionary(
+            {"event_type": "Other", "value": n} for n in range(20)
+        )
+        self.codec.add_dictionary(2, newer, "zlib")
+        new = self.codec.encode(_sample(2))
+
+        self.assertEqual(int.from_bytes(new[1:3], "big"), 2)
+        self.assertEqual(self.codec.decode(old), _sample(1))
+        self.assertEqual(self.codec.decode(new), _sample(2))
+
+    def test_dictionary_for_other_compression_not_activated(self):
+        """Un dictionnaire zstd ne sert pas à l'encodage DEFLATE"""
+        self.codec.add_dictionary(5, b"zstd dictionary", "zstd")
+
+        self.assertIsNone(self.codec.dictionary_id)
+        self.assertTrue(self.codec.needs_dictionary)
+
+
+class TestPayloads(unittest.TestCase):
+    """Valeurs non JSON, payloads corrompus, encodages optionnels"""
+
+    def test_non_json_values_become_strings(self):
+        """Les dates sont relues comme chaînes"""
+        codec = EventCodec(compression="zlib", encoding="json")
+        when = datetime(2026, 10, 1, 10, 0)
+
+        self.assertEqual(codec.decode(codec.encode({"at": when})), {"at": str(when)})
+
+    def test_corrupted_payload_raises(self):
+        """Corps illisible : EventSerializationError, pas d'erreur brute"""
+        codec = EventCodec(compression="zlib", encoding="json")
+        payload = codec.encode({"notes": "série " * 50})
+
+        for broken in (payload[: len(payload) // 2], b"", b"\x00{not json"):
+            with self.subTest(broken=broken[:8]):
+                with self.assertRaises(EventSerializationError):
+                    codec.decode(broken)
+
+    @unittest.skipUnless(event_codec.MSGPACK_AVAILABLE, "msgpack non installé")
+    def test_msgpack_round_trip(self):
+        """MessagePack : bit d'encodage posé, relu par un codec JSON"""
+        payload = EventCodec(encoding="msgpack").encode(_sample(1))
+
+        self.assertEqual(payload[0] & event_codec._ENCODING_MASK, 0x01)
+        self.assertEqual(EventCodec(encoding="json").decode(payload), _sample(1))
+
+    @unittest.skipUnless(event_codec.ZSTD_AVAILABLE, "zstandard non installé")
+    def test_zstd_dictionary_round_trip(self):
+        """zstd avec dictionnaire, relu par un codec DEFLATE qui le connaît"""
+        codec = EventCodec(compression="zstd")
+        dictionary = codec.train_dictionary(_sample(n) for n in range(200))
+        codec.add_dictionary(1, dictionary, "zstd")
+        payload = codec.encode(_sample(3))
+
+        reader = EventCodec(compression="zlib")
+        reader.add_dictionary(1, dictionary, "zstd")
+        self.assertEqual(payload[0] & event_codec._COMPRESSION_MASK, 0x08)
+        self.assertEqual(reader.decode(payload), _sample(3))
+
+
+class TestChecksums(unittest.TestCase):
+    """Sommes de contrôle préfixées et vérification tous algorithmes"""
+
+    def test_algorithm_prefixes(self):
+        """crc32 et blake2b préfixés, SHA-256 historique sans préfixe"""
+        payload = b"payload"
+        crc = EventCodec(checksum="crc32").checksum(payload)
+        blake = EventCodec(checksum="blake2b").checksum(payload)
+        sha = EventCodec(checksum="sha256").checksum(payload)
+
+        self.assertRegex(crc, r"^crc32:[0-9a-f]{8}$")
+        self.assertRegex(blake, r"^blake2b:[0-9a-f]{32}$")
+        self.assertRegex(sha, r"^[0-9a-f]{64}$")
+
+    def test_verify_any_algorithm(self):
+        """verify lit l'algorithme dans la somme et détecte l'altération"""
+        payload = EventCodec(compression="zlib", encoding="json").encode(_sample(1))
+        for algorithm in ("crc32", "blake2b", "sha256"):
+            with self.subTest(algorithm=algorithm):
+                checksum = EventCodec(checksum=algorithm).checksum(payload)
+                self.assertTrue(EventCodec.verify(payload, checksum))
+                self.assertFalse(EventCodec.verify(payload + b"\x00", checksum))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+"""
+Tests du processeur d'événements (checkpoints, lettres mortes)
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from dataclasses import dataclass
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# infrastructure.database repose sur aiosqlite
+HAS_AIOSQLITE = importlib.util.find_spec("aiosqlite") is not None
+
+if HAS_AIOSQLITE:
+    from core.event_handlers import (
+        BaseEventHandler,
+        EventHandlerRegistry,
+        EventProcessor,
+        HandlerConfig,
+    )
+    from core.event_store import AsyncEventStore, EventMetadata
+    from core.events import Event
+    from infrastructure.database import AsyncDatabaseManager, DatabaseConfig
+
+    @dataclass
+    class RepCounted(Event):
+        client_id: int = 0
+
+    @dataclass
+    class TempoChanged(Event):
+        tempo: str = ""
+
+    class _RecordingHandler(BaseEventHandler):
+        """Handler qui note les clients reçus, dans l'ordre"""
+
+        def __init__(self, name="recorder", fail_on=(), **config):
+            super().__init__(name, HandlerConfig(preserve_order=True, **config))
+            self.fail_on = set(fail_on)
+            self.seen = []
+
+        async def handle(self, event):
+            if event.client_id in self.fail_on:
+                raise ValueError(f"client {event.client_id} refusé")
+            self.seen.append(event.client_id)
+
+        def can_handle(self, event_type):
+            return event_type is RepCounted
+
+    class _RemovedEventsHandler(_RecordingHandler):
+        """Handler qui reconnaît ses événements au nom de leur type"""
+
+        def can_handle(self, event_type):
+            return event_type.__name__.startswith("Removed")
+
+
+@unittest.skipUnless(HAS_AIOSQLITE, "aiosqlite non installé")
+class TestEventProcessor(unittest.IsolatedAsyncioTestCase):
+    """Reprise au checkpoint et événements illisibles"""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(
+            DatabaseConfig(
+                database_path=os.path.join(self.tmpdir.name, "events.db"), pool_size=2
+            )
+        )
+        self.store = AsyncEventStore(
+            db_manager=self.db, cache_manager=object(), enable_snapshots=False
+        )
+        await self.store._create_event_store_schema()
+        self.processors = []
+
+    async def asyncTearDown(self):
+        for processor in self.processors:
+            await processor.stop()
+        await self.db.close_all()
+        self.tmpdir.cleanup()
+
+    async def _start(self, handler):
+        registry = EventHandlerRegistry()
+        registry.register_handler(handler)
+        processor = EventProcessor(self.store, registry, page_size=2, retry_delay=0.02)
+        self.processors.append(processor)
+        await processor.start()
+        return processor
+
+    async def _wait_for_checkpoint(self, consumer, sequence):
+        for _ in range(200):
+            if await self.store.load_checkpoint(consumer) >= sequence:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"checkpoint {consumer} bloqué avant {sequence}")
+
+    async def _dead_letters(self):
+        async with self.db.get_connection() as conn:
+            rows = await conn.fetchall("SELECT * FROM event_dead_letters")
+        return {row["event_id"]: row for row in rows}
+
+    async def test_restart_resumes_after_checkpoint(self):
+        """Un processeur relancé ne reçoit que les événements après son checkpoint"""
+        first = _RecordingHandler()
+        processor = await self._start(first)
+        for client_id in range(5):
+            await self.store.store_event(RepCounted(client_id=client_id))
+        await self._wait_for_checkpoint("recorder", 5)
+        await processor.stop()
+        self.processors.remove(processor)
+
+        for client_id in range(5, 8):
+            await self.store.store_event(RepCounted(client_id=client_id))
+        second = _RecordingHandler()
+        await self._start(second)
+        await self._wait_for_checkpoint("recorder", 8)
+
+        self.assertEqual(first.seen, [0, 1, 2, 3, 4])
+        self.assertEqual(second.seen, [5, 6, 7])
+
+    async def test_undecodable_events_are_dead_lettered(self):
+        """Données invalides ou payload corrompu : lettre morte, puis la suite"""
+        handler = _RecordingHandler()
+        await self.store.store_event(RepCounted(client_id=1))
+        invalid = await self.store.store_event(
+            TempoChanged(tempo="3-1-1"),
+            metadata=EventMetadata(event_type="RepCounted"),
+        )
+        corrupted = await self.store.store_event(RepCounted(client_id=2))
+        await self.store.store_event(RepCounted(client_id=3))
+        async with self.db.get_connection() as conn:
+            await conn.execute(
+                "UPDATE event_store SET payload = ? WHERE event_id = ?",
+                (b"\x04garbage", corrupted),
+            )
+            await conn.commit()
+
+        await self._start(handler)
+        await self._wait_for_checkpoint("recorder", 4)
+
+        self.assertEqual(handler.seen, [1, 3])
+        dead_letters = await self._dead_letters()
+        self.assertEqual(set(dead_letters), {invalid, corrupted})
+        original = json.loads(dead_letters[corrupted]["original_event"])
+        self.assertEqual(base64.b64decode(original["payload"]), b"\x04garbage")
+        self.assertIn("decode", original["decode_error"])
+
+    async def test_only_interested_consumers_dead_letter(self):
+        """Un événement illisible n'est traité que par les handlers concernés"""
+        await self.store.store_event(
+            TempoChanged(tempo="3-1-1"),
+            metadata=EventMetadata(event_type="RepCounted"),
+        )
+        unknown = await self.store.store_event(
+            RepCounted(client_id=2), metadata=EventMetadata(event_type="RemovedEvent")
+        )
+
+        await self._start(_RecordingHandler("a"))
+        await self._start(_RecordingHandler("b"))
+        await self._start(_RemovedEventsHandler("removed"))
+        for consumer in ("a", "b", "removed"):
+            await self._wait_for_checkpoint(consumer, 2)
+
+        dead_letters = await self._dead_letters()
+        counts = {
+            row["event_id"]: row["failure_count"] for row in dead_letters.values()
+        }
+        self.assertEqual(sorted(counts.values()), [1, 2])
+        self.assertEqual(counts[unknown], 1)
+        self.assertIn(
+            "removed: Unknown event type", dead_letters[unknown]["failure_reason"]
+        )
+
+    async def test_checkpoint_held_when_dead_letter_fails(self):
+        """Sans lettre morte écrite, le checkpoint ne dépasse pas l'événement"""
+        handler = _RecordingHandler()
+        await self.store.store_event(
+            TempoChanged(), metadata=EventMetadata(event_type="RepCounted")
+        )
+
+        async def broken_dead_letter(stored_event, failure_reason):
+            raise RuntimeError("disque plein")
+
+        self.store.dead_letter = broken_dead_letter
+        await self._start(handler)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.store.load_checkpoint("recorder"), 0)
+
+    async def test_handler_failure_is_dead_lettered(self):
+        """Échec définitif du handler : lettre morte, les suivants passent"""
+        handler = _RecordingHandler(fail_on={1}, max_retries=0)
+        failed = await self.store.store_event(RepCounted(client_id=1))
+        await self.store.store_event(RepCounted(client_id=2))
+
+        await self._start(handler)
+        await self._wait_for_checkpoint("recorder", 2)
+
+        self.assertEqual(handler.seen, [2])
+        dead_letters = await self._dead_letters()
+        self.assertEqual(set(dead_letters), {failed})
+        self.assertIn("client 1 refusé", dead_letters[failed]["failure_reason"])
+
+    async def test_open_circuit_defers_events(self):
+        """Circuit ouvert : checkpoint bloqué, événements relus à la reprise"""
+        handler = _RecordingHandler(
+            fail_on={1}, max_retries=0, failure_threshold=1, recovery_timeout_seconds=60
+        )
+        for client_id in (1, 2, 3):
+            await self.store.store_event(RepCounted(client_id=client_id))
+
+        await self._start(handler)
+        await self._wait_for_checkpoint("recorder", 1)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.store.load_checkpoint("recorder"), 1)
+        self.assertEqual(handler.seen, [])
+        self.assertEqual(len(await self._dead_letters()), 1)
+
+        handler.circuit_breaker.last_failure_time -= timedelta(seconds=60)
+        await self._wait_for_checkpoint("recorder", 3)
+
+        self.assertEqual(handler.seen, [2, 3])
+        self.assertEqual(len(await self._dead_letters()), 1)
+
+    async def test_backpressure_defers_events(self):
+        """Handler saturé : rien n'est perdu, livraison une fois libéré"""
+        handler = _RecordingHandler(max_queue_size=0)
+        for client_id in (1, 2):
+            await self.store.store_event(RepCounted(client_id=client_id))
+
+        await self._start(handler)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.store.load_checkpoint("recorder"), 0)
+        handler.config.max_queue_size = 1000
+        await self._wait_for_checkpoint("recorder", 2)
+
+        self.assertEqual(handler.seen, [1, 2])
+        self.assertEqual(await self._dead_letters(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
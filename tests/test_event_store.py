@@ -0,0 +1,400 @@
+"""
+Tests du journal d'événements (group commit, séquences, snapshots)
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# infrastructure.database repose sur aiosqlite
+HAS_AIOSQLITE = importlib.util.find_spec("aiosqlite") is not None
+
+if HAS_AIOSQLITE:
+    from core.event_store import AsyncEventStore, EventMetadata
+    from core.events import Event
+    from core.exceptions import EventStoreError
+    from domain.entities import (
+        Client,
+        ExerciseSet,
+        FitnessGoals,
+        PersonalInfo,
+        PhysicalProfile,
+        SessionExercise,
+        WorkoutSession,
+    )
+    from domain.snapshots import register_domain_snapshotters
+    from infrastructure.database import AsyncDatabaseManager, DatabaseConfig
+
+    @dataclass
+    class SetLogged(Event):
+        client_id: int = 0
+        n: int = 0
+
+
+class _EventStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base : un journal sur une base SQLite temporaire"""
+
+    store_options = {}
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(
+            DatabaseConfig(
+                database_path=os.path.join(self.tmpdir.name, "events.db"), pool_size=2
+            )
+        )
+        options = {"enable_snapshots": False, **self.store_options}
+        self.store = AsyncEventStore(
+            db_manager=self.db, cache_manager=object(), **options
+        )
+        await self.store._create_event_store_schema()
+
+    async def asyncTearDown(self):
+        await self.db.close_all()
+        self.tmpdir.cleanup()
+
+    async def _count_rows(self, table="event_store"):
+        async with self.db.get_connection() as conn:
+            row = await conn.fetchone(f"SELECT COUNT(*) FROM {table}")
+        return row[0]
+
+
+@unittest.skipUnless(HAS_AIOSQLITE, "aiosqlite non installé")
+class TestGroupCommit(_EventStoreTestCase):
+    """Événements groupés : un INSERT, un commit, résultat partagé"""
+
+    store_options = {"batch_size": 3, "batch_timeout": 10}
+
+    async def test_full_group_commits_once(self):
+        """Le groupe plein part en un seul commit, séquences contiguës"""
+        ids = await asyncio.gather(
+            *(
+                self.store.store_event(SetLogged(client_id=i), batch=True)
+                for i in range(3)
+            )
+        )
+
+        metrics = self.store.get_metrics()
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(metrics.batches_committed, 1)
+        self.assertEqual(metrics.last_batch_size, 3)
+        events = await self.store.get_events(limit=10)
+        self.assertEqual(sorted(e.sequence for e in events), [1, 2, 3])
+
+    async def test_explicit_flush_before_timeout(self):
+        """flush() écrit un groupe incomplet sans attendre le délai"""
+        waiter = asyncio.create_task(self.store.store_event(SetLogged(), batch=True))
+        await asyncio.sleep(0)
+
+        self.assertEqual(await self.store.flush(), 1)
+        self.assertIsNotNone(await waiter)
+        self.assertEqual(await self.store.flush(), 0)
+
+    async def test_flush_waits_for_group_in_flight(self):
+        """flush() attend aussi le groupe déjà parti sur un déclenchement"""
+        waiters = [
+            asyncio.create_task(
+                self.store.store_event(SetLogged(client_id=i), batch=True)
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        self.assertIsNone(self.store._pending_commit)
+        self.assertTrue(self.store._flush_tasks)
+
+        self.assertEqual(await self.store.flush(), 0)
+
+        self.assertFalse(self.store._flush_tasks)
+        self.assertEqual(await self._count_rows(), 3)
+        self.assertEqual(len(await asyncio.gather(*waiters)), 3)
+
+    async def test_cancelled_caller_does_not_abort_group(self):
+        """Annuler l'appelant qui remplit le groupe n'abandonne pas les autres"""
+        waiters = [
+            asyncio.create_task(
+                self.store.store_event(SetLogged(client_id=i), batch=True)
+            )
+            for i in range(2)
+        ]
+        await asyncio.sleep(0)
+        trigger = asyncio.create_task(
+            self.store.store_event(SetLogged(client_id=2), batch=True)
+        )
+        await asyncio.sleep(0)
+        trigger.cancel()
+
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+
+        self.assertEqual(len(results), 2)
+        with self.assertRaises(asyncio.CancelledError):
+            await trigger
+        self.assertEqual(await self._count_rows(), 3)
+
+    async def test_failed_group_reaches_every_waiter(self):
+        """Échec du commit : chaque appelant reçoit l'erreur, rien n'est écrit"""
+        event_id = await self.store.store_event(SetLogged())
+        self.store._batch_size = 2
+
+        results = await asyncio.gather(
+            self.store.store_event(SetLogged(client_id=1), batch=True),
+            self.store.store_event(
+                SetLogged(client_id=2),
+                metadata=EventMetadata(event_id=event_id, event_type="SetLogged"),
+                batch=True,
+            ),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, EventStoreError) for r in results))
+        self.assertEqual(await self._count_rows(), 1)
+        await asyncio.gather(*self.store._flush_tasks)
+        self.assertEqual(await self._count_rows("event_dead_letters"), 2)
+
+
+@unittest.skipUnless(HAS_AIOSQLITE, "aiosqlite non installé")
+class TestSequencePaging(_EventStoreTestCase):
+    """Séquence globale, versions par agrégat et pagination par clé"""
+
+    store_options = {"enable_compression": False}
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        # Écritures unitaires et groupées mêlées, quatre agrégats
+        for n in range(20):
+            client_id = n % 4
+            await self.store.store_event(
+                SetLogged(client_id=client_id, n=n),
+                metadata=EventMetadata(
+                    event_type="SetLogged",
+                    aggregate_id=f"c{client_id}",
+                    aggregate_type="Client",
+                ),
+                batch=n % 2 == 0,
+            )
+
+    async def test_sequences_and_versions_are_contiguous(self):
+        """Séquences 1..N dans l'ordre d'écriture, versions 1..k par agrégat"""
+        events = await self.store.get_events(limit=100)
+
+        self.assertEqual([e.sequence for e in events], list(range(1, 21)))
+        self.assertEqual([e.event_data["n"] for e in events], list(range(20)))
+        versions = [
+            e.aggregate_version
+            for e in await self.store.get_events(aggregate_id="c1", limit=100)
+        ]
+        self.assertEqual(versions, [1, 2, 3, 4, 5])
+
+    async def test_keyset_pages_cover_everything_once(self):
+        """Pages after_sequence : ni trou ni doublon"""
+        sequences, last = [], 0
+        while True:
+            page = await self.store.get_events(limit=6, after_sequence=last)
+            if not page:
+                break
+            sequences.extend(e.sequence for e in page)
+            last = page[-1].sequence
+
+        self.assertEqual(sequences, list(range(1, 21)))
+
+    async def test_stream_and_read_after(self):
+        """stream_events et read_after suivent l'ordre des séquences"""
+        streamed = [e.sequence async for e in self.store.stream_events(page_size=7)]
+        filtered = [
+            e.event_data["n"]
+            async for e in self.store.stream_events(aggregate_id="c2", page_size=2)
+        ]
+        tail = await self.store.read_after(17)
+
+        self.assertEqual(streamed, list(range(1, 21)))
+        self.assertEqual(filtered, [2, 6, 10, 14, 18])
+        self.assertEqual([e.sequence for e in tail], [18, 19, 20])
+        self.assertEqual(
+            [e.sequence for e in await self.store.read_after(0, limit=2)], [1, 2]
+        )
+
+    async def test_sequence_not_reused_after_delete(self):
+        """Supprimer le dernier événement ne libère pas sa séquence"""
+        async with self.db.get_connection() as conn:
+            await conn.execute("DELETE FROM event_store WHERE sequence = 20")
+            await conn.commit()
+
+        await self.store.store_event(SetLogged(n=20))
+
+        tail = await self.store.read_after(19)
+        self.assertEqual([e.sequence for e in tail], [21])
+
+    async def test_replay_keeps_aggregate_order(self):
+        """Rejeu concurrent : chaque agrégat reçoit ses événements dans l'ordre"""
+        seen = {}
+
+        async def record(event):
+            await asyncio.sleep(0)
+            seen.setdefault(event.client_id, []).append(event.n)
+
+        replayed = await self.store.replay_events(
+            {"SetLogged": record}, batch_size=5, concurrency=3
+        )
+
+        self.assertEqual(replayed, 20)
+        for client_id, ns in seen.items():
+            self.assertEqual(ns, list(range(client_id, 20, 4)))
+
+
+@unittest.skipUnless(HAS_AIOSQLITE, "aiosqlite non installé")
+class TestSnapshotRehydration(_EventStoreTestCase):
+    """Agrégats rechargés depuis le dernier snapshot plus la queue"""
+
+    store_options = {
+        "enable_snapshots": True,
+        "snapshot_frequency": 10,
+        "enable_compression": False,
+    }
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        register_domain_snapshotters(self.store)
+
+    async def _save(self, aggregate, batch=False):
+        """Stocke les événements du domaine levés par l'agrégat"""
+        for event in aggregate.get_domain_events():
+            await self.store.store_event(event, batch=batch)
+        aggregate.clear_domain_events()
+
+    async def _client_history(self):
+        """Client 42 : création, 24 exclusions, une mise à jour (26 événements)"""
+        client = Client(PersonalInfo("Ana", "Silva", "ana@example.com"), id=42)
+        await self._save(client)
+        for i in range(24):
+            client.add_exercise_exclusion(i)
+            await self._save(client, batch=i % 3 == 0)
+        client.update_personal_info(PersonalInfo("Ana", "Costa", "ana@example.com"))
+        await self._save(client)
+        return client
+
+    def _count_rows_read(self):
+        """Compte les lignes d'événements désérialisées par le journal"""
+        rows_read = []
+        deserialize = self.store._deserialize_stored_event
+
+        async def counting(row):
+            rows_read.append(row["sequence"])
+            return await deserialize(row)
+
+        self.store._deserialize_stored_event = counting
+        return rows_read
+
+    async def test_unknown_aggregate_loads_none(self):
+        """Aucun événement : pas d'agrégat"""
+        self.assertIsNone(await self.store.load_aggregate("404", "Client"))
+
+    async def test_client_round_trip(self):
+        """Chaque mutation du client est rejouée à l'identique"""
+        client = Client(
+            PersonalInfo(
+                first_name="Marie Claire",
+                last_name="Dupont",
+                email="marie@example.com",
+                birth_date=datetime(1990, 5, 1),
+                phone="0600",
+            ),
+            id=7,
+        )
+        client.update_physical_profile(PhysicalProfile(height_cm=168, weight_kg=61))
+        client.set_fitness_goals(
+            FitnessGoals("muscle_gain", target_date=datetime(2027, 1, 1))
+        )
+        client.deactivate("pause")
+        client.add_exercise_exclusion(3)
+        await self._save(client)
+
+        loaded = await self.store.load_aggregate("7", "Client")
+
+        self.assertEqual(loaded.id, 7)
+        self.assertEqual(loaded.personal_info, client.personal_info)
+        self.assertEqual(loaded.physical_profile, client.physical_profile)
+        self.assertEqual(loaded.fitness_goals, client.fitness_goals)
+        self.assertFalse(loaded.is_active)
+        self.assertEqual(loaded.excluded_exercise_ids, {3})
+        self.assertEqual(loaded.version, client.version)
+
+        client.reactivate()
+        client.remove_exercise_exclusion(3)
+        await self._save(client)
+        loaded = await self.store.load_aggregate("7", "Client")
+
+        self.assertTrue(loaded.is_active)
+        self.assertEqual(loaded.excluded_exercise_ids, set())
+        self.assertEqual(loaded.version, client.version)
+
+    async def test_snapshot_plus_tail(self):
+        """Seuls les événements postérieurs au dernier snapshot sont relus"""
+        written = await self._client_history()
+        snapshot = await self.store.get_latest_snapshot("42", "Client")
+        rows_read = self._count_rows_read()
+
+        client = await self.store.load_aggregate("42", "Client")
+
+        self.assertEqual(snapshot.snapshot_version, 20)
+        self.assertEqual(len(rows_read), 6)
+        self.assertEqual(client.version, written.version)
+        self.assertEqual(client.personal_info, written.personal_info)
+        self.assertEqual(client.excluded_exercise_ids, set(range(24)))
+
+    async def test_corrupted_snapshot_falls_back_to_full_replay(self):
+        """Checksum invalide : snapshot ignoré, même état par rejeu complet"""
+        written = await self._client_history()
+        async with self.db.get_connection() as conn:
+            await conn.execute(
+                "UPDATE event_snapshots SET checksum = 'x' WHERE snapshot_version = 20"
+            )
+            await conn.commit()
+        rows_read = self._count_rows_read()
+
+        client = await self.store.load_aggregate("42", "Client")
+
+        self.assertEqual(len(rows_read), 26)
+        self.assertEqual(client.version, written.version)
+        self.assertEqual(client.personal_info.full_name, "Ana Costa")
+
+    async def test_session_snapshot_round_trip(self):
+        """Séance : état du snapshot restauré, puis queue appliquée"""
+        session = WorkoutSession(42, "Jambes", datetime(2026, 10, 1, 10), id=1)
+        for order in range(1, 10):
+            session.add_exercise(
+                SessionExercise(
+                    exercise_id=order,
+                    sets=[ExerciseSet(reps=5, weight_kg=100.0)],
+                    order=order,
+                )
+            )
+        session.remove_exercise(9)
+        session.set_notes("Bonne séance")
+        session.set_duration(60)
+        session.complete_session()
+        await self._save(session)
+
+        snapshot = await self.store.get_latest_snapshot("1", "WorkoutSession")
+        snapshotter = self.store._snapshotters["WorkoutSession"]
+        restored = snapshotter.from_snapshot(snapshot.snapshot_data["state"])
+        loaded = await self.store.load_aggregate("1", "WorkoutSession")
+
+        self.assertEqual((restored.version, restored.is_completed), (9, False))
+        self.assertEqual(restored.calculate_total_exercises(), 9)
+        self.assertEqual(loaded.version, session.version)
+        self.assertEqual(loaded.session_date, session.session_date)
+        self.assertEqual(loaded.exercises, session.exercises)
+        self.assertEqual(loaded.notes, "Bonne séance")
+        self.assertEqual(loaded.duration_minutes, 60)
+        self.assertTrue(loaded.is_completed)
+        self.assertEqual(loaded.calculate_total_volume(), 4000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
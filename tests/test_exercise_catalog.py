@@ -0,0 +1,150 @@
+"""
+Tests du catalogue d'exercices en mémoire
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.seed import create_schema
+from models.exercices import Exercise
+from repositories.exercices_repo import ExerciseRepository
+from repositories.exercise_catalog import ExerciseCatalog, iter_bits
+from services.smart_workout_generator import SmartWorkoutGenerator
+from services.workout_config_service import WorkoutConfigService
+
+_EXERCISES = [
+    ("Squat barre", "Quadriceps", "Barre olympique", "Force", "Squat"),
+    ("Développé couché", "Pectoraux", "Barre olympique, Banc", "Force", "Push"),
+    ("Curl haltères", "Biceps", "Haltères", "Hypertrophie", "Pull"),
+    ("Burpees", "Full body", "Poids du corps", "Cardio, Metcon", "Jump"),
+    ("Kettlebell swing", "Fessiers", "Kettlebell", "Cardio", "Hinge"),
+]
+
+
+class TestExerciseCatalog(unittest.TestCase):
+    """Index en bitsets et invalidation par version"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "catalog.db")
+        create_schema()
+
+        self.repo = ExerciseRepository()
+        for nom, muscle, equipement, tags, pattern in _EXERCISES:
+            self.repo.create(
+                Exercise(
+                    id=None,
+                    nom=nom,
+                    groupe_musculaire_principal=muscle,
+                    equipement=equipement,
+                    tags=tags,
+                    movement_pattern=pattern,
+                    type_effort="",
+                    est_chargeable=equipement != "Poids du corps",
+                )
+            )
+        self.catalog = ExerciseCatalog(self.repo)
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_filter_matches_repository(self):
+        """Les filtres en mémoire donnent les mêmes résultats que SQL"""
+        cases = [
+            {"equipment": ["Barre"]},
+            {"equipment": ["halteres", "Kettlebell"]},
+            {"tags": ["cardio"]},
+            {"equipment": ["Barre olympique"], "tags": ["Force"]},
+            {"equipment": ["Poids du corps"], "tags": ["Force"]},
+            {},
+        ]
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                self.assertEqual(
+                    [e.nom for e in self.catalog.filter(**kwargs)],
+                    [e.nom for e in self.repo.filter(**kwargs)],
+                )
+
+    def test_pattern_and_muscle_bitsets(self):
+        """Index pattern et groupe musculaire combinables"""
+        bits = self.catalog.pattern_bits(["push", "Pull"])
+        names = [e.nom for e in self.catalog.exercises_for(bits)]
+        self.assertEqual(names, ["Curl haltères", "Développé couché"])
+        bits &= self.catalog.muscle_bits(["pectoraux"])
+        self.assertEqual(len(list(iter_bits(bits))), 1)
+
+    def test_reload_only_after_write(self):
+        """Le catalogue n'est rechargé qu'après une écriture"""
+        stats = db_manager.pool.query_stats
+        self.catalog.all()
+        stats.reset()
+        for _ in range(3):
+            self.catalog.filter(equipment=["Barre"])
+            self.catalog.get(1)
+        self.assertEqual(stats.snapshot(), [])
+        self.assertEqual(self.catalog.loads, 1)
+
+        squat = self.catalog.get(1)
+        squat.equipement = "Kettlebell"
+        self.repo.update(squat)
+        self.assertEqual(
+            [e.nom for e in self.catalog.filter(equipment=["kettlebell"])],
+            ["Kettlebell swing", "Squat barre"],
+        )
+        self.assertEqual(self.catalog.loads, 2)
+
+    def test_generator_pool_without_queries(self):
+        """Catalogue chaud : construire le pool ne touche pas la base"""
+        generator = SmartWorkoutGenerator(
+            config_service=WorkoutConfigService(os.path.join(self.tmpdir.name, "cfg")),
+            catalog=self.catalog,
+        )
+        params = {"equipment": ["Barre olympique"], "course_type": "Cross-Training"}
+        first = generator._build_intelligent_exercise_pool(params, {})
+        stats = db_manager.pool.query_stats
+        stats.reset()
+        second = generator._build_intelligent_exercise_pool(params, {})
+
+        self.assertEqual(stats.snapshot(), [])
+        self.assertTrue(second)
+        self.assertEqual(
+            sorted(e.nom for e, _ in first), sorted(e.nom for e, _ in second)
+        )
+
+    def test_generator_features_follow_database_switch(self):
+        """Changer de base sans écriture recompile les features du générateur"""
+        generator = SmartWorkoutGenerator(
+            config_service=WorkoutConfigService(os.path.join(self.tmpdir.name, "cfg")),
+            catalog=self.catalog,
+        )
+        params = {"course_type": "Cross-Training"}
+        generator._build_intelligent_exercise_pool(params, {})
+        version = self.catalog.version
+
+        # Copie modifiée hors dépôt : la version de données ne bouge pas
+        other_db = os.path.join(self.tmpdir.name, "other.db")
+        with db_manager.get_connection() as conn:
+            conn.execute("VACUUM INTO ?", (other_db,))
+        with sqlite3.connect(other_db) as conn:
+            conn.execute(
+                "UPDATE exercices SET id = 99, nom = 'Thruster' WHERE nom = 'Burpees'"
+            )
+        db_manager.db_path = other_db
+
+        pool = generator._build_intelligent_exercise_pool(params, {})
+
+        self.assertEqual(self.catalog.version, version)
+        self.assertIn(99, [e.id for e, _ in pool])
+        self.assertEqual(generator._features_key, self.catalog.data_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
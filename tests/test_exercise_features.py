@@ -0,0 +1,114 @@
+"""
+Tests du scoring vectorisé des exercices
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from models.exercices import Exercise
+from services.exercise_features import (
+    CANDIDATE_THRESHOLD,
+    FeatureMatrix,
+    WeightedPool,
+    score_exercises,
+    slot_weights,
+)
+from services.weighted_sampler import WeightedSampler
+
+
+def _ex(id, nom, tags=None, pattern=None, muscle="Dos", chargeable=False):
+    return Exercise(
+        id=id,
+        nom=nom,
+        groupe_musculaire_principal=muscle,
+        tags=tags,
+        movement_pattern=pattern,
+        est_chargeable=chargeable,
+    )
+
+
+class TestExerciseFeatures(unittest.TestCase):
+    """Règles de pondération appliquées au pool entier"""
+
+    def setUp(self):
+        self.exercises = [
+            _ex(1, "Back Squat", "Force", "Squat", "Quadriceps", True),
+            _ex(2, "Burpees", "Cardio, Metabolic", "Jump", "Full body"),
+            _ex(3, "Pull-ups", "Skill", "Pull", "Dos"),
+            _ex(4, "Plank", "Mobility", None, None),
+        ]
+        self.features = FeatureMatrix(self.exercises)
+        self.config = SimpleNamespace(
+            favorite_exercises={"strength": ["Back Squat"], "warmup": ["Plank"]},
+            exercise_restrictions={"limited_frequency": {"Burpees": 0.4}},
+        )
+
+    def test_compiled_rows(self):
+        """Tags, patterns et flags compilés une fois par exercice"""
+        f = self.features
+        self.assertEqual(f.has_any_tag(["cardio"]).tolist(), [0, 1, 0, 0])
+        self.assertEqual(f.pattern_in(["squat", "pull"]).tolist(), [1, 0, 1, 0])
+        self.assertEqual(f.chargeable.tolist(), [1, 0, 0, 0])
+        self.assertEqual(f.muscle[3], -1)
+
+    def test_score_rules(self):
+        """Objectif, continuum, focus, favoris, restrictions et suggestions"""
+        params = {"objectif": "Force", "continuum_cardio_renfo": -50, "focus": "Lower"}
+        recommendations = {"suggested_exercises": [["Pull-ups", "Row"]]}
+        weights = score_exercises(self.features, params, recommendations, self.config)
+
+        expected = [
+            1.4 * 1.5 * 1.5 * 1.2,  # objectif, renfo, focus, favori
+            0.7 * 0.6 * (1 - 0.4 + 0.1),  # cardio en renfo, hors focus, limité
+            1.5 * 0.6 * 1.3,  # pattern pull (renfo), hors focus, suggéré
+            0.6 * 1.2,  # hors focus, favori
+        ]
+        np.testing.assert_allclose(weights, expected)
+
+    def test_minimum_weight(self):
+        """Le poids ne descend jamais sous 0.05"""
+        config = SimpleNamespace(
+            favorite_exercises={},
+            exercise_restrictions={"limited_frequency": {"Burpees": 1.05}},
+        )
+        weights = score_exercises(self.features, {}, {}, config)
+        self.assertEqual(weights[1], 0.05)
+
+    def test_slot_penalties(self):
+        """Pénalités du slot appliquées comme masques sur le pool"""
+        pool = WeightedPool(self.features, np.arange(4), np.ones(4))
+        weights = slot_weights(
+            pool.features,
+            pool.positions,
+            pool.weights,
+            slot_focus="metabolic",
+            used_exercises={3},
+            muscle_usage_count={"Quadriceps": 2, "Full body": 1},
+            last_patterns=["Squat", "Pull", "Jump"],
+            consecutive_high_intensity=2,
+            max_consecutive=2,
+        )
+        np.testing.assert_allclose(
+            weights, [0.3, 0.5 * 0.7 * 0.1 * 1.4, 0.2 * 0.5, 1.0]
+        )
+
+        # Comme le générateur : poids sous le seuil mis à zéro, puis sync
+        weights[weights <= CANDIDATE_THRESHOLD] = 0.0
+        sampler = WeightedSampler(np.zeros(len(pool)))
+        sampler.sync(weights)
+        self.assertEqual(sampler.active, 3)
+        self.assertEqual(
+            [pool[i][0].nom for i in np.flatnonzero(sampler.weights)],
+            ["Back Squat", "Pull-ups", "Plank"],
+        )
+        self.assertAlmostEqual(sampler.weights[0], 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
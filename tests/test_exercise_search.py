@@ -0,0 +1,111 @@
+"""
+Tests de l'index plein texte FTS5 des exercices
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.exercise_fts import match_expression
+from db.seed import create_schema
+from models.exercices import Exercise
+from repositories.exercices_repo import ExerciseRepository
+
+
+def _exercise(nom, muscle, equipement, tags=None):
+    return Exercise(
+        id=None,
+        nom=nom,
+        groupe_musculaire_principal=muscle,
+        equipement=equipement,
+        tags=tags,
+        movement_pattern=None,
+        movement_category=None,
+        type_effort="",
+        coefficient_volume=1.0,
+        est_chargeable=True,
+    )
+
+
+class TestExerciseSearch(unittest.TestCase):
+    """Recherche et filtres via exercices_fts sur une base temporaire"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "fts.db")
+        create_schema()
+
+        self.repo = ExerciseRepository()
+        self.squat = self.repo.create(
+            _exercise("Squat barre", "Quadriceps", "Barre olympique", "Force")
+        )
+        self.repo.create(
+            _exercise("Développé couché", "Pectoraux", "Barre olympique, Banc", "Force")
+        )
+        self.repo.create(
+            _exercise("Curl haltères", "Biceps", "Haltères", "Hypertrophie")
+        )
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_search_prefix_and_accents(self):
+        """Préfixes et saisie sans accents, classement par pertinence"""
+        results, total = self.repo.search("devel")
+        self.assertEqual([e.nom for e in results], ["Développé couché"])
+        self.assertEqual(total, 1)
+
+        results, total = self.repo.search("halteres")
+        self.assertEqual([e.nom for e in results], ["Curl haltères"])
+
+        # "barre" apparaît dans le nom du squat : classé en premier
+        results, total = self.repo.search("barre")
+        self.assertEqual(total, 2)
+        self.assertEqual(results[0].nom, "Squat barre")
+
+    def test_search_pagination_total(self):
+        """Le total est renvoyé avec la page, même au-delà de la fin"""
+        results, total = self.repo.search("barre", limit=1)
+        self.assertEqual((len(results), total), (1, 2))
+        results, total = self.repo.search("barre", limit=1, offset=5)
+        self.assertEqual((results, total), ([], 2))
+        self.assertEqual(self.repo.search('"*'), ([], 0))
+
+    def test_triggers_keep_index_in_sync(self):
+        """Mises à jour et suppressions sont répercutées dans l'index"""
+        squat = self.repo.get_by_id(self.squat)
+        squat.nom = "Squat gobelet"
+        squat.equipement = "Kettlebell"
+        self.repo.update(squat)
+        self.assertEqual(self.repo.search("gobelet")[1], 1)
+        self.assertEqual(self.repo.search("barre")[1], 1)
+
+        self.repo.delete(self.squat)
+        self.assertEqual(self.repo.search("gobelet"), ([], 0))
+
+    def test_filter_equipment_and_tags(self):
+        """Filtres matériel (OU) et tags (OU) combinés en ET"""
+        names = [e.nom for e in self.repo.filter(equipment=["barre"])]
+        self.assertEqual(names, ["Développé couché", "Squat barre"])
+        names = [e.nom for e in self.repo.filter(equipment=["Banc", "Halteres"])]
+        self.assertEqual(names, ["Curl haltères", "Développé couché"])
+        names = [
+            e.nom for e in self.repo.filter(equipment=["Barre"], tags=["Hypertrophie"])
+        ]
+        self.assertEqual(names, [])
+        self.assertEqual(len(self.repo.filter()), 3)
+
+    def test_match_expression_escapes_input(self):
+        """Les opérateurs FTS de la saisie sont neutralisés"""
+        self.assertEqual(match_expression('dev "OR" halt*'), '"dev"* "OR"* "halt"*')
+        self.assertIsNone(match_expression("  -- "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests des empreintes canoniques utilisées comme clés de cache
+"""
+
+import enum
+import os
+import sys
+import threading
+import unittest
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.fingerprint import Fingerprinter, fingerprint
+
+
+class Repas(enum.Enum):
+    MIDI = "midi"
+
+
+@dataclass
+class Aliment:
+    nom: str
+    quantite: Decimal
+    repas: Repas
+
+
+class Objet:
+    def __init__(self, valeur):
+        self.valeur = valeur
+
+
+class TestFingerprint(unittest.TestCase):
+    """Stabilité, types riches et absence d'exception"""
+
+    def test_order_independent(self):
+        """Ordre des clés et des ensembles sans effet"""
+        self.assertEqual(
+            fingerprint({"a": 1, "b": {"x", "y"}, 3: None}),
+            fingerprint({3: None, "b": {"y", "x"}, "a": 1}),
+        )
+
+    def test_types_are_distinguished(self):
+        """1, 1.0, "1" et True donnent des empreintes différentes"""
+        keys = {fingerprint(v) for v in (1, 1.0, "1", True, [1], (1,), None)}
+        self.assertEqual(len(keys), 6)  # liste et tuple sont équivalents
+
+    def test_rich_values(self):
+        """Dates, décimaux, dataclasses, enums et objets quelconques"""
+        plan = {
+            "jour": date(2024, 1, 1),
+            "cree_le": datetime(2024, 1, 1, 8, 30),
+            "aliments": [Aliment("riz", Decimal("100.50"), Repas.MIDI)],
+            "client": Objet("Alice"),
+        }
+        same = dict(plan, aliments=[Aliment("riz", Decimal("100.5"), Repas.MIDI)])
+        self.assertEqual(fingerprint(plan), fingerprint(same))
+        self.assertNotEqual(
+            fingerprint(plan), fingerprint(dict(plan, client=Objet("Bob")))
+        )
+
+    def test_never_raises(self):
+        """Structures cycliques et objets sans repr utilisable"""
+
+        class Cassé:
+            __slots__ = ()
+
+            def __repr__(self):
+                raise RuntimeError
+
+        cycle = []
+        cycle.append(cycle)
+        self.assertEqual(len(fingerprint(cycle, Cassé(), object)), 32)
+
+    def test_default_repr_ignores_address(self):
+        """Objets sans état exportable : seul le type compte, pas l'adresse"""
+        self.assertEqual(fingerprint(object()), fingerprint(object()))
+        self.assertEqual(
+            fingerprint(threading.Lock()), fingerprint(threading.Lock())
+        )
+        self.assertNotEqual(fingerprint(object()), fingerprint(threading.Lock()))
+
+    def test_incremental_matches_one_shot(self):
+        """Les mises à jour successives valent une empreinte de la liste"""
+        hasher = Fingerprinter().update([{"a": 1}, "b"])
+        self.assertEqual(hasher.hexdigest(), fingerprint({"a": 1}, "b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+Tests du rendu PDF par lots côté pool de processus
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _load_batch_worker():
+    """Charge le module seul : le paquet pdf_engine importe ReportLab"""
+    path = os.path.join(ROOT, "services", "pdf_engine", "core", "batch_worker.py")
+    spec = importlib.util.spec_from_file_location("pdf_batch_worker", path)
+    module = importlib.util.module_from_spec(spec)
+    # Les workers retrouvent _render_batch_job par son nom de module
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+batch_worker = _load_batch_worker()
+
+
+class _StubTemplate:
+    """Template minimal : écrit les données, peut tuer son worker"""
+
+    def __init__(self, data, config=None):
+        self.data = data
+
+    def build(self, output_path):
+        crash_marker = self.data.get("crash_once")
+        if self.data.get("crash") or (
+            crash_marker and not os.path.exists(crash_marker)
+        ):
+            if crash_marker:
+                open(crash_marker, "w").close()
+            os._exit(1)
+        if self.data.get("fail"):
+            raise ValueError("données invalides")
+        with open(output_path, "w") as f:
+            f.write(self.data["text"])
+
+
+class _StubFactory:
+    """Fabrique minimale : registre type -> classe de template"""
+
+    def __init__(self):
+        self.templates = {}
+
+    def register_template(self, template_type, template_class):
+        self.templates[template_type] = template_class
+
+    def create_template(self, template_type, data, config=None):
+        return self.templates[template_type](data, config)
+
+
+class _VariantFactory(_StubFactory):
+    """Sous-classe qui applique la variante, comme la fabrique pro"""
+
+    def create_template(self, template_type, data, config=None):
+        variant = (config or {}).get("variant")
+        if variant:
+            data = dict(data, text=f"{variant}: {data['text']}")
+        return super().create_template(template_type, data, config)
+
+
+class _StubEngine:
+    """Moteur minimal exposant l'interface utilisée par les workers"""
+
+    def __init__(self, cache_enabled=True):
+        self.cache_enabled = cache_enabled
+        self.template_factory = _StubFactory()
+        self.warmed = False
+
+    def register_custom_template(self, template_type, template_class):
+        self.template_factory.register_template(template_type, template_class)
+
+    def warm_up(self):
+        self.warmed = True
+
+    def _generate(
+        self,
+        template_type,
+        data,
+        output_path,
+        template_config=None,
+        style_overrides=None,
+        cache_lookup=True,
+    ):
+        template = self.template_factory.create_template(
+            template_type, data, template_config
+        )
+        template.build(output_path)
+        return {"cached": False, "generation_time": 0.0, "lookup": cache_lookup}
+
+
+class TestBatchWorker(unittest.TestCase):
+    """Initialisation des workers et rendu d'un job"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(setattr, batch_worker, "_worker_engine", None)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_init_registers_templates_and_warms_up(self):
+        """Un moteur sans cache par worker, templates enregistrés et préchauffé"""
+        batch_worker._init_batch_worker(
+            _StubEngine, _VariantFactory, {"stub": _StubTemplate}
+        )
+        engine = batch_worker._worker_engine
+
+        self.assertIsInstance(engine, _StubEngine)
+        self.assertFalse(engine.cache_enabled)
+        self.assertIsInstance(engine.template_factory, _VariantFactory)
+        self.assertIs(engine.template_factory.templates["stub"], _StubTemplate)
+        self.assertTrue(engine.warmed)
+
+    def test_render_job_success(self):
+        """Le résultat porte l'index, le nom de fichier et le succès"""
+        engine = _StubEngine()
+        engine.register_custom_template("stub", _StubTemplate)
+        file_path = os.path.join(self.tmpdir.name, "seance.pdf")
+        job = {"template_type": "stub", "data": {"text": "contenu"}}
+
+        result = batch_worker._render_job(engine, 4, job, file_path, cache_lookup=False)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["index"], 4)
+        self.assertEqual(result["filename"], "seance.pdf")
+        self.assertFalse(result["lookup"])
+        with open(file_path) as f:
+            self.assertEqual(f.read(), "contenu")
+
+    def test_render_job_errors_become_results(self):
+        """Erreur de template ou job incomplet : échec rapporté, pas levé"""
+        engine = _StubEngine()
+        engine.register_custom_template("stub", _StubTemplate)
+        file_path = os.path.join(self.tmpdir.name, "erreur.pdf")
+
+        failed = batch_worker._render_job(
+            engine, 0, {"template_type": "stub", "data": {"fail": True}}, file_path
+        )
+        malformed = batch_worker._render_job(engine, 1, {"data": {}}, file_path)
+
+        self.assertFalse(failed["success"])
+        self.assertIn("données invalides", failed["error"])
+        self.assertFalse(malformed["success"])
+        self.assertEqual(malformed["filename"], "erreur.pdf")
+        self.assertEqual(malformed["index"], 1)
+
+
+class TestPoolRestart(unittest.TestCase):
+    """Un worker qui meurt casse le pool : les jobs restants sont relancés"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _jobs(self, *datas):
+        return [
+            (
+                index,
+                {"template_type": "stub", "data": dict(data, text=f"doc {index}")},
+                os.path.join(self.tmpdir.name, f"doc_{index}.pdf"),
+            )
+            for index, data in enumerate(datas)
+        ]
+
+    def _run(
+        self,
+        jobs,
+        max_restarts=batch_worker.MAX_POOL_RESTARTS,
+        factory_class=_StubFactory,
+    ):
+        results = batch_worker.iter_pool_results(
+            jobs, 2, _StubEngine, factory_class, {"stub": _StubTemplate}, max_restarts
+        )
+        return {result["index"]: result for result in results}
+
+    def test_workers_use_the_parent_factory_class(self):
+        """create_template d'une sous-classe de fabrique s'applique dans le pool"""
+        jobs = self._jobs({}, {})
+        jobs[1][1]["template_config"] = {"variant": "executive"}
+
+        results = self._run(jobs, factory_class=_VariantFactory)
+
+        self.assertTrue(all(result["success"] for result in results.values()))
+        with open(jobs[0][2]) as f:
+            self.assertEqual(f.read(), "doc 0")
+        with open(jobs[1][2]) as f:
+            self.assertEqual(f.read(), "executive: doc 1")
+
+    def test_unfinished_jobs_resubmitted_after_crash(self):
+        """Crash ponctuel : tous les jobs aboutissent sur un pool neuf"""
+        marker = os.path.join(self.tmpdir.name, "crashed")
+        results = self._run(self._jobs({}, {"crash_once": marker}, {}, {}))
+
+        self.assertTrue(os.path.exists(marker))
+        self.assertEqual(sorted(results), [0, 1, 2, 3])
+        self.assertTrue(all(result["success"] for result in results.values()))
+
+    def test_restarts_are_bounded(self):
+        """Crash systématique : le job échoue une fois les relances épuisées"""
+        results = self._run(self._jobs({}, {"crash": True}, {}), max_restarts=1)
+
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertFalse(results[1]["success"])
+        self.assertEqual(results[1]["filename"], "doc_1.pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
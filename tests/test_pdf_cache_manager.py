@@ -0,0 +1,107 @@
+"""
+Tests du cache PDF adressé par contenu
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _load_cache_manager():
+    """Charge le module seul : le paquet pdf_engine importe ReportLab"""
+    path = os.path.join(ROOT, "services", "pdf_engine", "managers", "cache_manager.py")
+    spec = importlib.util.spec_from_file_location("pdf_cache_manager", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CacheManager = _load_cache_manager().CacheManager
+
+
+class TestPdfCacheManager(unittest.TestCase):
+    """Blobs partagés, copie sur hit, comptage de taille et éviction LRU"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = CacheManager(self.tmpdir.name, max_size_mb=1)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_identical_content_shares_one_blob(self):
+        """Deux clés, même contenu : un seul fichier, taille comptée une fois"""
+        self.cache.set("a", b"%PDF" * 1000)
+        self.cache.set("b", b"%PDF" * 1000)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"]), (2, 1))
+        self.assertEqual(self.cache._total_size(), 4000)
+
+        self.cache.delete("a")
+        self.assertEqual(self.cache.get("b"), b"%PDF" * 1000)
+        self.cache.delete("b")
+        self.assertEqual(self.cache._total_size(), 0)
+
+    def test_copy_on_hit_and_put_file(self):
+        """Un fichier mis en cache ressort par simple copie"""
+        source = os.path.join(self.tmpdir.name, "source.pdf")
+        with open(source, "wb") as f:
+            f.write(b"%PDF-1.4 body")
+        self.cache.put_file("doc", source)
+
+        target = os.path.join(self.tmpdir.name, "target.pdf")
+        self.assertTrue(self.cache.copy_to("doc", target))
+        with open(target, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF-1.4 body")
+        self.assertFalse(self.cache.copy_to("absent", target))
+
+    def test_lru_and_ttl(self):
+        """Les entrées les moins récemment lues partent en premier"""
+        chunk = 400 * 1024
+        self.cache.set("old", b"a" * chunk)
+        self.cache.set("recent", b"b" * chunk)
+        self.assertIsNotNone(self.cache.get("old"))
+        self.cache.set("new", b"c" * chunk)
+
+        self.assertIsNone(self.cache.get("recent"))
+        self.assertIsNotNone(self.cache.get("old"))
+        self.assertLessEqual(self.cache._total_size(), self.cache.max_size_bytes)
+
+        self.cache.set("short", b"d", ttl=0)
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get("short"))
+
+    def test_shared_blob_survives_sweep_when_full(self):
+        """Réutiliser un blob présent ne déclenche pas d'éviction de ses clés"""
+        content = b"q" * 600_000
+        self.cache.set("k1", content)
+        self.cache.set("k2", content)
+
+        self.assertEqual(self.cache.get("k1"), content)
+        self.assertEqual(self.cache.get("k2"), content)
+        self.assertEqual(self.cache._total_size(), 600_000)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["entries"], stats["blobs"]), (2, 1))
+
+        self.cache.delete("k1")
+        self.assertEqual(self.cache.get("k2"), content)
+
+    def test_new_blob_evicts_others_when_full(self):
+        """Un nouveau contenu trop gros évince les entrées les plus anciennes"""
+        self.cache.set("k1", b"a" * 600_000)
+        self.cache.set("k2", b"b" * 600_000)
+
+        self.assertIsNone(self.cache.get("k1"))
+        self.assertEqual(self.cache.get("k2"), b"b" * 600_000)
+        self.assertEqual(self.cache._total_size(), 600_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests du registre partagé de thèmes et de styles PDF
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Le paquet pdf_engine importe ReportLab à l'initialisation
+HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
+
+
+@unittest.skipUnless(HAS_REPORTLAB, "reportlab non installé")
+class TestStyleRegistry(unittest.TestCase):
+    """Lecture unique des fichiers, surveillance et styles mémoïsés"""
+
+    def setUp(self):
+        from services.pdf_engine.managers.style_registry import StyleRegistry
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "pdf_themes.json")
+        self._write({"default": {"name": "A"}})
+        self.registry = StyleRegistry(check_interval=0)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, data):
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+
+    def test_file_parsed_once_and_reloaded_on_change(self):
+        """Même objet tant que le fichier ne change pas"""
+        first = self.registry.read_json(self.path)
+        self.assertIs(self.registry.read_json(self.path), first)
+        self.registry.memo("style", object)
+
+        self._write({"default": {"name": "Beaucoup plus long"}})
+        self.assertEqual(
+            self.registry.read_json(self.path)["default"]["name"], "Beaucoup plus long"
+        )
+        self.assertEqual(self.registry.generation, 1)
+        self.assertEqual(self.registry.get_stats()["styles"], 0)
+
+    def test_memo_is_bounded(self):
+        """Un objet construit par clé, LRU borné"""
+        self.registry.max_styles = 2
+        built = [self.registry.memo(k, object) for k in ("a", "b", "a", "c")]
+        self.assertIs(built[0], built[2])
+        self.assertEqual(self.registry.get_stats()["styles"], 2)
+        self.assertIsNot(self.registry.memo("b", object), built[1])
+
+    def test_templates_share_styles(self):
+        """Deux templates de même configuration partagent leurs styles"""
+        from services.pdf_engine.templates.nutrition_template import (
+            NutritionTemplate,
+        )
+
+        first = NutritionTemplate({"title": "A"})
+        second = NutritionTemplate({"title": "B"})
+        self.assertIs(first.styles, second.styles)
+        self.assertIs(
+            first._get_standard_table_style(), second._get_standard_table_style()
+        )
+        with self.assertRaises(TypeError):
+            first.styles["body"] = None
+
+        second.apply_style_overrides({"fonts": {"body": {"size": 12}}})
+        self.assertIsNot(first.styles, second.styles)
+
+
+if __name__ == "__main__":
+    unittest.main()
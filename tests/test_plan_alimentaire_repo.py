@@ -0,0 +1,137 @@
+"""
+Tests du chargement eager des plans alimentaires
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.seed import create_schema
+from models.plan_alimentaire import PlanAlimentaire, Repas, RepasItem
+from repositories.plan_alimentaire_repo import PlanAlimentaireRepository
+from services.plan_alimentaire_service import PlanAlimentaireService
+
+
+class TestPlanAlimentaireRepository(unittest.TestCase):
+    """Tests pour PlanAlimentaireRepository avec base temporaire"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "plans.db")
+        create_schema()
+
+        with db_manager.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO aliments (id, nom, kcal_100g, proteines_100g, "
+                "glucides_100g, lipides_100g) VALUES (1, 'Riz', 130, 2.7, 28, 0.3)"
+            )
+            conn.execute(
+                "INSERT INTO aliments (id, nom, kcal_100g, proteines_100g, "
+                "glucides_100g, lipides_100g) VALUES (2, 'Poulet', 165, 31, 0, 3.6)"
+            )
+            conn.execute(
+                "INSERT INTO portions (id, aliment_id, description, grammes_equivalents) "
+                "VALUES (1, 2, 'Filet', 150)"
+            )
+            conn.execute(
+                "INSERT INTO portions (id, aliment_id, description, grammes_equivalents) "
+                "VALUES (2, 1, 'Gramme', 1)"
+            )
+            conn.execute("INSERT INTO clients (id, nom, prenom) VALUES (7, 'D', 'J')")
+
+        self.repo = PlanAlimentaireRepository()
+        self.plan_id = self.repo.create_plan(
+            PlanAlimentaire(
+                id=0,
+                client_id=7,
+                nom="Semaine",
+                repas=[
+                    Repas(
+                        id=0,
+                        plan_id=0,
+                        nom="Dîner",
+                        ordre=1,
+                        items=[RepasItem(0, 0, 2, 1, 1.0)],
+                    ),
+                    Repas(
+                        id=0,
+                        plan_id=0,
+                        nom="Déjeuner",
+                        ordre=0,
+                        items=[
+                            RepasItem(0, 0, 1, 2, 200.0),
+                            RepasItem(0, 0, 2, 1, 2.0),
+                        ],
+                    ),
+                    Repas(id=0, plan_id=0, nom="Collation", ordre=2),
+                ],
+            )
+        )
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_get_plan_assembles_graph(self):
+        """Repas ordonnés, items et données aliment/portion joints"""
+        plan = self.repo.get_plan(self.plan_id)
+
+        self.assertEqual(
+            [r.nom for r in plan.repas], ["Déjeuner", "Dîner", "Collation"]
+        )
+        dejeuner = plan.repas[0]
+        self.assertEqual([i.aliment_id for i in dejeuner.items], [1, 2])
+        self.assertEqual(dejeuner.items[0].aliment.nom, "Riz")
+        self.assertEqual(dejeuner.items[0].portion.description, "Gramme")
+        self.assertEqual(dejeuner.items[1].portion.grammes_equivalents, 150)
+        self.assertEqual(plan.repas[2].items, [])
+
+    def test_get_plan_single_query(self):
+        """Le plan complet est chargé en une seule requête"""
+        stats = db_manager.pool.query_stats
+        stats.reset()
+        self.repo.get_plan(self.plan_id)
+        self.assertEqual(sum(q["count"] for q in stats.snapshot()), 1)
+
+    def test_find_by_client_id(self):
+        """Recherche par client et plan absent"""
+        plan = self.repo.find_by_client_id(7)
+        self.assertEqual(plan.id, self.plan_id)
+        self.assertEqual(len(plan.repas), 3)
+        self.assertIsNone(self.repo.find_by_client_id(999))
+        with self.assertRaises(ValueError):
+            self.repo.get_plan(999)
+
+    def test_compute_totals_without_queries(self):
+        """Les totaux item/repas/plan d'un plan eager ne touchent pas la base"""
+        plan = self.repo.get_plan(self.plan_id)
+        service = PlanAlimentaireService(self.repo)
+        stats = db_manager.pool.query_stats
+        stats.reset()
+
+        totals = service.compute_totals(plan)
+
+        self.assertEqual(stats.snapshot(), [])
+        riz, poulet = totals.meals[0].items
+        self.assertAlmostEqual(riz["kcal"], 260)  # 200 g x 130 kcal
+        self.assertAlmostEqual(poulet["proteines"], 93)  # 2 x 150 g x 31 g
+        self.assertAlmostEqual(totals.meals[1].totals["kcal"], 247.5)
+        self.assertAlmostEqual(totals.totals["kcal"], 260 + 495 + 247.5)
+        self.assertEqual(totals.meals[2].totals["kcal"], 0.0)
+
+    def test_compute_totals_hydrates_plain_items(self):
+        """Les items sans données jointes sont complétés en lot"""
+        item = RepasItem(id=1, repas_id=1, aliment_id=2, portion_id=1, quantite=1.0)
+        service = PlanAlimentaireService(self.repo)
+
+        self.assertAlmostEqual(service.compute_item_totals(item)["kcal"], 247.5)
+        self.assertEqual(item.aliment.nom, "Poulet")
+
+
+if __name__ == "__main__":
+    unittest.main()
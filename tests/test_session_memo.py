@@ -0,0 +1,116 @@
+"""
+Tests du mémo des séances générées
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.seed import create_schema, seed_data
+from models.session import Session
+from repositories.exercices_repo import ExerciseRepository
+from repositories.exercise_catalog import ExerciseCatalog
+from services.session_memo import SessionMemo, canonical_key
+from services.smart_workout_generator import SmartWorkoutGenerator
+from services.workout_config_service import WorkoutConfigService
+
+_PARAMS = {
+    "course_type": "Cross-Training",
+    "duration": 45,
+    "equipment": ["Kettlebell", "Barre"],
+    "variability": 60,
+    "seed": 3,
+}
+
+
+def _exercise_ids(session):
+    return [item.exercise_id for block in session.blocks for item in block.items]
+
+
+class TestSessionMemo(unittest.TestCase):
+    """Clé canonique, LRU et invalidation par catalogue ou configuration"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "memo.db")
+        create_schema()
+        seed_data()
+        self.config_service = WorkoutConfigService(
+            os.path.join(self.tmpdir.name, "cfg")
+        )
+        self.generator = SmartWorkoutGenerator(
+            config_service=self.config_service, catalog=ExerciseCatalog()
+        )
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_canonical_key_ignores_ordering(self):
+        """Ordre des clés et des ensembles sans effet sur la clé"""
+        self.assertEqual(
+            canonical_key({"a": 1, "b": {"x", "y"}}, 7),
+            canonical_key({"b": {"y", "x"}, "a": 1}, 7),
+        )
+        self.assertNotEqual(canonical_key({"a": 1}, 7), canonical_key({"a": 1}, 8))
+
+    def test_lru_is_bounded(self):
+        """Les entrées les moins récentes sont évincées"""
+        memo = SessionMemo(maxsize=2)
+        for key in ("a", "b", "c"):
+            memo.put(key, Session(key, "COLLECTIF", key, 60, "2024-01-01"))
+        self.assertIsNone(memo.get("a"))
+        copy = memo.get("c")
+        self.assertEqual(copy.label, "c")
+        self.assertNotEqual(copy.session_id, "c")
+        self.assertEqual(len(memo), 2)
+
+    def test_identical_request_is_served_from_memo(self):
+        """Mêmes réglages et graine : séance reprise sans requête SQL"""
+        first = self.generator.generate_collectif_smart(dict(_PARAMS))
+        stats = db_manager.pool.query_stats
+        stats.reset()
+        second = self.generator.generate_collectif_smart(dict(_PARAMS))
+
+        self.assertEqual(self.generator.session_memo.hits, 1)
+        self.assertEqual(stats.snapshot(), [])
+        self.assertEqual(_exercise_ids(first), _exercise_ids(second))
+        self.assertNotEqual(first.session_id, second.session_id)
+        self.assertTrue(getattr(second, "_smart_generated", False))
+
+        self.generator.generate_collectif_smart(dict(_PARAMS, seed=4))
+        self.assertEqual(self.generator.session_memo.hits, 1)
+
+    def test_config_and_catalog_changes_invalidate(self):
+        """Modifier la config (service ou fichier) ou les exercices invalide"""
+        generate = self.generator.generate_collectif_smart
+        generate(dict(_PARAMS))
+
+        self.config_service.add_favorite_exercise("Cross-Training", "Burpees")
+        generate(dict(_PARAMS))
+        self.assertEqual(self.generator.session_memo.hits, 0)
+
+        # Édition du fichier hors du service
+        with open(self.config_service.config_file, "a", encoding="utf-8") as f:
+            f.write("\n")
+        generate(dict(_PARAMS))
+        self.assertEqual(self.generator.session_memo.hits, 0)
+
+        repo = ExerciseRepository()
+        exercise = repo.list_all()[0]
+        exercise.tags = (exercise.tags or "") + ", cardio"
+        repo.update(exercise)
+        generate(dict(_PARAMS))
+        self.assertEqual(self.generator.session_memo.hits, 0)
+
+        generate(dict(_PARAMS))
+        self.assertEqual(self.generator.session_memo.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
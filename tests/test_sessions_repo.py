@@ -0,0 +1,94 @@
+"""
+Tests du chargement par lot des sessions (calendrier)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import db_manager
+from db.seed import create_schema
+from models.session import Block, BlockItem, Session
+from repositories.sessions_repo import SessionsRepository
+
+
+def _session(session_id: str, date_creation: str, n_blocks: int = 2) -> Session:
+    blocks = [
+        Block(
+            block_id=f"{session_id}-b{i}",
+            type="EMOM",
+            duration_sec=600,
+            items=[
+                BlockItem(exercise_id=str(j), prescription={"reps": 10 + j})
+                for j in range(3)
+            ],
+            title=f"Bloc {i}",
+        )
+        for i in range(n_blocks)
+    ]
+    return Session(
+        session_id=session_id,
+        mode="COLLECTIF",
+        label=session_id,
+        duration_sec=1800,
+        date_creation=date_creation,
+        blocks=blocks,
+    )
+
+
+class TestSessionsRepository(unittest.TestCase):
+    """Tests pour SessionsRepository avec base temporaire"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = db_manager.db_path
+        db_manager.db_path = os.path.join(self.tmpdir.name, "sessions.db")
+        create_schema()
+        self.repo = SessionsRepository()
+        for sid, day in [
+            ("a", "2025-11-30 12:00:00"),
+            ("b", "2025-12-01"),
+            ("c", "2025-12-31T18:30:00"),
+            ("d", "2026-01-01 08:00:00"),
+        ]:
+            self.repo.save(_session(sid, day))
+
+    def tearDown(self):
+        db_manager.db_path = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_month_range_boundaries(self):
+        """Le filtre par plage respecte les bornes du mois (y compris décembre)"""
+        sessions = self.repo.list_sessions_for_month(2025, 12)
+        self.assertEqual([s.session_id for s in sessions], ["b", "c"])
+        self.assertEqual(
+            [s.session_id for s in self.repo.list_sessions_for_month(2026, 1)], ["d"]
+        )
+
+    def test_batch_load_assembles_blocks_and_items(self):
+        """Blocs et items sont chargés en trois requêtes au total"""
+        stats = db_manager.pool.query_stats
+        stats.reset()
+
+        sessions = self.repo.list_sessions_for_month(2025, 12)
+
+        self.assertEqual(sum(q["count"] for q in stats.snapshot()), 3)
+        self.assertEqual([b.block_id for b in sessions[0].blocks], ["b-b0", "b-b1"])
+        self.assertEqual(
+            [it.prescription["reps"] for it in sessions[1].blocks[1].items],
+            [10, 11, 12],
+        )
+
+    def test_get_by_id(self):
+        """get_by_id utilise le même chargeur"""
+        session = self.repo.get_by_id("c")
+        self.assertEqual(len(session.blocks), 2)
+        self.assertEqual(session.blocks[0].title, "Bloc 0")
+        self.assertIsNone(self.repo.get_by_id("zzz"))
+
+
+if __name__ == "__main__":
+    unittest.main()
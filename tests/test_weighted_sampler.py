@@ -0,0 +1,77 @@
+"""
+Tests du tirage pondéré par arbre de Fenwick
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.weighted_sampler import WeightedSampler, choose
+
+
+class TestWeightedSampler(unittest.TestCase):
+    """Tirages, mises à jour en place et tirage sans remise"""
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.weights = [rng.uniform(0.05, 3.0) for _ in range(200)]
+
+    def test_same_draws_as_random_choices(self):
+        """À graine égale, mêmes tirages que random.choices"""
+        sampler = WeightedSampler(self.weights)
+        rng_a, rng_b = random.Random(11), random.Random(11)
+        indices = range(len(self.weights))
+        for _ in range(500):
+            self.assertEqual(
+                sampler.sample(rng_a),
+                rng_b.choices(indices, weights=self.weights)[0],
+            )
+
+    def test_in_place_updates(self):
+        """Les mises à jour unitaires et groupées équivalent à une reconstruction"""
+        sampler = WeightedSampler(self.weights)
+        updated = list(self.weights)
+        for index, factor in ((3, 0.2), (50, 0.0), (199, 4.0)):
+            sampler.scale(index, factor)
+            updated[index] *= factor
+        self.assertAlmostEqual(sampler.total(), sum(updated))
+        self.assertEqual(sampler.active, len(updated) - 1)
+
+        many = [w * 0.5 if i % 3 == 0 else w for i, w in enumerate(updated)]
+        self.assertEqual(sampler.sync(many), len(range(0, 200, 3)))
+        rebuilt = WeightedSampler(many)
+        rng_a, rng_b = random.Random(5), random.Random(5)
+        draws = [sampler.sample(rng_a) for _ in range(200)]
+        self.assertEqual(draws, [rebuilt.sample(rng_b) for _ in range(200)])
+        self.assertNotIn(50, draws)
+
+    def test_exclude_and_without_replacement(self):
+        """Indices écartés jamais tirés, tirage sans remise sans doublon"""
+        sampler = WeightedSampler(self.weights)
+        rng = random.Random(1)
+        small, large = {0, 1, 2}, set(range(0, 200, 2))
+        for exclude in (small, large):
+            draws = {sampler.sample(rng, exclude) for _ in range(300)}
+            self.assertFalse(draws & exclude)
+        self.assertEqual(sampler.available(large), 100)
+        self.assertAlmostEqual(sampler.total(), sum(self.weights))
+
+        picked = sampler.sample_without_replacement(rng, 250)
+        self.assertEqual(sorted(picked), list(range(200)))
+        self.assertEqual(sampler.active, 0)
+        with self.assertRaises(ValueError):
+            sampler.sample(rng)
+
+    def test_low_entropy_takes_best(self):
+        """Variabilité faible : premier plus gros poids, hors exclusions"""
+        sampler = WeightedSampler([1.0, 3.0, 2.0, 3.0])
+        rng = random.Random(0)
+        self.assertEqual(choose(sampler, rng, 0.0), 1)
+        self.assertEqual(choose(sampler, rng, 0.0, exclude=[1]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
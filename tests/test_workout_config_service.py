@@ -0,0 +1,115 @@
+"""
+Tests de la persistance différée de la configuration de génération
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.workout_config import SessionFeedback
+from services.workout_config_service import WorkoutConfigService
+
+
+def _feedback(i, rating=9.0):
+    feedback = SessionFeedback(session_id=f"s{i}", coach_rating=rating)
+    feedback.format = "AMRAP"
+    feedback.exercises_used = ["Burpees", f"Ex {i}"]
+    return feedback
+
+
+class TestWorkoutConfigService(unittest.TestCase):
+    """Écritures regroupées, atomiques, et journal d'apprentissage"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_dir = os.path.join(self.tmpdir.name, "cfg")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _service(self, **kwargs):
+        return WorkoutConfigService(self.config_dir, **kwargs)
+
+    def _on_disk(self):
+        with open(os.path.join(self.config_dir, "workout_generation.json")) as f:
+            return json.load(f)
+
+    def test_write_behind_coalesces_writes(self):
+        """Les modifications sont immédiates en mémoire, écrites en une fois"""
+        service = self._service(write_behind=True, debounce_sec=60)
+        writes = service.writes
+        for i in range(10):
+            service.ban_exercise(f"Ex {i}")
+
+        banned = service.get_config().exercise_restrictions["banned_exercises"]
+        self.assertIn("Ex 9", banned)
+        self.assertEqual(service.writes, writes)
+        self.assertNotIn(
+            "Ex 9", self._on_disk()["exercise_restrictions"]["banned_exercises"]
+        )
+
+        self.assertTrue(service.flush())
+        self.assertEqual(service.writes, writes + 1)
+        self.assertIn(
+            "Ex 9", self._on_disk()["exercise_restrictions"]["banned_exercises"]
+        )
+        self.assertFalse(service.flush())
+        self.assertFalse(os.path.exists(str(service.config_file) + ".tmp"))
+
+    def test_size_threshold_forces_write(self):
+        """Au-delà de max_pending modifications, écriture sans attendre"""
+        service = self._service(write_behind=True, debounce_sec=60, max_pending=3)
+        writes = service.writes
+        for i in range(7):
+            service.add_favorite_exercise("AMRAP", f"Ex {i}")
+        self.assertEqual(service.writes, writes + 2)
+        service.close()
+
+    def test_feedback_goes_to_log_and_is_replayed(self):
+        """Les feedbacks s'ajoutent au journal, rejoué au rechargement"""
+        service = self._service(compact_every=100)
+        writes = service.writes
+        for i in range(5):
+            service.record_session_feedback(_feedback(i))
+        self.assertEqual(service.writes, writes)
+        with open(service.learning_log, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+        # Le barème des feedbacks plafonne sous le seuil de 0.7 : entrées
+        # réussies ajoutées directement au journal
+        for i in range(2):
+            service._append_learning(
+                {
+                    "session_id": f"ok{i}",
+                    "format": "AMRAP",
+                    "exercises_used": ["a", "b"],
+                },
+                0.9,
+            )
+        reloaded = self._service()
+        combos = reloaded.get_config().learning_preferences["successful_combinations"]
+        self.assertEqual(len(combos["AMRAP_2"]), 2)
+
+        # Compactage : intégré au fichier, journal vidé, pas de double rejeu
+        reloaded.flush()
+        self.assertFalse(reloaded.learning_log.exists())
+        again = self._service()
+        combos = again.get_config().learning_preferences["successful_combinations"]
+        self.assertEqual(len(combos["AMRAP_2"]), 2)
+
+    def test_log_compacted_periodically(self):
+        """Tous les compact_every feedbacks, le journal est compacté"""
+        service = self._service(compact_every=3)
+        for i in range(4):
+            service.record_session_feedback(_feedback(i))
+        with open(service.learning_log, encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["seq"] for line in f], [4])
+        self.assertEqual(self._on_disk()["learning_log_seq"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
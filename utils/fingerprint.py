@@ -0,0 +1,295 @@
+"""Stable content fingerprints for cache keys.
+
+``fingerprint(*parts)`` hashes arbitrary nested data into a short hex digest
+that only depends on the *value* of the data: dictionary key order, set
+iteration order and object identity do not matter, while the type of each
+leaf does (``1``, ``1.0``, ``"1"`` and ``True`` hash differently).
+
+Values are encoded into a type-tagged byte stream fed to BLAKE2b in chunks,
+so no intermediate JSON string of the whole payload is built. Dates,
+decimals, enums, UUIDs, paths, dataclasses, pydantic-style models
+(``model_dump``/``dict``), objects exposing ``to_dict`` or ``tolist`` and
+plain objects (through ``vars``) are all supported. Anything else falls
+back to its type name and ``repr``, or the type name alone when the repr
+only carries a memory address: fingerprinting never raises.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import re
+import uuid
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any, Callable, Optional, Set
+
+_FLUSH_SIZE = 64 * 1024
+# ``<foo.Bar object at 0x7f...>``-style reprs change with every process
+_ADDRESS_REPR = re.compile(r" at 0x[0-9a-fA-F]+>$")
+_MAX_DEPTH = 200
+
+
+class Fingerprinter:
+    """Incremental fingerprint: feed values with ``update``, read ``hexdigest``"""
+
+    def __init__(self, digest_size: int = 16):
+        self._hash = hashlib.blake2b(digest_size=digest_size)
+        self._buffer = bytearray()
+        self._active: Set[int] = set()
+        self._flush_at = _FLUSH_SIZE
+
+    def update(self, value: Any) -> "Fingerprinter":
+        self._encode(value, 0)
+        if len(self._buffer) >= self._flush_at:
+            self._flush()
+        return self
+
+    def digest(self) -> bytes:
+        self._flush()
+        return self._hash.digest()
+
+    def hexdigest(self) -> str:
+        self._flush()
+        return self._hash.hexdigest()
+
+    # --- encoding ---------------------------------------------------------
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._hash.update(self._buffer)
+            self._buffer.clear()
+
+    def _write(self, tag: bytes, text: str) -> None:
+        raw = text.encode("utf-8", "surrogatepass")
+        self._buffer += b"%b%d:%b" % (tag, len(raw), raw)
+
+    def _encode(self, value: Any, depth: int) -> None:
+        if len(self._buffer) >= self._flush_at:
+            self._flush()
+
+        # Exact-type fast paths for the common JSON-like leaves
+        kind = type(value)
+        if kind is str:
+            self._write(b"s", value)
+            return
+        if value is None:
+            self._buffer += b"N"
+            return
+        if kind is bool:
+            self._buffer += b"T" if value else b"F"
+            return
+        if kind is int:
+            self._buffer += b"i%d;" % value
+            return
+        if kind is float:
+            self._buffer += b"f%r;" % value
+            return
+
+        if depth > _MAX_DEPTH:
+            self._write(b"?", kind.__qualname__)
+            return
+
+        plain_container = kind is dict or kind is list or kind is tuple
+        if not plain_container and isinstance(value, _SCALARS):
+            self._encode_scalar(value, depth)
+            return
+
+        if (
+            plain_container
+            or isinstance(value, (Mapping, list, tuple, set, frozenset))
+            or hasattr(value, "__dict__")
+        ):
+            # Guard against self-referencing containers and objects
+            marker = id(value)
+            if marker in self._active:
+                self._buffer += b"@"
+                return
+            self._active.add(marker)
+            try:
+                self._encode_compound(value, depth)
+            finally:
+                self._active.discard(marker)
+            return
+
+        self._encode_scalar(value, depth)
+
+    def _encode_compound(self, value: Any, depth: int) -> None:
+        if isinstance(value, Mapping):
+            self._encode_mapping(value, depth)
+        elif isinstance(value, (list, tuple)):
+            self._buffer += b"["
+            for item in value:
+                self._encode(item, depth + 1)
+            self._buffer += b"]"
+        elif isinstance(value, (set, frozenset)):
+            # Order-free: hash each member on its own, then sort the digests
+            members = sorted(_sub_digest(item, depth + 1) for item in value)
+            self._buffer += b"<" + b"".join(members) + b">"
+        else:
+            self._encode_object(value, depth)
+
+    def _encode_mapping(self, mapping: Mapping[Any, Any], depth: int) -> None:
+        buffer = self._buffer
+        buffer += b"{"
+        try:
+            # Common case, string keys: sort and write them inline
+            keys = sorted(mapping)
+            if not all(isinstance(key, str) for key in keys):
+                raise TypeError
+        except TypeError:
+            entries = sorted(
+                (
+                    (_sub_encoding(key, depth + 1), item)
+                    for key, item in mapping.items()
+                ),
+                key=lambda entry: entry[0],
+            )
+            for key_bytes, item in entries:
+                buffer += key_bytes
+                self._encode(item, depth + 1)
+        else:
+            for key in keys:
+                raw = key.encode("utf-8", "surrogatepass")
+                buffer += b"s%d:%b" % (len(raw), raw)
+                self._encode(mapping[key], depth + 1)
+        buffer += b"}"
+
+    def _encode_object(self, value: Any, depth: int) -> None:
+        kind = type(value)
+        if dataclasses.is_dataclass(value):
+            self._write(b"c", kind.__qualname__)
+            self._buffer += b"{"
+            for field in dataclasses.fields(value):
+                self._write(b"s", field.name)
+                self._encode(getattr(value, field.name, None), depth + 1)
+            self._buffer += b"}"
+            return
+
+        exported = _export(value)
+        if exported is not _MISSING:
+            self._write(b"o", kind.__qualname__)
+            self._encode(exported, depth + 1)
+            return
+
+        self._write(b"o", kind.__qualname__)
+        self._encode_mapping(vars(value), depth)
+
+    def _encode_scalar(self, value: Any, depth: int) -> None:
+        if isinstance(value, enum.Enum):
+            self._write(b"e", type(value).__qualname__)
+            self._encode(value.value, depth + 1)
+        elif isinstance(value, str):
+            self._write(b"s", str(value))
+        elif isinstance(value, bool):
+            self._buffer += b"T" if value else b"F"
+        elif isinstance(value, int):
+            self._buffer += b"i" + str(int(value)).encode() + b";"
+        elif isinstance(value, float):
+            self._buffer += b"f" + repr(float(value)).encode() + b";"
+        elif isinstance(value, Decimal):
+            # 1.0 and 1.00 are the same amount
+            try:
+                text = str(value.normalize())
+            except ArithmeticError:
+                text = str(value)
+            self._write(b"d", text)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            raw = bytes(value)
+            self._buffer += b"b" + str(len(raw)).encode() + b":" + raw
+        elif isinstance(value, datetime):
+            self._write(b"t", value.isoformat())
+        elif isinstance(value, date):
+            self._write(b"D", value.isoformat())
+        elif isinstance(value, time):
+            self._write(b"h", value.isoformat())
+        elif isinstance(value, timedelta):
+            self._buffer += b"r" + repr(value.total_seconds()).encode() + b";"
+        elif isinstance(value, uuid.UUID):
+            self._write(b"u", value.hex)
+        elif isinstance(value, PurePath):
+            self._write(b"p", value.as_posix())
+        elif isinstance(value, type):
+            self._write(b"y", f"{value.__module__}.{value.__qualname__}")
+        else:
+            exported = _export(value)
+            if exported is not _MISSING:
+                self._write(b"o", type(value).__qualname__)
+                self._encode(exported, depth + 1)
+            else:
+                self._write(b"?", _fallback_text(value))
+
+
+_MISSING = object()
+
+# Leaves encoded by value even when they carry an instance ``__dict__``
+_SCALARS = (
+    enum.Enum,
+    str,
+    int,
+    float,
+    Decimal,
+    bytes,
+    bytearray,
+    memoryview,
+    date,
+    time,
+    timedelta,
+    uuid.UUID,
+    PurePath,
+    type,
+)
+
+# Conversion hooks tried in order on objects that are not plain containers
+_EXPORTERS = ("model_dump", "to_dict", "dict", "tolist")
+
+
+def _export(value: Any) -> Any:
+    for name in _EXPORTERS:
+        method: Optional[Callable[[], Any]] = getattr(value, name, None)
+        if callable(method):
+            try:
+                exported = method()
+            except Exception:
+                continue
+            if exported is not value:
+                return exported
+    return _MISSING
+
+
+def _fallback_text(value: Any) -> str:
+    """Type name and repr, without the repr when it is address-based"""
+    name = type(value).__qualname__
+    if type(value).__repr__ is object.__repr__:
+        return name
+    try:
+        text = repr(value)
+    except Exception:
+        return f"{name}:<unrepresentable>"
+    if _ADDRESS_REPR.search(text):
+        return name
+    return f"{name}:{text}"
+
+
+def _sub_encoding(value: Any, depth: int) -> bytes:
+    """Full encoding of a small value (dictionary keys)"""
+    sub = Fingerprinter()
+    sub._flush_at = float("inf")
+    sub._encode(value, depth)
+    return bytes(sub._buffer)
+
+
+def _sub_digest(value: Any, depth: int) -> bytes:
+    sub = Fingerprinter()
+    sub._encode(value, depth)
+    return sub.digest()
+
+
+def fingerprint(*parts: Any, digest_size: int = 16) -> str:
+    """Hex fingerprint of ``parts``, stable across runs and processes"""
+    hasher = Fingerprinter(digest_size=digest_size)
+    hasher.update(list(parts))
+    return hasher.hexdigest()